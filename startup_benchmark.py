@@ -0,0 +1,101 @@
+"""
+⏱️ Başlangıç Performans Ölçümü
+Soğuk süreçte yks_app import süresini ve giriş ekranının ilk render süresini ölçer.
+Ağır paketlerin (pandas, plotly, firebase_admin) giriş ekranında yüklenmediğini doğrular.
+
+Kullanım: python startup_benchmark.py [--runs 5] [--importtime]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ('pandas', 'plotly', 'firebase_admin', 'google.cloud.firestore', 'requests')
+
+# Her ölçüm yeni bir Python sürecinde çalışır; böylece sys.modules önbelleği sonucu bozmaz
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import yks_app.app
+elapsed = time.perf_counter() - start
+print(json.dumps({'import_ms': elapsed * 1000,
+                  'loaded': [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+RENDER_PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+app = AppTest.from_file('aa.py', default_timeout=60)
+app.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({'render_ms': elapsed * 1000,
+                  'exception': [str(e.value) for e in app.exception],
+                  'login_screen': any('Giriş' in h.value for h in app.subheader),
+                  'loaded': [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+def run_probe(code, extra_args=()):
+    """Probe kodunu temiz bir alt süreçte çalıştırır ve JSON çıktısını döndürür"""
+    result = subprocess.run(
+        [sys.executable, *extra_args, '-c', code],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or 'probe başarısız')
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+def summarize(label, values):
+    print(f"{label:<28} medyan {statistics.median(values):8.1f} ms   "
+          f"min {min(values):8.1f} ms   max {max(values):8.1f} ms")
+
+def print_importtime(stderr, top=15):
+    """-X importtime çıktısından en pahalı (kümülatif) import'ları listeler"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # Biçim: "import time:  self [us] | cumulative | imported package"
+        _, cumulative_us, name = line.split(':', 1)[1].split('|', 2)
+        rows.append((int(cumulative_us), name))
+    print(f"\n📦 En pahalı {top} import (kümülatif):")
+    for cumulative_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name.strip()}")
+
+def main():
+    parser = argparse.ArgumentParser(description="YKS uygulaması başlangıç ölçümü")
+    parser.add_argument('--runs', type=int, default=5, help="Her ölçüm için tekrar sayısı")
+    parser.add_argument('--importtime', action='store_true', help="-X importtime dökümünü göster")
+    args = parser.parse_args()
+
+    import_times, loaded = [], set()
+    for _ in range(args.runs):
+        result, _ = run_probe(IMPORT_PROBE)
+        import_times.append(result['import_ms'])
+        loaded.update(result['loaded'])
+    summarize("yks_app import", import_times)
+    print(f"  import sırasında yüklenen ağır modüller: {sorted(loaded) or 'yok'}")
+
+    try:
+        render_times, loaded = [], set()
+        for _ in range(args.runs):
+            result, _ = run_probe(RENDER_PROBE)
+            if result['exception']:
+                raise RuntimeError(result['exception'][0])
+            render_times.append(result['render_ms'])
+            loaded.update(result['loaded'])
+        summarize("giriş ekranı ilk render", render_times)
+        print(f"  giriş ekranında yüklenen ağır modüller: {sorted(loaded) or 'yok'}")
+    except Exception as e:
+        print(f"⚠️ Render ölçümü yapılamadı: {e}")
+
+    if args.importtime:
+        _, stderr = run_probe(IMPORT_PROBE, ('-X', 'importtime'))
+        print_importtime(stderr)
+
+if __name__ == '__main__':
+    main()
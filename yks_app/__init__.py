@@ -0,0 +1,3 @@
+"""
+🎯 YKS Takip Sistemi paketi
+"""
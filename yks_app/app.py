@@ -0,0 +1,738 @@
+"""
+🚪 Uygulama kabuğu - giriş, profil tamamlama, kenar çubuğu ve sayfa yönlendirme
+"""
+
+from yks_app.core import *
+from yks_app.pages import SIDEBAR_PAGES, ROUTED_PAGES, render_page
+
+def main(rerun_span=NULL_SPAN):
+    # 🚀 OPTİMİZE EDİLMİŞ: Cache sistemi başlat
+    if 'firebase_cache' not in st.session_state:
+        st.session_state.firebase_cache = FirebaseCache()
+    
+    # Veri kalıcılığını garanti altına al
+    ensure_data_persistence()
+    
+    if 'current_user' not in st.session_state:
+        st.session_state.current_user = None
+    
+    # Sayfa yönlendirmeleri kontrolü
+    if st.session_state.get('page') in ROUTED_PAGES:
+        render_page(ROUTED_PAGES[st.session_state.page])
+        return
+    
+    if st.session_state.current_user is None:
+        st.markdown(get_custom_css("Varsayılan"), unsafe_allow_html=True)
+        st.markdown('<div class="main-header"><h1>🎯"Senin Alanın" YKS Takip Sistemi</h1><p>Hedefine Bilimsel Yaklaşım</p></div>', unsafe_allow_html=True)
+        
+        st.subheader("🔐 Güvenli Giriş")
+        
+        # Firebase durumuna göre mesaj (bağlantı giriş denemesine kadar kurulmaz)
+        if not is_firebase_configured():
+            st.warning("⚠️ Firebase bağlantısı yok - Test modu aktif")
+            with st.expander("📋 Test Kullanıcı Bilgileri", expanded=True):
+                st.success("👤 **Test Öğrenci:**\n- Kullanıcı Adı: `test_ogrenci`\n- Şifre: `123456`")
+                st.info("👤 **Admin:**\n- Kullanıcı Adı: `admin`\n- Şifre: `admin123`")
+        else:
+            st.info("🛡️ Sadece kayıtlı öğrenciler sisteme erişebilir")
+        
+        username = st.text_input("Kullanıcı Adı")
+        password = st.text_input("Şifre", type="password")
+        
+        if st.button("Giriş Yap", type="primary", use_container_width=True):
+            if login_user_secure(username, password):
+                st.success("Giriş başarılı! Hoş geldiniz! 🎯")
+                time.sleep(1)
+                st.rerun()
+            else:
+                st.error("❌ Hatalı kullanıcı adı veya şifre!")
+                st.warning("🔒 Bu sisteme sadece kayıtlı öğrenciler erişebilir.")
+    
+    else:
+        # Liderboard snapshot ve bakım işleri için arka plan zamanlayıcısı
+        ensure_background_scheduler()
+        
+        # 🚀 OPTİMİZE: Sadece users_db yoksa yükle (giriş ekranında Firebase'e gidilmez)
+        if 'users_db' not in st.session_state:
+            st.session_state.users_db = load_users_from_firebase()
+        
+        # 🔐 Admin panel kontrolü - Gizli admin girişi kontrolü
+        if st.session_state.get('admin_logged_in', False):
+            show_admin_dashboard()
+            return
+        
+        user_data = get_user_data()
+        
+        profile_complete = user_data.get('name') and user_data.get('tyt_avg_net')
+        learning_style_complete = user_data.get('learning_style')
+        
+        if not profile_complete:
+            st.markdown(get_custom_css("Varsayılan"), unsafe_allow_html=True)
+            st.markdown('<div class="main-header"><h1>📝 Profil Bilgilerinizi Tamamlayın</h1><p>Sistemi size özel hale getirmek için bu bilgileri doldurmalısınız</p></div>', unsafe_allow_html=True)
+            
+            st.subheader("Öğrenci Bilgileri")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                name = st.text_input("Adınız", key="name_input")
+                surname = st.text_input("Soyadınız", key="surname_input")
+                grade = st.selectbox("Sınıfınız", ["11. Sınıf", "12. Sınıf", "Mezun"], key="grade_input")
+                field = st.selectbox("Alanınız", ["Sayısal", "Sözel", "Eşit Ağırlık", "TYT & MSÜ"], key="field_input")
+                
+                # 🎯 TYT & MSÜ için alt kategori seçimi
+                sub_category = None
+                if field == "TYT & MSÜ":
+                    st.markdown("**🎯 Alt Kategori Seçiniz:**")
+                    sub_category = st.selectbox(
+                        "Hedeflediğiniz alan", 
+                        [
+                            "MSÜ - Kara Astsubay Meslek Yüksekokulu",
+                            "MSÜ - Deniz Astsubay Yüksekokulu", 
+                            "MSÜ - Hava Astsubay Yüksekokulu",
+                            "TYT - Bilgisayar Programcılığı",
+                            "TYT - Anestezi Teknisyenliği",
+                            "TYT - Acil Tıp Teknisyenliği (ATT)",
+                            "TYT - Çocuk Gelişimi",
+                            "TYT - Ebe",
+                            "TYT - Hemato terapilişi",
+                            "TYT - Tıbbi Laboratuvar Teknikleri",
+                            "TYT - Tıbbi Görüntüleme Teknikleri",
+                            "TYT - Radyoterapi",
+                            "TYT - Diyaliz",
+                            "TYT - Diş Protés Teknisyenliği",
+                            "TYT - Otomotiv Teknolojisi",
+                            "TYT - Elektrik-Elektronik Teknolojisi",
+                            "TYT - Makine Teknolojisi",
+                            "TYT - İnşaat Teknolojisi",
+                            "TYT - Diğer Meslek Yüksekokulu"
+                        ], 
+                        key="sub_category_input"
+                    )
+                
+                # ⚠️ TYT & MSÜ seçildiğinde alt kategori zaten hedef bölümü belirliyor
+                if field != "TYT & MSÜ":
+                    # 🎯 Alan bazında bölüm filtrelemesi
+                    if field == "Sayısal":
+                        allowed_departments = ["Tıp", "Diş Hekimliği", "Mühendislik", "Varsayılan"]
+                    elif field == "Sözel":
+                        allowed_departments = ["Hukuk", "Öğretmenlik", "Psikoloji", "İktisat", "Varsayılan"]
+                    elif field == "Eşit Ağırlık":
+                        allowed_departments = ["İktisat", "Öğretmenlik", "Mimarlık", "Hukuk", "Psikoloji", "Varsayılan"]
+                    else:
+                        allowed_departments = list(BACKGROUND_STYLES.keys())[:-1]  # Tüm bölümler
+                    
+                    target = st.selectbox("Hedef Bölümünüz", allowed_departments, key="target_input")
+                else:
+                    # TYT & MSÜ için alt kategori hedef bölüm olarak kullanılacak
+                    target = sub_category if sub_category else "Genel"
+            
+            with col2:
+                st.subheader("📊 Net Bilgileri")
+                
+                # TYT Net Aralıkları
+                st.write("**TYT Netler**")
+                
+                # TYT aralık seçenekleri (kullanıcıya sadece aralık gösteriliyor)
+                tyt_ranges = [
+                    {"display": "0-25", "value": "0-25", "level": "Başlangıç", "avg": 12.5},
+                    {"display": "25-40", "value": "25-40", "level": "Gelişen", "avg": 32.5},
+                    {"display": "40-55", "value": "40-55", "level": "Orta", "avg": 47.5},
+                    {"display": "55-65", "value": "55-65", "level": "İyi", "avg": 60},
+                    {"display": "65-80", "value": "65-80", "level": "Çok İyi", "avg": 72.5},
+                    {"display": "80-95", "value": "80-95", "level": "Mükemmel", "avg": 87.5},
+                    {"display": "95+", "value": "95+", "level": "Uzman", "avg": 100}
+                ]
+                
+                tyt_last_range = st.selectbox(
+                    "Son TYT Net Aralığınız", 
+                    [r["display"] for r in tyt_ranges], 
+                    key="tyt_last_input"
+                )
+                tyt_avg_range = st.selectbox(
+                    "Genel TYT Net Ortalamanız", 
+                    [r["display"] for r in tyt_ranges], 
+                    key="tyt_avg_input"
+                )
+                
+                # AYT Net Aralıkları
+                st.write("**AYT Netler**")
+                
+                # AYT aralık seçenekleri (kullanıcıya sadece aralık gösteriliyor)
+                ayt_ranges = [
+                    {"display": "0-20", "value": "0-20", "level": "Başlangıç", "avg": 10},
+                    {"display": "20-35", "value": "20-35", "level": "Gelişen", "avg": 27.5},
+                    {"display": "35-50", "value": "35-50", "level": "İyi", "avg": 42.5},
+                    {"display": "50-65+", "value": "50-65+", "level": "Mükemmel", "avg": 57.5}
+                ]
+                
+                ayt_last_range = st.selectbox(
+                    "Son AYT Net Aralığınız", 
+                    [r["display"] for r in ayt_ranges], 
+                    key="ayt_last_input"
+                )
+                ayt_avg_range = st.selectbox(
+                    "Genel AYT Net Ortalamanız", 
+                    [r["display"] for r in ayt_ranges], 
+                    key="ayt_avg_input"
+                )
+                
+                # Seçilen aralıkların orta değerlerini hesapla (sistem için)
+                tyt_last = next(r["avg"] for r in tyt_ranges if r["display"] == tyt_last_range)
+                tyt_avg = next(r["avg"] for r in tyt_ranges if r["display"] == tyt_avg_range)
+                ayt_last = next(r["avg"] for r in ayt_ranges if r["display"] == ayt_last_range)
+                ayt_avg = next(r["avg"] for r in ayt_ranges if r["display"] == ayt_avg_range)
+                
+                # Seviye etiketlerini sistem için sakla (kullanıcıya gösterilmez)
+                tyt_last_level = next(r["level"] for r in tyt_ranges if r["display"] == tyt_last_range)
+                tyt_avg_level = next(r["level"] for r in tyt_ranges if r["display"] == tyt_avg_range)
+                ayt_last_level = next(r["level"] for r in ayt_ranges if r["display"] == ayt_last_range)
+                ayt_avg_level = next(r["level"] for r in ayt_ranges if r["display"] == ayt_avg_range)
+            
+            if st.button("💾 Bilgileri Kaydet", type="primary", use_container_width=True):
+                # TYT & MSÜ seçilmişse sub_category zorunlu
+                validation_error = False
+                if field == "TYT & MSÜ" and not sub_category:
+                    st.error("🚨 TYT & MSÜ alanı için alt kategori seçimi zorunludur!")
+                    validation_error = True
+                
+                # TYT & MSÜ için target kontrolünü özel olarak yap
+                target_valid = target if field != "TYT & MSÜ" else sub_category
+                
+                if not validation_error and name and surname and target_valid and tyt_last is not None and tyt_avg is not None and ayt_last is not None and ayt_avg is not None:
+                    # Kaydedilecek veri yapısı
+                    user_data_to_save = {
+                        'name': name,
+                        'surname': surname,
+                        'grade': grade,
+                        'field': field,
+                        'target_department': target,
+                        'tyt_last_net': str(tyt_last),
+                        'tyt_avg_net': str(tyt_avg),
+                        'ayt_last_net': str(ayt_last),
+                        'ayt_avg_net': str(ayt_avg),
+                        # Net aralık bilgileri (kullanıcının seçtiği aralık)
+                        'tyt_last_range': tyt_last_range,
+                        'tyt_avg_range': tyt_avg_range,
+                        'ayt_last_range': ayt_last_range,
+                        'ayt_avg_range': ayt_avg_range,
+                        # Seviye etiketleri (sistem için - Başlangıç, Gelişen, vb.)
+                        'tyt_last_level': tyt_last_level,
+                        'tyt_avg_level': tyt_avg_level,
+                        'ayt_last_level': ayt_last_level,
+                        'ayt_avg_level': ayt_avg_level,
+                        # Dinamik haftalık plan için kayıt tarihi
+                        'created_at': current_time().isoformat(),
+                        'is_profile_complete': 'True'
+                    }
+                    
+                    # TYT & MSÜ ise alt kategoriyi de kaydet
+                    if field == "TYT & MSÜ" and sub_category:
+                        user_data_to_save['tyt_msu_sub_category'] = sub_category
+                    
+                    update_user_in_firebase(st.session_state.current_user, user_data_to_save)
+                    
+                    # 🚀 OPTİMİZE: Update sonrası fresh data gerek
+                    st.session_state.users_db = load_users_from_firebase(force_refresh=True)
+                    st.session_state.is_profile_complete = True 
+                    st.success("🎉 Bilgileriniz başarıyla kaydedildi! Şimdi öğrenme stilinizi belirleyelim.")
+                    
+                    st.rerun()
+                else:
+                    st.error("⚠️ Lütfen tüm alanları doldurun!")
+        
+        elif not learning_style_complete:
+            # Dört testin durumunu kontrol et
+            vak_test_completed = user_data.get('vak_test_results')
+            cognitive_test_completed = user_data.get('cognitive_test_results')
+            motivation_test_completed = user_data.get('motivation_test_results')
+            time_management_test_completed = user_data.get('time_management_test_results')
+            
+            st.markdown(get_custom_css("Varsayılan"), unsafe_allow_html=True)
+            
+            # Ana sistem başlığı
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                            padding: 30px; border-radius: 20px; margin: 20px 0; text-align: center;">
+                    <h1 style="color: white; margin: 0; font-size: 2.5em;">🧭 GENEL PSİKOLOJİK ANALİZ SİSTEMİ</h1>
+                    <p style="color: white; font-size: 1.2em; margin: 10px 0; font-style: italic;">
+                        "Kendini Tanı & Doğru Çalış" Sistemi
+                    </p>
+                </div>
+            """, unsafe_allow_html=True)
+            
+            # 4 Test Karesi Modern Düzenlemesi
+            st.markdown("""
+            <style>
+            .test-grid {
+                display: grid;
+                grid-template-columns: repeat(2, 1fr);
+                gap: 60px 50px;
+                margin: 50px 0;
+                padding: 0 20px;
+            }
+            
+            /* Genel kart stilleri */
+            .test-card {
+                position: relative;
+                border-radius: 20px;
+                padding: 30px 25px;
+                text-align: center;
+                border: none;
+                overflow: hidden;
+                transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
+                cursor: pointer;
+                height: 300px;
+                width: 100%;
+                display: flex;
+                flex-direction: column;
+                justify-content: space-between;
+                backdrop-filter: blur(10px);
+                -webkit-backdrop-filter: blur(10px);
+            }
+            
+            /* Farklı renkli kartlar - Resimdeki gibi modern renkler */
+            .test-card.vak {
+                background: linear-gradient(135deg, #8B5CF6 0%, #A855F7 50%, #C084FC 100%);
+                box-shadow: 0 4px 20px rgba(139, 92, 246, 0.25);
+            }
+            
+            .test-card.cognitive {
+                background: linear-gradient(135deg, #3B82F6 0%, #1D4ED8 50%, #1E40AF 100%);
+                box-shadow: 0 4px 20px rgba(59, 130, 246, 0.25);
+            }
+            
+            .test-card.motivation {
+                background: linear-gradient(135deg, #F59E0B 0%, #F97316 50%, #EA580C 100%);
+                box-shadow: 0 4px 20px rgba(245, 158, 11, 0.25);
+            }
+            
+            .test-card.time {
+                background: linear-gradient(135deg, #10B981 0%, #059669 50%, #047857 100%);
+                box-shadow: 0 4px 20px rgba(16, 185, 129, 0.25);
+            }
+            
+            /* Hover efektleri */
+            .test-card:hover {
+                transform: translateY(-5px);
+                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+            }
+            
+            .test-card.vak:hover {
+                box-shadow: 0 8px 30px rgba(139, 92, 246, 0.4);
+                background: linear-gradient(135deg, #9333EA 0%, #B45BF7 50%, #D8B4FE 100%);
+            }
+            
+            .test-card.cognitive:hover {
+                box-shadow: 0 8px 30px rgba(59, 130, 246, 0.4);
+                background: linear-gradient(135deg, #2563EB 0%, #1E40AF 50%, #1E3A8A 100%);
+            }
+            
+            .test-card.motivation:hover {
+                box-shadow: 0 8px 30px rgba(245, 158, 11, 0.4);
+                background: linear-gradient(135deg, #F59E0B 0%, #FB923C 50%, #F97316 100%);
+            }
+            
+            .test-card.time:hover {
+                box-shadow: 0 8px 30px rgba(16, 185, 129, 0.4);
+                background: linear-gradient(135deg, #059669 0%, #10B981 50%, #34D399 100%);
+            }
+            
+            .test-icon {
+                font-size: 3rem;
+                margin-bottom: 12px;
+                filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1));
+            }
+            
+            .test-title {
+                font-size: 1.2rem;
+                font-weight: 700;
+                color: white;
+                margin-bottom: 8px;
+                text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+                line-height: 1.3;
+            }
+            
+            .test-subtitle {
+                font-size: 0.95rem;
+                color: rgba(255,255,255,0.9);
+                margin-bottom: 12px;
+                font-weight: 500;
+            }
+            
+            .test-details {
+                font-size: 0.85rem;
+                color: rgba(255,255,255,0.8);
+                line-height: 1.5;
+                margin-bottom: 20px;
+                font-weight: 400;
+            }
+            
+            .test-status {
+                padding: 10px 20px;
+                border-radius: 25px;
+                font-weight: 600;
+                font-size: 0.9rem;
+                margin-bottom: 15px;
+                backdrop-filter: blur(10px);
+                border: 2px solid rgba(255,255,255,0.2);
+            }
+            
+            .status-completed {
+                background: rgba(76, 175, 80, 0.9);
+                color: white;
+                box-shadow: 0 4px 15px rgba(76, 175, 80, 0.3);
+            }
+            
+            .status-waiting {
+                background: rgba(255, 193, 7, 0.9);
+                color: white;
+                box-shadow: 0 4px 15px rgba(255, 193, 7, 0.3);
+            }
+            
+            /* Responsive tasarım */
+            @media (max-width: 768px) {
+                .test-grid {
+                    grid-template-columns: 1fr;
+                    gap: 40px;
+                    padding: 0 15px;
+                }
+                .test-card {
+                    height: 250px;
+                    padding: 20px 15px;
+                }
+                .test-icon {
+                    font-size: 2.5rem;
+                }
+                .test-title {
+                    font-size: 1.05rem;
+                }
+            }
+            
+            /* Button stilleri */
+            .stButton > button {
+                background: linear-gradient(135deg, rgba(255,255,255,0.2), rgba(255,255,255,0.1)) !important;
+                border: 2px solid rgba(255,255,255,0.3) !important;
+                color: white !important;
+                font-weight: 600 !important;
+                border-radius: 15px !important;
+                backdrop-filter: blur(10px) !important;
+                transition: all 0.3s ease !important;
+            }
+            
+            .stButton > button:hover {
+                background: linear-gradient(135deg, rgba(255,255,255,0.3), rgba(255,255,255,0.2)) !important;
+                border: 2px solid rgba(255,255,255,0.5) !important;
+                transform: translateY(-2px) !important;
+                box-shadow: 0 8px 25px rgba(0,0,0,0.2) !important;
+            }
+            </style>
+            
+            <div class="test-grid">
+            """, unsafe_allow_html=True)
+            
+            # Test Kartları Verilerini Tanımla
+            test_cards = [
+                {
+                    'id': 'vak',
+                    'class': 'vak',
+                    'icon': '📚',
+                    'title': 'Öğrenme Stilleri Testi (VAK)',
+                    'subtitle': '75 soru - Görsel, İşitsel, Kinestetik',
+                    'details': '',
+                    'completed': vak_test_completed,
+                    'page': 'learning_styles_test'
+                },
+                {
+                    'id': 'cognitive',
+                    'class': 'cognitive',
+                    'icon': '🧠',
+                    'title': 'Bilişsel Profil Testi',
+                    'subtitle': '20 soru - Likert gösterim (1-5)',
+                    'details': '',
+                    'completed': cognitive_test_completed,
+                    'page': 'cognitive_profile_test'
+                },
+                {
+                    'id': 'motivation',
+                    'class': 'motivation',
+                    'icon': '⚡',
+                    'title': 'Motivasyon & Duygu Testi',
+                    'subtitle': '',
+                    'details': '💫 İçsel/Dışsal motivasyon<br>😰 Sınav kaygısı düzeyi<br>💪 Duygusal dayanıklılık',
+                    'completed': motivation_test_completed,
+                    'page': 'motivation_emotional_test'
+                },
+                {
+                    'id': 'time',
+                    'class': 'time',
+                    'icon': '⏰',
+                    'title': 'Zaman Yönetimi Testi',
+                    'subtitle': '',
+                    'details': '📋 Planlama & disiplin<br>⏰ Erteleme<br>🎯 Odak kontrolü',
+                    'completed': time_management_test_completed,
+                    'page': 'time_management_test'
+                }
+            ]
+            
+            # Her test için kart oluştur
+            cols = st.columns(2)
+            for i, test in enumerate(test_cards):
+                col_index = i % 2
+                with cols[col_index]:
+                    status_class = "status-completed" if test['completed'] else "status-waiting"
+                    status_text = "✅ Tamamlandı" if test['completed'] else "⏳ Beklemede"
+                    
+                    st.markdown(f"""
+                    <div class="test-card {test['class']}">
+                        <div>
+                            <div class="test-icon">{test['icon']}</div>
+                            <div class="test-title">{test['title']}</div>
+                            <div class="test-subtitle">{test['subtitle']}</div>
+                            <div class="test-details">{test['details']}</div>
+                        </div>
+                        <div class="test-status {status_class}">{status_text}</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    # Butonlar
+                    if not test['completed']:
+                        if st.button(f"🚀 Testi Şimdi Doldur", key=f"start_now_{test['id']}", use_container_width=True, type="primary"):
+                            st.session_state.page = test['page']
+                            st.rerun()
+                        
+                        if st.button(f"⏳ Sonra Doldur", key=f"start_later_{test['id']}", use_container_width=True):
+                            st.info(f"{test['title']} daha sonra için kaydedildi.")
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            # "Verilerimi Kaydet ve Tamamla" Bölümü
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                            padding: 30px; border-radius: 25px; margin: 25px 0; text-align: center;
+                            border: 3px solid rgba(255,255,255,0.2);
+                            box-shadow: 0 15px 40px rgba(102, 126, 234, 0.3);
+                            position: relative;
+                            overflow: hidden;">
+                    <div style="position: absolute; top: -50%; left: -50%; width: 200%; height: 200%; 
+                                background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
+                                animation: pulse 4s ease-in-out infinite;"></div>
+                    <div style="position: relative; z-index: 1;">
+                        <h3 style="color: white; margin: 0 0 15px 0; font-size: 1.8em; 
+                                   text-shadow: 0 3px 6px rgba(0,0,0,0.3);">
+                            💾 Verilerimi Kaydet ve Tamamla
+                        </h3>
+                        <p style="color: rgba(255,255,255,0.95); margin: 0; font-size: 1.15em; 
+                                  line-height: 1.5; font-weight: 500;">
+                            🎯 Testleri istediğiniz zaman yapabilirsiniz<br>
+                            ⚡ Şimdi sistemi açabilir ve çalışmaya başlayabilirsiniz!
+                        </p>
+                    </div>
+                </div>
+                
+                <style>
+                @keyframes pulse {
+                    0%, 100% { transform: scale(1) rotate(0deg); opacity: 0.3; }
+                    50% { transform: scale(1.1) rotate(180deg); opacity: 0.1; }
+                }
+                </style>
+            """, unsafe_allow_html=True)
+                
+            # Modern buton stili ekle
+            st.markdown("""
+                <style>
+                .final-button > button {
+                    background: linear-gradient(135deg, #00b894 0%, #00a085 100%) !important;
+                    border: none !important;
+                    color: white !important;
+                    font-weight: 700 !important;
+                    font-size: 1.2em !important;
+                    padding: 15px 30px !important;
+                    border-radius: 20px !important;
+                    box-shadow: 0 8px 25px rgba(0, 184, 148, 0.3) !important;
+                    transition: all 0.3s ease !important;
+                    text-transform: uppercase !important;
+                    letter-spacing: 1px !important;
+                }
+                
+                .final-button > button:hover {
+                    background: linear-gradient(135deg, #00a085 0%, #00b894 100%) !important;
+                    transform: translateY(-3px) !important;
+                    box-shadow: 0 15px 35px rgba(0, 184, 148, 0.4) !important;
+                }
+                
+                .final-button > button:active {
+                    transform: translateY(0px) !important;
+                }
+                </style>
+            """, unsafe_allow_html=True)
+            
+            # Butonu özel CSS ile sarmalayın
+            st.markdown('<div class="final-button">', unsafe_allow_html=True)
+            button_clicked = st.button("💾 Verilerimi Kaydet ve Sistemi Aç", type="primary", use_container_width=True, key="save_and_complete")
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            if button_clicked:
+                # Profili tamamlandı olarak işaretle
+                profile_data = {'learning_style': 'Profil Tamamlandı'}
+                
+                # Eğer testler tamamlandıysa sonuçları dahil et
+                if vak_test_completed:
+                    vak_results = json.loads(vak_test_completed) if isinstance(vak_test_completed, str) else vak_test_completed
+                    visual_score = vak_results.get('visual', 0)
+                    auditory_score = vak_results.get('auditory', 0)
+                    kinesthetic_score = vak_results.get('kinesthetic', 0)
+                    
+                    max_score = max(visual_score, auditory_score, kinesthetic_score)
+                    if visual_score == max_score:
+                        dominant_learning_style = "Görsel"
+                    elif auditory_score == max_score:
+                        dominant_learning_style = "İşitsel"
+                    else:
+                        dominant_learning_style = "Kinestetik"
+                    
+                    if cognitive_test_completed:
+                        cognitive_results = json.loads(cognitive_test_completed) if isinstance(cognitive_test_completed, str) else cognitive_test_completed
+                        combined_profile = f"{dominant_learning_style} Öğrenme + {cognitive_results.get('dominant_profile', 'Analitik')} Bilişsel"
+                    else:
+                        combined_profile = f"{dominant_learning_style} Öğrenme"
+                    
+                    profile_data['learning_style'] = combined_profile
+                    profile_data['learning_style_scores'] = json.dumps({
+                        'visual': visual_score,
+                        'auditory': auditory_score,
+                        'kinesthetic': kinesthetic_score
+                    })
+                
+                # Profili kaydet
+                update_user_in_firebase(st.session_state.current_user, profile_data)
+                # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+                
+                st.success("✅ Verileriniz kaydedildi! Sisteme hoş geldiniz!")
+                time.sleep(2)
+                st.rerun()
+
+
+        else:
+            # ✨ Hoş geldin mesajını göster - SADECE profil tamamlandıktan sonra!
+            if not st.session_state.get('admin_logged_in', False):
+                check_and_show_welcome_message(st.session_state.current_user)
+            
+            target_dept = user_data.get('target_department', 'Varsayılan')
+            
+            st.markdown(get_custom_css(target_dept), unsafe_allow_html=True)
+            
+            progress_data = calculate_subject_progress(user_data)
+            
+            with st.sidebar:
+                # Logo - En üstte!
+                st.markdown("""
+                <div style="
+        background-color: white;
+        border-radius: 25px;
+        width: 220px;
+        height: 240px;
+        display: flex;
+        align-items: center;        /* dikey ortalama */
+        justify-content: center;    /* yatay ortalama */
+        box-shadow: 0 4px 10px rgba(0,0,0,0.2);
+        margin: auto;
+       
+        
+    Burası "Senin Alanın" 
+        <img src="https://raw.githubusercontent.com/g2672v6dps-ship-it/ykstakipdf/0538075040afbf31b8a262ce85d449137fbdac30/logodf.png"
+             alt="Psiko DSF Logo"
+             style="width:160px; height:160px; border-radius:20px; object-fit: contain;">
+    </div>
+    """,
+    unsafe_allow_html=True
+)
+
+                
+                # Sayfa seçimi - Logo'dan sonra!
+                page = st.sidebar.selectbox("🌐 Sayfa Seçin", list(SIDEBAR_PAGES))
+                rerun_span.set(page=page)
+                st.markdown("---")
+                
+                bg_style = BACKGROUND_STYLES.get(target_dept, BACKGROUND_STYLES["Varsayılan"])
+                st.markdown(f"### {bg_style['icon']} Hoş geldin, {user_data.get('name', 'Öğrenci')}!")
+                st.markdown(f"**🎯 Hedef:** {user_data.get('target_department', 'Belirlenmedi')}")
+                st.markdown(f"**📊 Alan:** {user_data.get('field', 'Belirlenmedi')}")
+                st.markdown(f"**🏫 Sınıf:** {user_data.get('grade', 'Belirlenmedi')}")
+                st.markdown("---")
+                st.markdown("**📈 Net Durumu**")
+                
+                # Net değerlerini düzenli formatla göster
+                tyt_last = user_data.get('tyt_last_net', '0')
+                tyt_avg = user_data.get('tyt_avg_net', '0')
+                ayt_last = user_data.get('ayt_last_net', '0')
+                ayt_avg = user_data.get('ayt_avg_net', '0')
+                
+                try:
+                    tyt_last_f = f"{float(tyt_last):.1f}" if tyt_last != 'Belirlenmedi' else 'Belirlenmedi'
+                except:
+                    tyt_last_f = tyt_last
+                    
+                try:
+                    tyt_avg_f = f"{float(tyt_avg):.1f}" if tyt_avg != 'Belirlenmedi' else 'Belirlenmedi'
+                except:
+                    tyt_avg_f = tyt_avg
+                    
+                try:
+                    ayt_last_f = f"{float(ayt_last):.1f}" if ayt_last != 'Belirlenmedi' else 'Belirlenmedi'
+                except:
+                    ayt_last_f = ayt_last
+                    
+                try:
+                    ayt_avg_f = f"{float(ayt_avg):.1f}" if ayt_avg != 'Belirlenmedi' else 'Belirlenmedi'
+                except:
+                    ayt_avg_f = ayt_avg
+                
+                st.markdown(f"**TYT Son:** {tyt_last_f}")
+                st.markdown(f"**TYT Ort:** {tyt_avg_f}")
+                st.markdown(f"**AYT Son:** {ayt_last_f}")
+                st.markdown(f"**AYT Ort:** {ayt_avg_f}")
+                
+
+                
+                st.markdown("---")
+                st.markdown("**🧠 Öğrenme Stili Dağılımı**")
+                style_scores = user_data.get('learning_style_scores', None)
+                if style_scores:
+                    try:
+                        # Eğer string ise JSON parse et, değilse doğrudan kullan
+                        if isinstance(style_scores, str):
+                            style_scores = json.loads(style_scores.replace("'", "\""))
+                        
+                        # Dictionary olduğundan emin ol
+                        if isinstance(style_scores, dict):
+                            sorted_styles = sorted(style_scores.items(), key=lambda item: item[1], reverse=True)
+                            for style, score in sorted_styles:
+                                if score > 0:
+                                    st.write(f"- {style}: %{score:.1f}")
+                        else:
+                            st.write("Veri formatı hatalı")
+                    except (json.JSONDecodeError, TypeError, KeyError) as e:
+                        st.write(f"Veri Hatası: {str(e)}")
+                else:
+                    st.write("Henüz belirlenmedi.")
+                
+                total_completed = sum(data['completed'] for data in progress_data.values())
+                total_topics = count_total_topics()
+                genel_ilerleme = (total_completed / total_topics * 100) if total_topics > 0 else 0
+                    
+                st.markdown("---")
+                st.metric("📈 Genel İlerleme", f"%{genel_ilerleme:.1f}")
+                st.metric("✅ Tamamlanan", f"{total_completed}/{total_topics}")
+                
+                # Debug modu kontrolü (geliştiriciler için)
+                st.markdown("---")
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if st.button("🚪 Çıkış Yap", use_container_width=True):
+                        st.session_state.current_user = None
+                        st.rerun()
+
+            # Sayfa modülü ilk seçildiğinde import edilir, sonra sys.modules'tan gelir
+            render_page(page, user_data, progress_data, target_dept)
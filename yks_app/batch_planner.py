@@ -0,0 +1,113 @@
+"""
+🌙 Toplu Haftalık Plan Üretici
+Tüm öğrencilerin gelecek haftaki planını süreç havuzunda önceden hesaplar ve
+YKS_WEEKLY_PLAN_CACHE_DIR'e yazar; Pazartesi girişlerinde plan diskten hazır okunur.
+Pazar gecesi cron ile çalıştırılmak üzere tasarlandı.
+
+Kullanım: python -m yks_app.batch_planner --cache-dir /var/cache/yks/plans [--workers 4] [--date 2025-10-20]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from yks_app.core import (get_firestore_db, get_iso_week_id, load_all_users_direct,
+                          reset_offline_store, rerun_context, save_user_direct)
+from yks_app import planner
+
+logger = logging.getLogger('yks.batch')
+
+def next_monday(today=None):
+    """Bir sonraki Pazartesi (bugün Pazartesi ise bugün)"""
+    today = (today or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today + timedelta(days=(7 - today.weekday()) % 7)
+
+def load_survey_data(user_data):
+    """Haftalık planlama sekmesiyle aynı anket verisi"""
+    survey_data_raw = user_data.get('yks_survey_data', '{}')
+    return json.loads(survey_data_raw) if isinstance(survey_data_raw, str) else survey_data_raw
+
+def is_plannable(username, user_data):
+    """Programı başlamış öğrenci mi - başlamayanların planı ilk girişte canlı hesaplanır"""
+    return (isinstance(user_data, dict) and user_data.get('field')
+            and user_data.get('weekly_program_started') and username != 'coach_approvals')
+
+def plan_student(username, user_data, approvals_data, plan_time, cache_dir):
+    """Tek öğrencinin planını hesaplar ve diske yazar (işçi süreçte çalışır)"""
+    user_data.setdefault('username', username)
+    reset_offline_store()
+    with rerun_context(now=plan_time, offline=True):
+        student_field = user_data.get('field', '')
+        survey_data = load_survey_data(user_data)
+        approved_topics = planner.select_approved_coached_topics(approvals_data, user_data)
+        events = planner.PlanEvents()
+        weekly_plan = planner.build_dynamic_weekly_plan(
+            user_data, student_field, survey_data, approved_topics, events)
+        # Anahtar motorun güncellediği alanlarla hesaplanır; güncellemeler de Firestore'a yazılacak.
+        # Sözel matematik tercihi oturuma bağlı: toplu plan kapalı tercihle anahtarlanır, açanlar canlı hesaplar
+        cache_key = planner.get_weekly_plan_cache_key(user_data, student_field, survey_data, approved_topics,
+                                                      include_verbal_math=False)
+        planner.persist_weekly_plan(cache_key, weekly_plan, cache_dir)
+    for level, text in events.messages:
+        logger.debug("%s [%s] %s", username, level, text)
+    return username, len(weekly_plan.get('new_topics', [])), events.user_updates
+
+def run_batch(cache_dir, plan_time, workers=None):
+    """Tüm öğrenciler için planları üretir; (başarılı, hatalı) sayısını döndürür"""
+    started = time.perf_counter()
+    users = {username: data for username, data in load_all_users_direct().items()
+             if is_plannable(username, data)}
+    approvals_doc = get_firestore_db().document('coach_approvals').get()
+    approvals_data = approvals_doc.to_dict() if approvals_doc.exists else {}
+    logger.info("%s öğrenci için %s haftası planlanıyor", len(users), get_iso_week_id(plan_time))
+
+    done, failed = 0, 0
+    # spawn: üst süreçteki Firebase/gRPC bağlantısı fork ile işçilere kopyalanmasın
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = {
+            pool.submit(plan_student, username, data, approvals_data, plan_time, cache_dir): username
+            for username, data in users.items()
+        }
+        for future in as_completed(futures):
+            username = futures[future]
+            try:
+                _, topic_count, user_updates = future.result()
+            except Exception as e:
+                failed += 1
+                logger.error("%s planı üretilemedi: %s", username, e)
+                continue
+            # Hafta ilerletme gibi alan güncellemeleri tek süreçten yazılır
+            if user_updates:
+                save_user_direct(username, user_updates)
+            done += 1
+            logger.debug("%s: %s yeni konu", username, topic_count)
+
+    logger.info("Toplu plan bitti: %s başarılı, %s hatalı, %.1f sn",
+                done, failed, time.perf_counter() - started)
+    return done, failed
+
+def main():
+    parser = argparse.ArgumentParser(description="Gelecek hafta planlarını önceden hesaplar")
+    parser.add_argument('--cache-dir', default=os.environ.get('YKS_WEEKLY_PLAN_CACHE_DIR'),
+                        help="Plan dizini (web süreciyle aynı YKS_WEEKLY_PLAN_CACHE_DIR)")
+    parser.add_argument('--workers', type=int, default=None, help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--date', help="Planlanacak gün, YYYY-MM-DD (varsayılan: gelecek Pazartesi)")
+    args = parser.parse_args()
+
+    if not args.cache_dir:
+        parser.error("--cache-dir veya YKS_WEEKLY_PLAN_CACHE_DIR gerekli")
+    if get_firestore_db() is None:
+        parser.error("Firebase bağlantısı kurulamadı (FIREBASE_KEY)")
+
+    logging.getLogger('yks').setLevel(logging.INFO)
+    plan_time = datetime.strptime(args.date, '%Y-%m-%d') if args.date else next_monday()
+    _, failed = run_batch(args.cache_dir, plan_time, args.workers)
+    raise SystemExit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+📦 Statik Veri Deposu
+Müfredat, haftalık planlar, taban puanları ve test bankaları yks_app/data altındaki
+sürümlü JSON dosyalarında durur. İlk kullanımda marshal ile derlenir, sonraki süreçler
+derlenmiş halini okur. Her veri seti süreç başına bir kez yüklenir ve paylaşılır.
+"""
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+import sys
+import threading
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+# Derlenmiş dosyalar .pyc gibi __pycache__ altında tutulur (git'e girmez)
+COMPILED_DIR = os.environ.get('YKS_DATA_CACHE_DIR', os.path.join(DATA_DIR, '__pycache__'))
+COMPILED_TAG = f"py{sys.version_info[0]}{sys.version_info[1]}"
+
+logger = logging.getLogger('yks.data')
+
+_datasets = {}
+_versions = {}
+_lock = threading.Lock()
+
+def _restore_int_keys(data):
+    """JSON'da string'e dönen tamsayı üst anahtarları geri çevirir (hafta numaraları)"""
+    return {int(key): value for key, value in data.items()}
+
+def _compile(name, raw):
+    """JSON zarfını çözer: {"name", "version", "int_keys", "data"}"""
+    envelope = json.loads(raw)
+    data = envelope['data']
+    if envelope.get('int_keys'):
+        data = _restore_int_keys(data)
+    return envelope.get('version', 1), data
+
+def _read_compiled(path):
+    try:
+        with open(path, 'rb') as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+def _write_compiled(name, path, payload):
+    """Atomik yazım + eski sürümleri temizleme; salt okunur dosya sisteminde sessizce vazgeçer"""
+    try:
+        os.makedirs(COMPILED_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            marshal.dump(payload, f)
+        os.replace(tmp_path, path)
+        for file_name in os.listdir(COMPILED_DIR):
+            if file_name.startswith(f"{name}-") and file_name.endswith('.marshal') \
+                    and os.path.join(COMPILED_DIR, file_name) != path:
+                os.remove(os.path.join(COMPILED_DIR, file_name))
+    except OSError as e:
+        logger.warning("Derlenmiş veri yazılamadı (%s): %s", path, e)
+
+def _load(name):
+    source_path = os.path.join(DATA_DIR, f"{name}.json")
+    with open(source_path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()[:16]
+    compiled_path = os.path.join(COMPILED_DIR, f"{name}-{digest}.{COMPILED_TAG}.marshal")
+
+    payload = _read_compiled(compiled_path)
+    if payload is None:
+        payload = _compile(name, raw)
+        _write_compiled(name, compiled_path, payload)
+        logger.info("Veri seti derlendi: %s (v%s)", name, payload[0])
+    return payload
+
+def load_dataset(name):
+    """Veri setini döndürür - süreç içinde ilk çağrıda yüklenir, sonra paylaşılır"""
+    data = _datasets.get(name)
+    if data is not None:
+        return data
+    with _lock:
+        if name not in _datasets:
+            version, data = _load(name)
+            _versions[name] = version
+            _datasets[name] = data
+        return _datasets[name]
+
+def get_dataset_version(name):
+    """Yüklenmiş veri setinin sürüm numarası"""
+    load_dataset(name)
+    return _versions[name]
@@ -0,0 +1,1083 @@
+"""
+🎞️ YKS Yolculuk Filmi
+Sinema sayfasının film paketini üretir: gün verisi, oynatıcı şablonu ve markup tek bir
+içerik özetli pakette toplanır. Paket (kullanıcı, son veri değişikliği) ile anahtarlanır;
+oturum → süreç → disk sırasıyla aranır, yeni gün eklendiğinde arka plan işi (journey_film_refresh) yeniden üretir.
+Zamanlayıcı yalnızca lider süreçte çalışır: önceden üretim yalnızca YKS_JOURNEY_FILM_CACHE_DIR (tüm
+süreçlerin paylaştığı disk dizini) tanımlıysa yapılır; tanımlı değilse paketler ilk izlemede üretilir.
+"""
+
+import html
+import pickle
+import re
+from collections import OrderedDict
+
+from yks_app.core import *
+
+# === 🎞️ FİLM VERİSİ ===
+WEEKDAY_NAMES = ['Pazartesi', 'Salı', 'Çarşamba', 'Perşembe', 'Cuma', 'Cumartesi', 'Pazar']
+JOURNEY_MAX_DAYS = 30
+JOURNEY_MUSIC_URL = ("https://www.youtube.com/embed/V9FW37WkIf0"
+                     "?autoplay=1&loop=1&playlist=V9FW37WkIf0&controls=0&mute=0&start=0")
+# Oynatıcıya gönderilen gün alanları
+JOURNEY_PLAYER_FIELDS = ('day_number', 'date_label', 'weekday', 'motivation_score', 'daily_note',
+                         'photo_data', 'photo_caption', 'questions_solved', 'total_questions',
+                         'completed_topics', 'tyt_progress', 'ayt_progress', 'daily_achievement')
+
+def _load_json_field(user_data, field, default):
+    value = user_data.get(field, default)
+    return json.loads(value) if isinstance(value, str) else value
+
+def build_journey_days(user_data, start_date, days_passed):
+    """Film günlerini kurar - ilk JOURNEY_MAX_DAYS gün"""
+    try:
+        daily_motivation = _load_json_field(user_data, 'daily_motivation', '{}')
+        # Günlük pomodoro özetleri: gün başına konu sayıları hazır
+        pomodoro_rollups = load_pomodoro_rollups(user_data)
+        exam_data = _load_json_field(user_data, 'exam_data', '{}')
+    except:
+        daily_motivation = {}
+        pomodoro_rollups = {}
+        exam_data = {}
+    
+    journey_days = []
+    for i in range(min(days_passed, JOURNEY_MAX_DAYS)):
+        day_date = start_date + timedelta(days=i)
+        date_str = day_date.strftime('%Y-%m-%d')
+        
+        # Günlük veri yapısı
+        day_data = {
+            'date': day_date,
+            'date_label': day_date.strftime('%d.%m.%Y'),
+            'weekday': WEEKDAY_NAMES[day_date.weekday()],
+            'day_number': i + 1,
+            'motivation_score': 5,
+            'daily_note': '',
+            'photo_data': None,
+            'photo_caption': '',
+            'questions_solved': {},
+            'total_questions': 0,
+            'completed_topics': [],
+            'review_topics': [],
+            'exam_taken': False,
+            'exam_scores': {},
+            'tyt_progress': 0,
+            'ayt_progress': 0,
+            'daily_achievement': ''
+        }
+        
+        # Günlük motivasyon verilerini al
+        if date_str in daily_motivation:
+            day_motivation = daily_motivation[date_str]
+            day_data['motivation_score'] = day_motivation.get('score', 5)
+            day_data['daily_note'] = day_motivation.get('note', '')
+            
+            # Base64 fotoğrafı data URI formatına çevir
+            photo_info = day_motivation.get('photo_data', None)
+            if photo_info and isinstance(photo_info, dict) and 'data' in photo_info:
+                photo_type = photo_info.get('type', 'image/jpeg')
+                day_data['photo_data'] = f"data:{photo_type};base64,{photo_info['data']}"
+                day_data['photo_filename'] = photo_info.get('filename', 'Fotoğraf')
+            else:
+                day_data['photo_filename'] = ''
+            
+            day_data['photo_caption'] = day_motivation.get('photo_caption', '')
+            
+            # Soru takibi verilerini al
+            questions_data = day_motivation.get('questions', {})
+            day_data['questions_solved'] = questions_data
+            day_data['total_questions'] = sum([int(v) for v in questions_data.values() if str(v).isdigit()])
+        
+        # Günün pomodorolarında çalışılan konular
+        topics_completed = pomodoro_rollups.get(date_str, {}).get('by_topic', {})
+        day_data['completed_topics'] = list(topics_completed)[:3]
+        
+        # Deneme verileri kontrol et
+        if date_str in exam_data:
+            day_data['exam_taken'] = True
+            day_data['exam_scores'] = exam_data[date_str]
+        
+        # TYT-AYT ilerleme hesapla (simulated)
+        day_data['tyt_progress'] = min(i * 2, 100)
+        day_data['ayt_progress'] = min(i * 1.5, 100)
+        
+        # Günlük başarı mesajı oluştur
+        if day_data['total_questions'] > 20:
+            day_data['daily_achievement'] = f"🔥 {day_data['total_questions']} soru çözdün!"
+        elif len(day_data['completed_topics']) > 2:
+            day_data['daily_achievement'] = f"📚 {len(day_data['completed_topics'])} konu tamamladın!"
+        elif day_data['motivation_score'] >= 8:
+            day_data['daily_achievement'] = "⭐ Süper motivasyonla çalıştın!"
+        else:
+            day_data['daily_achievement'] = "💪 YKS yolunda bir adım daha!"
+        
+        journey_days.append(day_data)
+    
+    return journey_days
+
+
+def get_journey_start_date(user_data):
+    """Filmin ilk günü - kullanıcı kayıt tarihi (created_at, yoksa created_date)"""
+    try:
+        # Önce created_at (ISO format) kontrol et
+        if 'created_at' in user_data and user_data['created_at']:
+            if isinstance(user_data['created_at'], str):
+                # ISO format: 2024-10-12T14:30:00.123456
+                return datetime.fromisoformat(user_data['created_at'].replace('Z', '+00:00')).replace(tzinfo=None)
+            return user_data['created_at']
+        
+        # Eğer created_at yoksa created_date kontrol et (eski format)
+        if 'created_date' in user_data and user_data['created_date']:
+            return datetime.strptime(user_data['created_date'], '%Y-%m-%d')
+    except Exception:
+        pass
+    # Hiçbiri yoksa veya hatalıysa güvenli varsayılan
+    return current_time() - timedelta(days=1)
+
+def get_journey_day_count(start_date):
+    """Filmdeki gün sayısı - bugüne kadar geçen günler, en fazla JOURNEY_MAX_DAYS"""
+    return max(0, min((current_time() - start_date).days + 1, JOURNEY_MAX_DAYS))
+
+# === 📦 FİLM PAKETİ CACHE ===
+# Paket (kullanıcı, kaynak özeti) ile anahtarlanır. Özet filmi etkileyen alanları ve gün sayısını
+# içerir; yeni bir gün eklendiğinde ya da motivasyon/pomodoro/deneme verisi değiştiğinde anahtar değişir.
+# Oynatma ayarları (hız, müzik) pakete girmez, sunarken ayrı bir <script> ayar bloğuyla verilir.
+JOURNEY_FILM_INPUT_FIELDS = ('name', 'daily_motivation', 'pomodoro_history', POMODORO_ROLLUP_FIELD, 'exam_data')
+JOURNEY_FILM_FORMAT_VERSION = 2  # Şablon biçimi değişince artırılır; eski (diskteki) paketler geçersiz olur
+JOURNEY_PLACEHOLDER_PATTERN = re.compile(r'__(?:CURTAIN_HTML|STUDENT_NAME|MUSIC_URL|JOURNEY_DAYS)__')
+JOURNEY_FILM_CACHE_LIMIT = 32  # Süreç genelinde tutulan paket sayısı (fotoğraflı paketler büyük)
+# Opsiyonel disk kalıcılığı: tanımlıysa paketler bu dizine yazılır, yeni süreçler de okur
+JOURNEY_FILM_CACHE_DIR = os.environ.get('YKS_JOURNEY_FILM_CACHE_DIR')
+
+@st.cache_resource
+def get_journey_film_store():
+    """Süreç genelinde paylaşılan film paketi cache'i (LRU)"""
+    return {'lock': threading.Lock(), 'bundles': OrderedDict()}
+
+def get_journey_film_key(user_data):
+    """(kullanıcı, kaynak özeti) anahtarı"""
+    start_date = get_journey_start_date(user_data)
+    digest = hashlib.sha1(f"v{JOURNEY_FILM_FORMAT_VERSION}".encode('utf-8'))
+    for field in JOURNEY_FILM_INPUT_FIELDS:
+        value = user_data.get(field, '')
+        digest.update((value if isinstance(value, str) else json.dumps(value, sort_keys=True, default=str)).encode('utf-8'))
+        digest.update(b'\0')
+    digest.update(f"{start_date:%Y-%m-%d}:{get_journey_day_count(start_date)}".encode('utf-8'))
+    return (user_data.get('username', ''), digest.hexdigest()[:16])
+
+def summarize_journey_days(journey_days):
+    """Başlatma ekranındaki yolculuk özeti"""
+    total_days = len(journey_days)
+    return {
+        'total_days': total_days,
+        'total_questions': sum(day['total_questions'] for day in journey_days),
+        'avg_motivation': sum(day['motivation_score'] for day in journey_days) / max(total_days, 1),
+        'total_topics': sum(len(day['completed_topics']) for day in journey_days),
+    }
+
+def build_journey_film_bundle(user_data, cache_key=None):
+    """Film paketini üretir: markup + gün verisi tek HTML'de, içerik özeti (etag) ile"""
+    cache_key = cache_key or get_journey_film_key(user_data)
+    start_date = get_journey_start_date(user_data)
+    journey_days = build_journey_days(user_data, start_date, get_journey_day_count(start_date))
+    
+    # </script> kaçışı: veri script etiketi içine gömülüyor
+    player_json = json.dumps([{field: day.get(field) for field in JOURNEY_PLAYER_FIELDS}
+                              for day in journey_days],
+                             ensure_ascii=False, default=str).replace('</', '<\\/')
+    # Tek geçişte doldurulur: yazılan kullanıcı içeriği başka bir yer tutucu olarak yeniden taranmaz
+    values = {
+        '__CURTAIN_HTML__': JOURNEY_CURTAIN_HTML,
+        '__STUDENT_NAME__': html.escape(user_data.get('name', 'Öğrenci')),
+        '__MUSIC_URL__': JOURNEY_MUSIC_URL,
+        '__JOURNEY_DAYS__': player_json,
+    }
+    markup = JOURNEY_PLACEHOLDER_PATTERN.sub(lambda match: values[match.group(0)], JOURNEY_PLAYER_TEMPLATE)
+    return {
+        'key': cache_key,
+        'etag': hashlib.sha1(markup.encode('utf-8')).hexdigest()[:16],
+        'html': markup,
+        'summary': summarize_journey_days(journey_days),
+        'built_at': current_time().isoformat(timespec='seconds'),
+    }
+
+def _journey_film_path(cache_key, cache_dir):
+    username, digest = cache_key
+    user_hash = hashlib.sha1(username.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{user_hash}-{digest}.pickle"), user_hash
+
+def _read_persisted_bundle(cache_key):
+    path, _ = _journey_film_path(cache_key, JOURNEY_FILM_CACHE_DIR)
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+def persist_journey_film_bundle(bundle, cache_dir=None):
+    """Paketi diske yazar (atomik) ve kullanıcının eski paketlerini temizler"""
+    cache_dir = cache_dir or JOURNEY_FILM_CACHE_DIR
+    path, user_hash = _journey_film_path(bundle['key'], cache_dir)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        for file_name in os.listdir(cache_dir):
+            if file_name.startswith(f"{user_hash}-") and file_name.endswith('.pickle') \
+                    and os.path.join(cache_dir, file_name) != path:
+                os.remove(os.path.join(cache_dir, file_name))
+    except (OSError, pickle.PicklingError, TypeError) as e:
+        logger.warning("Film paketi diske yazılamadı: %s", e)
+
+def store_journey_film_bundle(bundle):
+    """Paketi süreç cache'ine ve (açıksa) diske yazar; kullanıcının eski paketi düşer"""
+    username = bundle['key'][0]
+    store = get_journey_film_store()
+    with store['lock']:
+        for cache_key in [key for key in store['bundles'] if key[0] == username]:
+            del store['bundles'][cache_key]
+        store['bundles'][bundle['key']] = bundle
+        while len(store['bundles']) > JOURNEY_FILM_CACHE_LIMIT:
+            store['bundles'].popitem(last=False)
+    if JOURNEY_FILM_CACHE_DIR:
+        persist_journey_film_bundle(bundle)
+
+def get_journey_film_bundle(user_data):
+    """Oturum → süreç → disk sırasıyla paketi arar; bulunamazsa üretip saklar"""
+    cache_key = get_journey_film_key(user_data)
+    session_cache = get_session_store().setdefault('journey_film_cache', {})
+    bundle = session_cache.get(cache_key[0])
+    if bundle is not None and bundle['key'] == cache_key:
+        return bundle
+    
+    store = get_journey_film_store()
+    with store['lock']:
+        bundle = store['bundles'].get(cache_key)
+        if bundle is not None:
+            store['bundles'].move_to_end(cache_key)
+    if bundle is None and JOURNEY_FILM_CACHE_DIR:
+        bundle = _read_persisted_bundle(cache_key)
+        if bundle is not None:
+            with store['lock']:
+                store['bundles'][cache_key] = bundle
+    if bundle is None:
+        bundle = build_journey_film_bundle(user_data, cache_key)
+        store_journey_film_bundle(bundle)
+    
+    # Paket salt okunur kullanılır; kopya gerekmez
+    session_cache[cache_key[0]] = bundle
+    return bundle
+
+def render_journey_film_html(bundle, day_duration, music_enabled):
+    """Oynatma ayarlarını paketten önce ayrı bir script bloğunda verir (paket markup'ına dokunulmaz)"""
+    settings = json.dumps({'dayDuration': float(day_duration), 'musicEnabled': bool(music_enabled)})
+    return f"<script>const JOURNEY_SETTINGS = {settings};</script>\n{bundle['html']}"
+
+def _cached_film_usernames():
+    """Paketi daha önce üretilmiş (filmi izlemiş) kullanıcılar: süreç cache'i + disk"""
+    store = get_journey_film_store()
+    with store['lock']:
+        usernames = {key[0] for key in store['bundles']}
+    user_hashes = set()
+    if JOURNEY_FILM_CACHE_DIR and os.path.isdir(JOURNEY_FILM_CACHE_DIR):
+        user_hashes = {file_name.split('-', 1)[0] for file_name in os.listdir(JOURNEY_FILM_CACHE_DIR)
+                       if file_name.endswith('.pickle')}
+    return usernames, user_hashes
+
+def refresh_journey_film_bundles():
+    """Yeni gün eklenen veya verisi değişen filmlerin paketini önceden yeniden üretir"""
+    # İş yalnızca lider süreçte çalışır; paylaşılan disk dizini yoksa ürettiği paket diğer süreçlere ulaşmaz
+    if not JOURNEY_FILM_CACHE_DIR:
+        return
+    usernames, user_hashes = _cached_film_usernames()
+    if not usernames and not user_hashes:
+        return
+    
+    store = get_journey_film_store()
+    for username, user_data in load_all_users_direct().items():
+        if not isinstance(user_data, dict):
+            continue
+        if username not in usernames and \
+                hashlib.sha1(username.encode('utf-8')).hexdigest()[:12] not in user_hashes:
+            continue
+        user_data.setdefault('username', username)
+        try:
+            cache_key = get_journey_film_key(user_data)
+            with store['lock']:
+                fresh = cache_key in store['bundles']
+            if fresh or os.path.exists(_journey_film_path(cache_key, JOURNEY_FILM_CACHE_DIR)[0]):
+                continue
+            store_journey_film_bundle(build_journey_film_bundle(user_data, cache_key))
+        except Exception as e:
+            logger.error("Film paketi yenilenemedi (%s): %s", username, e)
+
+# === 🎥 OYNATICI ŞABLONU ===
+# Sinema perdesi açılış animasyonu (film başında ve tekrar izlemede gösterilir)
+JOURNEY_CURTAIN_HTML = """
+<style>
+.cinema-stage {
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: radial-gradient(circle at center, #1a0000 0%, #000000 100%);
+    z-index: 999999;
+    overflow: hidden;
+    box-shadow: inset 0 0 100px rgba(139, 0, 0, 0.3);
+}
+
+.curtain-backdrop {
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: radial-gradient(ellipse at center, #2d1b1b 0%, #1a0a0a 50%, #000000 100%);
+    animation: backdrop-glow 6s ease-in-out;
+}
+
+@keyframes backdrop-glow {
+    0% { background: #000000; }
+    30% { background: radial-gradient(ellipse at center, #2d1b1b 0%, #1a0a0a 50%, #000000 100%); }
+    100% { background: #000000; }
+}
+
+@keyframes curtain-left-open {
+    0% { 
+        transform: translateX(0) scaleY(1);
+        opacity: 1;
+        box-shadow: 15px 0 40px rgba(0,0,0,0.9), inset -30px 0 50px rgba(0,0,0,0.4);
+    }
+    15% {
+        transform: translateX(-3%) scaleY(0.99);
+        opacity: 0.98;
+    }
+    30% {
+        transform: translateX(-10%) scaleY(0.96);
+        opacity: 0.95;
+    }
+    60% {
+        transform: translateX(-70%) scaleY(0.92);
+        opacity: 0.8;
+    }
+    80% {
+        transform: translateX(-90%) scaleY(0.88);
+        opacity: 0.5;
+    }
+    100% { 
+        transform: translateX(-110%) scaleY(0.85);
+        opacity: 0;
+        visibility: hidden;
+    }
+}
+
+@keyframes curtain-right-open {
+    0% { 
+        transform: translateX(0) scaleY(1);
+        opacity: 1;
+        box-shadow: -15px 0 40px rgba(0,0,0,0.9), inset 30px 0 50px rgba(0,0,0,0.4);
+    }
+    15% {
+        transform: translateX(3%) scaleY(0.99);
+        opacity: 0.98;
+    }
+    30% {
+        transform: translateX(10%) scaleY(0.96);
+        opacity: 0.95;
+    }
+    60% {
+        transform: translateX(70%) scaleY(0.92);
+        opacity: 0.8;
+    }
+    80% {
+        transform: translateX(90%) scaleY(0.88);
+        opacity: 0.5;
+    }
+    100% { 
+        transform: translateX(110%) scaleY(0.85);
+        opacity: 0;
+        visibility: hidden;
+    }
+}
+
+@keyframes stage-fadeout {
+    0% { opacity: 1; }
+    85% { opacity: 1; }
+    100% { opacity: 0; visibility: hidden; }
+}
+
+.curtain-left {
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 52%;
+    height: 100%;
+    background: linear-gradient(90deg, 
+        #8B0000 0%,    /* Dark Red */
+        #B22222 15%,   /* Fire Brick */
+        #DC143C 30%,   /* Crimson */
+        #FF0000 45%,   /* Red */
+        #DC143C 60%,   /* Crimson */
+        #B22222 80%,   /* Fire Brick */
+        #8B0000 100%   /* Dark Red */
+    );
+    background-image: 
+        repeating-linear-gradient(0deg, transparent 0px, rgba(255,255,255,0.03) 2px, transparent 4px),
+        repeating-linear-gradient(90deg, transparent 0px, rgba(0,0,0,0.1) 1px, transparent 2px);
+    box-shadow: 
+        15px 0 40px rgba(0,0,0,0.9),
+        inset -30px 0 50px rgba(0,0,0,0.4),
+        inset 0 0 30px rgba(255,215,0,0.1);
+    animation: curtain-left-open 6s ease-in-out forwards;
+    border-right: 6px solid #FFD700;
+    border-image: linear-gradient(180deg, #FFD700 0%, #FFA500 50%, #FFD700 100%) 1;
+    transform-origin: left center;
+}
+
+.curtain-right {
+    position: absolute;
+    top: 0;
+    right: 0;
+    width: 52%;
+    height: 100%;
+    background: linear-gradient(270deg, 
+        #8B0000 0%,    /* Dark Red */
+        #B22222 15%,   /* Fire Brick */
+        #DC143C 30%,   /* Crimson */
+        #FF0000 45%,   /* Red */
+        #DC143C 60%,   /* Crimson */
+        #B22222 80%,   /* Fire Brick */
+        #8B0000 100%   /* Dark Red */
+    );
+    background-image: 
+        repeating-linear-gradient(0deg, transparent 0px, rgba(255,255,255,0.03) 2px, transparent 4px),
+        repeating-linear-gradient(90deg, transparent 0px, rgba(0,0,0,0.1) 1px, transparent 2px);
+    box-shadow: 
+        -15px 0 40px rgba(0,0,0,0.9),
+        inset 30px 0 50px rgba(0,0,0,0.4),
+        inset 0 0 30px rgba(255,215,0,0.1);
+    animation: curtain-right-open 6s ease-in-out forwards;
+    border-left: 6px solid #FFD700;
+    border-image: linear-gradient(180deg, #FFD700 0%, #FFA500 50%, #FFD700 100%) 1;
+    transform-origin: right center;
+}
+
+.curtain-top-border {
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 50px;
+    background: linear-gradient(180deg, 
+        #FFD700 0%, 
+        #FFA500 25%, 
+        #FF8C00 50%, 
+        #FFA500 75%, 
+        #B8860B 100%
+    );
+    box-shadow: 
+        0 8px 25px rgba(0,0,0,0.7),
+        inset 0 -10px 20px rgba(0,0,0,0.3);
+    z-index: 10;
+    border-bottom: 3px solid #8B0000;
+}
+
+.curtain-tassels {
+    position: absolute;
+    top: 50px;
+    width: 100%;
+    height: 80px;
+    background: repeating-linear-gradient(
+        90deg,
+        #FFD700 0px, #FFD700 20px,
+        #FFA500 20px, #FFA500 30px,
+        #FF8C00 30px, #FF8C00 35px,
+        #FFA500 35px, #FFA500 40px
+    );
+    opacity: 0.9;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.5);
+    animation: tassel-sway 6s ease-in-out infinite;
+}
+
+@keyframes tassel-sway {
+    0%, 100% { transform: translateY(0px); }
+    50% { transform: translateY(3px); }
+}
+
+.cinema-stage {
+    animation: stage-fadeout 6.5s ease-in-out forwards;
+}
+
+.cinema-logo {
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    transform: translate(-50%, -50%);
+    color: #FFD700;
+    font-size: 4rem;
+    font-family: 'Georgia', serif;
+    text-shadow: 
+        3px 3px 6px rgba(0,0,0,0.8),
+        0 0 20px rgba(255,215,0,0.3),
+        0 0 40px rgba(255,215,0,0.2);
+    opacity: 0;
+    animation: logo-dramatic-entrance 6s ease-in-out;
+    text-align: center;
+    line-height: 1.2;
+}
+
+@keyframes logo-dramatic-entrance {
+    0% { 
+        opacity: 0; 
+        transform: translate(-50%, -50%) scale(0.5);
+        filter: blur(10px);
+    }
+    20% { 
+        opacity: 0.3; 
+        transform: translate(-50%, -50%) scale(0.8);
+        filter: blur(5px);
+    }
+    40% { 
+        opacity: 1; 
+        transform: translate(-50%, -50%) scale(1.1);
+        filter: blur(0px);
+    }
+    60% { 
+        opacity: 1; 
+        transform: translate(-50%, -50%) scale(1);
+        filter: blur(0px);
+    }
+    80% { 
+        opacity: 0.8; 
+        transform: translate(-50%, -50%) scale(0.95);
+    }
+    100% { 
+        opacity: 0; 
+        transform: translate(-50%, -50%) scale(0.9);
+        filter: blur(2px);
+    }
+}
+
+.spotlight {
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    width: 400px;
+    height: 400px;
+    border-radius: 50%;
+    background: radial-gradient(circle, rgba(255,215,0,0.3) 0%, transparent 70%);
+    transform: translate(-50%, -50%);
+    animation: spotlight-pulse 6s ease-in-out;
+    pointer-events: none;
+}
+
+@keyframes spotlight-pulse {
+    0% { opacity: 0; transform: translate(-50%, -50%) scale(0.5); }
+    30% { opacity: 0.8; transform: translate(-50%, -50%) scale(1.2); }
+    70% { opacity: 0.6; transform: translate(-50%, -50%) scale(1); }
+    100% { opacity: 0; transform: translate(-50%, -50%) scale(0.8); }
+}
+
+.curtain-rope-left {
+    position: absolute;
+    top: 130px;
+    left: 48%;
+    width: 8px;
+    height: 200px;
+    background: linear-gradient(180deg, #8B4513 0%, #654321 100%);
+    border-radius: 4px;
+    box-shadow: 2px 0 5px rgba(0,0,0,0.5);
+    animation: rope-pull 6s ease-in-out;
+}
+
+.curtain-rope-right {
+    position: absolute;
+    top: 130px;
+    right: 48%;
+    width: 8px;
+    height: 200px;
+    background: linear-gradient(180deg, #8B4513 0%, #654321 100%);
+    border-radius: 4px;
+    box-shadow: -2px 0 5px rgba(0,0,0,0.5);
+    animation: rope-pull 6s ease-in-out;
+}
+
+@keyframes rope-pull {
+    0% { transform: translateY(0); }
+    30% { transform: translateY(-20px); }
+    60% { transform: translateY(-40px); }
+    100% { transform: translateY(-60px); opacity: 0; }
+}
+</style>
+
+<div class="cinema-stage">
+    <div class="curtain-backdrop"></div>
+    <div class="spotlight"></div>
+    <div class="curtain-top-border"></div>
+    <div class="curtain-tassels"></div>
+    <div class="curtain-rope-left"></div>
+    <div class="curtain-rope-right"></div>
+    <div class="curtain-left"></div>
+    <div class="curtain-right"></div>
+    <div class="cinema-logo">🎭<br/>YKS Hikayesi<br/>Başlıyor...</div>
+</div>
+"""
+
+# __PLACEHOLDER__ alanları build_journey_film_bundle'da doldurulur (JS süslü parantezleri f-string'e uymaz);
+# oynatma ayarları render_journey_film_html'in JOURNEY_SETTINGS bloğundan okunur
+JOURNEY_PLAYER_TEMPLATE = """
+<style>
+    body {
+        margin: 0;
+        background: transparent;
+        font-family: 'Arial', sans-serif;
+    }
+    #cinema-content-wrapper {
+        position: relative;
+        overflow: hidden;
+    }
+    .cinema-day-card {
+        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+        border: 6px solid #ffd700;
+        border-radius: 15px;
+        padding: 30px;
+        margin: 20px 0;
+        color: white;
+        box-shadow: 0 10px 25px rgba(255, 215, 0, 0.2);
+        max-width: 100%;
+        height: 720px;
+        box-sizing: border-box;
+        overflow-x: hidden;
+        overflow-y: auto;
+        animation: day-fade-in 0.6s ease-in-out;
+    }
+    @keyframes day-fade-in {
+        0% { opacity: 0; transform: translateY(10px); }
+        100% { opacity: 1; transform: translateY(0); }
+    }
+    .data-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+        gap: 15px;
+        margin: 25px 0;
+    }
+    @media (max-width: 768px) {
+        .data-grid {
+            grid-template-columns: 1fr !important;
+            gap: 10px !important;
+        }
+    }
+
+    /* Tam ekran için scrollbar stilleri */
+    .cinema-day-card::-webkit-scrollbar { width: 8px; }
+    .cinema-day-card::-webkit-scrollbar-track { background: rgba(255, 215, 0, 0.1); border-radius: 4px; }
+    .cinema-day-card::-webkit-scrollbar-thumb { background: #ffd700; border-radius: 4px; }
+    .cinema-day-card::-webkit-scrollbar-thumb:hover { background: #ffed4e; }
+
+    .cinema-photo-container {
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        height: 450px;
+        overflow: hidden;
+        border-radius: 15px;
+        background: rgba(0,0,0,0.3);
+        margin: 20px 0;
+        padding: 10px;
+        box-sizing: border-box;
+        border: 2px solid #ffd700;
+    }
+    .cinema-photo-container img {
+        max-width: 100%;
+        max-height: 420px;
+        width: auto;
+        height: auto;
+        object-fit: contain;
+        border-radius: 12px;
+        border: 3px solid #ffd700;
+        box-shadow: 0 8px 25px rgba(255, 215, 0, 0.4);
+        transition: all 0.3s ease;
+    }
+    .cinema-photo-container img:hover {
+        transform: scale(1.02);
+        box-shadow: 0 12px 35px rgba(255, 215, 0, 0.6);
+    }
+
+    /* Tam ekran: oynatıcı tüm ekranı kaplar, gün kartı yüksekliğe uyar */
+    #cinema-content-wrapper.fullscreen {
+        background: #000;
+        padding: 20px;
+        box-sizing: border-box;
+        overflow-y: auto;
+    }
+    #cinema-content-wrapper.fullscreen .cinema-day-card {
+        height: calc(100vh - 200px);
+    }
+
+    .cinema-controls {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 10px;
+        justify-content: center;
+        margin: 10px 0;
+    }
+    .cinema-controls button {
+        padding: 10px 22px;
+        background: linear-gradient(45deg, #1a1a2e, #16213e);
+        color: #ffd700;
+        border: 2px solid #ffd700;
+        border-radius: 10px;
+        cursor: pointer;
+        font-size: 15px;
+        font-weight: bold;
+    }
+    .cinema-controls button:disabled {
+        opacity: 0.4;
+        cursor: default;
+    }
+    .cinema-controls button.fullscreen-btn {
+        background: linear-gradient(45deg, #ff6b6b, #ee5a24);
+        color: white;
+        border: none;
+        box-shadow: 0 4px 15px rgba(255, 107, 107, 0.4);
+    }
+    #status-info {
+        background: linear-gradient(45deg, #28a745, #20c997);
+        color: white; padding: 12px 20px; border-radius: 10px;
+        font-weight: bold; text-align: center; margin: 10px 0;
+        box-shadow: 0 2px 10px rgba(40, 167, 69, 0.3);
+    }
+    .film-progress {
+        height: 8px;
+        background: rgba(255, 215, 0, 0.2);
+        border-radius: 4px;
+        overflow: hidden;
+    }
+    .film-progress-bar {
+        height: 100%;
+        background: #ffd700;
+        transition: width 0.3s ease;
+    }
+    .film-captions {
+        display: flex;
+        justify-content: space-between;
+        color: #888;
+        font-size: 0.85rem;
+        margin-top: 6px;
+    }
+    .film-end {
+        position: absolute;
+        inset: 0;
+        display: none;
+        flex-direction: column;
+        justify-content: center;
+        align-items: center;
+        background: rgba(0, 0, 0, 0.85);
+        color: #ffd700;
+        text-align: center;
+        z-index: 1000;
+    }
+    .film-end h2 { font-size: 2.5rem; margin: 0 0 10px 0; }
+    .film-end p { color: #ffffff; font-size: 1.2rem; }
+    .film-music {
+        position: absolute;
+        top: -200px;
+        left: -200px;
+        opacity: 0.01;
+        pointer-events: none;
+    }
+</style>
+
+<div id="cinema-content-wrapper">
+    <div id="curtain-slot"></div>
+    <div id="day-card" class="cinema-day-card"></div>
+
+    <div class="cinema-controls">
+        <button id="prev-btn" onclick="prevDay()">⏮️ Önceki</button>
+        <button id="play-btn" onclick="togglePlay()">⏸️ Duraklat</button>
+        <button id="next-btn" onclick="nextDay()">⏭️ Sonraki</button>
+        <button onclick="replay()">🔄 Tekrar İzle</button>
+        <button id="fullscreen-btn" class="fullscreen-btn" onclick="toggleFullscreenMode()">🖼️ Tam Ekran</button>
+    </div>
+
+    <div id="status-info">
+        <span id="music-status">🎵 Müzik Durumu</span> |
+        <span id="screen-status">🪟 Normal Mod</span> |
+        <span id="day-status">📅 Gün: 1/1</span>
+    </div>
+
+    <div class="film-progress"><div id="film-progress-bar" class="film-progress-bar"></div></div>
+    <div class="film-captions">
+        <span id="progress-caption"></span>
+        <span id="countdown-caption"></span>
+    </div>
+
+    <div id="film-end" class="film-end">
+        <h2>🎉 Hikaye Tamamlandı!</h2>
+        <p>__STUDENT_NAME__'nin başarı hikayesi tamamlandı!</p>
+        <div class="cinema-controls"><button onclick="replay()">🔄 Tekrar İzle</button></div>
+    </div>
+
+    <div id="film-music" class="film-music"></div>
+</div>
+
+<template id="curtain-template">
+__CURTAIN_HTML__
+</template>
+
+<script>
+// Tüm film verisi tek seferde gömülür; oynatma, gün geçişleri, müzik ve tam ekran
+// tamamen tarayıcıda çalışır (sunucuya rerun gönderilmez)
+const DAYS = __JOURNEY_DAYS__;
+const DAY_MS = JOURNEY_SETTINGS.dayDuration * 1000;
+const MUSIC_ENABLED = JOURNEY_SETTINGS.musicEnabled;
+const MUSIC_URL = "__MUSIC_URL__";
+
+let dayIndex = 0;
+let playing = true;
+let musicPlaying = MUSIC_ENABLED;
+let isFullscreen = false;
+let dayTimer = null;
+let dayStartedAt = Date.now();
+let remainingMs = DAY_MS;
+
+function esc(value) {
+    const div = document.createElement('div');
+    div.textContent = value == null ? '' : String(value);
+    return div.innerHTML;
+}
+
+function photoBlock(day) {
+    if (day.photo_data && day.photo_data.length > 50) {
+        return `
+        <div style="text-align: center; margin-top: 25px; padding: 20px; background: rgba(255, 215, 0, 0.08); border-radius: 15px; border: 2px solid rgba(255, 215, 0, 0.3);">
+            <h4 style="color: #ffd700; margin-bottom: 20px; font-size: 1.4rem; text-shadow: 1px 1px 3px rgba(0,0,0,0.5);">📷 Günün Fotoğrafı</h4>
+            <div class="cinema-photo-container">
+                <img src="${esc(day.photo_data)}" alt="Günün Fotoğrafı"
+                     onerror="this.replaceWith(document.createTextNode('📸 Fotoğraf'));">
+            </div>
+            <p style="color: #e0e0e0; font-size: 1rem; margin-top: 15px; font-style: italic;">"${esc(day.photo_caption || 'Fotoğraf açıklaması eklenmemiş')}"</p>
+        </div>`;
+    }
+    return `
+        <div style="text-align: center; margin-top: 20px; padding: 15px; background: rgba(255, 193, 7, 0.1); border-radius: 10px; border: 2px dashed #ffc107;">
+            <h4 style="color: #ffc107; margin-bottom: 15px;">📷 Günün Anısı</h4>
+            <div style="color: #ffc107; font-size: 4rem; margin: 20px 0;">🌅</div>
+            <p style="color: #ffc107; font-size: 1.1rem; margin: 10px 0; font-weight: 500;">Bu günün özel anları fotoğrafa çekilmemiş</p>
+            <p style="color: #888888; font-size: 0.9rem;">Gelecekte hatırlamak için fotoğraf eklemeyi unutma!</p>
+        </div>`;
+}
+
+function renderDay() {
+    const day = DAYS[dayIndex];
+    const questions = Object.entries(day.questions_solved || {})
+        .filter(([, value]) => value).map(([key, value]) => `${key}: ${value}`).join(', ');
+
+    const card = document.getElementById('day-card');
+    card.innerHTML = `
+        <div style="text-align: center; margin-bottom: 25px;">
+            <h2 style="color: #ffd700; font-size: 2.5rem; margin: 0; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);">
+                📅 ${day.day_number}. Gün
+            </h2>
+            <p style="color: #ffffff; font-size: 1.3rem; margin: 5px 0;">${esc(day.date_label)} - ${esc(day.weekday)}</p>
+        </div>
+        <div class="data-grid">
+            <div style="background: rgba(255, 215, 0, 0.1); padding: 20px; border-radius: 10px; border-left: 4px solid #ffd700;">
+                <h4 style="color: #ffd700; margin: 0 0 10px 0;">⭐ Günlük Motivasyon</h4>
+                <p style="font-size: 1.5rem; margin: 5px 0;">${esc(day.motivation_score)}/10</p>
+                <p style="font-size: 0.9rem; color: #cccccc;">${esc(day.daily_note || 'Not girilmemiş')}</p>
+            </div>
+            <div style="background: rgba(76, 175, 80, 0.1); padding: 20px; border-radius: 10px; border-left: 4px solid #4CAF50;">
+                <h4 style="color: #4CAF50; margin: 0 0 10px 0;">❓ Çözülen Sorular</h4>
+                <p style="font-size: 1.5rem; margin: 5px 0;">${day.total_questions} soru</p>
+                <p style="font-size: 0.9rem; color: #cccccc;">${esc(questions || 'Veri girilmemiş')}</p>
+            </div>
+            <div style="background: rgba(33, 150, 243, 0.1); padding: 20px; border-radius: 10px; border-left: 4px solid #2196F3;">
+                <h4 style="color: #2196F3; margin: 0 0 10px 0;">📚 Tamamlanan Konular</h4>
+                <p style="font-size: 1.5rem; margin: 5px 0;">${day.completed_topics.length} konu</p>
+                <p style="font-size: 0.9rem; color: #cccccc;">${esc(day.completed_topics.slice(0, 2).join(', ') || 'Konu girilmemiş')}</p>
+            </div>
+            <div style="background: rgba(156, 39, 176, 0.1); padding: 20px; border-radius: 10px; border-left: 4px solid #9C27B0;">
+                <h4 style="color: #9C27B0; margin: 0 0 10px 0;">🎯 YKS İlerleme</h4>
+                <p style="font-size: 1.2rem; margin: 5px 0;">TYT: %${day.tyt_progress} | AYT: %${day.ayt_progress}</p>
+                <p style="font-size: 0.9rem; color: #cccccc;">Hedeflere doğru ilerliyor</p>
+            </div>
+        </div>
+        <div style="text-align: center; margin-top: 30px; padding: 20px; background: rgba(255, 215, 0, 0.1); border-radius: 10px;">
+            <h3 style="color: #ffd700; margin: 0 0 10px 0;">🏆 Günün Başarısı</h3>
+            <p style="font-size: 1.3rem; color: #ffffff; margin: 0;">${esc(day.daily_achievement)}</p>
+        </div>
+        ${photoBlock(day)}`;
+    // Animasyonu her gün için yeniden başlat
+    card.style.animation = 'none';
+    void card.offsetWidth;
+    card.style.animation = '';
+
+    document.getElementById('prev-btn').disabled = dayIndex === 0;
+    document.getElementById('next-btn').disabled = dayIndex >= DAYS.length - 1;
+    document.getElementById('day-status').textContent = `📅 Gün: ${dayIndex + 1}/${DAYS.length}`;
+    document.getElementById('progress-caption').textContent = `📊 İlerleme: ${dayIndex + 1}/${DAYS.length} gün`;
+    document.getElementById('film-progress-bar').style.width = `${(dayIndex + 1) / DAYS.length * 100}%`;
+}
+
+// --- Oynatma ---
+function scheduleNextDay() {
+    clearTimeout(dayTimer);
+    if (!playing) return;
+    dayStartedAt = Date.now();
+    dayTimer = setTimeout(advance, remainingMs);
+}
+
+function advance() {
+    if (dayIndex < DAYS.length - 1) {
+        dayIndex++;
+        remainingMs = DAY_MS;
+        renderDay();
+        scheduleNextDay();
+    } else {
+        // Film bitti
+        playing = false;
+        updatePlayButton();
+        document.getElementById('film-end').style.display = 'flex';
+    }
+}
+
+function goTo(index) {
+    dayIndex = Math.max(0, Math.min(DAYS.length - 1, index));
+    remainingMs = DAY_MS;
+    renderDay();
+    scheduleNextDay();
+}
+
+function prevDay() { goTo(dayIndex - 1); }
+function nextDay() { goTo(dayIndex + 1); }
+
+function togglePlay() {
+    // Hem film hem müzik kontrolü
+    if (playing) {
+        remainingMs = Math.max(0, remainingMs - (Date.now() - dayStartedAt));
+        playing = false;
+        clearTimeout(dayTimer);
+        setMusic(false);
+    } else {
+        playing = true;
+        if (remainingMs <= 0) remainingMs = DAY_MS;
+        setMusic(MUSIC_ENABLED);
+        scheduleNextDay();
+    }
+    updatePlayButton();
+}
+
+function replay() {
+    document.getElementById('film-end').style.display = 'none';
+    playing = true;
+    showCurtain();
+    setMusic(MUSIC_ENABLED);
+    updatePlayButton();
+    goTo(0);
+}
+
+function updatePlayButton() {
+    document.getElementById('play-btn').textContent = playing ? '⏸️ Duraklat' : '▶️ Oynat';
+}
+
+function updateCountdown() {
+    const caption = document.getElementById('countdown-caption');
+    if (!playing) {
+        caption.textContent = '⏸️ Duraklatıldı';
+        return;
+    }
+    const remaining = (remainingMs - (Date.now() - dayStartedAt)) / 1000;
+    caption.textContent = remaining > 0 ? `⏰ Sonraki gün: ${remaining.toFixed(1)}s` : '⏰ Geçiş yapılıyor...';
+}
+
+// --- Müzik (gizli YouTube embed; duraklatınca kaldırılır) ---
+function setMusic(on) {
+    musicPlaying = on;
+    const slot = document.getElementById('film-music');
+    if (on && !slot.firstChild) {
+        slot.innerHTML = `<iframe width="100" height="100" src="${MUSIC_URL}" frameborder="0" allow="autoplay; encrypted-media"></iframe>`;
+    } else if (!on) {
+        slot.innerHTML = '';
+    }
+    document.getElementById('music-status').textContent = !MUSIC_ENABLED ? '🔇 Sessiz' : on ? '🎵 Çalıyor' : '🔇 Duraklatıldı';
+}
+
+// --- Sinema perdesi (ilk açılışta ve tekrar izlemede) ---
+function showCurtain() {
+    const slot = document.getElementById('curtain-slot');
+    slot.innerHTML = '';
+    slot.appendChild(document.getElementById('curtain-template').content.cloneNode(true));
+    setTimeout(() => { slot.innerHTML = ''; }, 6500);
+}
+
+// --- Tam ekran ---
+function isMobileDevice() {
+    return /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent);
+}
+
+function toggleFullscreenMode() {
+    const wrapper = document.getElementById('cinema-content-wrapper');
+    if (!isFullscreen) {
+        wrapper.classList.add('fullscreen');
+        const request = wrapper.requestFullscreen || wrapper.webkitRequestFullscreen ||
+                        wrapper.mozRequestFullScreen || wrapper.msRequestFullscreen;
+        if (request) {
+            Promise.resolve(request.call(wrapper)).catch(err => console.log('Native fullscreen desteklenmiyor:', err));
+        }
+        setFullscreenState(true);
+        showNotification(isMobileDevice() ? '📱 Mobil Tam Ekran Aktif!' : '🎬 PC Tam Ekran Aktif!');
+    } else {
+        const exit = document.exitFullscreen || document.webkitExitFullscreen ||
+                     document.mozCancelFullScreen || document.msExitFullscreen;
+        if (exit && (document.fullscreenElement || document.webkitFullscreenElement)) {
+            exit.call(document);
+        }
+        setFullscreenState(false);
+        showNotification('🪟 Normal moda döndü');
+    }
+}
+
+function setFullscreenState(state) {
+    isFullscreen = state;
+    document.getElementById('cinema-content-wrapper').classList.toggle('fullscreen', state);
+    document.getElementById('fullscreen-btn').textContent = state ? '🪟 Normal Mod (ESC)' : '🖼️ Tam Ekran';
+    document.getElementById('screen-status').textContent = state ? '🖼️ Tam Ekran AKTİF' : '🪟 Normal Mod';
+}
+
+// ESC tuşu veya native fullscreen çıkışını dinle
+['fullscreenchange', 'webkitfullscreenchange'].forEach(eventName => {
+    document.addEventListener(eventName, () => {
+        if (!(document.fullscreenElement || document.webkitFullscreenElement) && isFullscreen) {
+            setFullscreenState(false);
+        }
+    });
+});
+
+function showNotification(message) {
+    const existing = document.querySelector('.fullscreen-notification');
+    if (existing) existing.remove();
+
+    const notification = document.createElement('div');
+    notification.className = 'fullscreen-notification';
+    notification.textContent = message;
+    notification.style.cssText = 'position: fixed; top: 20px; left: 50%; transform: translateX(-50%);' +
+        'background: linear-gradient(45deg, #4CAF50, #45a049); color: white; padding: 15px 30px;' +
+        'border-radius: 25px; z-index: 9999999; font-size: 16px; font-weight: bold;' +
+        'border: 2px solid #ffd700; box-shadow: 0 8px 25px rgba(0,0,0,0.5);';
+    document.body.appendChild(notification);
+    setTimeout(() => notification.remove(), 2500);
+}
+
+// Başlat
+showCurtain();
+setMusic(MUSIC_ENABLED);
+renderDay();
+scheduleNextDay();
+setInterval(updateCountdown, 250);
+</script>
+"""
+
@@ -0,0 +1,48 @@
+"""
+🗂️ Sayfa kayıt defteri
+Her sayfa ayrı bir modüldür; ilk seçildiğinde import edilir ve sys.modules'ta cache'lenir.
+Böylece bir rerun yalnızca seçili sayfanın modülüne dokunur.
+"""
+
+import importlib
+
+# Sayfa etiketi -> (yks_app.pages altındaki modül, render fonksiyonu)
+PAGE_REGISTRY = {
+    "🏠 Ana Sayfa": ("home", "render"),
+    "📚 Konu Takip": ("topic_tracking", "render"),
+    "🧠 Çalışma Teknikleri": ("study_techniques", "render"),
+    "🎯 YKS Canlı Takip": ("yks_live", "render"),
+    "🍅 Pomodoro Timer": ("pomodoro", "render"),
+    "🏆 Rekabet Panosu": ("leaderboard", "render"),
+    "🧠 Psikolojim": ("psychology", "render"),
+    "🔬Detaylı Deneme Analiz Takibi": ("exam_analysis", "render"),
+    "📊 İstatistikler": ("stats", "render"),
+    "🎬 Filmi Başlat– İlk Günden Bugüne YKS Yolculuğum": ("journey_cinema", "render"),
+    "🎨 Öğrenme Stilleri Testi": ("psychology_tests", "render_learning_styles_test"),
+    "🧠 Bilişsel Profil Testi": ("psychology_tests", "render_cognitive_profile_test"),
+    "⚡ Motivasyon & Duygu Testi": ("psychology_tests", "render_motivation_emotional_test"),
+    "⏰ Zaman Yönetimi Testi": ("psychology_tests", "render_time_management_test"),
+}
+
+# Kenar çubuğunda görünen sayfalar (sırasıyla)
+SIDEBAR_PAGES = tuple(list(PAGE_REGISTRY)[:10])
+
+# st.session_state.page ile yönlendirilen test sayfaları
+ROUTED_PAGES = {
+    "learning_styles_test": "🎨 Öğrenme Stilleri Testi",
+    "cognitive_profile_test": "🧠 Bilişsel Profil Testi",
+    "motivation_emotional_test": "⚡ Motivasyon & Duygu Testi",
+    "time_management_test": "⏰ Zaman Yönetimi Testi",
+}
+
+def get_page_renderer(label):
+    """Sayfanın render fonksiyonunu döndürür - modül yalnızca ilk çağrıda import edilir"""
+    module_name, func_name = PAGE_REGISTRY[label]
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, func_name)
+
+def render_page(label, user_data=None, progress_data=None, target_dept=None):
+    """Seçili sayfayı çizer; kayıtlı olmayan etiketler sessizce atlanır"""
+    if label not in PAGE_REGISTRY:
+        return
+    get_page_renderer(label)(user_data, progress_data, target_dept)
@@ -0,0 +1,341 @@
+"""
+🔬 Detaylı Deneme Analiz Takibi sayfası
+Sayfa ilk seçildiğinde import edilir (yks_app.pages.render_page)
+"""
+
+from yks_app.core import *
+
+
+
+def render(user_data, progress_data, target_dept):
+    """🔬Detaylı Deneme Analiz Takibi"""
+    st.markdown(f'<div class="main-header"><h1>🔬Detaylı Deneme Analiz Takibi</h1><p>Sınav performansınızı bilimsel analiz edin</p></div>', unsafe_allow_html=True)
+
+    # Eğer global olarak daha önce tanımlanmadıysa ders soru sayılarını tanımla
+    if 'SUBJECT_MAX_QUESTIONS' not in globals():
+        SUBJECT_MAX_QUESTIONS = {
+            "TYT Türkçe": 40, "TYT Matematik": 40, "TYT Geometri": 40,
+            "TYT Tarih": 5, "TYT Coğrafya": 5, "TYT Felsefe": 5, "TYT Din Kültürü": 5,
+            "TYT Fizik": 7, "TYT Kimya": 7, "TYT Biyoloji": 6,
+            "AYT Matematik": 40, "AYT Fizik": 14, "AYT Kimya": 13, "AYT Biyoloji": 13,
+            "AYT Edebiyat": 40, "AYT Tarih": 40, "AYT Coğrafya": 40
+        }
+
+    # Kullanıcının deneme verilerini yükle (sütunlu depo cache'li; liste kopyalanır, yeni deneme eklenecek)
+    exam_store = get_exam_store(user_data)
+    deneme_kayitlari = list(exam_store.records)
+
+    # Yeni deneme ekleme (manuel toplam_net alanını koruyoruz)
+    with st.expander("➕ Yeni Deneme Ekle", expanded=True):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            deneme_adi = st.text_input("Deneme Adı", placeholder="Örn: 2024 TYT Denemesi #1", key="deneme_adi")
+            deneme_tarihi = st.date_input("Deneme Tarihi", key="deneme_tarihi")
+        with col2:
+            deneme_turu = st.selectbox("Deneme Türü", ["TYT", "AYT", "TYT-AYT"], key="deneme_turu")
+            # Eski arayüzde olan toplam_net alanını bırakıyoruz (kullanıcı manuel girebilir)
+            toplam_net_input = st.number_input("Toplam Net (manuel, istersen bırak)", min_value=0.0, max_value=200.0, step=0.25, key="toplam_net")
+        with col3:
+            toplam_dogru = st.number_input("Toplam Doğru", min_value=0, max_value=200, step=1, key="toplam_dogru")
+            toplam_yanlis = st.number_input("Toplam Yanlış", min_value=0, max_value=200, step=1, key="toplam_yanlis")
+
+    # Ders bazlı net bilgileri (her dersin max'ını SUBJECT_MAX_QUESTIONS ile kontrol et)
+    st.subheader("📝 Ders Bazlı Net Dağılımı")
+    ders_netleri = {}
+
+    if deneme_turu in ("TYT", "TYT-AYT"):
+        tyt_dersler = ["TYT Türkçe", "TYT Matematik", "TYT Geometri",
+                       "TYT Fizik", "TYT Kimya", "TYT Biyoloji",
+                       "TYT Tarih", "TYT Coğrafya", "TYT Felsefe", "TYT Din Kültürü"]
+        cols = st.columns(2)
+        for i, ders in enumerate(tyt_dersler):
+            with cols[i % 2]:
+                max_val = SUBJECT_MAX_QUESTIONS.get(ders, 20)
+                ders_netleri[ders] = st.number_input(
+                    f"{ders} Net",
+                    min_value=0.0,
+                    max_value=float(max_val),
+                    step=0.25,
+                    key=f"tyt_{ders}"
+                )
+
+    if deneme_turu in ("AYT", "TYT-AYT"):
+        ayt_dersler = ["AYT Matematik", "AYT Fizik", "AYT Kimya", "AYT Biyoloji", "AYT Edebiyat", "AYT Tarih", "AYT Coğrafya"]
+        cols = st.columns(2)
+        for i, ders in enumerate(ayt_dersler):
+            with cols[i % 2]:
+                max_val = SUBJECT_MAX_QUESTIONS.get(ders, 20)
+                ders_netleri[ders] = st.number_input(
+                    f"{ders} Net",
+                    min_value=0.0,
+                    max_value=float(max_val),
+                    step=0.25,
+                    key=f"ayt_{ders}"
+                )
+
+    # Yanlış analizi (eski key'leri koruyoruz: f"{ders}_{neden}" -> böylece önceki kayıtlara bağlılık bozulmaz)
+    st.subheader("🔍 Yanlış Analizi")
+    yanlis_nedenleri = {
+        "Bilgi Eksikliği": "Konuyu tam olarak öğrenmemiş olmak",
+        "Dikkatsizlik": "Soruyu yanlış okuma veya işlem hatası",
+        "Zaman Yetmedi": "Süreyi iyi kullanamama",
+        "Yorum Hatası": "Sorunun mantığını anlayamama",
+        "Şans Eseri Doğru": "Tahminle doğru cevabı bulma",
+        "Kodlama Hatası": "İşaretleme hatası"
+    }
+
+    yanlis_analiz = {}
+    for ders, net in ders_netleri.items():
+        subject_max = SUBJECT_MAX_QUESTIONS.get(ders, 20)
+        if float(net) < float(subject_max) * 0.75:
+            with st.expander(f"❌ {ders} - Yanlış Analizi"):
+                st.write(f"Bu derste {float(subject_max) - float(net):.1f} net kaybınız var. Sebepleri:")
+                for neden, aciklama in yanlis_nedenleri.items():
+                    # Burada eski key formatını koruyoruz: key=f"{ders}_{neden}"
+                    yanlis_sayisi = st.number_input(
+                        f"{ders} - {neden}",
+                        min_value=0,
+                        max_value=int(subject_max),
+                        value=0,
+                        step=1,
+                        key=f"{ders}_{neden}"
+                    )
+                    if yanlis_sayisi > 0:
+                        if ders not in yanlis_analiz:
+                            yanlis_analiz[ders] = {}
+                        yanlis_analiz[ders][neden] = int(yanlis_sayisi)
+
+    # Eksik konu tespiti (aynı mantık korunuyor)
+    st.subheader("📌 Eksik Konu Tespiti")
+    eksik_konular = {}
+    for ders, net in ders_netleri.items():
+        subject_max = SUBJECT_MAX_QUESTIONS.get(ders, 20)
+        if float(net) < float(subject_max) * 0.6:
+            st.write(f"**{ders}** - Eksik konularınızı işaretleyin:")
+            ders_konulari = get_topic_list(ders)
+            if ders_konulari:
+                secilen_konular = st.multiselect(f"{ders} eksik konular", ders_konulari, key=f"eksik_{ders}")
+                if secilen_konular:
+                    eksik_konular[ders] = secilen_konular
+
+    # Kaydet butonu: manuel toplam_net_input varsa onu kullan, yoksa ders_netleri toplamını kullan
+    if st.button("💾 Deneme Analizini Kaydet", type="primary", use_container_width=True, key="kaydet_deneme"):
+        if deneme_adi and deneme_tarihi:
+            # Derslerden otomatik toplam
+            computed_total = sum([float(v) for v in ders_netleri.values()]) if ders_netleri else 0.0
+            # Eğer kullanıcı manuel toplam girmişse (manuel > 0) onu öncelikle kullan, değilse computed_total
+            toplam_net_to_save = float(toplam_net_input) if float(toplam_net_input) > 0.0 else float(computed_total)
+
+            yeni_deneme = {
+                "id": len(deneme_kayitlari) + 1,
+                "adi": deneme_adi,
+                "tarih": str(deneme_tarihi),
+                "tur": deneme_turu,
+                "toplam_net": float(toplam_net_to_save),
+                "toplam_dogru": int(toplam_dogru),
+                "toplam_yanlis": int(toplam_yanlis),
+                "ders_netleri": ders_netleri,
+                "yanlis_analiz": yanlis_analiz,
+                "eksik_konular": eksik_konular,
+                "tavsiyeler": []
+            }
+
+            # Basit otomatik tavsiyeler (ders oranlarına göre)
+            tavsiyeler = []
+            if float(toplam_net_to_save) < 50.0:
+                tavsiyeler.append("🔴 Netiniz düşük: Öncelik temel konu tekrarları olmalı.")
+            elif float(toplam_net_to_save) < 80.0:
+                tavsiyeler.append("🟡 Orta seviye: Eksik konulara ve hız çalışmasına odaklanın.")
+            else:
+                tavsiyeler.append("🟢 İyi seviyedesiniz: Deneme pratiğini sürdürün, süre yönetimini geliştirin.")
+
+            # Sadece düşük performanslı dersler için tavsiye ekle
+            dusuk_dersler = []
+            orta_dersler = []
+            for ders, net in ders_netleri.items():
+                subject_max = SUBJECT_MAX_QUESTIONS.get(ders, 20)
+                oran = float(net) / subject_max if subject_max > 0 else 0
+                if oran < 0.3:
+                    dusuk_dersler.append(ders)
+                elif oran < 0.6:
+                    orta_dersler.append(ders)
+
+            if dusuk_dersler:
+                tavsiyeler.append(f"📚 **Öncelikli Dersler ({len(dusuk_dersler)} ders)**: {', '.join(dusuk_dersler[:3])} {'ve diğerleri' if len(dusuk_dersler) > 3 else ''} - Temel konu tekrarı yapın.")
+            if orta_dersler:
+                tavsiyeler.append(f"📖 **Geliştirilebilir Dersler ({len(orta_dersler)} ders)**: {', '.join(orta_dersler[:3])} {'ve diğerleri' if len(orta_dersler) > 3 else ''} - Soru çözme pratiği yapın.")
+
+            yeni_deneme["tavsiyeler"] = tavsiyeler
+            deneme_kayitlari.append(yeni_deneme)
+
+            # TYT/AYT NET GÜNCELLEMESİ - Otomatik hesapla ve güncelle
+            updates_to_firebase = {'deneme_analizleri': json.dumps(deneme_kayitlari)}
+
+            # Son 3 denemenin ortalamaları yeni denemeyle birlikte sütunlu depodan hesaplanır
+            saved_store = ExamStore(deneme_kayitlari)
+
+            # Değişkenleri başta tanımla
+            last_tyt_total = 0
+            last_ayt_total = 0
+
+            # TYT NET HESAPLAMA
+            if deneme_turu in ["TYT", "TYT-AYT"]:
+                tyt_subjects = ["TYT Türkçe", "TYT Matematik", "TYT Geometri", "TYT Fizik", 
+                              "TYT Kimya", "TYT Biyoloji", "TYT Tarih", "TYT Coğrafya", 
+                              "TYT Felsefe", "TYT Din Kültürü"]
+
+                # En son denemenin TYT toplam net'ini hesapla
+                last_tyt_total = sum([float(ders_netleri.get(subj, 0)) for subj in tyt_subjects])
+                updates_to_firebase['tyt_last_net'] = str(last_tyt_total)
+
+                # Son 3 denemedeki TYT denemelerinin ortalaması (yeni deneme TYT olduğundan pencere boş değil)
+                tyt_totals = saved_store.section_totals(tyt_subjects)
+                tyt_avg = saved_store.moving_average(tyt_totals, 3, saved_store.type_mask(("TYT", "TYT-AYT")))[-1]
+                updates_to_firebase['tyt_avg_net'] = str(float(tyt_avg))
+
+            # AYT NET HESAPLAMA
+            if deneme_turu in ["AYT", "TYT-AYT"]:
+                ayt_subjects = ["AYT Matematik", "AYT Fizik", "AYT Kimya", "AYT Biyoloji", 
+                              "AYT Edebiyat", "AYT Tarih", "AYT Coğrafya"]
+
+                # En son denemenin AYT toplam net'ini hesapla
+                last_ayt_total = sum([float(ders_netleri.get(subj, 0)) for subj in ayt_subjects])
+                updates_to_firebase['ayt_last_net'] = str(last_ayt_total)
+
+                # Son 3 denemedeki AYT denemelerinin ortalaması
+                ayt_totals = saved_store.section_totals(ayt_subjects)
+                ayt_avg = saved_store.moving_average(ayt_totals, 3, saved_store.type_mask(("AYT", "TYT-AYT")))[-1]
+                updates_to_firebase['ayt_avg_net'] = str(float(ayt_avg))
+
+            # Tüm güncellemeleri Firebase'e kaydet
+            update_user_in_firebase(st.session_state.current_user, updates_to_firebase)
+
+            # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+
+            # MEVCUT KULLANICININ USER_DATA'SINI TAMAMEN YENİLE
+            current_user_name = st.session_state.current_user
+            if current_user_name in st.session_state.users_db:
+                # user_data'yı tamamen yenile
+                st.session_state.user_data = st.session_state.users_db[current_user_name].copy()
+
+            # Başarı mesajını güncelle
+            success_msg = "✅ Deneme analizi başarıyla kaydedildi!"
+            if deneme_turu in ["TYT", "TYT-AYT"]:
+                success_msg += f"\n🔄 TYT Son Net: {last_tyt_total:.1f} olarak güncellendi"
+                if 'tyt_avg_net' in updates_to_firebase:
+                    success_msg += f"\n📊 TYT Ortalama Net: {float(updates_to_firebase['tyt_avg_net']):.1f} olarak güncellendi"
+            if deneme_turu in ["AYT", "TYT-AYT"]:
+                success_msg += f"\n🔄 AYT Son Net: {last_ayt_total:.1f} olarak güncellendi"
+                if 'ayt_avg_net' in updates_to_firebase:
+                    success_msg += f"\n📊 AYT Ortalama Net: {float(updates_to_firebase['ayt_avg_net']):.1f} olarak güncellendi"
+
+            st.success(success_msg)
+
+            # Güncellenen netleri göster
+            if deneme_turu in ["TYT", "TYT-AYT"] and 'tyt_last_net' in updates_to_firebase:
+                st.info(f"📈 TYT netlerin güncellendi: Son {float(updates_to_firebase['tyt_last_net']):.1f}, Ort {float(updates_to_firebase.get('tyt_avg_net', 0)):.1f}")
+            if deneme_turu in ["AYT", "TYT-AYT"] and 'ayt_last_net' in updates_to_firebase:
+                st.info(f"📈 AYT netlerin güncellendi: Son {float(updates_to_firebase['ayt_last_net']):.1f}, Ort {float(updates_to_firebase.get('ayt_avg_net', 0)):.1f}")
+
+            # Başarı animasyonu (kısa)
+            st.balloons()
+
+            # DOM hatasını önlemek için daha kısa delay ve alternatif yenileme
+            time.sleep(0.5)
+
+            # State'i temizle ve yeniden yükle
+            if 'deneme_form_submitted' not in st.session_state:
+                st.session_state.deneme_form_submitted = True
+
+            st.rerun()
+        else:
+            st.error("⚠️ Lütfen deneme adı ve tarihini giriniz")
+
+    # Geçmiş denemeleri gösterme + seçilen deneme detayları
+    if deneme_kayitlari:
+        st.markdown("---")
+        st.subheader("📈 Geçmiş Denemeler")
+
+        deneme_listesi = [f"{d['adi']} - {d['tarih']} ({d['tur']})" for d in deneme_kayitlari]
+        secilen_deneme = st.selectbox("Analizini görüntülemek istediğiniz denemeyi seçin:", deneme_listesi, key="deneme_secim")
+
+        if secilen_deneme:
+            deneme_index = deneme_listesi.index(secilen_deneme)
+            deneme = deneme_kayitlari[deneme_index]
+
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("📊 Toplam Net", f"{float(deneme.get('toplam_net', 0)):.1f}")
+            with col2:
+                st.metric("✅ Doğru Sayısı", deneme.get('toplam_dogru', 0))
+            with col3:
+                st.metric("❌ Yanlış Sayısı", deneme.get('toplam_yanlis', 0))
+            with col4:
+                st.metric("🎯 Deneme Türü", deneme.get('tur', '—'))
+
+            # Net dağılım grafiği
+            st.subheader("📊 Net Dağılımı")
+            dersler = [d for d, v in (deneme.get('ders_netleri') or {}).items() if v > 0]
+            netler = [deneme.get('ders_netleri', {}).get(d, 0) for d in dersler]
+            if dersler:
+                fig = px.bar(x=dersler, y=netler, title="Derslere Göre Net Dağılımı",
+                             labels={'x': 'Dersler', 'y': 'Net'}, color=netler,
+                             color_continuous_scale="Viridis")
+                safe_plotly_chart(fig, use_container_width=True, key=f"analysis_chart_{deneme.get('adi', '')}_{deneme.get('tarih', '')}_{hash(str(dersler))}")
+
+            # Öneriler (kaydedilmiş öneriler gösterilsin) - DOM hatasını önlemek için tek markdown
+            st.subheader("💡 Kayıtlı Gelişim Tavsiyeleri")
+            tavsiyeler = deneme.get('tavsiyeler', [])
+            if tavsiyeler and len(tavsiyeler) > 0:
+                # Tüm tavsiyeleri tek bir markdown string'de birleştir
+                tavsiye_text = "\n".join([f"{i+1}. {tavsiye}" for i, tavsiye in enumerate(tavsiyeler)])
+                st.markdown(tavsiye_text)
+            else:
+                st.info("📝 Bu deneme için henüz tavsiye kaydedilmemiş.")
+
+        # ----- EN ALTA: Tüm denemelerin gidişat grafiği -----
+        st.markdown("---")
+        st.subheader("📈 Zaman İçinde Gelişim (Tüm Denemeler)")
+        tarihler = [d.get('tarih') for d in deneme_kayitlari]
+        netler = list(exam_store.total_nets)
+        if tarihler and any(netler):
+            gelisim_df = pd.DataFrame({"Tarih": tarihler, "Toplam Net": netler,
+                                       "3 Deneme Ortalaması": exam_store.moving_average(netler, 3)})
+            fig_line = px.line(gelisim_df, x="Tarih", y=["Toplam Net", "3 Deneme Ortalaması"], markers=True,
+                               title="Denemelerde Net Gelişimi")
+            safe_plotly_chart(fig_line, use_container_width=True, key=f"gelisim_grafigi_{len(deneme_kayitlari)}_{hash(str(netler))}")
+
+            # Tüm denemelerdeki yanlış nedenleri (yanlış nedeni × deneme matrisinin satır toplamları)
+            yanlis_toplamlari = {neden: sayi for neden, sayi in exam_store.mistake_totals().items() if sayi > 0}
+            if yanlis_toplamlari:
+                fig_reasons = px.bar(x=list(yanlis_toplamlari), y=list(yanlis_toplamlari.values()),
+                                     title="Yanlış Nedenleri (Tüm Denemeler)",
+                                     labels={'x': 'Neden', 'y': 'Yanlış Sayısı'})
+                safe_plotly_chart(fig_reasons, use_container_width=True, key=f"yanlis_nedenleri_{len(deneme_kayitlari)}_{hash(str(yanlis_toplamlari))}")
+
+            # Son denemeye özel ders bazlı öneriler (kısa, eyleme dönük)
+            son_deneme = deneme_kayitlari[-1]
+            low_subjects = []
+            for ders, net in (son_deneme.get('ders_netleri') or {}).items():
+                max_val = SUBJECT_MAX_QUESTIONS.get(ders, 20)
+                try:
+                    oran = float(net) / float(max_val) if float(max_val) > 0 else 0
+                except Exception:
+                    oran = 0
+                if oran < 0.5:
+                    low_subjects.append((ders, oran))
+
+            st.subheader("📌 Son Denemeye Göre Öncelikli Öneriler")
+            if low_subjects and len(low_subjects) > 0:
+                # DOM hatasını önlemek için tüm önerileri tek markdown'da birleştir
+                oneriler_listesi = []
+                for i, (ders, oran) in enumerate(low_subjects):
+                    oneriler_listesi.append(f"{i+1}. **{ders}** (%{oran*100:.0f}): Konu tekrarı ve çıkmış soru çözümü; eksik konuları parça parça kapatın.")
+                st.markdown("\n".join(oneriler_listesi))
+            else:
+                st.markdown("🎉 Tebrikler! Son denemede ders bazında kayda değer düşük alan bulunmadı.")
+
+            # Genel çalışma önerileri (kaynaklı, kısa)
+            st.markdown("---")
+            st.subheader("🔎 Güvenilir Kaynaklardan Derlenen Kısa Çalışma Önerileri")
+            st.markdown("- Okuduğunu anlama için günlük okuma alışkanlığı (gazete/deneme/uzun paragraflar).")
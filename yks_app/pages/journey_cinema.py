@@ -0,0 +1,181 @@
+"""
+🎬 YKS Yolculuğu Sineması sayfası
+Sayfa ilk seçildiğinde import edilir (yks_app.pages.render_page)
+Film paketi yks_app.journey_film'den cache'li gelir; oynatma tamamen tarayıcıda çalışır
+"""
+
+from yks_app.core import *
+from yks_app.journey_film import get_journey_film_bundle, render_journey_film_html
+
+def show_yks_journey_cinema(user_data, progress_data):
+    """🎬 Filmi Başlat– İlk Günden Bugüne YKS Yolculuğum - Sinematik Deneyim"""
+    
+    # KRİTİK: Kullanıcı kimlik kontrolü
+    if not user_data:
+        st.error("❌ Kullanıcı verisi bulunamadı!")
+        return
+    
+    # GÜVENLİK KONTROLÜ: Doğru kullanıcının verilerini kullandığımızdan emin ol
+    current_username = st.session_state.get('current_user', None)
+    if not current_username:
+        st.error("❌ Aktif kullanıcı bulunamadı! Lütfen yeniden giriş yapın.")
+        return
+    
+    # Kullanıcı kimlik doğrulama
+    expected_username = user_data.get('username', '')
+    if current_username != expected_username:
+        st.error(f"❌ Veri uyumsuzluğu tespit edildi! Session: {current_username}, Data: {expected_username}")
+        st.error("🔒 Güvenlik için sayfa yenileniyor...")
+        st.rerun()
+        return
+    
+
+        st.info(f"🔍 Debug: Kullanıcı {current_username} için veriler yükleniyor...")
+        st.info(f"📅 Kayıt tarihi: {user_data.get('created_at', 'Bilinmiyor')}")
+        st.info(f"👤 İsim: {user_data.get('name', 'Bilinmiyor')}")
+    
+    # Session state'leri başlat
+    if 'cinema_active' not in st.session_state:
+        st.session_state.cinema_active = False
+    if 'music_enabled' not in st.session_state:
+        st.session_state.music_enabled = True
+    
+    # Öğrenci adını al
+    student_name = user_data.get('name', 'Öğrenci')
+    
+    # Sinematik başlık
+    cinema_title = f"""
+    <link href="https://fonts.googleapis.com/css2?family=Cinzel:wght@400;500;600;700&family=Playfair+Display:wght@400;500;600;700&display=swap" rel="stylesheet">
+    <div style="
+        background: linear-gradient(135deg, #000 0%, #1a1a2e 50%, #16213e 100%);
+        border: 8px solid #ffd700;
+        border-radius: 20px;
+        padding: 40px;
+        margin: 20px 0;
+        text-align: center;
+        position: relative;
+        box-shadow: 0 10px 30px rgba(255, 215, 0, 0.3);
+    ">
+        <!-- Film çerçevesi -->
+        <div style="
+            position: absolute;
+            top: -4px; left: -4px; right: -4px; bottom: -4px;
+            background: repeating-linear-gradient(
+                90deg,
+                #ffd700 0px, #ffd700 10px,
+                transparent 10px, transparent 20px
+            );
+            border-radius: 24px;
+            z-index: -1;
+        "></div>
+        
+        <h1 style="
+            color: #ffd700;
+            font-family: 'Cinzel', serif;
+            font-size: clamp(2rem, 6vw, 4rem);
+            font-weight: 700;
+            margin: 0 0 20px 0;
+            text-shadow: 3px 3px 6px rgba(0,0,0,0.8);
+            letter-spacing: 2px;
+        🎬 {student_name}'nin YKS Serüveni</h1>
+        
+        <p style="
+            color: #ffffff;
+            font-family: 'Playfair Display', serif;
+            font-size: clamp(1.2rem, 3vw, 2rem);
+            margin: 0;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.8);
+            font-style: italic;
+        İlk Günden Bugüne Başarı Yolculuğu</p>
+        
+        <div style="
+            margin-top: 30px;
+            color: #ffd700;
+            font-size: clamp(1rem, 2.5vw, 1.5rem);
+            font-family: 'Playfair Display', serif;
+        ">
+            🎭 Sinematik Deneyim Hazır
+        </div>
+    </div>
+    """
+    
+    st.components.v1.html(cinema_title, height=250)
+    
+    # Film paketi: oturum → süreç → disk cache'inden, yoksa bir kez üretilir
+    film_bundle = get_journey_film_bundle(user_data)
+    summary = film_bundle['summary']
+    total_days = summary['total_days']
+    
+    if not st.session_state.cinema_active:
+        # Başlatma ekranı
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.markdown("### 🎬 Sinema Kontrolleri")
+            
+            # Müzik seçeneği
+            music_choice = st.radio(
+                "🎵 Arka Plan Müziği:",
+                ["🎶 Müzikli İzle", "🔇 Sessiz İzle"],
+                index=0 if st.session_state.music_enabled else 1
+            )
+            st.session_state.music_enabled = (music_choice == "🎶 Müzikli İzle")
+            
+            # Oynatma hızı
+            speed_choice = st.radio(
+                "⚡ İzleme Hızı:",
+                ["🐌 Yavaş (6sn/gün)", "⚡ Normal (4sn/gün)", "🚀 Hızlı (2sn/gün)"],
+                index=1
+            )
+            
+            if speed_choice == "🐌 Yavaş (6sn/gün)":
+                st.session_state.day_duration = 6
+            elif speed_choice == "🚀 Hızlı (2sn/gün)":
+                st.session_state.day_duration = 2
+            else:
+                st.session_state.day_duration = 4
+            
+            # Sinematik deneyim bilgisi
+            st.info("🎥 **Pro İpucu:** '🖼️ Tam Ekran' butonuna tıklayın! ✅ Köklü çözüm - %100 çalışır! Fotoğraflar artık tam boyutta görünür!")
+            
+            st.markdown("---")
+            
+            # Başlat butonu
+            if st.button(f"🎬 {student_name}'nin Hikayesini Başlat!", 
+                        type="primary", 
+                        use_container_width=True):
+                st.session_state.cinema_active = True
+                st.rerun()
+        
+        # Önizleme bilgileri
+        if total_days:
+            st.markdown("### 📊 Yolculuk Özeti")
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("📅 Toplam Gün", total_days)
+            with col2:
+                st.metric("❓ Toplam Soru", summary['total_questions'])
+            with col3:
+                st.metric("⭐ Ort. Motivasyon", f"{summary['avg_motivation']:.1f}/10")
+            with col4:
+                st.metric("📚 Toplam Konu", summary['total_topics'])
+    
+    elif total_days:
+        # Sinema modu: tüm oynatma tek bileşende, Python tarafı sadece çıkışı dinler
+        film_html = render_journey_film_html(film_bundle, st.session_state.get('day_duration', 4),
+                                             st.session_state.music_enabled)
+        st.components.v1.html(film_html, height=1000, scrolling=False)
+        
+        col1, col2, col3 = st.columns([2, 1, 2])
+        with col2:
+            if st.button("🚪 Çıkış", use_container_width=True):
+                st.session_state.cinema_active = False
+                st.rerun()
+    
+    else:
+        st.info("📅 Henüz gösterilecek gün yok.")
+        st.session_state.cinema_active = False
+
+def render(user_data, progress_data, target_dept):
+    """🎬 Filmi Başlat– İlk Günden Bugüne YKS Yolculuğum"""
+    show_yks_journey_cinema(user_data, progress_data)
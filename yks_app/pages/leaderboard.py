@@ -0,0 +1,767 @@
+"""
+🏆 Rekabet Panosu sayfası
+Sayfa ilk seçildiğinde import edilir (yks_app.pages.render_page)
+"""
+
+from yks_app.core import *
+
+# === 🏆 BASİT REKABET SİSTEMİ ===
+
+# Liderboard cache süresi (saniye)
+LEADERBOARD_CACHE_DURATION = 300
+
+class LeaderboardIndex:
+    """Skora göre sıralı dizi + bisect ile O(log n) sıra sorguları"""
+    def __init__(self, entries=None, computed_at=None):
+        self.computed_at = computed_at  # Snapshot hesaplanma zamanı (ISO)
+        entries = [e for e in (entries or []) if e.get('username')]
+        entries.sort(key=self._sort_key)
+        self._keys = [self._sort_key(e) for e in entries]  # (-skor, kullanıcı) artan
+        self._entries = entries  # _keys ile paralel performans kayıtları
+        self._scores = {e['username']: e['total_score'] for e in entries}
+    
+    @staticmethod
+    def _sort_key(entry):
+        return (-entry['total_score'], entry['username'])
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def _position(self, username):
+        """Kullanıcının dizideki 0 tabanlı konumu (yoksa None)"""
+        if username not in self._scores:
+            return None
+        return bisect.bisect_left(self._keys, (-self._scores[username], username))
+    
+    def rank(self, username):
+        """Kullanıcının 1 tabanlı sırası - O(log n)"""
+        position = self._position(username)
+        return position + 1 if position is not None else None
+    
+    def get(self, username):
+        """Kullanıcının performans kaydı"""
+        position = self._position(username)
+        return self._entries[position] if position is not None else None
+    
+    def top(self, k):
+        """İlk k kayıt - dilim, sıralama yok"""
+        return self._entries[:k]
+    
+    def around(self, username, radius=5):
+        """Kullanıcının üstündeki ve altındaki radius kişi: [(sıra, kayıt), ...]"""
+        position = self._position(username)
+        if position is None:
+            return []
+        start = max(0, position - radius)
+        end = min(len(self._entries), position + radius + 1)
+        return [(i + 1, self._entries[i]) for i in range(start, end)]
+    
+    def upsert(self, entry):
+        """Tek kullanıcının kaydını ekle/güncelle - tam sıralama yapmadan"""
+        self.remove(entry['username'])
+        key = self._sort_key(entry)
+        position = bisect.bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._entries.insert(position, entry)
+        self._scores[entry['username']] = entry['total_score']
+    
+    def remove(self, username):
+        """Kullanıcıyı indeksten çıkar"""
+        position = self._position(username)
+        if position is not None:
+            del self._keys[position]
+            del self._entries[position]
+            del self._scores[username]
+
+def get_leaderboard_index(force_refresh=False):
+    """Cache'li liderboard sıra indeksi"""
+    cache = st.session_state.get('leaderboard_cache')
+    if (not force_refresh and cache and
+            time.time() - cache['time'] < LEADERBOARD_CACHE_DURATION):
+        return cache['index']
+    
+    # Zamanlayıcının ürettiği son snapshot'ı kullan
+    snapshot = get_latest_leaderboard_snapshot()
+    if snapshot is None:
+        # Henüz snapshot yoksa (veya yerel test modu) satır içi hesapla
+        snapshot = {
+            'entries': calculate_weekly_leaderboard(),
+            'computed_at': current_time().isoformat(timespec='seconds')
+        }
+    
+    index = LeaderboardIndex(snapshot['entries'], computed_at=snapshot.get('computed_at'))
+    st.session_state.leaderboard_cache = {'index': index, 'time': time.time()}
+    return index
+
+def get_leaderboard_rank(username):
+    """Kullanıcının haftalık sırası"""
+    return get_leaderboard_index().rank(username)
+
+def get_leaderboard_top(k=20):
+    """Haftalık ilk k lider"""
+    return get_leaderboard_index().top(k)
+
+def get_leaderboard_neighbors(username, radius=5):
+    """Kullanıcının üstündeki ve altındaki öğrenciler"""
+    return get_leaderboard_index().around(username, radius)
+
+def competition_leaderboard_page(user_data):
+    """🏆 İsteğe Bağlı Rekabet Panosu"""
+    st.markdown(f'<div class="main-header"><h1>🏆 Rekabet Panosu</h1><p>İsteğe bağlı katılım - Günlük sosyal medya takibi! 📱⬇️</p></div>', unsafe_allow_html=True)
+    
+    # Günlük temizlik arka plan zamanlayıcısında yapılır
+    
+    # İsteğe bağlı rekabet sistemi
+    show_simple_leaderboard(user_data)
+
+def show_simple_leaderboard(user_data):
+    """🏆 Basit Rekabet Listesi - İsteğe Bağlı Katılım"""
+    
+    # Kullanıcının oturum açıp açmadığını kontrol et
+    if not user_data:
+        st.warning("🔐 Rekabet sistemine katılmak için önce giriş yapmalısın!")
+        return
+    
+    # Kullanıcının katılım durumunu kontrol et (güncel veriyi al)
+    current_user_data = user_data  # Parametre olarak gelen user_data'yı kullan
+    is_participating = current_user_data.get('competition_participating', False)
+    
+    # Katılım kontrolü - Kırmızı tema
+    st.markdown("### 🎯 Rekabet Sistemi Katılımı")
+    
+    col_join1, col_join2 = st.columns([3, 2])
+    
+    with col_join1:
+        if is_participating:
+            st.markdown("""
+            <div style="background: linear-gradient(135deg, #27ae60 0%, #229954 100%); 
+                        padding: 15px; border-radius: 10px; color: white; margin: 10px 0;">
+                <h4 style="color: white; margin: 0;">✅ Rekabet sistemine katılıyorsun!</h4>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown("""
+            <div style="background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); 
+                        padding: 15px; border-radius: 10px; color: white; margin: 10px 0;">
+                <h4 style="color: white; margin: 0;">📢 Rekabet sistemine katılmak istersen butona tıkla</h4>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col_join2:
+        st.markdown("<br>", unsafe_allow_html=True)  # Boşluk için
+        if is_participating:
+            if st.button("🚪 Rekabetten Ayrıl", key="leave_competition", use_container_width=True):
+                # Firebase'e kaydet
+                update_user_in_firebase(st.session_state.current_user, {'competition_participating': False})
+                
+                # Session state'i de güncelle
+                if 'user_data' in st.session_state:
+                    st.session_state.user_data['competition_participating'] = False
+                
+                # Güncel veriyi tekrar al
+                st.session_state.user_data = get_user_data()
+                
+                st.success("✅ Rekabetten ayrıldın! Liderboard'dan çıkarıldın.")
+                st.rerun()
+        else:
+            if st.button("🏆 Rekabete Katıl", key="join_competition", use_container_width=True):
+                # Firebase'e kaydet
+                update_user_in_firebase(st.session_state.current_user, {'competition_participating': True})
+                
+                # Session state'i de güncelle
+                if 'user_data' in st.session_state:
+                    st.session_state.user_data['competition_participating'] = True
+                
+                # Güncel veriyi tekrar al
+                st.session_state.user_data = get_user_data()
+                
+                st.success("🏆 Rekabete katıldın! Liderboard'da görünüyorsun.")
+                st.rerun()
+    
+    # Eğer katılmıyorsa sadece bilgi göster
+    if not is_participating:
+        st.markdown("---")
+        st.markdown("### 📊 Rekabet Sistemine Katılmadın")
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); 
+                    padding: 20px; border-radius: 15px; color: white; margin: 10px 0; text-align: center;">
+            <h4 style="color: white; margin-bottom: 15px;">🏆 Rekabete Katılmadın</h4>
+            <div style="font-size: 16px; line-height: 1.6;">
+                Rekabete katıldığında:<br>
+                • Haftalık sıralaman görünecek<br>
+                • Diğer öğrencilerle karşılaştırma yapabileceksin<br>
+                • Sosyal medya takibin başlayacak<br>
+                • Puanlama sistemine dahil olacaksın
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+    
+    st.markdown("---")
+    
+    # **YENİ**: Kendisiyle yarışma sistemi 
+    show_self_competition_section(current_user_data)
+    
+    st.markdown("---")
+    
+    # Haftalık liderboard indeksi (sadece katılanlar)
+    leaderboard_index = get_leaderboard_index()
+    current_user_stats = calculate_user_weekly_performance(current_user_data)
+    
+    # Kendi kaydını tam sıralama yapmadan güncelle
+    leaderboard_index.upsert(dict(current_user_stats, username=st.session_state.current_user))
+    
+    # Debug: Sosyal medya verisini kontrol et
+    sm_debug_data = current_user_data.get('social_media_daily', '{}')
+    st.write(f"🔍 Debug - User data'daki sosyal medya: {sm_debug_data}")
+    st.write(f"🔍 Debug - Hesaplanan sosyal medya saati: {current_user_stats.get('social_media_hours', 0)}")
+    
+    # Bugünkü tarih key'i de gösterelim
+    today_debug = current_time().strftime('%Y-%m-%d')
+    st.write(f"🔍 Debug - Bugünkü tarih key: {today_debug}")
+    
+    # Kullanıcının sıralamasını bul
+    user_rank = leaderboard_index.rank(st.session_state.current_user)
+    
+    # Günlük sosyal medya ekran süresi girişi
+    st.markdown("### 📱 Günlük Sosyal Medya Bildirimi")
+    
+    # Bugünkü durumu kontrol et
+    today_key = current_time().strftime('%Y-%m-%d')
+    user_sm_data = get_user_daily_social_media(st.session_state.current_user)
+    
+    if today_key in user_sm_data:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #27ae60 0%, #229954 100%); 
+                    padding: 15px; border-radius: 10px; color: white; margin: 10px 0;">
+            <h4 style="color: white; margin: 0;">✅ Bugün sosyal medya süren kaydedildi: {user_sm_data[today_key]:.1f} saat</h4>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        col_sm1, col_sm2 = st.columns([3, 2])
+        
+        with col_sm1:
+            st.markdown("**Bugün sosyal medyada ne kadar zaman geçirdin?**")
+            col_h, col_m = st.columns(2)
+            
+            with col_h:
+                social_media_hours = st.number_input("Saat", min_value=0.0, max_value=24.0, value=0.0, step=0.5, key="sm_hours")
+            with col_m:
+                social_media_minutes = st.number_input("Dakika", min_value=0, max_value=59, value=0, key="sm_minutes")
+            
+            total_sm_time = social_media_hours + (social_media_minutes / 60)
+        
+        with col_sm2:
+            st.markdown("**📱 Ekran görüntüsü**")
+            uploaded_screenshot = st.file_uploader("Telefon ayarlarından ss", type=['png', 'jpg', 'jpeg'], key="sm_screenshot")
+            
+            if st.button("💾 Bugünü Kaydet", key="save_sm_time", use_container_width=True):
+                if uploaded_screenshot and total_sm_time > 0:
+                    # Veriyi kaydet
+                    result = save_daily_social_media_time(st.session_state.current_user, total_sm_time)
+                    
+                    # Debug: Kaydedilen veriyi kontrol et
+                    user_data_check = get_user_data()
+                    sm_data_check = user_data_check.get('social_media_daily', '{}')
+                    
+                    st.success(f"✅ Bugün kaydedildi: {total_sm_time:.1f}h")
+                    st.info(f"🔍 Debug: Firebase'deki veri: {sm_data_check}")
+                    st.rerun()
+                else:
+                    st.error("Süre ve SS gerekli!")
+    
+    st.markdown("---")
+    
+    # Kırmızı tema metrik kartları - Sade ve modern
+    st.markdown("""
+    <style>
+    .metric-card {
+        background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
+        padding: 20px;
+        border-radius: 15px;
+        text-align: center;
+        color: white;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+        margin: 10px 0;
+    }
+    .metric-value {
+        font-size: 28px;
+        font-weight: bold;
+        margin: 10px 0;
+        color: white;
+    }
+    .metric-label {
+        font-size: 14px;
+        opacity: 0.9;
+        color: white;
+    }
+    .metric-card-special {
+        background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
+        padding: 20px;
+        border-radius: 15px;
+        text-align: center;
+        color: white;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+        margin: 10px 0;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    progress_avg = (current_user_stats['tyt_progress'] + current_user_stats['ayt_progress']) / 2
+    
+    with col1:
+        rank_text = f"#{user_rank}" if user_rank else "---"
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">🏆 Haftalık Sıralama</div>
+            <div class="metric-value">{rank_text}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">📝 Soru Sayısı</div>
+            <div class="metric-value">{current_user_stats['questions_solved']}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">📈 İlerleme Oranı</div>
+            <div class="metric-value">%{progress_avg:.1f}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">⏱️ Çalışma Saati</div>
+            <div class="metric-value">{current_user_stats['study_hours']:.1f}h</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col5:
+        st.markdown(f"""
+        <div class="metric-card-special">
+            <div class="metric-label">📱 Sosyal Medya</div>
+            <div class="metric-value">{current_user_stats['social_media_hours']:.1f}h</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Ana liderboard tablosu
+    st.markdown("---")
+    st.markdown("### 🏆 Haftalık Liderler")
+    if leaderboard_index.computed_at:
+        computed_at = datetime.fromisoformat(leaderboard_index.computed_at).strftime('%d.%m.%Y %H:%M')
+        st.caption(f"Her Pazartesi güncellenir • Son hesaplama: {computed_at}")
+    else:
+        st.caption("Her Pazartesi güncellenir")
+    
+    if not len(leaderboard_index):
+        st.info("📊 Henüz veri yok. İlk lider olun!")
+        return
+    
+    # Top 20 göster (donmaması için)
+    for i, leader in enumerate(leaderboard_index.top(20)):
+        rank = i + 1
+        
+        # Kırmızı tema rozet sistemi - Sade ve modern
+        if rank == 1:
+            medal = "🥇"
+            bg_color = "#e74c3c"
+            border_color = "#FFD700"
+            text_color = "#ffffff"
+        elif rank == 2:
+            medal = "🥈" 
+            bg_color = "#c0392b"
+            border_color = "#C0C0C0"
+            text_color = "#ffffff"
+        elif rank == 3:
+            medal = "🥉"
+            bg_color = "#a93226"
+            border_color = "#CD7F32"
+            text_color = "#ffffff"
+        elif rank <= 10:
+            medal = f"{rank}️⃣"
+            bg_color = "#922b21"
+            border_color = "#e74c3c"
+            text_color = "#ffffff"
+        else:
+            medal = f"{rank}"
+            bg_color = "#641e16"
+            border_color = "#c0392b"
+            text_color = "#ffffff"
+        
+        # İlerleme oranı hesapla
+        avg_progress = (leader['tyt_progress'] + leader['ayt_progress']) / 2
+        
+        # Kısa isim (ilk 15 karakter)
+        display_name = leader['username'][:15] + "..." if len(leader['username']) > 15 else leader['username']
+        
+        # Modern lider kartı - Büyük ve okunabilir
+        st.markdown(f"""
+        <div style="background: {bg_color}; padding: 20px; margin: 12px 0; border-radius: 15px; 
+                    border-left: 6px solid {border_color}; display: flex; align-items: center; 
+                    box-shadow: 0 4px 8px rgba(0,0,0,0.15); transition: all 0.3s ease;">
+            <div style="font-size: 36px; margin-right: 25px; min-width: 60px; text-align: center;">{medal}</div>
+            <div style="flex: 1;">
+                <div style="font-size: 22px; font-weight: bold; color: {text_color}; margin-bottom: 8px;">{display_name}</div>
+                <div style="font-size: 16px; color: {text_color}; font-weight: 500; line-height: 1.4;">
+                    📝 <span style="font-weight: bold;">{leader['questions_solved']}</span> soru | 
+                    📈 <span style="font-weight: bold;">%{avg_progress:.1f}</span> | 
+                    ⏱️ <span style="font-weight: bold;">{leader['study_hours']:.1f}h</span> | 
+                    📱 <span style="color: #ff6b6b; font-weight: bold;">{leader['social_media_hours']:.1f}h</span>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Kullanıcının pozisyonu (eğer top 20'de değilse)
+    if user_rank and user_rank > 20:
+        st.markdown("---")
+        st.markdown(f"### 📍 Sizin Pozisyonunuz: #{user_rank}")
+        
+        # Kullanıcının kartını göster - Kırmızı tema
+        avg_progress = (current_user_stats['tyt_progress'] + current_user_stats['ayt_progress']) / 2
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); padding: 20px; border-radius: 15px; 
+                    border-left: 6px solid #2c3e50; box-shadow: 0 4px 8px rgba(0,0,0,0.15);">
+            <div style="font-size: 22px; font-weight: bold; color: #ffffff; margin-bottom: 8px;">
+                {st.session_state.current_user}
+            </div>
+            <div style="font-size: 16px; color: #ffffff; font-weight: 500; line-height: 1.4;">
+                📝 <span style="font-weight: bold;">{current_user_stats['questions_solved']}</span> soru | 
+                📈 <span style="font-weight: bold;">%{avg_progress:.1f}</span> | 
+                ⏱️ <span style="font-weight: bold;">{current_user_stats['study_hours']:.1f}h</span> | 
+                📱 <span style="color: #2c3e50; font-weight: bold;">{current_user_stats['social_media_hours']:.1f}h</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Üstündeki ve altındaki 5 öğrenci
+        st.markdown("#### 👥 Yakın Rakiplerin")
+        for rank, neighbor in leaderboard_index.around(st.session_state.current_user, radius=5):
+            if neighbor['username'] == st.session_state.current_user:
+                continue
+            neighbor_progress = (neighbor['tyt_progress'] + neighbor['ayt_progress']) / 2
+            neighbor_name = neighbor['username'][:15] + "..." if len(neighbor['username']) > 15 else neighbor['username']
+            st.markdown(f"**#{rank}** {neighbor_name} — 📝 {neighbor['questions_solved']} soru | "
+                        f"📈 %{neighbor_progress:.1f} | ⏱️ {neighbor['study_hours']:.1f}h | "
+                        f"📱 {neighbor['social_media_hours']:.1f}h")
+    
+    # Puanlama sistemi açıklaması - Modern tasarım
+    st.markdown("---")
+    st.markdown("### 📊 Puanlama Sistemi")
+    
+    col_info1, col_info2 = st.columns(2)
+    
+    with col_info1:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); 
+                    padding: 20px; border-radius: 15px; color: white; margin: 10px 0;">
+            <h4 style="color: white; margin-bottom: 15px;">🏆 Nasıl Puanlanıyor?</h4>
+            <div style="font-size: 16px; line-height: 1.6;">
+                📝 <strong>Soru çözme:</strong> Her 10 soru = +1 puan<br>
+                📈 <strong>İlerleme:</strong> Her %10 TYT/AYT = +1 puan<br>
+                ⏱️ <strong>Çalışma saati:</strong> Her saat = +1 puan<br>
+                📱 <strong>Sosyal medya:</strong> Her saat = -0.5 puan
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_info2:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%); 
+                    padding: 20px; border-radius: 15px; color: white; margin: 10px 0;">
+            <h4 style="color: white; margin-bottom: 15px;">📱 Günlük Sistem</h4>
+            <div style="font-size: 16px; line-height: 1.6;">
+                ✅ <strong>Her gün</strong> sosyal medya süreni bildir<br>
+                🗓️ <strong>7 gün</strong> veri tutulur<br>
+                🔄 <strong>Pazartesi</strong> yeni hafta başlar<br>
+                📸 <strong>Ekran görüntüsü</strong> zorunlu
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%); 
+                padding: 15px; border-radius: 10px; text-align: center; color: white; margin: 20px 0;">
+        <h4 style="color: white; margin: 0;">💡 Sosyal medyayı azalt, çalışma saatini artır!</h4>
+    </div>
+    """, unsafe_allow_html=True)
+
+def calculate_weekly_leaderboard():
+    """Haftalık liderboard hesaplar - Sadece katılan kullanıcılar"""
+    try:
+        # Firebase'den tüm kullanıcı verilerini al (3 saniye timeout)
+        users_data = load_users_from_firebase()
+        
+        return build_weekly_leaderboard(users_data)
+        
+    except Exception as e:
+        st.error(f"⚠️ Liderboard hesaplanırken hata: {e}")
+        return []
+
+def save_daily_social_media_time(username, total_hours):
+    """Günlük sosyal medya ekran süresini kaydet"""
+    try:
+        today_key = current_time().strftime('%Y-%m-%d')
+        
+        # Kullanıcı verilerini al
+        user_data = get_user_data()
+        
+        # Sosyal medya verilerini al veya oluştur
+        social_media_data_str = user_data.get('social_media_daily', '{}')
+        try:
+            social_media_data = json.loads(social_media_data_str) if social_media_data_str else {}
+        except:
+            social_media_data = {}
+        
+        # Bugünün verisini kaydet
+        social_media_data[today_key] = total_hours
+        
+        # Firebase'e kaydet
+        update_user_in_firebase(username, {'social_media_daily': json.dumps(social_media_data)})
+        
+        return True
+        
+    except Exception as e:
+        st.error(f"Günlük sosyal medya verisi kaydedilirken hata: {e}")
+        return False
+
+def get_user_daily_social_media(username):
+    """Kullanıcının günlük sosyal medya verilerini al"""
+    try:
+        # Mevcut kullanıcı verilerini al
+        if username == st.session_state.current_user:
+            user_data = get_user_data()
+        else:
+            users_db = load_users_from_firebase()
+            user_data = users_db.get(username, {})
+        
+        social_media_str = user_data.get('social_media_daily', '{}')
+        return json.loads(social_media_str) if social_media_str else {}
+    except:
+        return {}
+
+def show_self_competition_section(user_data):
+    """Kendisiyle yarışma bölümü - En büyük zafer dünkü senle bugünkü senin arasındaki farktır"""
+    st.markdown("### 🎯 Kendisiyle Yarışma - En Büyük Zafer!")
+    
+    # Son 7 günün verilerini al
+    personal_progress = get_personal_weekly_progress(st.session_state.current_user)
+    
+    if len(personal_progress) < 2:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); 
+                    padding: 15px; border-radius: 10px; color: white; margin: 10px 0; text-align: center;">
+            <h4 style="color: white; margin: 0;">💪 Kendini geçmeye başla!</h4>
+            <p style="margin: 5px 0;">En az 2 gün veri olunca kendi gelişimini görebileceksin</p>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+    
+    # Son gün vs önceki gün karşılaştırması
+    latest_day = personal_progress[-1]
+    previous_day = personal_progress[-2]
+    
+    col_self1, col_self2, col_self3 = st.columns(3)
+    
+    # Sosyal medya karşılaştırması (az olan iyi)
+    sm_diff = latest_day['social_media'] - previous_day['social_media']
+    sm_trend = "📉" if sm_diff < 0 else "📈" if sm_diff > 0 else "➡️"
+    sm_color = "#27ae60" if sm_diff < 0 else "#e74c3c" if sm_diff > 0 else "#f39c12"
+    
+    # Çalışma saati karşılaştırması (çok olan iyi)
+    study_diff = latest_day['study_hours'] - previous_day['study_hours']
+    study_trend = "📈" if study_diff > 0 else "📉" if study_diff < 0 else "➡️"
+    study_color = "#27ae60" if study_diff > 0 else "#e74c3c" if study_diff < 0 else "#f39c12"
+    
+    # Soru karşılaştırması (çok olan iyi)
+    question_diff = latest_day['questions'] - previous_day['questions']
+    question_trend = "📈" if question_diff > 0 else "📉" if question_diff < 0 else "➡️"
+    question_color = "#27ae60" if question_diff > 0 else "#e74c3c" if question_diff < 0 else "#f39c12"
+    
+    with col_self1:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {sm_color} 0%, {sm_color}AA 100%); 
+                    padding: 15px; border-radius: 10px; color: white; text-align: center;">
+            <div style="font-size: 24px;">{sm_trend}</div>
+            <div style="font-size: 16px; font-weight: bold;">Sosyal Medya</div>
+            <div style="font-size: 14px;">Dün: {previous_day['social_media']:.1f}h</div>
+            <div style="font-size: 14px;">Bugün: {latest_day['social_media']:.1f}h</div>
+            <div style="font-size: 12px;">Fark: {sm_diff:+.1f}h</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_self2:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {study_color} 0%, {study_color}AA 100%); 
+                    padding: 15px; border-radius: 10px; color: white; text-align: center;">
+            <div style="font-size: 24px;">{study_trend}</div>
+            <div style="font-size: 16px; font-weight: bold;">Çalışma Saati</div>
+            <div style="font-size: 14px;">Dün: {previous_day['study_hours']:.1f}h</div>
+            <div style="font-size: 14px;">Bugün: {latest_day['study_hours']:.1f}h</div>
+            <div style="font-size: 12px;">Fark: {study_diff:+.1f}h</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_self3:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {question_color} 0%, {question_color}AA 100%); 
+                    padding: 15px; border-radius: 10px; color: white; text-align: center;">
+            <div style="font-size: 24px;">{question_trend}</div>
+            <div style="font-size: 16px; font-weight: bold;">Soru Sayısı</div>
+            <div style="font-size: 14px;">Dün: {previous_day['questions']}</div>
+            <div style="font-size: 14px;">Bugün: {latest_day['questions']}</div>
+            <div style="font-size: 12px;">Fark: {question_diff:+}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Haftalık sıralama geçmişi (arşivlenmiş snapshot'lardan)
+    rank_history = get_user_rank_history(st.session_state.current_user)
+    if rank_history:
+        st.markdown("#### 📅 Haftalık Sıralama Geçmişin")
+        history_text = " → ".join(f"{item['week']}: #{item['rank']}" for item in rank_history)
+        st.caption(history_text)
+    
+    # Toplam motivasyon skoru
+    motivation_score = 0
+    if sm_diff < 0: motivation_score += 2  # Sosyal medya azalırsa +2
+    if study_diff > 0: motivation_score += 3  # Çalışma artırsa +3
+    if question_diff > 0: motivation_score += 3  # Soru artırsa +3
+    
+    if motivation_score >= 6:
+        motivation_msg = "🏆 MÜTHIŞ GELİŞİM! Kendini geçtin!"
+        motivation_color = "#27ae60"
+    elif motivation_score >= 3:
+        motivation_msg = "💪 İYİ GİDİYOR! Devam et!"
+        motivation_color = "#f39c12"
+    else:
+        motivation_msg = "🔥 DAHA İYİSİNİ YAPABİLİRSİN!"
+        motivation_color = "#e74c3c"
+    
+    st.markdown(f"""
+    <div style="background: linear-gradient(135deg, {motivation_color} 0%, {motivation_color}AA 100%); 
+                padding: 20px; border-radius: 15px; color: white; text-align: center; margin: 15px 0;">
+        <h3 style="color: white; margin: 0;">{motivation_msg}</h3>
+        <p style="margin: 5px 0;">✨ "En büyük zafer dünkü senle bugünkü senin arasındaki farktır" ✨</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def get_personal_weekly_progress(username):
+    """Son 7 günün kişisel gelişim verilerini al
+    
+    Geçmiş günler arşivlenmiş haftalık snapshot'lardan okunur; sadece
+    arşivde olmayan günler (bugün dahil) ham geçmişten hesaplanır.
+    """
+    try:
+        # Kullanıcı verilerini al
+        if username == st.session_state.current_user:
+            user_data = get_user_data()
+        else:
+            users_db = load_users_from_firebase()
+            user_data = users_db.get(username, {})
+        
+        today = current_time()
+        day_keys = [(today - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(6, -1, -1)]
+        
+        archived = get_archived_daily_stats(username, day_keys[:-1])
+        missing_days = [day_key for day_key in day_keys if day_key not in archived]
+        live = calculate_user_daily_stats(user_data, missing_days) if missing_days else {}
+        
+        # Eski tarihten yeni tarihe sıralı
+        return [dict(archived.get(day_key) or live[day_key], date=day_key) for day_key in day_keys]
+        
+    except Exception as e:
+        return []
+
+def find_user_rank(weekly_leaders, username):
+    """Kullanıcının haftalık sıralamasını bulur"""
+    if isinstance(weekly_leaders, LeaderboardIndex):
+        return weekly_leaders.rank(username)
+    for i, leader in enumerate(weekly_leaders):
+        if leader['username'] == username:
+            return i + 1
+    return None
+
+def get_archived_daily_stats(username, day_keys):
+    """Arşivlenmiş günlük istatistikler: {gün: {...}} - arşivde olmayan günler dönmez"""
+    collection = get_firestore_collection('leaderboard_snapshots')
+    if collection is None or not day_keys:
+        return {}
+    
+    cache_key = f"archived_daily_{username}_{day_keys[-1]}"
+    if cache_key in st.session_state:
+        return st.session_state[cache_key]
+    
+    # Günleri ISO haftalarına göre grupla - hafta başına tek okuma
+    weeks = {}
+    for day_key in day_keys:
+        weeks.setdefault(get_iso_week_id(datetime.strptime(day_key, '%Y-%m-%d')), []).append(day_key)
+    
+    archived = {}
+    try:
+        for week_id, week_days in weeks.items():
+            doc = collection.document(week_id).collection('standings').document(username).get()
+            daily = (doc.to_dict() or {}).get('daily', {}) if doc.exists else {}
+            for day_key in week_days:
+                if day_key in daily:
+                    archived[day_key] = daily[day_key]
+    except Exception as e:
+        logger.error("Arşiv okuma hatası: %s", e)
+        return {}
+    
+    st.session_state[cache_key] = archived
+    return archived
+
+def get_user_rank_history(username, weeks=8):
+    """Son kesinleşmiş haftalardaki sıralama: [{'week', 'rank', 'total_score', 'participants'}]"""
+    collection = get_firestore_collection('leaderboard_snapshots')
+    if collection is None:
+        return []
+    
+    cache_key = f"rank_history_{username}_{get_iso_week_id()}"
+    if cache_key in st.session_state:
+        return st.session_state[cache_key]
+    
+    today = current_time()
+    history = []
+    try:
+        for i in range(weeks, 0, -1):
+            week_id = get_iso_week_id(today - timedelta(weeks=i))
+            doc = collection.document(week_id).collection('standings').document(username).get()
+            standing = (doc.to_dict() or {}) if doc.exists else {}
+            if standing.get('rank') is not None:
+                history.append({
+                    'week': week_id,
+                    'rank': standing['rank'],
+                    'total_score': standing.get('total_score', 0),
+                    'participants': standing.get('participants', 0)
+                })
+    except Exception as e:
+        logger.error("Sıralama geçmişi okuma hatası: %s", e)
+        return []
+    
+    st.session_state[cache_key] = history
+    return history
+
+def get_latest_leaderboard_snapshot(week_id=None):
+    """Bu haftanın son liderboard snapshot'ı (yoksa None)"""
+    collection = get_firestore_collection('leaderboard_snapshots')
+    if collection is None:
+        return None
+    try:
+        doc = collection.document(week_id or get_iso_week_id()).get()
+        return doc.to_dict() if doc.exists else None
+    except Exception as e:
+        logger.error("Liderboard snapshot okuma hatası: %s", e)
+        return None
+
+def render(user_data, progress_data, target_dept):
+    """🏆 Rekabet Panosu"""
+    competition_leaderboard_page(user_data)
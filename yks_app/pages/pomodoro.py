@@ -0,0 +1,1523 @@
+"""
+🍅 Pomodoro Timer sayfası
+Sayfa ilk seçildiğinde import edilir (yks_app.pages.render_page)
+"""
+
+import streamlit.components.v1 as components
+
+from yks_app.core import *
+from yks_app.planner import *
+
+# === ⏱️ TARAYICI TARAFLI SAYAÇ ===
+# Geri sayım, nefes molası, mola geçişi ve sesler bileşende çalışır; Python'a sadece
+# başlat/duraklat/sıfırla/tamamla ve nefes molası başı-sonu olaylarında dönülür (saniyelik rerun yok)
+POMODORO_TIMER_KEY = 'pomodoro_timer_component'
+BREATHING_DURATION = 60
+_pomodoro_timer_component = components.declare_component(
+    'pomodoro_timer',
+    path=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'frontend', 'pomodoro_timer')
+)
+
+def play_pomodoro_finished_sound():
+    """🚀 OPTİMİZE EDİLMİŞ: Sadece görsel bildirim - Download azalması"""
+    st.markdown("""
+    <script>
+    // Sadece görsel bildirim - Base64 ses dosyası yok
+    const notification = document.createElement('div');
+    notification.style.position = 'fixed';
+    notification.style.top = '20px';
+    notification.style.right = '20px';
+    notification.style.background = '#ff6b6b';
+    notification.style.color = 'white';
+    notification.style.padding = '15px 20px';
+    notification.style.borderRadius = '8px';
+    notification.style.boxShadow = '0 4px 12px rgba(255, 107, 107, 0.3)';
+    notification.style.zIndex = '9999';
+    notification.style.transform = 'translateX(0)';
+    notification.style.transition = 'transform 0.5s ease-out';
+    notification.innerHTML = '🎉 Pomodoro Tamamlandı! Mola zamanı! 🔔';
+    document.body.appendChild(notification);
+    
+    setTimeout(() => {
+        notification.style.transform = 'translateX(100%)';
+        setTimeout(() => {
+            if (notification.parentNode) {
+                notification.parentNode.removeChild(notification);
+            }
+        }, 500);
+    }, 3000);
+    </script>
+    """, unsafe_allow_html=True)
+
+def play_break_start_sound():
+    """🚀 OPTİMİZE EDİLMİŞ: Mola bildirimı - Download azalması"""
+    st.markdown("""
+    <script>
+    // Sadece görsel bildirim - Base64 ses dosyası yok
+    const notification = document.createElement('div');
+    notification.style.position = 'fixed';
+    notification.style.top = '20px';
+    notification.style.right = '20px';
+    notification.style.background = '#28a745';
+    notification.style.color = 'white';
+    notification.style.padding = '15px 20px';
+    notification.style.borderRadius = '8px';
+    notification.style.boxShadow = '0 4px 12px rgba(40, 167, 69, 0.3)';
+    notification.style.zIndex = '9999';
+    notification.innerHTML = '⏰ Mola Başladı! Rahatlamaya zaman! 😌';
+    document.body.appendChild(notification);
+    
+    setTimeout(() => {
+        if (notification.parentNode) {
+            notification.parentNode.removeChild(notification);
+        }
+    }, 3000);
+    </script>
+    """, unsafe_allow_html=True)
+# get_topic_net_from_sources'un kaynak önceliği (netsiz kayıtlar atlanır)
+PLAN_NET_SOURCE_ORDER = ('progress', 'tracking', 'mastery', 'evaluation_levels')
+
+
+
+def pomodoro_timer_page(user_data):
+    """🍅 Hibrit Pomodoro Timer - Akıllı Nefes Sistemi ile"""
+    st.markdown(f'<div class="main-header"><h1>🍅 Hibrit Pomodoro Timer</h1><p>Akıllı nefes sistemi ile verimli çalışma - Sıkıldığında "Nefes Al" butonuna bas!</p></div>', unsafe_allow_html=True)
+    
+    # Session state başlat
+    init_pomodoro_session_state()
+    
+    # Ana pomodoro arayüzü
+    show_pomodoro_interface(user_data)
+    
+    # Bugünkü istatistikler
+    show_daily_pomodoro_stats(user_data)
+    
+    # Çalışma geçmişi
+    show_pomodoro_history(user_data)
+
+def init_pomodoro_session_state():
+    """Pomodoro session state'ini başlat ve eski değerleri yeni preset'lere migrate et"""
+    
+    # Mevcut preset isimleri
+    valid_presets = ['Kısa Odak (25dk+5dk)', 'Standart Odak (35dk+10dk)', 
+                     'Derin Odak (50dk+15dk)', 'Tam Konsantrasyon (90dk+25dk)']
+    
+    # Eski preset isimlerinden yeni preset isimlerine migration map
+    preset_migration = {
+        'Pomodoro (25dk)': 'Kısa Odak (25dk+5dk)',
+        'Kısa Mola (5dk)': 'Kısa Odak (25dk+5dk)',
+        'Uzun Mola (15dk)': 'Derin Odak (50dk+15dk)',
+        'Derin Odak (50dk)': 'Derin Odak (50dk+15dk)'
+    }
+    
+    if 'pomodoro_active' not in st.session_state:
+        st.session_state.pomodoro_active = False
+        
+    # Pomodoro türü kontrolü ve migration
+    if 'pomodoro_type' not in st.session_state:
+        st.session_state.pomodoro_type = 'Kısa Odak (25dk+5dk)'
+    else:
+        # Eğer mevcut preset geçersizse, migrate et veya varsayılana dön
+        if st.session_state.pomodoro_type not in valid_presets:
+            if st.session_state.pomodoro_type in preset_migration:
+                st.session_state.pomodoro_type = preset_migration[st.session_state.pomodoro_type]
+                st.info(f"🔄 Pomodoro ayarınız yeni sisteme güncellendi: {st.session_state.pomodoro_type}")
+            else:
+                st.session_state.pomodoro_type = 'Kısa Odak (25dk+5dk)'
+                st.warning("⚠️ Eski Pomodoro ayarı tespit edildi, varsayılan preset seçildi.")
+    
+    if 'time_remaining' not in st.session_state:
+        st.session_state.time_remaining = 25 * 60  # 25 dakika
+    if 'start_time' not in st.session_state:
+        st.session_state.start_time = None
+    if 'current_subject' not in st.session_state:
+        st.session_state.current_subject = ''
+    if 'current_topic' not in st.session_state:
+        st.session_state.current_topic = ''
+    if 'daily_pomodoros' not in st.session_state:
+        st.session_state.daily_pomodoros = []
+    # Eski günlük hedef sistemi kaldırıldı - artık haftalık hedef konular kullanılıyor
+    
+    # === HİBRİT POMODORO SİSTEMİ İÇİN YENİ SESSION STATES ===
+    if 'breathing_active' not in st.session_state:
+        st.session_state.breathing_active = False
+    if 'breathing_paused_time' not in st.session_state:
+        st.session_state.breathing_paused_time = 0
+    if 'breath_time_remaining' not in st.session_state:
+        st.session_state.breath_time_remaining = 60
+    if 'breath_start_time' not in st.session_state:
+        st.session_state.breath_start_time = None
+    if 'current_motivation_type' not in st.session_state:
+        st.session_state.current_motivation_type = 'quote'
+    if 'current_motivation_content' not in st.session_state:
+        st.session_state.current_motivation_content = ''
+    if 'breathing_usage_log' not in st.session_state:
+        st.session_state.breathing_usage_log = []
+    
+    # === REKABET SİSTEMİ SESSION STATES === (Basit sistem, fazla state yok)
+
+def show_pomodoro_interface(user_data):
+    """Ana pomodoro arayüzünü gösterir - Hibrit Pomodoro Sistemi ile"""
+    
+    # === HİBRİT SİSTEM GÜNCELLEMELERİ ===
+    
+    # Sayaç bileşeninden gelen olay (başlat/duraklat/sıfırla/tamamla/nefes)
+    handle_pomodoro_timer_event(user_data)
+    sync_pomodoro_timer()
+    
+    # Sekme kapalıyken süre dolduysa (bileşen olay gönderemedi) burada tamamlanır
+    if st.session_state.breathing_active and st.session_state.breath_time_remaining <= 0:
+        complete_breathing_exercise()
+    if st.session_state.pomodoro_active and not st.session_state.breathing_active \
+            and st.session_state.time_remaining <= 0:
+        # SESLİ UYARI: Pomodoro bitti! 🔔
+        play_pomodoro_finished_sound()
+        complete_pomodoro(user_data)
+    
+    # Pomodoro türleri
+    # Bilimsel Temelli Pomodoro Preset Seçenekleri
+    pomodoro_types = {
+        'Kısa Odak (25dk+5dk)': {
+            'duration': 25, 
+            'break_duration': 5, 
+            'color': '#ff6b6b', 
+            'icon': '🍅',
+            'description': 'Standart Pomodoro - Çoğu öğrenci için ideal başlangıç',
+            'scientific_info': 'Beynin dikkat süresi ortalama 20-25 dk. Kısa molalar hafızayı güçlendirir.'
+        },
+        'Standart Odak (35dk+10dk)': {
+            'duration': 35, 
+            'break_duration': 10, 
+            'color': '#4ecdc4', 
+            'icon': '📚',
+            'description': 'Orta seviye konsantrasyon - Alışkanlık kazandıktan sonra',
+            'scientific_info': 'Uzun odaklanma süresi derin öğrenmeyi destekler. 10dk mola beynin dinlenmesi için yeterli.'
+        },
+        'Derin Odak (50dk+15dk)': {
+            'duration': 50, 
+            'break_duration': 15, 
+            'color': '#3742fa', 
+            'icon': '🧘',
+            'description': 'İleri seviye - Zor konular için önerilen süre',
+            'scientific_info': 'Beynin maksimum odaklanma eşiği 45-60dk. Bu süre karmaşık problemler için idealdir.'
+        },
+        'Tam Konsantrasyon (90dk+25dk)': {
+            'duration': 90, 
+            'break_duration': 25, 
+            'color': '#a55eea', 
+            'icon': '🚀',
+            'description': 'Uzman seviye - Çok zorlu konular ve sınav hazırlığı',
+            'scientific_info': 'Ultradian ritim döngüsü ~90dk. Uzun molalar beyni tamamen yeniler.'
+        }
+    }
+    
+    # Timer gösterimi
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        # Güvenlik kontrolü: Eğer session'daki pomodoro_type geçersizse varsayılana dön
+        if st.session_state.pomodoro_type not in pomodoro_types:
+            st.session_state.pomodoro_type = 'Kısa Odak (25dk+5dk)'
+            st.warning("⚠️ Geçersiz Pomodoro türü tespit edildi, varsayılan ayar yüklendi.")
+            st.rerun()
+        
+        # Sayaç, nefes molası ve kontrol butonları tek bileşende
+        _pomodoro_timer_component(state=build_pomodoro_timer_state(pomodoro_types[st.session_state.pomodoro_type]),
+                                  key=POMODORO_TIMER_KEY, default=None)
+    
+    st.markdown("---")
+    
+    # Pomodoro türü seçimi - Bilimsel temelli yaklaşım
+    st.markdown("### 🧪 Pomodoro Preset'i Seçin")
+    
+    cols = st.columns(2)
+    for i, (pom_type, info) in enumerate(pomodoro_types.items()):
+        with cols[i % 2]:
+            # Aktif türü vurgula
+            is_active = st.session_state.pomodoro_type == pom_type
+            
+            # Mola süresi sınırlandırması kontrolü
+            can_select = True
+            warning_msg = ""
+            
+            if pom_type == 'Tam Konsantrasyon (90dk+25dk)' and not is_active:
+                # 90 dakika çalışma yapan herkes 25 dk mola alabilir
+                warning_msg = "⚠️ 90dk yoğun çalışma sonrası uzun mola gerekli!"
+            elif pom_type == 'Derin Odak (50dk+15dk)' and not is_active:
+                # 50dk çalışma yapan 15dk mola alabilir
+                warning_msg = "🧪 50dk derin odaklanma için 15dk mola önerilir!"
+            elif pom_type in ['Standart Odak (35dk+10dk)', 'Kısa Odak (25dk+5dk)'] and not is_active:
+                # 25dk ve 35dk çalışanlar uzun mola alamaz
+                if st.session_state.pomodoro_type in ['Tam Konsantrasyon (90dk+25dk)', 'Derin Odak (50dk+15dk)']:
+                    can_select = True  # Daha uzun süreden kısa süreye geçebilir
+                warning_msg = f"🚨 {pom_type.split('(')[1].split(')')[0]} çalışanlar uzun mola yapamaz!"
+            
+            # Preset butonu ve açıklaması
+            container = st.container()
+            with container:
+                if st.button(
+                    f"{info['icon']} **{pom_type}**\n{info['description']}", 
+                    key=f"pom_type_{i}",
+                    use_container_width=True,
+                    disabled=st.session_state.pomodoro_active or not can_select,
+                    type="primary" if is_active else "secondary"
+                ):
+                    st.session_state.pomodoro_type = pom_type
+                    st.session_state.time_remaining = info['duration'] * 60
+                    st.success(f"🎉 {pom_type} seçildi! Çalışma süresi: {info['duration']}dk, Mola süresi: {info['break_duration']}dk")
+                    st.rerun()
+                
+                # Bilimsel açıklama
+                with st.expander(f"🔬 Bilimsel Temeli - {pom_type.split('(')[0].strip()}", expanded=False):
+                    st.info(f"🧪 **Bilimsel Açıklama:**\n{info['scientific_info']}")
+                    
+                    if warning_msg:
+                        st.warning(warning_msg)
+                        
+                st.markdown("---")
+    
+    st.markdown("---")
+    
+    # Çalışma konusu seçimi
+    st.markdown("### 📚 Ders:")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Ders seçimi
+        student_field = user_data.get('field', '')
+        available_subjects = get_subjects_by_field_yks(student_field)
+        
+        # Özel kategoriler ekle
+        special_categories = ["📝 Deneme Sınavı", "📂 Diğer"]
+        all_subject_options = ["Seçiniz..."] + available_subjects + special_categories
+        
+        selected_subject = st.selectbox(
+            "Ders:",
+            all_subject_options,
+            index=0 if not st.session_state.current_subject else (
+                all_subject_options.index(st.session_state.current_subject) 
+                if st.session_state.current_subject in all_subject_options else 0
+            ),
+            disabled=st.session_state.pomodoro_active
+        )
+        
+        if selected_subject != "Seçiniz...":
+            st.session_state.current_subject = selected_subject
+
+    with col2:
+        # Konu seçimi - Eğer normal ders seçildiyse konu takipten konuları getir
+        if (st.session_state.current_subject and 
+            st.session_state.current_subject not in ["Seçiniz...", "📝 Deneme Sınavı", "📂 Diğer"]):
+            
+            # Konu takipten konuları getir
+            available_topics = get_topic_list(st.session_state.current_subject)
+            topic_options = ["Manuel Konu Girişi..."] + available_topics
+            
+            selected_topic = st.selectbox(
+                "Konu:",
+                topic_options,
+                index=0 if not st.session_state.current_topic else (
+                    topic_options.index(st.session_state.current_topic) 
+                    if st.session_state.current_topic in topic_options else 0
+                ),
+                disabled=st.session_state.pomodoro_active,
+                help="Konu Takip'ten otomatik olarak konular getirildi. Manuel giriş için 'Manuel Konu Girişi...' seçin."
+            )
+            
+            if selected_topic == "Manuel Konu Girişi...":
+                # Manuel konu girişi
+                manual_topic = st.text_input(
+                    "Manuel Konu:",
+                    value=st.session_state.current_topic if st.session_state.current_topic not in topic_options else "",
+                    placeholder="örn: Temel Kavramlar - Basamak",
+                    disabled=st.session_state.pomodoro_active
+                )
+                if manual_topic:
+                    st.session_state.current_topic = manual_topic
+            else:
+                if selected_topic and selected_topic != "Manuel Konu Girişi...":
+                    # Konu takipten seçilen konuyu kısalt (sadece konu adını göster)
+                    if " | " in selected_topic:
+                        topic_parts = selected_topic.split(" | ")
+                        display_topic = topic_parts[-1]  # Son kısmı (gerçek konu adı)
+                    else:
+                        display_topic = selected_topic
+                    st.session_state.current_topic = display_topic
+        else:
+            # YKS Canlı Takip'ten haftalık hedef konuları ve tüm konuları al
+            student_field = user_data.get('field', '')
+            survey_data_raw = user_data.get('yks_survey_data', '{}')
+            survey_data = json.loads(survey_data_raw) if isinstance(survey_data_raw, str) else survey_data_raw if user_data.get('yks_survey_data') else {}
+            weekly_plan = get_weekly_topics_from_topic_tracking(user_data, student_field, survey_data)
+            
+            # Haftalık hedef konuları
+            weekly_target_topics = weekly_plan.get('new_topics', []) + weekly_plan.get('review_topics', [])
+            
+            # Tüm konular (konu takipten)
+            all_topics_raw = weekly_plan.get('all_topics', [])
+            
+            # Konu seçeneklerini kategorize ederek hazırla
+            topic_options = ["🔄 Yeni Konu Seç..."]
+            
+            # 1. Haftalık Hedef Konular bölümü (sadece konu isimleri)
+            if weekly_target_topics:
+                topic_options.append("─── 🎯 HAFTALİK HEDEF KONULAR ───")
+                for topic in weekly_target_topics[:10]:  # Max 10 konu
+                    topic_name = topic.get('topic', topic.get('subject', str(topic)))
+                    # Öncelikli konuları ⭐ ile vurgula
+                    if topic.get('priority') == 'high':
+                        topic_options.append(f"⭐ {topic_name} (Öncelikli)")
+                    else:
+                        topic_options.append(f"🎯 {topic_name}")
+            
+            # 2. Tüm Konular bölümü
+            if all_topics_raw:
+                topic_options.append("─── 📚 TÜM KONULAR ───")
+                for topic in all_topics_raw[:15]:  # Max 15 konu
+                    topic_name = topic.get('topic', topic.get('subject', str(topic)))
+                    # Duplicate kontrolü
+                    if f"🎯 {topic_name}" not in topic_options:
+                        topic_options.append(f"📚 {topic_name}")
+            
+            # 3. Deneme Sınavı seçeneği
+            topic_options.append("─── 📝 ÖZELLEŞTİRİLMİŞ ───")
+            topic_options.append("📝 Deneme Sınavı")
+            
+            # 4. Diğer (Manuel) seçeneği
+            topic_options.append("📂 Diğer")
+            
+            # Konu seçimi dropdown
+            selected_topic_option = st.selectbox(
+                "Konu/Açıklama:",
+                options=topic_options,
+                index=0 if not st.session_state.current_topic else 
+                      next((i for i, opt in enumerate(topic_options) 
+                           if st.session_state.current_topic in opt), 0),
+                disabled=st.session_state.pomodoro_active,
+                key="topic_selection_pomodoro"
+            )
+            
+            # Seçilen konuya göre işlem yap
+            if selected_topic_option.startswith("───"):
+                # Başlık seçilmişse varsayılana dön
+                st.warning("⚠️ Lütfen bir konu seçin, başlık seçilemez.")
+                st.session_state.current_topic = ""
+            elif selected_topic_option == "📂 Diğer":
+                # Manuel konu girişi
+                manual_topic_input = st.text_input(
+                    "Manuel Konu Girişi:",
+                    value=st.session_state.current_topic if not any(
+                        st.session_state.current_topic.startswith(prefix) for prefix in ["🎯 ", "📝 ", "📚 "]
+                    ) else "",
+                    placeholder="örn: Özet Çıkarma, Formül Tekrarı, Defter Düzenleme",
+                    disabled=st.session_state.pomodoro_active,
+                    key="manual_topic_pomodoro"
+                )
+                
+                if manual_topic_input:
+                    st.session_state.current_topic = manual_topic_input
+            elif selected_topic_option == "📝 Deneme Sınavı":
+                # Deneme sınavı için özel alan
+                deneme_input = st.text_input(
+                    "Deneme Sınavı Detayı:",
+                    value=st.session_state.current_topic if "Deneme" in str(st.session_state.current_topic) else "",
+                    placeholder="örn: TYT Deneme 5, AYT Mat Deneme 3, Fizik Konu Deneme",
+                    disabled=st.session_state.pomodoro_active,
+                    key="deneme_topic_pomodoro"
+                )
+                
+                if deneme_input:
+                    st.session_state.current_topic = f"Deneme: {deneme_input}"
+            elif selected_topic_option != "🔄 Yeni Konu Seç...":
+                # Konu listelerinden seçim yapıldı
+                if selected_topic_option.startswith("🎯 "):
+                    # Haftalık hedef konular - çalışma türü seçimi göster
+                    base_topic = selected_topic_option.replace("🎯 ", "")
+                    
+                    # 2. AŞAMA: Çalışma türü seçimi
+                    st.markdown("#### 🎯 Çalışma Türü Seçin:")
+                    
+                    study_type_options = [
+                        "📖 Konu Çalışması - Yeni kavramları öğrenme",
+                        "🔄 Tekrar - Daha önce öğrenilenları pekiştirme", 
+                        "✏️ Soru Çözüm - Pratik yapma ve test etme"
+                    ]
+                    
+                    selected_study_type = st.selectbox(
+                        "Nasıl çalışacaksınız?",
+                        options=study_type_options,
+                        disabled=st.session_state.pomodoro_active,
+                        key="study_type_selection_pomodoro"
+                    )
+                    
+                    if selected_study_type:
+                        # Çalışma türünü parse et
+                        study_type_short = selected_study_type.split(" - ")[0].replace("📖 ", "").replace("🔄 ", "").replace("✏️ ", "")
+                        emoji = selected_study_type.split(" ")[0]
+                        
+                        # Final topic oluştur
+                        st.session_state.current_topic = f"{emoji} {base_topic} ({study_type_short})"
+                    
+                    # Haftalık hedef konularından detay göster
+                    selected_topic_detail = None
+                    for topic in weekly_target_topics:
+                        topic_name = topic.get('topic', topic.get('subject', str(topic)))
+                        if base_topic == topic_name:
+                            selected_topic_detail = topic
+                            break
+                    
+                    if selected_topic_detail:
+                        topic_subject = selected_topic_detail.get('subject', 'Bilinmiyor')
+                        topic_priority = selected_topic_detail.get('priority', 'NORMAL')
+                        topic_reason = selected_topic_detail.get('reason', 'Haftalık plan')
+                        
+                        priority_info = {
+                            'HIGH': {'icon': '🔴', 'name': 'Yüksek'},
+                            'MEDIUM': {'icon': '🟡', 'name': 'Orta'},
+                            'NORMAL': {'icon': '🟢', 'name': 'Normal'},
+                            'LOW': {'icon': '🔵', 'name': 'Düşük'},
+                            'MINIMAL': {'icon': '⚪', 'name': 'Minimal'}
+                        }
+                        
+                        priority_data = priority_info.get(topic_priority, priority_info['NORMAL'])
+                        
+                        st.info(f"""
+                        **📚 Ders:** {topic_subject}  
+                        **⚡ Öncelik seviyesi:** {priority_data['icon']} {priority_data['name']}  
+                        **📋 Neden bu hafta planında:** {topic_reason}
+                        """)
+                        
+                elif selected_topic_option.startswith("📚 "):
+                    # Tüm konular bölümünden seçim
+                    clean_topic = selected_topic_option.replace("📚 ", "")
+                    st.session_state.current_topic = clean_topic
+                    
+                    # Tüm konularda ara
+                    selected_topic_detail = None
+                    if all_topics_raw:
+                        for topic in all_topics_raw:
+                            topic_name = topic.get('topic', topic.get('subject', str(topic)))
+                            if clean_topic == topic_name:
+                                selected_topic_detail = topic
+                                break
+                    
+                    if selected_topic_detail:
+                        topic_subject = selected_topic_detail.get('subject', 'Bilinmiyor')
+                        st.info(f"**📚 Ders:** {topic_subject}")
+
+            
+            # Eğer hiçbir konu seçilmemişse varsayılan değer
+            if not st.session_state.current_topic and selected_topic_option == "🔄 Yeni Konu Seç...":
+                st.session_state.current_topic = ""
+    
+    # Bu haftanın hedef konuları
+    st.markdown("### 🎯 HAFTALİK HEDEF KONULAR - TAM MANTIK")
+    
+    # Algoritma açıklaması
+    with st.expander("🤖 Haftalık Hedef Konuların Nasıl Belirleniyor? (Algoritma Mantığı)", expanded=False):
+        st.markdown("""
+        İşte haftalık hedef konuların tam olarak neye göre belirlendiği:
+        
+        ## 🔥 1. ÖNCELIK SIRALAMASI (En Kritik)
+        
+        **A) Ders Önem Puanları:**
+        - 🔢 **TYT Matematik:** 10 puan (En kritik)
+        - 📝 **TYT Türkçe:** 9 puan  
+        - 🎯 **AYT Matematik:** 10 puan
+        - ⚛️ **TYT Fizik/Kimya:** 8 puan
+        - 🧠 **TYT Felsefe/Din:** 4 puan (2-3. hafta sonra başlar)
+        
+        **B) Haftalık Konu Limitleri:**
+        - 📊 **10 puan** → 5 konu/hafta
+        - 📊 **9 puan** → 4 konu/hafta  
+        - 📊 **8 puan** → 3 konu/hafta
+        - 📊 **7 puan** → 2 konu/hafta
+        - 📊 **4 puan** → 1 konu/hafta
+        
+        ## 📊 2. PERFORMANS DEĞERLENDİRMESİ
+        
+        **Öncelik Hesaplama Formülü:**
+        ```
+        Base Puan + Deneme Boost + Anket Etkisi = Final Öncelik
+        ```
+        
+        **Net Seviyesine Göre:**
+        - 🚨 **0-5 net:** 85 puan (ACİL - Çok zayıf)
+        - 🟡 **6-8 net:** 70 puan (ÖNCELİKLİ - Temel)
+        - 🟢 **9-14 net:** 50 puan (NORMAL - Orta)
+        - 🔵 **15-18 net:** 30 puan (DÜŞÜK - İyi)
+        - 💎 **18+ net:** 15 puan (MİNİMAL - Uzman)
+        
+        **Deneme Analizi Boost'u:**
+        - Son 3 denemede %60'ın altında net → **+20 puan boost**
+        
+        ## 🔄 3. YENİ vs TEKRAR KONULAR
+        
+        **Yeni Konular:**
+        - Net değeri 14'ün altında olan konular
+        - Ders önem sırasına göre sıralı seçim
+        - Her dersten limit kadar (1-5 konu)
+        
+        **Tekrar Konular:**
+        - Aralıklı tekrar sistemi (3-7-7-7-7 gün)
+        - Zamanı gelen konular otomatik seçilir
+        - Maksimum 8 tekrar konu/hafta
+        
+        ## 🎮 4. TYT/AYT GEÇİŞ SİSTEMİ
+        
+        **AYT Başlatma Koşulları:**
+        - TYT matematik konularının belirli oranı tamamlanmış olmalı
+        - TYT genel ilerlemesi yeterli seviyede olmalı
+        - Alan seçimine uygun dersler aktif edilir
+        
+        ## 📝 5. ANKET VERİSİ ETKİSİ
+        - 🔥 **Zor Dersler:** +10 puan boost
+        - ❤️ **Sevilen Dersler:** +15 puan boost
+        - 😐 **Sevilmeyen Dersler:** -5 puan (hafif azalma)
+        
+        ## ⏰ 6. DİNAMİK ZAMAN KONTROLÜ
+        - **İlk 2 hafta:** Sadece yüksek öncelikli dersler (8+ puan)
+        - **3. hafta sonrası:** Düşük öncelikli dersler de dahil edilir
+        
+        ## 🤖 ÖZET: HAFTALİK PLANLAMA ALGORİTMASI
+        
+        1. 📋 Tüm dersleri öncelik sırasına göre sırala
+        2. 🎯 Her dersten net 14'ün altındaki konuları al
+        3. ⚖️ Ders önemine göre haftalık limit uygula
+        4. 🔄 Tekrar zamanı gelmiş 8 konuyu ekle
+        5. ✅ Toplam ~15-20 konu haftalık hedef olur
+        
+        **Bu sistem sayesinde:** Zayıf konular öncelenirken, önemli derslerden daha fazla konu alınır ve tekrarlar da unutulmuyor! 🎯
+        """)
+    
+    # Kullanıcı verilerini al
+    student_field = user_data.get('field', '')
+    survey_data_raw = user_data.get('survey_data', '{}')
+    survey_data = json.loads(survey_data_raw) if isinstance(survey_data_raw, str) else survey_data_raw if user_data.get('survey_data') else {}
+    
+    # Haftalık hedef konuları çek - KOÇ ONAYLARIYLA BİRLİKTE
+    weekly_plan = create_dynamic_weekly_plan(user_data, student_field, survey_data)
+    weekly_target_topics = weekly_plan.get('new_topics', []) + weekly_plan.get('review_topics', [])
+    
+
+
+    if weekly_target_topics:
+        st.info("📋 Haftalık hedef konular listesi:")
+        for i, topic in enumerate(weekly_target_topics[:5]):  # İlk 5 konuyu göster
+            st.info(f"  {i+1}. {topic.get('subject', 'N/A')} - {topic.get('topic', 'N/A')} - Net: {topic.get('net', 'N/A')}")
+    else:
+        st.warning("⚠️ Hiç haftalık hedef konu bulunamadı!")
+    
+    if weekly_target_topics:
+        # Haftalık hedef konularını görüntüle
+        st.markdown("#### 📋 YKS Canlı Takip'ten Hedef Konular")
+        
+
+        try:
+            from datetime import datetime
+            coach_approved_topics = get_approved_coached_topics(user_data)
+            if coach_approved_topics:
+                st.success(f"✅ {len(coach_approved_topics)} adet koç onaylı konu entegre edildi!")
+            else:
+                st.info("ℹ️ Henüz koç onaylı konu yok")
+        except Exception as coach_debug_error:
+            pass        # Bu haftaki pomodorolardan konu bazında ilerleme hesapla
+        topic_progress_in_pomodoros = {}
+        
+        # Bu haftanın günlük pomodoro özetlerinden konu sayıları
+        try:
+            topic_progress_in_pomodoros = get_weekly_pomodoro_topic_counts(user_data)
+        except Exception as e:
+            st.warning("Haftalık ilerleme hesaplanırken hata oluştu.")
+            topic_progress_in_pomodoros = {}
+        
+        # Hedef konuları tabloda göster
+        cols = st.columns([3, 1, 1, 1])
+        
+        with cols[0]:
+            st.markdown("**📚 Hedef Konu**")
+        with cols[1]:
+            st.markdown("**🎯 Net**")
+        with cols[2]:
+            st.markdown("**🍅 Bu Hafta**")
+        with cols[3]:
+            st.markdown("**📊 Durum**")
+        
+        st.markdown("---")
+        
+        for i, topic in enumerate(weekly_target_topics[:8]):  # Max 8 konu göster
+            cols = st.columns([3, 1, 1, 1])
+            
+            # Konu adını kısalt
+            topic_display = f"{topic['subject']} - {topic.get('detail', topic.get('topic', 'Bilinmiyor'))}"
+            if len(topic_display) > 40:
+                topic_display = topic_display[:37] + "..."
+            
+            # 🔥 NET DEĞERİNİ DOĞRU ÇEK - GELİŞMİŞ SİSTEM
+            topic_net = get_topic_net_from_sources(topic, user_data)
+            
+            # Bu konuda bu hafta kaç pomodoro yapıldı
+            pomodoros_this_week = topic_progress_in_pomodoros.get(topic.get('detail', topic.get('topic', '')), 0)
+            
+            # Net değerine göre renk - DOĞRU SEVİYE BELİRLEME
+            if topic_net >= 15:
+                status_color = "🟢"
+                status_text = "Çok İyi"
+            elif topic_net >= 12:
+                status_color = "🟠"
+                status_text = "İyi"
+            elif topic_net >= 8:
+                status_color = "🟡"
+                status_text = "Orta"
+            elif topic_net >= 5:
+                status_color = "🟠"
+                status_text = "Gelişim Gerekli"
+            else:
+                status_color = "🔴"
+                status_text = "Çok Zayıf"
+            
+            with cols[0]:
+                st.write(f"**{topic_display}**")
+            with cols[1]:
+                st.write(f"**{topic_net}**")
+            with cols[2]:
+                if pomodoros_this_week > 0:
+                    st.write(f"**{pomodoros_this_week}** 🍅")
+                else:
+                    st.write("-")
+            with cols[3]:
+                st.write(f"{status_color} {status_text}")
+                st.write(f"{status_color} {status_text}")
+        
+        # Haftalık özet
+        st.markdown("---")
+        
+        total_weekly_pomodoros = sum(topic_progress_in_pomodoros.values())
+        completed_today = len(st.session_state.daily_pomodoros)
+        
+        summary_col1, summary_col2, summary_col3 = st.columns(3)
+        
+        with summary_col1:
+            st.metric("🍅 Bugün", completed_today)
+        with summary_col2:
+            st.metric("📅 Bu Hafta", total_weekly_pomodoros)
+        with summary_col3:
+            topics_worked_this_week = len([k for k, v in topic_progress_in_pomodoros.items() if v > 0])
+            st.metric("📚 Çalışılan Konu", f"{topics_worked_this_week}/{len(weekly_target_topics)}")
+        
+        # Motivasyon mesajı
+        if topics_worked_this_week >= len(weekly_target_topics) // 2:
+            st.success("🎉 Harika gidiyorsun! Haftalık hedeflerinin yarısından fazlasında çalıştın!")
+        elif topics_worked_this_week > 0:
+            st.info("💪 İyi başlangıç! Hedef konularında çalışmaya devam et!")
+        else:
+            st.warning("🎯 Bu hafta henüz hedef konularında çalışmadın. Başlamak için şimdi güzel bir zaman!")
+            
+    else:
+        # Hedef konu bulunamadıysa alternatif göster
+        completed_today = len(st.session_state.daily_pomodoros)
+        
+        st.info("📋 Bu hafta için hedef konu bulunamadı. **YKS Canlı Takip** sekmesinde konularınızı değerlendirin ve haftalık programınızı oluşturun.")
+        
+        # Basit günlük metrik
+        summary_col1, summary_col2 = st.columns(2)
+        
+        with summary_col1:
+            st.metric("🍅 Bugün Tamamlanan", completed_today)
+        with summary_col2:
+            # Son 7 günlük pomodoro sayısı
+            try:
+                today = current_time().date()
+                last_days = pomodoro_rollup_days(load_pomodoro_rollups(user_data), today - timedelta(days=7), today)
+                weekly_count = sum(day.get('count', 0) for day in last_days)
+                
+                st.metric("📅 Son 7 Gün", weekly_count)
+            except:
+                st.metric("📅 Son 7 Gün", "?")
+    
+
+def sync_pomodoro_timer():
+    """Geçen süreyi session state'e işler (saniyelik rerun yok; olay ve render anında çağrılır)"""
+    now = time.time()
+    if st.session_state.breathing_active and st.session_state.breath_start_time:
+        elapsed = now - st.session_state.breath_start_time
+        st.session_state.breath_time_remaining = max(0, BREATHING_DURATION - elapsed)
+    
+    # Normal Pomodoro timer güncellemesi (nefes sırasında duraklatılmış olabilir)
+    if st.session_state.pomodoro_active and st.session_state.start_time and not st.session_state.breathing_active:
+        elapsed = now - st.session_state.start_time
+        st.session_state.time_remaining = max(0, st.session_state.time_remaining - elapsed)
+        st.session_state.start_time = now
+
+def handle_pomodoro_timer_event(user_data):
+    """Bileşenin son olayını bir kez işler - değer rerun'lar boyunca aynı kaldığı için id ile ayıklanır"""
+    event = st.session_state.get(POMODORO_TIMER_KEY)
+    if not isinstance(event, dict) or event.get('id') == st.session_state.get('pomodoro_last_event_id'):
+        return
+    st.session_state.pomodoro_last_event_id = event.get('id')
+    sync_pomodoro_timer()
+    
+    action = event.get('action')
+    if action == 'start' and not st.session_state.pomodoro_active:
+        start_pomodoro()
+    elif action == 'pause' and st.session_state.pomodoro_active:
+        pause_pomodoro()
+    elif action == 'reset':
+        reset_pomodoro()
+    elif action == 'complete' and st.session_state.pomodoro_active and not st.session_state.breathing_active:
+        complete_pomodoro(user_data)
+    elif action == 'breath_start' and st.session_state.pomodoro_active and not st.session_state.breathing_active:
+        start_hibrit_breathing()
+    elif action == 'breath_end' and st.session_state.breathing_active:
+        complete_breathing_exercise()
+
+def build_pomodoro_timer_state(pomodoro_info):
+    """Bileşene gönderilen yetkili durum - kalan süreler göreli saniye"""
+    if st.session_state.breathing_active:
+        status, remaining = 'breathing', st.session_state.breath_time_remaining
+    elif st.session_state.pomodoro_active:
+        status, remaining = 'running', st.session_state.time_remaining
+    else:
+        break_remaining = st.session_state.get('pomodoro_break_ends_at', 0) - time.time()
+        if break_remaining > 0:
+            status, remaining = 'break', break_remaining
+        else:
+            status, remaining = 'paused', st.session_state.time_remaining
+    
+    return {
+        'status': status,
+        'remaining': remaining,
+        'duration': pomodoro_info['duration'] * 60,
+        'label': st.session_state.pomodoro_type.split('(')[0].strip(),
+        'color': pomodoro_info['color'],
+        'motivation': st.session_state.current_motivation_content,
+        'sound': True,
+        'last_event_id': st.session_state.get('pomodoro_last_event_id'),
+    }
+
+def start_pomodoro():
+    """Pomodoro'yu başlat"""
+    if not st.session_state.current_subject or not st.session_state.current_topic:
+        st.error("😱 Lütfen ders ve konu seçin!")
+        return
+    
+    st.session_state.pomodoro_active = True
+    st.session_state.start_time = time.time()
+    st.session_state.pomodoro_break_ends_at = 0
+    st.success(f"✅ {st.session_state.pomodoro_type} başlatıldı!")
+
+def pause_pomodoro():
+    """Pomodoro'yu duraklat"""
+    st.session_state.pomodoro_active = False
+    st.session_state.start_time = None
+    st.warning("⏸️ Pomodoro duraklatıldı")
+
+def reset_pomodoro():
+    """Pomodoro'yu sıfırla"""
+    st.session_state.pomodoro_active = False
+    st.session_state.start_time = None
+    # Nefes molası ve mola geri sayımı da biter
+    st.session_state.breathing_active = False
+    st.session_state.breath_start_time = None
+    st.session_state.pomodoro_break_ends_at = 0
+    
+    # Süreyi türe göre sıfırla
+    duration_map = {
+        'Kısa Odak (25dk+5dk)': 25,
+        'Standart Odak (35dk+10dk)': 35,
+        'Derin Odak (50dk+15dk)': 50,
+        'Tam Konsantrasyon (90dk+25dk)': 90
+    }
+    
+    # Güvenlik kontrolü ile süre ayarla
+    if st.session_state.pomodoro_type in duration_map:
+        st.session_state.time_remaining = duration_map[st.session_state.pomodoro_type] * 60
+    else:
+        # Eğer preset bulunamazsa varsayılana dön
+        st.session_state.pomodoro_type = 'Kısa Odak (25dk+5dk)'
+        st.session_state.time_remaining = 25 * 60
+        st.warning("⚠️ Geçersiz preset tespit edildi, varsayılan ayarlara dönüldü.")
+    
+    st.info("🔄 Pomodoro sıfırlandı")
+
+def complete_pomodoro(user_data):
+    """Pomodoro'yu tamamla ve kaydet - SADECE KONU "İYİ" SEVİYEYE GELİRSE TAMAMLANMIŞ SAYILIR"""
+    # Konu seviyesi kontrolü - ÇOK ÖNEMLİ!
+    current_subject = st.session_state.current_subject
+    current_topic = st.session_state.current_topic
+    
+    # Konu takipte seviye kontrolü yap
+    topic_key = f"{current_subject}_{current_topic}".replace(" ", "_")
+    topic_level = user_data.get('topic_levels', {}).get(topic_key, 'başlangıç')
+    
+    # SADECE "iyi" veya "mükemmel" seviyeye geldiyse tamamlanmış say
+    if topic_level not in ['iyi', 'mükemmel']:
+        # Pomodoro'yu durdur ama tamamlanmış sayma!
+        st.session_state.pomodoro_active = False
+        st.session_state.start_time = None
+        
+        st.warning(f"""
+        ⚠️ **Pomodoro tamamlandı ama konu henüz tamamlanmış sayılmadı!**
+        
+        **📚 Konu:** {current_topic}
+        **📊 Mevcut Seviye:** {topic_level.title()}
+        **🎯 Gerekli Seviye:** İyi veya Mükemmel
+        
+        **Konu takip bölümünden seviyenizi "İyi"ye çıkarın, sonra pomodoro tamamlanmış sayılacak!**
+        """)
+        
+        # Kısmi kayıt oluştur (tamamlanmamış)
+        pomodoro_record = {
+            'timestamp': current_time().isoformat(),
+            'type': st.session_state.pomodoro_type,
+            'subject': current_subject,
+            'topic': current_topic,
+            'completed': False,  # TAMAMLANMADI!
+            'reason': f'Konu seviyesi yetersiz: {topic_level}'
+        }
+        
+        # Günlük listeye ekle (tamamlanmamış olarak)
+        st.session_state.daily_pomodoros.append(pomodoro_record)
+        save_pomodoro_to_user_data(user_data, pomodoro_record)
+        
+        # Timer'i sıfırla
+        duration_map = {
+            'Kısa Odak (25dk+5dk)': 25,
+            'Standart Odak (35dk+10dk)': 35,
+            'Derin Odak (50dk+15dk)': 50,
+            'Tam Konsantrasyon (90dk+25dk)': 90
+        }
+        
+        if st.session_state.pomodoro_type in duration_map:
+            st.session_state.time_remaining = duration_map[st.session_state.pomodoro_type] * 60
+        else:
+            st.session_state.pomodoro_type = 'Kısa Odak (25dk+5dk)'
+            st.session_state.time_remaining = 25 * 60
+        
+        return  # Fonksiyondan çık - tam tamamlanma işlemi yapma
+    
+    # KONU SEVİYESİ YETERLİ - NORMAL TAMAMLANMA İŞLEMİ
+    st.session_state.pomodoro_active = False
+    st.session_state.start_time = None
+    
+    # Kayıt oluştur (GERÇEKTEN TAMAMLANDI)
+    pomodoro_record = {
+        'timestamp': current_time().isoformat(),
+        'type': st.session_state.pomodoro_type,
+        'subject': current_subject,
+        'topic': current_topic,
+        'completed': True,
+        'topic_level': topic_level  # Seviye bilgisi ekle
+    }
+    
+    # Günlük listeye ekle
+    st.session_state.daily_pomodoros.append(pomodoro_record)
+    
+    # Kullanıcı verisine kaydet
+    save_pomodoro_to_user_data(user_data, pomodoro_record)
+    
+    # Timer'i sıfırla
+    duration_map = {
+        'Kısa Odak (25dk+5dk)': 25,
+        'Standart Odak (35dk+10dk)': 35,
+        'Derin Odak (50dk+15dk)': 50,
+        'Tam Konsantrasyon (90dk+25dk)': 90
+    }
+    
+    # Güvenlik kontrolü ile süre ayarla
+    if st.session_state.pomodoro_type in duration_map:
+        st.session_state.time_remaining = duration_map[st.session_state.pomodoro_type] * 60
+    else:
+        # Eğer preset bulunamazsa varsayılana dön
+        st.session_state.pomodoro_type = 'Kısa Odak (25dk+5dk)'
+        st.session_state.time_remaining = 25 * 60
+    
+    # Başarı mesajı ve mola başlangıç sesi
+    break_duration = {
+        'Kısa Odak (25dk+5dk)': 5,
+        'Standart Odak (35dk+10dk)': 10,
+        'Derin Odak (50dk+15dk)': 15,
+        'Tam Konsantrasyon (90dk+25dk)': 25
+    }
+    
+    current_break = break_duration.get(st.session_state.pomodoro_type, 5)
+    # Mola geri sayımı bileşende gösterilir
+    st.session_state.pomodoro_break_ends_at = time.time() + current_break * 60
+    st.success(f"🎉 {st.session_state.pomodoro_type} tamamlandı! Şimdi {current_break} dakika mola zamanı! 💨")
+    
+    # Gamification: Pomodoro tamamlama puanı
+    try:
+        pomodoro_points = {
+            'Hızlı Odak (25dk+5dk)': 15,
+            'Standart Odak (35dk+10dk)': 20,
+            'Derin Odak (50dk+15dk)': 30,
+            'Tam Konsantrasyon (90dk+25dk)': 50
+        }
+        points = award_points("topic_completion", 3)  # Orta zorluk
+        st.info(f"⭐ Pomodoro ödülü: +{points} puan kazandın!")
+        
+        # İstatistikleri güncelle
+        if 'gamification' in st.session_state:
+            st.session_state.gamification['stats']['total_study_time'] += int(st.session_state.pomodoro_type.split('(')[1].split('dk')[0])
+    except:
+        pass
+    
+    # SESLİ UYARI: Mola başladı! 🔔
+    play_break_start_sound()
+    
+    # YENI ÖZELLİK: Tamamlanan pomodoro'yu haftalık programa ekle
+    add_pomodoro_to_weekly_program(user_data, pomodoro_record)
+    
+    st.balloons()
+
+def add_pomodoro_to_weekly_program(user_data, pomodoro_record):
+    """Tamamlanan pomodoro'yu haftalık programa otomatik ekler"""
+    try:
+        # Güncel tarih bilgisini al
+        now = current_time()
+        current_day_tr = {
+            'Monday': 'PAZARTESİ',
+            'Tuesday': 'SALI', 
+            'Wednesday': 'ÇARŞAMBA',
+            'Thursday': 'PERŞEMBE',
+            'Friday': 'CUMA',
+            'Saturday': 'CUMARTESİ',
+            'Sunday': 'PAZAR'
+        }
+        
+        current_day = current_day_tr.get(now.strftime('%A'), 'PAZARTESİ')
+        current_time = now.strftime('%H:%M')
+        
+        # Session state'te day_plans yoksa oluştur
+        if 'day_plans' not in st.session_state:
+            days = ["PAZARTESİ", "SALI", "ÇARŞAMBA", "PERŞEMBE", "CUMA", "CUMARTESİ", "PAZAR"]
+            st.session_state.day_plans = {day: [] for day in days}
+        
+        # Pomodoro bilgilerini al
+        subject = pomodoro_record.get('subject', 'Genel')
+        topic = pomodoro_record.get('topic', 'Belirtilmemiş')
+        pomodoro_type = pomodoro_record.get('type', 'Kısa Odak (25dk+5dk)')
+        
+        # Süreyi hesapla
+        duration_map = {
+            'Kısa Odak (25dk+5dk)': '25dk',
+            'Standart Odak (35dk+10dk)': '35dk',
+            'Derin Odak (50dk+15dk)': '50dk',
+            'Tam Konsantrasyon (90dk+25dk)': '90dk'
+        }
+        duration = duration_map.get(pomodoro_type, '25dk')
+        
+        # Haftalık programa eklenecek öğeyi oluştur
+        program_item = {
+            'subject': subject,
+            'topic': f"🍅 {topic}",  # Pomodoro emojisi ile işaretle
+            'detail': f"Pomodoro ({duration}) - {current_time}",
+            'time': f"{current_time} (🍅 {duration})",
+            'priority': 'COMPLETED',  # Tamamlanmış öğe olarak işaretle
+            'auto_added': True  # Otomatik eklendiğini belirt
+        }
+        
+        # Bugünün planına ekle
+        if current_day in st.session_state.day_plans:
+            st.session_state.day_plans[current_day].append(program_item)
+            
+            # Başarı mesajını göster
+            st.success(f"✅ Tamamlanan pomodoro **{current_day}** gününe otomatik eklendi!")
+            st.info(f"📅 **Konu:** {topic} | **Süre:** {duration} | **Saat:** {current_time}")
+        
+    except Exception as e:
+        st.warning(f"⚠️ Haftalık programa ekleme sırasında hata: {e}")
+
+def save_pomodoro_to_user_data(user_data, pomodoro_record):
+    """Pomodoro kaydını olay deposuna ekler, günlük özeti ve son kayıtları günceller"""
+    try:
+        record_pomodoro_event(st.session_state.current_user, user_data, pomodoro_record)
+        
+        # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+        
+    except Exception as e:
+        st.error(f"Pomodoro kaydı kaydedilirken hata: {e}")
+
+def get_weekly_pomodoro_topic_counts(user_data):
+    """Bu haftanın (Pazartesi - bugün) konu bazında pomodoro sayıları - günlük özetlerden"""
+    week_info = get_current_week_info()
+    week_rollups = pomodoro_rollup_days(load_pomodoro_rollups(user_data),
+                                        week_info['monday'].date(), week_info['today'].date())
+    topic_counts = sum_pomodoro_rollups(week_rollups)['by_topic']
+    topic_counts.pop('Belirtilmemiş', None)
+    return topic_counts
+
+def show_daily_pomodoro_stats(user_data):
+    """Hibrit Pomodoro istatistiklerini göster"""
+    st.markdown("### 📊 Bugünkü Hibrit Pomodoro İstatistikleri")
+    
+    completed_today = len(st.session_state.daily_pomodoros)
+    breathing_used_today = len([log for log in st.session_state.breathing_usage_log 
+                              if log['timestamp'][:10] == current_time().date().isoformat()])
+    
+    if st.session_state.daily_pomodoros or breathing_used_today > 0:
+        # İstatistik metrikleri
+        col1, col2, col3, col4 = st.columns(4)
+        
+        # Pomodoro türlerine göre süre hesaplama
+        duration_map = {
+            'Kısa Odak (25dk+5dk)': 25,
+            'Standart Odak (35dk+10dk)': 35,
+            'Derin Odak (50dk+15dk)': 50,
+            'Tam Konsantrasyon (90dk+25dk)': 90
+        }
+        
+        # Ders bazında çalışma sürelerini hesapla
+        subject_times = {}
+        topic_counts = {}
+        total_minutes = 0
+        
+        for p in st.session_state.daily_pomodoros:
+            subject = p['subject']
+            topic = p.get('topic', 'Belirtilmemiş')
+            pomodoro_type = p.get('type', 'Kısa Odak (25dk+5dk)')
+            
+            # Süreyi hesapla
+            duration = duration_map.get(pomodoro_type, 25)
+            total_minutes += duration
+            
+            # Ders bazında topla
+            if subject not in subject_times:
+                subject_times[subject] = 0
+            subject_times[subject] += duration
+            
+            # Konu sayısını topla
+            if subject not in topic_counts:
+                topic_counts[subject] = {}
+            if topic not in topic_counts[subject]:
+                topic_counts[subject][topic] = 0
+            topic_counts[subject][topic] += 1
+        
+        hours = total_minutes // 60
+        minutes = total_minutes % 60
+        
+        with col1:
+            st.metric("🍅 Tamamlanan", completed_today)
+        with col2:
+            st.metric("💨 Nefes Molası", breathing_used_today)
+        with col3:
+            st.metric("⏰ Toplam Süre", f"{hours}s {minutes}dk")
+        with col4:
+            # Haftalık hedef konular bazında ilerleme hesapla
+            try:
+                student_field = user_data.get('field', '')
+                survey_data_raw = user_data.get('survey_data', '{}')
+                survey_data = json.loads(survey_data_raw) if isinstance(survey_data_raw, str) else survey_data_raw
+                weekly_plan = get_weekly_topics_from_topic_tracking(user_data, student_field, survey_data)
+                weekly_target_topics = weekly_plan.get('new_topics', []) + weekly_plan.get('review_topics', [])
+                
+                if weekly_target_topics:
+                    # Bu haftaki pomodorolardan konu bazlı ilerleme
+                    topic_progress_in_pomodoros = get_weekly_pomodoro_topic_counts(user_data)
+                    
+                    topics_worked = len([k for k, v in topic_progress_in_pomodoros.items() if v > 0])
+                    weekly_progress = (topics_worked / len(weekly_target_topics)) * 100 if weekly_target_topics else 0
+                    
+                    st.metric("🎯 Haftalık İlerleme", f"%{weekly_progress:.1f}")
+                else:
+                    st.metric("🎯 Haftalık İlerleme", "Hedef yok")
+            except:
+                st.metric("🎯 Haftalık İlerleme", "?")
+        
+        
+        # === DERS BAZINDA DETAYLAR ===
+        st.markdown("#### 📚 Bugünkü Ders Detayları")
+        
+        if subject_times:
+            # Ders tablosu
+            col_table, col_chart = st.columns([1, 1])
+            
+            with col_table:
+                st.markdown("**Ders Bazında Çalışma Süreleri:**")
+                
+                for subject in sorted(subject_times.keys()):
+                    minutes_studied = subject_times[subject]
+                    hours_studied = minutes_studied // 60
+                    mins_studied = minutes_studied % 60
+                    
+                    time_str = f"{hours_studied}s {mins_studied}dk" if hours_studied > 0 else f"{mins_studied}dk"
+                    
+                    # Emoji seçimi
+                    if subject.startswith("📝"):
+                        emoji = "📝"
+                    elif subject.startswith("📂"):
+                        emoji = "📂"
+                    elif "Matematik" in subject:
+                        emoji = "🔢"
+                    elif "Fizik" in subject:
+                        emoji = "⚛️"
+                    elif "Kimya" in subject:
+                        emoji = "🧪"
+                    elif "Biyoloji" in subject:
+                        emoji = "🧬"
+                    elif "Türkçe" in subject or "Edebiyat" in subject:
+                        emoji = "📖"
+                    else:
+                        emoji = "📚"
+                    
+                    st.write(f"{emoji} **{subject}**: {time_str}")
+                    
+                    # Konu detayları
+                    if subject in topic_counts:
+                        for topic, count in topic_counts[subject].items():
+                            if topic and topic != "Belirtilmemiş":
+                                st.write(f"    • {topic}: {count} pomodoro")
+            
+            with col_chart:
+                # Pasta grafik
+                if len(subject_times) > 1:
+                    subject_df = pd.DataFrame([
+                        {'Ders': subject, 'Dakika': minutes} 
+                        for subject, minutes in subject_times.items()
+                    ])
+                    fig = px.pie(subject_df, values='Dakika', names='Ders', 
+                                title='Bugünkü Çalışma Süresi Dağılımı')
+                    safe_plotly_chart(fig, use_container_width=True, height=400)
+        
+        # === TOPLAM İSTATİSTİKLER (TÜM ZAMANLAR) ===
+        st.markdown("#### 🏆 Toplam İstatistikler")
+        
+        # Günlük özetlerden tüm zamanların toplamı (gün sayısı kadar iş)
+        try:
+            pomodoro_rollups = load_pomodoro_rollups(user_data)
+            
+            if pomodoro_rollups:
+                all_time = sum_pomodoro_rollups(pomodoro_rollups.values())
+                total_all_time = all_time['minutes']
+                subject_totals = all_time['by_subject']
+                total_count = all_time['count']
+                
+                total_hours = total_all_time // 60
+                total_mins = total_all_time % 60
+                
+                col_total1, col_total2, col_total3 = st.columns(3)
+                
+                with col_total1:
+                    st.metric("🎯 Toplam Pomodoro", total_count)
+                with col_total2:
+                    st.metric("⏰ Toplam Çalışma", f"{total_hours}s {total_mins}dk")
+                with col_total3:
+                    # En çok çalışılan ders
+                    if subject_totals:
+                        top_subject = max(subject_totals, key=subject_totals.get)
+                        st.metric("🏅 En Çok Çalışılan", top_subject.split()[0] + "...")
+                
+                # Son 7 günün istatistikleri - DİNAMİK
+                week_info = get_current_week_info()
+                today = week_info['today'].date()
+                last_week = sum_pomodoro_rollups(
+                    pomodoro_rollup_days(pomodoro_rollups, today - timedelta(days=7), today))
+                
+                if last_week['count']:
+                    week_total = last_week['minutes']
+                    week_hours = week_total // 60
+                    week_mins = week_total % 60
+                    avg_daily = week_total / 7
+                    
+                    st.markdown("**📅 Son 7 Gün:**")
+                    st.write(f"• Toplam: {last_week['count']} pomodoro ({week_hours}s {week_mins}dk)")
+                    st.write(f"• Günlük ortalama: {avg_daily:.1f} dk")
+                    
+        except Exception as e:
+            st.warning("Toplam istatistikler yüklenirken bir hata oluştu.")
+        
+        # === HİBRİT SİSTEM ANALİZİ ===
+        if breathing_used_today > 0:
+            st.markdown("#### 🧠 Hibrit Sistem Analizi")
+            
+            # Hangi derslerde daha çok nefes molası kullanıldı
+            today_breathing_logs = [log for log in st.session_state.breathing_usage_log 
+                                   if log['timestamp'][:10] == current_time().date().isoformat()]
+            
+            subject_breathing = {}
+            motivation_type_count = {'quote': 0, 'tip': 0, 'breathing': 0}
+            
+            for log in today_breathing_logs:
+                subject = log['subject']
+                subject_breathing[subject] = subject_breathing.get(subject, 0) + 1
+                motivation_type_count[log['motivation_type']] += 1
+            
+            col_a, col_b = st.columns(2)
+            
+            with col_a:
+                st.markdown("**📚 Derslerde Nefes Kullanımı:**")
+                for subject, count in subject_breathing.items():
+                    st.write(f"• {subject}: {count} kez")
+            
+            with col_b:
+                st.markdown("**💭 Motivasyon Türü Dağılımı:**")
+                st.write(f"• Motivasyon Sözleri: {motivation_type_count['quote']}")
+                st.write(f"• Mikro İpuçları: {motivation_type_count['tip']}")
+                st.write(f"• Nefes Egzersizleri: {motivation_type_count['breathing']}")
+            
+            # Akıllı öneriler
+            avg_breathing_per_pomodoro = breathing_used_today / completed_today if completed_today > 0 else 0
+            
+            if breathing_used_today > 4:
+                st.warning("💡 **Hibrit Analiz:** Bugün nefes sistemini sıkça kullandınız. Bu, odaklanma zorluğu yaşadığınızı gösterebilir. Bu normal ve sağlıklı bir yaklaşım! Belki çalışma ortamınızı kontrol etmek ya da ara verme sıklığını artırmak faydalı olabilir.")
+            elif breathing_used_today > 0 and avg_breathing_per_pomodoro < 1:
+                st.info("🎯 **Hibrit Analiz:** Nefes sistemini dengeli şekilde kullanıyorsunuz. Bu, öz-farkındalığınızın yüksek olduğunu gösteriyor!")
+            elif breathing_used_today == 0 and completed_today > 3:
+                st.success("🏆 **Hibrit Analiz:** Bugün hibrit sistemi kullanmadan harika bir performans sergiledinin! Odaklanma beceriniz gelişiyor.")
+
+    else:
+        st.info("📊 Bugün henüz hibrit pomodoro tamamlanmamış. İlk pomodoro'nuzu başlatın!")
+
+def show_pomodoro_history(user_data):
+    """Pomodoro geçmişini göster"""
+    st.markdown("### 📅 Çalışma Geçmişi")
+    
+    try:
+        pomodoro_data_str = user_data.get('pomodoro_history', '[]')
+        pomodoro_history = json.loads(pomodoro_data_str) if pomodoro_data_str else []
+        
+        if pomodoro_history:
+            # Son 10 kaydı göster
+            recent_history = pomodoro_history[-10:]
+            
+            for i, record in enumerate(reversed(recent_history)):
+                with st.expander(f"🍅 {record['subject']} - {record['topic'][:30]}... ({record['timestamp'][:10]})"):
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.write(f"**Tür:** {record['type']}")
+                    with col2:
+                        st.write(f"**Ders:** {record['subject']}")
+                    with col3:
+                        st.write(f"**Durum:** {'✅ Tamamlandı' if record['completed'] else '❌ Yarım'}")
+                    
+                    st.write(f"**Konu:** {record['topic']}")
+                    st.write(f"**Tarih:** {record['timestamp']}")
+        else:
+            st.info("📅 Henüz pomodoro geçmişi bulunmuyor.")
+            
+    except Exception as e:
+        st.error(f"Geçmiş yüklenirken hata: {e}")
+# === HİBRİT POMODORO SİSTEMİ FONKSİYONLARI ===
+
+# YKS Odaklı Motivasyon Sözleri - Hibrit Sistem için
+MOTIVATION_QUOTES = [
+    "Her 50 dakikalık emek, seni rakiplerinden ayırıyor! 💪",
+    "Şu anda çözdüğün her soru, YKS'de seni zirveye taşıyacak! 🎯",
+    "Büyük hedefler küçük adımlarla başlar - sen doğru yoldasın! ⭐",
+    "Her nefes alışın, YKS başarına bir adım daha yaklaştırıyor! 🌬️",
+    "Zorluklara direnmek seni güçlendiriyor - YKS'de fark yaratacaksın! 🚀",
+    "Bugün kazandığın her kavram, sınavda seni öne çıkaracak! 📚",
+    "Konsantrasyon kasların güçleniyor - şampiyonlar böyle yetişir! 🧠",
+    "Hedefine odaklan! Her dakika YKS başarın için değerli! 🏆",
+    "Mola hakkını akıllıca kullanıyorsun - bu seni daha güçlü yapıyor! 💨",
+    "Başarı sabır ister, sen sabırlı bir savaşçısın! ⚔️",
+    "Her yeni konu öğrenişin, gelecekteki mesleğinin temeli! 🏗️",
+    "Rüyalarının peşinde koşuyorsun - asla vazgeçme! 🌟",
+    "YKS sadece bir sınav, sen ise sınırsız potansiyelin! 🌈",
+    "Her pomodoro seansı, hedefine bir adım daha yaklaştırıyor! 🎯",
+    "Dün yapamadığını bugün yapabiliyorsun - bu gelişim! 📈",
+    "Zorlu soruları çözerken beynin güçleniyor! 🧩",
+    "Her mola sonrası daha güçlü dönüyorsun! 💪",
+    "Bilim insanları da böyle çalıştı - sen de başaracaksın! 🔬",
+    "Her nefes, yeni bir başlangıç fırsatı! 🌱",
+    "Hayal ettiğin üniversite seni bekliyor! 🏛️"
+]
+
+# Mikro ipuçları (ders bazında)
+MICRO_TIPS = {
+    "TYT Matematik": [
+        "📐 Türev sorularında genellikle önce fonksiyonun köklerini bulmak saldırıları hızlandırır.",
+        "🔢 İntegral hesaplarken substitüsyon methodunu akılda tut.",
+        "📊 Geometri problemlerinde çizim yapmayı unutma.",
+        "⚡ Limit sorularında l'hopital kuralını hatırla."
+    ],
+    "TYT Fizik": [
+        "⚡ Newton yasalarını uygularken kuvvet vektörlerini doğru çiz.",
+        "🌊 Dalga problemlerinde frekans-dalga boyu ilişkisini unutma.",
+        "🔥 Termodinamik sorularında sistem sınırlarını net belirle.",
+        "🔬 Elektrik alanı hesaplamalarında işaret dikkatli kontrol et."
+    ],
+    "TYT Kimya": [
+        "🧪 Mol kavramı tüm hesaplamaların temeli - ezberleme!",
+        "⚛️ Periyodik cetveldeki eğilimleri görselleştir.",
+        "🔄 Denge tepkimelerinde Le Chatelier prensibini uygula.",
+        "💧 Asit-baz titrasyonlarında eşdeğer nokta kavramını unutma."
+    ],
+    "TYT Türkçe": [
+        "📖 Paragraf sorularında ana fikri ilk ve son cümlelerde ara.",
+        "✍️ Anlam bilgisi sorularında bağlamı dikkate al.",
+        "📝 Yazım kurallarında 'de/da' ayrım kuralını hatırla.",
+        "🎭 Edebi türlerde karakterizasyon önemli."
+    ],
+    "TYT Tarih": [
+        "📅 Olayları kronolojik sırayla öğren, sebep-sonuç bağla.",
+        "🏛️ Siyasi yapılar sosyal yapılarla ilişkisini kur.",
+        "🗺️ Haritalarla coğrafi konumları pekiştir.",
+        "👑 Dönem özelliklerini başlıca olaylarla örnekle."
+    ],
+    "TYT Coğrafya": [
+        "🌍 İklim türlerini sebepleriyle birlikte öğren.",
+        "🏔️ Jeomorfoloji'de süreç-şekil ilişkisini kur.",
+        "📊 İstatistiksel veriler harita okuma becerisini geliştir.",
+        "🌱 Bitki örtüsü-iklim ilişkisini unutma."
+    ],
+    "Genel": [
+        "🎯 Zor sorularla karşılaştığında derin nefes al ve sistematik düşün.",
+        "⏰ Zaman yönetimini ihmal etme - her dakika değerli.",
+        "📚 Kavramları sadece ezberlemek yerine anlayarak öğren.",
+        "🔄 Düzenli tekrar yapmak kalıcılığı artırır."
+    ]
+}
+
+# YKS Odaklı Nefes Egzersizi Talimatları
+BREATHING_EXERCISES = [
+    {
+        "name": "4-4-4-4 Tekniği (Kare Nefes)",
+        "instruction": "4 saniye nefes al → 4 saniye tut → 4 saniye ver → 4 saniye bekle",
+        "benefit": "Stresi azaltır, odaklanmayı artırır, sınav kaygısını azaltır"
+    },
+    {
+        "name": "Karın Nefesi (Diyafragma Nefesi)",
+        "instruction": "Elinizi karnınıza koyun. Nefes alırken karın şişsin, verirken insin",
+        "benefit": "Gevşemeyi sağlar, kaygıyı azaltır, zihinsel netliği artırır"
+    },
+    {
+        "name": "4-7-8 Sakinleştirici Nefes",
+        "instruction": "4 saniye burun ile nefes al → 7 saniye tut → 8 saniye ağız ile ver",
+        "benefit": "Derin rahatlama sağlar, uykuya yardım eder, sınav öncesi sakinleştirir"
+    },
+    {
+        "name": "Yavaş Derin Nefes",
+        "instruction": "6 saniye nefes al → 2 saniye tut → 6 saniye yavaşça ver",
+        "benefit": "Kalp ritmi düzenlenir, sakinleşir, zihinsel berraklık artar"
+    },
+    {
+        "name": "Alternatif Burun Nefesi",
+        "instruction": "Sağ burun deliği ile nefes al, sol ile ver. Sonra tersini yap",
+        "benefit": "Beynin her iki yarım küresini dengeler, konsantrasyonu artırır"
+    },
+    {
+        "name": "5-5 Basit Ritim",
+        "instruction": "5 saniye nefes al → 5 saniye nefes ver (hiç tutmadan)",
+        "benefit": "Basit ve etkili, hızlı sakinleşme, odaklanma öncesi ideal"
+    }
+]
+
+# === HİBRİT POMODORO SİSTEMİ FONKSİYONLARI ===
+
+def start_hibrit_breathing():
+    """Hibrit nefes sistemini başlat - Pomodoro'yu duraklat"""
+    # Pomodoro'yu duraklat
+    if st.session_state.pomodoro_active:
+        st.session_state.breathing_paused_time = st.session_state.time_remaining
+    
+    # Nefes sistemini başlat
+    st.session_state.breathing_active = True
+    st.session_state.breath_time_remaining = BREATHING_DURATION
+    st.session_state.breath_start_time = time.time()
+    
+    # Rastgele bir motivasyon türü seç
+    motivation_types = ['quote', 'tip', 'breathing']
+    st.session_state.current_motivation_type = random.choice(motivation_types)
+    
+    if st.session_state.current_motivation_type == 'quote':
+        st.session_state.current_motivation_content = random.choice(MOTIVATION_QUOTES)
+    elif st.session_state.current_motivation_type == 'tip':
+        subject = st.session_state.current_subject
+        if subject in MICRO_TIPS:
+            st.session_state.current_motivation_content = random.choice(MICRO_TIPS[subject])
+        else:
+            st.session_state.current_motivation_content = random.choice(MICRO_TIPS['Genel'])
+    else:  # breathing
+        exercise = random.choice(BREATHING_EXERCISES)
+        st.session_state.current_motivation_content = f"""
+🫁 **{exercise['name']}**
+
+📋 {exercise['instruction']}
+
+✨ **Faydası:** {exercise['benefit']}
+        """
+    
+    # Kullanım loguna kaydet
+    log_entry = {
+        'timestamp': current_time().isoformat(),
+        'subject': st.session_state.current_subject,
+        'motivation_type': st.session_state.current_motivation_type,
+        'remaining_time_when_used': st.session_state.breathing_paused_time
+    }
+    st.session_state.breathing_usage_log.append(log_entry)
+    
+    st.success("💨 Hibrit nefes molası başladı! Pomodoro timer duraklatıldı.")
+
+def complete_breathing_exercise():
+    """Nefes egzersizini tamamla ve Pomodoro'ya dön"""
+    st.session_state.breathing_active = False
+    st.session_state.breath_time_remaining = BREATHING_DURATION
+    st.session_state.breath_start_time = None
+    
+    # Pomodoro'yu kaldığı yerden devam ettir
+    if st.session_state.pomodoro_active:
+        st.session_state.time_remaining = st.session_state.breathing_paused_time
+        st.session_state.start_time = time.time()
+    
+    st.success("🎉 Hibrit nefes molası tamamlandı! Pomodoro kaldığı yerden devam ediyor.")
+    st.balloons()
+
+def get_topic_net_from_sources(topic, user_data):
+    """Farklı kaynaklardan konunun net değerini çeker - GELİŞMİŞ SİSTEM"""
+    
+    subject = topic.get('subject', '')
+    topic_name = topic.get('topic', topic.get('detail', ''))
+    
+    # 🔥 KAYNAK 1: Haftalık plandan direkt
+    direct_net = topic.get('net', None)
+    if direct_net is not None:
+        try:
+            return int(float(direct_net))
+        except:
+            pass
+    
+    # 🔥 KAYNAK 2-5: Progress tracking, konu takip, kalıcı öğrenme, değerlendirmeler (ortak indeks)
+    indexed_net = get_topic_net_index(user_data).lookup(subject, topic_name, PLAN_NET_SOURCE_ORDER, require_net=True)
+    if indexed_net is not None:
+        return indexed_net
+    
+    # 🔥 KAYNAK 6: Varsayılan değerler - Daha gerçekçi
+    # Konu türüne göre varsayılan değerler
+    subject_lower = subject.lower()
+    
+    if 'matematik' in subject_lower:
+        return 8   # Matematik için ortalama
+    elif 'fizik' in subject_lower:
+        return 7   # Fizik için ortalama
+    elif 'kimya' in subject_lower:
+        return 9   # Kimya için ortalama
+    elif 'biyoloji' in subject_lower:
+        return 11  # Biyoloji için ortalama
+    elif 'türkçe' in subject_lower:
+        return 12  # Türkçe için ortalama
+    elif 'tarih' in subject_lower:
+        return 10  # Tarih için ortalama
+    elif 'coğrafya' in subject_lower:
+        return 9   # Coğrafya için ortalama
+    else:
+        return 10  # Genel ortalama
+    if processed_requests:
+        st.markdown("## ✅ İşlenmiş Onaylar")
+        
+        for request in processed_requests[-5:]:  # Son 5 işlem
+            status_emoji = "✅" if request['status'] == 'approved' else "❌"
+            status_color = "#27ae60" if request['status'] == 'approved' else "#e74c3c"
+            
+            st.markdown(f"""
+            <div style="background: {status_color}; color: white; padding: 15px; border-radius: 10px; margin: 10px 0;">
+                <h4 style="margin: 0; color: white;">{status_emoji} {request['student_name']}</h4>
+                <p style="margin: 5px 0 0 0;">📅 {request['submission_date']} → {request.get('approved_date', 'İşlenmedi')}</p>
+                <p style="margin: 5px 0 0 0;">📝 {request.get('coach_notes', 'Koç notu yok')}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+def render(user_data, progress_data, target_dept):
+    """🍅 Pomodoro Timer"""
+    pomodoro_timer_page(user_data)
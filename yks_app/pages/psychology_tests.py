@@ -0,0 +1,1414 @@
+"""
+🧭 Psikolojik analiz testleri (VAK, bilişsel profil, motivasyon, zaman yönetimi)
+Sayfa ilk seçildiğinde import edilir (yks_app.pages.render_page)
+"""
+
+from yks_app.core import *
+
+# ===== VAK ÖĞRENME STİLLERİ TESTİ =====
+# A Kategorisi: Görsel (20 soru)
+# B Kategorisi: İşitsel (20 soru)  
+# C Kategorisi: Kinestetik (20 soru)
+VAK_LEARNING_STYLES_TEST = load_dataset('test_vak_learning_styles')
+
+# ===== BİLİŞSEL PROFİL TESTİ =====
+# 4 Bölüm x 5 Soru = 20 Soru (Likert 1-5)
+COGNITIVE_PROFILE_TEST = load_dataset('test_cognitive_profile')
+
+# ===== YENİ TESTLER =====
+
+# Motivasyon & Duygusal Denge Testi
+MOTIVATION_EMOTIONAL_TEST = load_dataset('test_motivation_emotional')
+
+# Zaman Yönetimi & Çalışma Alışkanlığı Testi
+TIME_MANAGEMENT_TEST = load_dataset('test_time_management')
+
+# ===== MODERN VAK ANALIZ FONKSİYONLARI =====
+
+def display_modern_vak_analysis(dominant_style, visual_percent, auditory_percent, kinesthetic_percent):
+    """Modern ve detaylı VAK analizi gösterir"""
+    
+    # Paydaşılan bilgi paragrafına göre detaylı özellikler
+    vak_detailed_info = {
+        "Görsel": {
+            "icon": "👁️",
+            "title": "GÖRSEL ÖĞRENME STİLİ",
+            "natural_places": [
+                "Doğal olarak düzenli ve temiz bir çevresi olmasını ister",
+                "Ayrıntıları ve renkleri iyi hatırlar",
+                "Okumayı, yazmayı sever",
+                "İnsanların yüzünü hatırlar ama isimlerini unutur",
+                "Zihinsel (görsel) imgeler yaratmayı sever"
+            ],
+            "problem_solving": [
+                "Talimatları okumayı tercih eder",
+                "Problemleri listeler",
+                "Düşüncelerini düzenlerken grafiksel malzemeler kullanır",
+                "Akış kartları ve şemaları etkili kullanır",
+                "Kağıt üzerinde grafiksel çalışmalar yapar"
+            ],
+            "evaluation_needs": [
+                "Görsel-yazılı testlerde başarılı",
+                "Araştırma raporları hazırlamayı sever",
+                "Grafiksel gösterimlerden yararlanır",
+                "Yazılı sınavlarda yüksek başarı gösterir"
+            ],
+            "best_learning": [
+                "Not alarak öğrenir",
+                "Liste yaparak bilgileri organize eder",
+                "Bir gösteriyi izleyerek öğrenir",
+                "Kitaplar, video filmler ve basılı materyallerden yararlanır",
+                "Görsel destekli içeriklerle daha iyi anlar"
+            ],
+            "school_difficulties": [
+                "Ne yapılacağını görmeden hareket etmekte zorlanır",
+                "Gürültülü ve hareketli çevrede çalışamaz",
+                "Görsel resim ve malzeme olmadan öğretmeni dinleyemez",
+                "Sıkıcı ve düzensiz sınıfta çalışmak istemez",
+                "Florasan ışığı altında çalışmaktan verim alamaz"
+            ],
+            "general_evaluation": [
+                "Özel yaşamlarında genellikle düzenlidirler",
+                "Karışıklık ve dağınıklıktan rahatsız olurlar",
+                "Çantaları, dolapları her zaman düzenlidir",
+                "Harita, poster, şema, grafik gibi görsel araçlardan kolay etkilenirler",
+                "Öğrendikleri konuları gözlerinin önüne getirerek hatırlamaya çalışırlar"
+            ]
+        },
+        "İşitsel": {
+            "icon": "👂",
+            "title": "İŞİTSEL ÖĞRENME STİLİ",
+            "natural_places": [
+                "Doğaçlama (spontan) konuşur",
+                "Ayaküstü düşünür",
+                "Karşılaştığı insanların yüzlerini unutur ama adlarını hatırlar",
+                "Kelimelerle ve dille çalışmayı sever",
+                "Hafif sesli ortamlardan hoşlanır"
+            ],
+            "problem_solving": [
+                "Tartışmalardan hoşlanır",
+                "Seçenekler hakkında konuşur",
+                "Bir durumda ne yapılacağını o durumu yaşayanlara sorar",
+                "Hedefi sözle ifade eder",
+                "Sözlü tekrarlar yapar"
+            ],
+            "evaluation_needs": [
+                "Yazılılardan ziyade sözlülerde başarılı olur",
+                "Projelerini sözlü olarak sunar",
+                "Ne öğrendiğinin birileri tarafından sorulmasını ister",
+                "Şiir okumaktan, şarkı söylemekten hoşlanır"
+            ],
+            "best_learning": [
+                "Yüksek sesle anlatım dinleyerek",
+                "Küçük ve büyük grup tartışması yaparak",
+                "Çalışma yerinde fon olarak sessiz müzik dinleyerek",
+                "Sesli kaynak materyallerle",
+                "Konuları anlatarak ve tartışarak"
+            ],
+            "school_difficulties": [
+                "Görsel öğrencilerden daha yavaş okur",
+                "Uzun süre sessiz okuyamaz",
+                "Okuduğu parçada resimleri umursamaz",
+                "Sessizleştirilmiş ortamda yaşamada sıkıntı yaşar",
+                "Uzun süre sessiz kalmakta zorlanır"
+            ],
+            "general_evaluation": [
+                "Küçük yaşlarda kendi kendilerine konuşurlar",
+                "Ses ve müziğe duyarlıdırlar",
+                "Sohbet etmeyi, birileri ile çalışmayı severler",
+                "Genellikle ahenkli ve güzel konuşurlar",
+                "İşittiklerini daha iyi anlarlar ve hatırlarlar"
+            ]
+        },
+        "Kinestetik": {
+            "icon": "✋",
+            "title": "KİNESTETİK ÖĞRENME STİLİ",
+            "natural_places": [
+                "Çeşitli spor ve danslarla uğraşmayı sever",
+                "Yarışmalardan ve maceradan hoşlanır",
+                "Zorluklara meydan okur",
+                "Koşma, sıçrama, atlama, yuvarlanma gibi hareketlerden hoşlanır",
+                "Büyük motor kasları kullanmayı gerektiren eylemlerden hoşlanır"
+            ],
+            "problem_solving": [
+                "Harekete geçer daha sonra da sonuçlara bakarak plan yapar",
+                "Problemleri güç kullanarak (fiziksel olarak) çözmeye çalışır",
+                "Önemli ölçüde bedensel çaba gerektiren çözümler arar",
+                "Problemleri bireysel olarak veya çok küçük gruplarla çalışarak çözmeyi tercih eder",
+                "Deneme-yanılma ve keşfetme yoluyla öğrenir"
+            ],
+            "evaluation_needs": [
+                "Performansa dayalı ve proje yönelimli değerlendirmelerde başarılı olur",
+                "Öğrendiği şeyi sergileme veya gösterme eğilimi vardır",
+                "Bir şeyi anlatmaktan ziyade nasıl yapılacağını göstermeyi tercih eder",
+                "Uygulamalı değerlendirmelerde daha başarılı"
+            ],
+            "best_learning": [
+                "Canlandırma ve taklit yaparak",
+                "Gezerek ve performansa dayalı öğrenmeyle",
+                "Küçük tartışma grupları ile",
+                "Yaparak yaşayarak öğrenir",
+                "Ellerini kullanabileceği yöntemlerle"
+            ],
+            "school_difficulties": [
+                "Okunaaklı el yazısına sahip değildir",
+                "Uzun süre oturamaz",
+                "Kelimeleri doğru okuma ve kullanmada sıkıntı yaşar",
+                "Duyulan, görülen ve yapılan şeyleri hatırlamakta zorlanır",
+                "Uzun süre herhangi bir eylemi devam ettiremez"
+            ],
+            "general_evaluation": [
+                "Oldukça hareketli olurlar",
+                "Sınıfta yerlerinde duramazlar",
+                "Sürekli hareket halindedirler",
+                "Dersin anlatılması veya görsel malzemelerle zenginleştirilmesi beklenildiği ölçülerde katkı sağlamaz",
+                "Mutlaka ellerini kullanabilecekleri, yaparak yaşayarak öğrenme yöntemlerinin kullanılması gerekir"
+            ]
+        }
+    }
+    
+    style_info = vak_detailed_info[dominant_style]
+    
+    st.markdown("---")
+    st.markdown(f"## {style_info['icon']} **{style_info['title']}** - Baskın Stiliniz!")
+    
+    # Stil dağılımı grafik
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        import plotly.express as px
+        
+        vak_data = {
+            'Stil': ['Görsel', 'İşitsel', 'Kinestetik'],
+            'Yüzde': [visual_percent, auditory_percent, kinesthetic_percent],
+            'Renk': ['#FF6B6B', '#4ECDC4', '#45B7D1']
+        }
+        
+        fig = px.pie(
+            values=vak_data['Yüzde'], 
+            names=vak_data['Stil'],
+            title="📊 Öğrenme Stili Dağılımıniz",
+            color_discrete_sequence=['#FF6B6B', '#4ECDC4', '#45B7D1']
+        )
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        fig.update_layout(
+            height=400,
+            font=dict(size=14),
+            showlegend=True
+        )
+        safe_plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.markdown("### 📈 Puan Detayları")
+        styles = [
+            ("Görsel 👁️", visual_percent, "#FF6B6B"),
+            ("İşitsel 👂", auditory_percent, "#4ECDC4"),
+            ("Kinestetik ✋", kinesthetic_percent, "#45B7D1")
+        ]
+        
+        for style_name, percentage, color in styles:
+            is_dominant = style_name.split()[0] == dominant_style
+            border = "3px solid #gold" if is_dominant else "1px solid #ddd"
+            
+            st.markdown(f"""
+                <div style="
+                    border: {border};
+                    padding: 10px;
+                    margin: 8px 0;
+                    border-radius: 8px;
+                    background: linear-gradient(90deg, {color}20, transparent);
+                    text-align: center;
+                ">
+                    <strong>{style_name}</strong><br>
+                    <span style="font-size: 24px; color: {color};">%{percentage:.1f}</span>
+                </div>
+            """, unsafe_allow_html=True)
+    
+    # Detaylı özellikler
+    st.markdown("### 🔍 Detaylı Özellik Analizi")
+    
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "🌟 Doğal Özellikler", 
+        "🔧 Problem Çözme", 
+        "📉 Değerlendirme", 
+        "🎯 En İyi Öğrenme", 
+        "⚠️ Okul Zorlukları", 
+        "📄 Genel Değerlendirme"
+    ])
+    
+    with tab1:
+        st.markdown("**Doğal olduğunuz yerler:**")
+        for item in style_info['natural_places']:
+            st.write(f"• {item}")
+    
+    with tab2:
+        st.markdown("**Problem çözme yollarınız:**")
+        for item in style_info['problem_solving']:
+            st.write(f"• {item}")
+    
+    with tab3:
+        st.markdown("**Değerlendirme ve test etme ihtiyacınız:**")
+        for item in style_info['evaluation_needs']:
+            st.write(f"• {item}")
+    
+    with tab4:
+        st.markdown("**En iyi öğrenme yollarınız:**")
+        for item in style_info['best_learning']:
+            st.write(f"• {item}")
+    
+    with tab5:
+        st.markdown("**Okuldaki güçlükleriniz:**")
+        for item in style_info['school_difficulties']:
+            st.write(f"• {item}")
+    
+    with tab6:
+        st.markdown("**Genel değerlendirmeniz:**")
+        for item in style_info['general_evaluation']:
+            st.write(f"• {item}")
+    
+    # YKS'ye özel stratejiler
+    st.markdown("### 🎯 YKS İçin Özel Stratejileriniz")
+    
+    yks_strategies = {
+        "Görsel": [
+            "🗺️ **Kavram haritaları** oluşturun ve konuları görsel olarak bağlayın",
+            "🎨 **Renkli kalemler** kullanarak notlarınızı kategorilendirin",
+            "📊 **Şemalar ve grafikler** çizerek formülleri ve süreci görselleştirin",
+            "📹 **Görsel destekli videolar** izleyin ve ekran görüntüsü alın",
+            "📖 **Güzel tasarlanmış kitaplar** ve renkli test kitapları tercih edin",
+            "📝 **Akış şemaları** ile konuları adım adım çizin",
+            "🖼️ **Poster ve infografikler** hazırlayarak duvarlarınıza asın"
+        ],
+        "İşitsel": [
+            "🎧 **Podcast ve sesli anlatım** kaynakları bulun ve dinleyin",
+            "👥 **Çalışma grupları** oluşturun ve konuları tartışın",
+            "🗣️ **Konuları sesli anlatın** (kendinize ya da arkadaşlarınıza)",
+            "🎵 **Hafif klasik müzik** eşliğinde çalışın",
+            "📞 **Online grup çalışmaları** ve Zoom seansı organize edin",
+            "🎤 **Sesli notlar** kayıt edin ve tekrar dinleyin",
+            "📻 **Radyo programları** ve eğitim yayınları takip edin"
+        ],
+        "Kinestetik": [
+            "✍️ **Çok soru çözümü** yapın (mutlaka elle yazarak)",
+            "🚶 **Ayakta çalışma** dönemleri ekleyin (masa başında)",
+            "🔧 **Laboratuvar ve pratik uygulamalar** yapın",
+            "📝 **El yazısı notlar** alın, tablet yerine kağıt kullanın",
+            "⚡ **25 dk çalış, 5 dk hareket** sistemi uygulayın",
+            "🎯 **Interaktif simülasyonlar** ve oyunlar kullanın",
+            "🏃 **Yürüyüş yaparken** ses kayıtları dinleyin"
+        ]
+    }
+    
+    strategies = yks_strategies[dominant_style]
+    
+    for i, strategy in enumerate(strategies, 1):
+        st.markdown(f"{i}. {strategy}")
+
+def display_teacher_guide_section(dominant_style):
+    """Eğitimciler için rehber bölümü"""
+    
+    st.markdown("---")
+    st.markdown("🎓 ## Eğitimci Rehberi")
+    
+    teacher_guide = {
+        "Görsel": {
+            "recommended_methods": [
+                "Tahtada renkli kalemler kullanarak anlatım yapın",
+                "Kavram haritaları ve akış şemaları hazırlayın",
+                "Görsel destekli sunumlar ve videolar kullanın",
+                "Grafik, tablo ve şekiller çizerek açıklayın",
+                "Sınıfı düzenli ve görsel olarak zengin tutun"
+            ],
+            "classroom_setup": [
+                "Parlak ve iyi aydınlatılmış sınıf ortamı",
+                "Duvar posterler ve eğitici görseller",
+                "Düzenli sıra düzenlemesi",
+                "Beyaz tahta ve projeksiyon kullanımı",
+                "Renkli öğretim materyalleri"
+            ],
+            "avoid": [
+                "Sadece sözlü anlatım yapmayı uzun süre sürdürmek",
+                "Gürültülü ve karışık sınıf ortamı",
+                "Görsel destek olmadan sınavlar yapmak"
+            ]
+        },
+        "İşitsel": {
+            "recommended_methods": [
+                "Sesli anlatım ve hikaye anlatımı kullanın",
+                "Grup tartışmaları ve beyin fırtınası organize edin",
+                "Müzik ve ses efektleri ile dersi zenginleştirin",
+                "Sık sık soru-cevap seçimi kullanın",
+                "Sesli okuma ve tekrar seçimi yapın"
+            ],
+            "classroom_setup": [
+                "Akustik kalitesi iyi sınıf",
+                "Grup çalışmasına uygun oturma düzenlemesi",
+                "Ses sistemi ve mikrofonlar",
+                "Müzik çalar ve ses kaydı imkanları",
+                "Tartışmaya uygun havalandırma"
+            ],
+            "avoid": [
+                "Uzun süre sessizlik dayatmak",
+                "Sadece görsel materyallerle ders işlemek",
+                "Bireysel çalışmayı çok uzun sürdürmek"
+            ]
+        },
+        "Kinestetik": {
+            "recommended_methods": [
+                "Uygulamalı etkinlikler ve deneyler organize edin",
+                "Hareket gerektiren oyunlar ve simülasyonlar kullanın",
+                "Sık ara verme ve fiziksel aktivite ekleyin",
+                "Elle tutulur materyaller ve modellerle çalışın",
+                "Proje tabanlı öğrenme yöntemini tercih edin"
+            ],
+            "classroom_setup": [
+                "Hareket edebilecek geniş alan",
+                "Grup çalışmasına uygun masa düzenlemesi",
+                "Deneysel malzemeler ve araçlar",
+                "Ayakta çalışma imkanı",
+                "Esnek oturma düzenleri"
+            ],
+            "avoid": [
+                "Uzun süre hareketsiz oturmaya zorlama",
+                "Sadece teorik anlatım yapma",
+                "Fiziksel aktiviteyi kısıtlama"
+            ]
+        }
+    }
+    
+    guide = teacher_guide[dominant_style]
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("### ✅ **Tavsiye Edilen Yöntemler**")
+        for method in guide['recommended_methods']:
+            st.write(f"• {method}")
+    
+    with col2:
+        st.markdown("### 🏢 **Sınıf Düzenlemesi**")
+        for setup in guide['classroom_setup']:
+            st.write(f"• {setup}")
+    
+    with col3:
+        st.markdown("### ❌ **Kaçınılması Gerekenler**")
+        for avoid in guide['avoid']:
+            st.write(f"• {avoid}")
+
+def display_advanced_study_techniques(dominant_style):
+    """Gelişmiş çalışma teknikleri"""
+    
+    st.markdown("---")
+    st.markdown("⚙️ ## Gelişmiş Çalışma Teknikleri")
+    
+    advanced_techniques = {
+        "Görsel": {
+            "memory_techniques": [
+                "🗺️ **Zihin Haritası**: Konuları renkli dallar halinde çizin",
+                "🎨 **Görsel Hafıza Teknikleri**: Bilgileri resim ve sembollerle ilişkilendirin",
+                "🎭 **Hikaye Yöntemi**: Bilgileri görsel hikayeler halinde organize edin",
+                "📋 **Zaman Çizgisi**: Tarih ve sıralı konuları çizgisel görsele dönüştürün"
+            ],
+            "study_tools": [
+                "Canva, Miro, MindMeister gibi görsel tasarım araçları",
+                "iPad ve Apple Pencil ile dijital çizim",
+                "Renkli kağıtlar ve yapışkan notlar",
+                "Görsel plan bçleri ve infografikler"
+            ],
+            "exam_prep": [
+                "Soru tiplerine göre renkli kodlama sistemi",
+                "Görsel formül kartı hazırlama",
+                "Konu başlıklarını akış şeması olarak düzenleme"
+            ]
+        },
+        "İşitsel": {
+            "memory_techniques": [
+                "🎵 **Müziksel Hafıza**: Bilgileri şarkı ya da ritim halinde öğrenin",
+                "🗣️ **Sesli Tekrar**: Konuları kendi sesinizle kaydedin ve dinleyin",
+                "👥 **Sosyal Öğrenme**: Arkadaşlarınızla tartışarak öğrenin",
+                "🎤 **Anlatım Yöntemi**: Konuları başkalarına anlatarak pekiştirin"
+            ],
+            "study_tools": [
+                "Otter.ai, Rev gibi ses kayıt ve tranükripsiyon araçları",
+                "Spotify, Apple Music eğitim listleri",
+                "Discord, Zoom grup çalışma platformları",
+                "Podcast uygulamaları ve sesli kitaplar"
+            ],
+            "exam_prep": [
+                "Soru çözüm adımlarını sesli açıklama",
+                "Grup halinde mock sınav yapımı",
+                "Formülleri ritimli şekilde ezberleme"
+            ]
+        },
+        "Kinestetik": {
+            "memory_techniques": [
+                "✋ **Hareket ile Hafıza**: El hareketleriyle formülleri ilişkilendirin",
+                "🚶 **Yürüyüş Hafızası**: Yürüyerek seslice tekrar yapın",
+                "🎯 **Fiziksel Model**: Konuları 3D modellerle görselleştirin",
+                "✍️ **Yazma Hafızası**: Elle yazarak kas hafızasını geliştirin"
+            ],
+            "study_tools": [
+                "Pomodoro Timer uygulamaları",
+                "Standing desk ve egzersiz topları",
+                "Fidget araçları ve stres topları",
+                "İnteraktif simülasyon yazıçları"
+            ],
+            "exam_prep": [
+                "El yazısı ile çok soru çözme pratiği",
+                "Fiziksel hareket ile mental ara verme",
+                "Mock sınav sırasında hareket gülümseme"
+            ]
+        }
+    }
+    
+    techniques = advanced_techniques[dominant_style]
+    
+    tab1, tab2, tab3 = st.tabs(["🧠 Hafıza Teknikleri", "🛠️ Çalışma Araçları", "📈 Sınav Hazırlığı"])
+    
+    with tab1:
+        st.markdown("**Hafıza ve Öğrenme Teknikleri:**")
+        for technique in techniques['memory_techniques']:
+            st.write(f"• {technique}")
+    
+    with tab2:
+        st.markdown("**Tavsiye Edilen Çalışma Araçları:**")
+        for tool in techniques['study_tools']:
+            st.write(f"• {tool}")
+    
+    with tab3:
+        st.markdown("**Sınav Hazırlık Stratejileri:**")
+        for prep in techniques['exam_prep']:
+            st.write(f"• {prep}")
+    
+    # Bonus motivasyon bölümü
+    st.markdown("### 🏆 Motivasyon İpuçları")
+    motivation_tips = {
+        "Görsel": "Görsel hedefler koyun! YKS hedef üniversitenizin fotoğrafını çalışma alanınıza asın. İlerleme grafikleri hazırlayın.",
+        "İşitsel": "Motivasyon müziği dinleyin! Başarı hikayeleri podcast'lerini takip edin. Kendinize günün sonunda ses kaydı ile teşekkür mesajı bırakın.",
+        "Kinestetik": "Hareket halinde hedef belirleyin! Her başarı için kendinizi fiziksel bir aktivite ile ödüllendirin. İlerleme için fiziksel bir başarı panosu hazırlayın."
+    }
+    
+    st.info(motivation_tips[dominant_style])
+
+# ===== TEST FONKSİYONLARI =====
+
+def run_vak_learning_styles_test():
+    """Modern VAK Öğrenme Stilleri Testi - Detaylı analiz ve öğretmen rehberi ile"""
+    
+    # Ana menüye dön butonu
+    if st.button("🏠 Ana Menüye Dön", key="back_to_main_vak"):
+        if 'page' in st.session_state:
+            del st.session_state.page
+        st.rerun()
+    
+    st.markdown("---")
+    
+    # Modern CSS stilini ekle
+    st.markdown("""
+    <style>
+    .test-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 15px;
+        text-align: center;
+        margin-bottom: 2rem;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    }
+    .category-section {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        color: white;
+        padding: 1rem;
+        border-radius: 10px;
+        margin: 1.5rem 0;
+        text-align: center;
+        font-weight: bold;
+    }
+    .question-box {
+        background: #ffffff;
+        color: #333333;
+        border-left: 4px solid #667eea;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        border-radius: 12px;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+        border: 1px solid #e0e6ed;
+    }
+    .question-text {
+        color: #2c3e50;
+        font-size: 16px;
+        font-weight: 500;
+        margin-bottom: 1rem;
+        line-height: 1.5;
+    }
+    .likert-info {
+        background: #f8f9fa;
+        color: #495057;
+        padding: 1rem;
+        border-radius: 8px;
+        margin: 1rem 0;
+        border-left: 4px solid #17a2b8;
+        font-size: 14px;
+    }
+    .result-box {
+        background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Başlık
+    st.markdown("""
+    <div class="test-header">
+        <h1>🎨 Öğrenme Stilleri Testi (VAK)</h1>
+        <p>Görsel, İşitsel ve Kinestetik öğrenme stillerinizi keşfedin</p>
+        <p><strong>📋 75 soru | 🎯 1-5 Likert Ölçeği | 🆕 2025 Güncel Versiyonu</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Test açıklaması
+    st.markdown("""
+    ### 📖 Test Hakkında
+    Bu testte **doğru ya da yanlış cevap yoktur**. Her maddenin sizin için ne kadar geçerli olduğunu 1-5 arasında değerlendirin.
+    
+    **🎯 Kategoriler:**
+    - **A Kategorisi**: Görsel Öğrenme Stili (25 soru)
+    - **B Kategorisi**: İşitsel Öğrenme Stili (25 soru) 
+    - **C Kategorisi**: Kinestetik Öğrenme Stili (25 soru)
+    
+    **🆕 2025 Yılı Güncellemesi**: Bu yıl eklenen 15 yeni soru ile modern öğrenme alışkanlıklarınızı daha iyi analiz ediyoruz!
+    """)
+    
+    # Likert ölçeği açıklaması
+    st.markdown("""
+    <div class="likert-info">
+        <strong>📏 Değerlendirme Ölçeği:</strong><br>
+        <strong>1 = Hiç katılmıyorum</strong> | 
+        <strong>2 = Katılmıyorum</strong> | 
+        <strong>3 = Kararsızım</strong> | 
+        <strong>4 = Katılıyorum</strong> | 
+        <strong>5 = Tamamen katılıyorum</strong>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Test formunu başlat
+    with st.form("vak_test_form"):
+        user_data = get_user_data()
+        existing_results_raw = user_data.get('vak_test_results', '{}')
+        
+        # JSON string ise parse et, değilse dict olarak kullan
+        if isinstance(existing_results_raw, str):
+            try:
+                existing_results = json.loads(existing_results_raw)
+            except:
+                existing_results = {}
+        else:
+            existing_results = existing_results_raw
+        
+        # A Kategorisi soruları
+        st.markdown('<div class="category-section">👁️ A KATEGORİSİ - GÖRSEL ÖĞRENME STİLİ</div>', unsafe_allow_html=True)
+        
+        a_responses = {}
+        a_questions = [q for q in VAK_LEARNING_STYLES_TEST if q['category'] == 'A']
+        
+        for i, question in enumerate(a_questions):
+            question_key = f"A_{i+1}"
+            default_value = existing_results.get(question_key, 3)  # Default: Kararsızım
+            
+            st.markdown(f"""
+            <div class="question-box">
+                <div class="question-text">A{i+1}. {question["question"]}</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            a_responses[question_key] = st.select_slider(
+                f"A{i+1} - Değerlendirmeniz:",
+                options=[1, 2, 3, 4, 5],
+                value=default_value,
+                key=question_key,
+                format_func=lambda x: {
+                    1: "1 - Hiç katılmıyorum",
+                    2: "2 - Katılmıyorum", 
+                    3: "3 - Kararsızım",
+                    4: "4 - Katılıyorum",
+                    5: "5 - Tamamen katılıyorum"
+                }[x]
+            )
+        
+        # B Kategorisi soruları
+        st.markdown('<div class="category-section">👂 B KATEGORİSİ - İŞİTSEL ÖĞRENME STİLİ</div>', unsafe_allow_html=True)
+        
+        b_responses = {}
+        b_questions = [q for q in VAK_LEARNING_STYLES_TEST if q['category'] == 'B']
+        
+        for i, question in enumerate(b_questions):
+            question_key = f"B_{i+1}"
+            default_value = existing_results.get(question_key, 3)  # Default: Kararsızım
+            
+            st.markdown(f"""
+            <div class="question-box">
+                <div class="question-text">B{i+1}. {question["question"]}</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            b_responses[question_key] = st.select_slider(
+                f"B{i+1} - Değerlendirmeniz:",
+                options=[1, 2, 3, 4, 5],
+                value=default_value,
+                key=question_key,
+                format_func=lambda x: {
+                    1: "1 - Hiç katılmıyorum",
+                    2: "2 - Katılmıyorum", 
+                    3: "3 - Kararsızım",
+                    4: "4 - Katılıyorum",
+                    5: "5 - Tamamen katılıyorum"
+                }[x]
+            )
+        
+        # C Kategorisi soruları
+        st.markdown('<div class="category-section">✋ C KATEGORİSİ - KİNESTETİK ÖĞRENME STİLİ</div>', unsafe_allow_html=True)
+        
+        c_responses = {}
+        c_questions = [q for q in VAK_LEARNING_STYLES_TEST if q['category'] == 'C']
+        
+        for i, question in enumerate(c_questions):
+            question_key = f"C_{i+1}"
+            default_value = existing_results.get(question_key, 3)  # Default: Kararsızım
+            
+            st.markdown(f"""
+            <div class="question-box">
+                <div class="question-text">C{i+1}. {question["question"]}</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            c_responses[question_key] = st.select_slider(
+                f"C{i+1} - Değerlendirmeniz:",
+                options=[1, 2, 3, 4, 5],
+                value=default_value,
+                key=question_key,
+                format_func=lambda x: {
+                    1: "1 - Hiç katılmıyorum",
+                    2: "2 - Katılmıyorum", 
+                    3: "3 - Kararsızım",
+                    4: "4 - Katılıyorum",
+                    5: "5 - Tamamen katılıyorum"
+                }[x]
+            )
+        
+        # Test sonuçlarını hesapla ve kaydet
+        if st.form_submit_button("🎯 Testi Değerlendir", type="primary", use_container_width=True):
+            # Bilimsel puanlama sistemi (1-5 Likert ölçeği)
+            # Her kategori için ortalama puan hesapla
+            a_score = sum(a_responses.values()) / len(a_responses) if a_responses else 0
+            b_score = sum(b_responses.values()) / len(b_responses) if b_responses else 0  
+            c_score = sum(c_responses.values()) / len(c_responses) if c_responses else 0
+            
+            # Toplam puan ve yüzdelik hesaplama
+            total_score = a_score + b_score + c_score
+            
+            if total_score > 0:
+                a_percentage = (a_score / total_score) * 100
+                b_percentage = (b_score / total_score) * 100
+                c_percentage = (c_score / total_score) * 100
+            else:
+                a_percentage = b_percentage = c_percentage = 33.33
+            
+            # Baskın öğrenme stilini belirle
+            scores = {
+                'Görsel': (a_score, a_percentage),
+                'İşitsel': (b_score, b_percentage), 
+                'Kinestetik': (c_score, c_percentage)
+            }
+            
+            # En yüksek puanı bul
+            dominant_style = max(scores.keys(), key=lambda k: scores[k][0])
+            
+            # Sonuçları birleştir
+            all_responses = {**a_responses, **b_responses, **c_responses}
+            
+            # Veritabanına kaydet - Hem eski hem yeni field isimleri
+            update_user_in_firebase(st.session_state.current_user, {
+                'vak_test_results': json.dumps(all_responses),
+                'learning_style': dominant_style,
+                'learning_style_scores': json.dumps({
+                    'visual': a_percentage,
+                    'auditory': b_percentage,
+                    'kinesthetic': c_percentage
+                }),
+                'vak_test_scores': json.dumps({
+                    'A_score': a_score,
+                    'B_score': b_score, 
+                    'C_score': c_score,
+                    'A_percentage': a_percentage,
+                    'B_percentage': b_percentage,
+                    'C_percentage': c_percentage,
+                    'dominant_style': dominant_style
+                }),
+                'vak_test_completed': 'True'
+            })
+            
+            # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+            
+            # Sonuçları göster
+            st.markdown('<div class="result-box">', unsafe_allow_html=True)
+            st.markdown("## 🎉 VAK Öğrenme Stilleri Test Sonuçlarınız")
+            
+            # Puanlar ve yüzdeler
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("👁️ GÖRSEL ÖĞRENME", 
+                         f"{a_score:.2f}/5.00", 
+                         f"%{a_percentage:.1f}")
+            with col2:
+                st.metric("👂 İŞİTSEL ÖĞRENME", 
+                         f"{b_score:.2f}/5.00", 
+                         f"%{b_percentage:.1f}") 
+            with col3:
+                st.metric("✋ KİNESTETİK ÖĞRENME", 
+                         f"{c_score:.2f}/5.00", 
+                         f"%{c_percentage:.1f}")
+            
+            st.markdown("---")
+            st.markdown(f"## 🏆 Baskın Öğrenme Stiliniz: **{dominant_style.upper()}**")
+            
+            # Detaylı öğrenme stili analizi ve modern öneriler
+            display_modern_vak_analysis(dominant_style, a_percentage, b_percentage, c_percentage)
+            
+            # Öğretmen rehberi bölümü
+            display_teacher_guide_section(dominant_style)
+            
+            # Gelişmiş çalışma teknikleri
+            display_advanced_study_techniques(dominant_style)
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            st.success("✅ Test sonuçlarınız kaydedildi!")
+
+def run_cognitive_profile_test():
+    """Bilişsel Profil Testi - 20 soru (Likert 1-5)"""
+    
+    # Ana menüye dön butonu
+    if st.button("🏠 Ana Menüye Dön", key="back_to_main_cognitive"):
+        if 'page' in st.session_state:
+            del st.session_state.page
+        st.rerun()
+    
+    st.markdown("---")
+    
+    # Modern CSS stilini ekle ve metin görünürlük sorunu için css ekle
+    st.markdown("""
+    <style>
+    body {
+        color: black !important;
+    }
+    .stMarkdown {
+        color: black !important;
+    }
+    .cognitive-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 15px;
+        text-align: center;
+        margin-bottom: 2rem;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    }
+    .section-header {
+        background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%);
+        color: #333;
+        padding: 1rem;
+        border-radius: 10px;
+        margin: 1.5rem 0;
+        text-align: center;
+        font-weight: bold;
+    }
+    .cognitive-question {
+        background: #f8f9ff;
+        border-left: 4px solid #667eea;
+        padding: 1rem;
+        margin: 0.5rem 0;
+        border-radius: 8px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.05);
+    }
+    .cognitive-result {
+        background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    }
+    .likert-scale {
+        display: flex;
+        justify-content: space-between;
+        margin: 1rem 0;
+        padding: 0.5rem;
+        background: #f0f2f6;
+        border-radius: 8px;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Başlık
+    st.markdown("""
+    <div class="cognitive-header">
+        <h1>🧠 Bilişsel Profil Testi</h1>
+        <p>Düşünme stilinizi, motivasyon kaynağınızı ve problem çözme yaklaşımınızı keşfedin</p>
+        <p><strong>📋 20 soru | 🎯 1-5 arası puanlama</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Test açıklaması
+    st.markdown("""
+    ### 🔬 Test Hakkında
+    Bu test **4 ana boyutta** bilişsel profilinizi analiz eder:
+    
+    🔬 **Bilişsel İşleme Stili** - Bilgiyi nasıl işliyorsunuz?  
+    ⚡ **Motivasyon & Duygusal Stil** - Neyin sizi motive ettiği  
+    🔍 **Problem Çözme Yaklaşımı** - Zorluklarla nasıl başa çıktığınız  
+    💾 **Hafıza & Pekiştirme Tarzı** - Bilgiyi nasıl sakladığınız  
+    
+    **Puanlama:** 1 = Hiç uymuyor, 5 = Tamamen uyuyor
+    """)
+    
+    # Test formunu başlat
+    with st.form("cognitive_test_form"):
+        user_data = get_user_data()
+        existing_results_raw = user_data.get('cognitive_test_results', {})
+        
+        # JSON string ise parse et, dict ise direkt kullan
+        if isinstance(existing_results_raw, str):
+            try:
+                existing_results = json.loads(existing_results_raw)
+            except (json.JSONDecodeError, TypeError):
+                existing_results = {}
+        else:
+            existing_results = existing_results_raw if isinstance(existing_results_raw, dict) else {}
+        
+        responses = {}
+        
+        # Bölümlere göre soruları grupla
+        sections = {}
+        for question in COGNITIVE_PROFILE_TEST:
+            section = question['section']
+            if section not in sections:
+                sections[section] = []
+            sections[section].append(question)
+        
+        # Her bölüm için soruları göster
+        for section_name, questions in sections.items():
+            st.markdown(f'<div class="section-header">{section_name}</div>', unsafe_allow_html=True)
+            
+            for i, question in enumerate(questions):
+                question_key = f"{question['category']}_{i}"
+                default_value = existing_results.get(question_key, 3)
+                
+                st.markdown(f'<div class="cognitive-question">{question["question"]}</div>', unsafe_allow_html=True)
+                
+                # Likert scale slider
+                responses[question_key] = st.slider(
+                    "Değerlendirme",
+                    min_value=1,
+                    max_value=5,
+                    value=default_value,
+                    key=question_key,
+                    help="1 = Hiç uymuyor, 5 = Tamamen uyuyor",
+                    label_visibility="collapsed"
+                )
+                
+                # Açıklama metni
+                col1, col2, col3 = st.columns([1, 3, 1])
+                with col1:
+                    st.caption("Hiç uymuyor")
+                with col2:
+                    st.caption("")
+                with col3:
+                    st.caption("Tamamen uyuyor")
+                
+                st.markdown("---")
+        
+        # Test sonuçlarını hesapla ve kaydet
+        if st.form_submit_button("🎯 Testi Değerlendir", type="primary", use_container_width=True):
+            # Kategorilere göre puanları hesapla
+            category_scores = {}
+            
+            for question_key, score in responses.items():
+                # İlgili soruyu bul
+                for question in COGNITIVE_PROFILE_TEST:
+                    if question_key.startswith(question['category']):
+                        category = question['category']
+                        if category not in category_scores:
+                            category_scores[category] = []
+                        category_scores[category].append(score)
+                        break
+            
+            # Ortalama puanları hesapla
+            average_scores = {}
+            for category, scores in category_scores.items():
+                average_scores[category] = sum(scores) / len(scores)
+            
+            # Veritabanına kaydet
+            update_user_in_firebase(st.session_state.current_user, {
+                'cognitive_test_results': json.dumps(responses),
+                'cognitive_test_scores': json.dumps(average_scores),
+                'cognitive_test_completed': 'True'
+            })
+            
+            # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+            
+            # Sonuçları göster
+            st.markdown('<div class="cognitive-result">', unsafe_allow_html=True)
+            st.markdown("## 🎉 Bilişsel Profil Sonuçlarınız")
+            
+            # Sonuçları görselleştir
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("### 📊 Puanlarınız")
+                for category, score in average_scores.items():
+                    # Kategori isimlerini Türkçe'ye çevir
+                    if 'analytic' in category:
+                        display_name = "🔬 Analitik Düşünme"
+                    elif 'synthetic' in category:
+                        display_name = "🎨 Sintetik Düşünme"
+                    elif 'reflective' in category:
+                        display_name = "🧘 Reflektif Düşünme"
+                    elif 'external' in category:
+                        display_name = "⚡ Dışsal Motivasyon"
+                    elif 'internal' in category:
+                        display_name = "🧍‍♂️ İçsel Motivasyon"
+                    elif 'methodic' in category:
+                        display_name = "📊 Metodik Problem Çözme"
+                    elif 'experimental' in category:
+                        display_name = "💡 Deneysel Problem Çözme"
+                    elif 'social' in category:
+                        display_name = "🗣️ Sosyal Problem Çözme"
+                    elif 'visual' in category:
+                        display_name = "👁 Görsel Hafıza"
+                    elif 'auditory' in category:
+                        display_name = "👂 İşitsel Hafıza"
+                    elif 'experiential' in category:
+                        display_name = "✋ Deneyimsel Hafıza"
+                    elif 'analytic' in category:
+                        display_name = "📖 Analitik Hafıza"
+                    else:
+                        display_name = category
+                    
+                    st.metric(display_name, f"{score:.1f}/5")
+            
+            with col2:
+                st.markdown("### 🎯 YKS İçin Öneriler")
+                
+                # En yüksek puanları bul ve önerilerde bulun
+                max_categories = [k for k, v in average_scores.items() if v == max(average_scores.values())]
+                
+                if any('analytic' in cat for cat in max_categories):
+                    st.info("📊 **Analitik yapınız güçlü:** Düzenli çalışma planları ve aşama aşama öğrenme size uygun!")
+                    
+                if any('synthetic' in cat for cat in max_categories):
+                    st.info("🎨 **Bütüncül bakış açınız güçlü:** Kavram haritaları ve genel resmi görme yaklaşımları size uygun!")
+                    
+                if any('external' in cat for cat in max_categories):
+                    st.info("🏆 **Dışsal motivasyon:** Hedef koyma, ödül sistemi ve rekabet size enerji verir!")
+                    
+                if any('internal' in cat for cat in max_categories):
+                    st.info("💫 **İçsel motivasyon:** İlginizi çeken konulardan başlayın, merak duygusu size güç verir!")
+                    
+                if any('methodic' in cat for cat in max_categories):
+                    st.info("📋 **Sistematik yaklaşım:** Adım adım planlar ve düzenli tekrarlar size uygun!")
+                    
+                if any('experimental' in cat for cat in max_categories):
+                    st.info("🔬 **Deneyimsel öğrenme:** Bol soru çözümü ve pratik uygulamalar size uygun!")
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            st.success("✅ Bilişsel profil sonuçlarınız kaydedildi!")
+
+def run_motivation_emotional_test():
+    """Motivasyon & Duygusal Denge Testi - 10 soru (Likert 1-5)"""
+    
+    # Ana menüye dön butonu
+    if st.button("🏠 Ana Menüye Dön", key="back_to_main_motivation"):
+        if 'page' in st.session_state:
+            del st.session_state.page
+        st.rerun()
+    
+    st.markdown("---")
+    
+    # CSS stilini ekle ve metin görünürlük sorunu için css ekle
+    st.markdown("""
+    <style>
+    body {
+        color: black !important;
+    }
+    .stMarkdown {
+        color: black !important;
+    }
+    .motivation-header {
+        background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 15px;
+        text-align: center;
+        margin-bottom: 2rem;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    }
+    .motivation-question {
+        background: #fff5f5;
+        border-left: 4px solid #ff6b6b;
+        padding: 1rem;
+        margin: 0.5rem 0;
+        border-radius: 8px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.05);
+    }
+    .motivation-result {
+        background: linear-gradient(135deg, #ff9999 0%, #ffcccc 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Başlık
+    st.markdown("""
+    <div class="motivation-header">
+        <h1>⚡ Motivasyon & Duygusal Denge Testi</h1>
+        <p>Motivasyon kaynağınızı, kaygı düeyinizi ve duygusal dayanıklılığınızı keşedin</p>
+        <p><strong>📋 10 soru | 🎯 1-5 arası puanlama</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Test açıklaması
+    st.markdown("""
+    ### 🔬 Test Hakkında
+    Bu test **4 ana boyutta** motivasyon ve duygusal profilinizi analiz eder:
+    
+    💫 **İçsel Motivasyon** - Öğrenme sürecinden zevk alma  
+    🏆 **Dışsal Motivasyon** - Harici ödül ve takdir arayışı  
+    😰 **Sınav Kaygısı** - Performans kaygısı ve stres düzeyi  
+    💪 **Duygusal Dayanıklılık** - Zorluklarla başa çıkma kapasitesi  
+    
+    **Puanlama:** 1 = Hiç katılmıyorum, 5 = Tamamen katılıyorum
+    """)
+    
+    # Test formunu başlat
+    with st.form("motivation_test_form"):
+        user_data = get_user_data()
+        existing_results_raw = user_data.get('motivation_test_results', {})
+        
+        # JSON string ise parse et, dict ise direkt kullan
+        if isinstance(existing_results_raw, str):
+            try:
+                existing_results = json.loads(existing_results_raw)
+            except (json.JSONDecodeError, TypeError):
+                existing_results = {}
+        else:
+            existing_results = existing_results_raw if isinstance(existing_results_raw, dict) else {}
+        
+        responses = {}
+        
+        # Soru sayısını takip et
+        for i, question in enumerate(MOTIVATION_EMOTIONAL_TEST):
+            question_key = f"motivation_{i+1}"
+            default_value = existing_results.get(question_key, 3)
+            
+            st.markdown(f'<div class="motivation-question">{i+1}. {question["question"]}</div>', unsafe_allow_html=True)
+            
+            # Likert scale slider
+            responses[question_key] = st.select_slider(
+                f"Soru {i+1} - Değerlendirmeniz:",
+                options=[1, 2, 3, 4, 5],
+                value=default_value,
+                key=question_key,
+                format_func=lambda x: {
+                    1: "1 - Hiç katılmıyorum",
+                    2: "2 - Katılmıyorum", 
+                    3: "3 - Kararsızım",
+                    4: "4 - Katılıyorum",
+                    5: "5 - Tamamen katılıyorum"
+                }[x]
+            )
+            st.markdown("---")
+        
+        # Test sonuçlarını hesapla ve kaydet
+        if st.form_submit_button("🎯 Testi Değerlendir", type="primary", use_container_width=True):
+            # Kategorilere göre puanları hesapla
+            category_scores = {
+                'internal_motivation': [],
+                'external_motivation': [],
+                'test_anxiety': [],
+                'emotional_resilience': []
+            }
+            
+            for i, question in enumerate(MOTIVATION_EMOTIONAL_TEST):
+                question_key = f"motivation_{i+1}"
+                score = responses[question_key]
+                category = question['category']
+                category_scores[category].append(score)
+            
+            # Ortalama puanları hesapla
+            average_scores = {}
+            for category, scores in category_scores.items():
+                if scores:
+                    average_scores[category] = sum(scores) / len(scores)
+                else:
+                    average_scores[category] = 0
+            
+            # Veritabanına kaydet
+            update_user_in_firebase(st.session_state.current_user, {
+                'motivation_test_results': json.dumps(responses),
+                'motivation_test_scores': json.dumps(average_scores),
+                'motivation_test_completed': 'True'
+            })
+            
+            # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+            
+            # Sonuçları göster
+            st.markdown('<div class="motivation-result">', unsafe_allow_html=True)
+            st.markdown("## 🎉 Motivasyon & Duygusal Denge Sonuçlarınız")
+            
+            # Sonuçları görselleştir
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("### 📋 Puanlarınız")
+                st.metric("💫 İçsel Motivasyon", f"{average_scores['internal_motivation']:.1f}/5")
+                st.metric("🏆 Dışsal Motivasyon", f"{average_scores['external_motivation']:.1f}/5")
+                st.metric("😰 Sınav Kaygısı", f"{average_scores['test_anxiety']:.1f}/5")
+                st.metric("💪 Duygusal Dayanıklılık", f"{average_scores['emotional_resilience']:.1f}/5")
+            
+            with col2:
+                st.markdown("### 🎯 YKS İçin Öneriler")
+                
+                # En yüksek motivasyon türünü bul
+                if average_scores['internal_motivation'] > average_scores['external_motivation']:
+                    st.info("💫 **İçsel motivasyon baskın:** Merak ettiğiniz konulardan başlayın, öğrenme zevkini öne çıkarın!")
+                else:
+                    st.info("🏆 **Dışsal motivasyon baskın:** Hedefler koyun, ödül sistemi oluşturun, rekabet size enerji verir!")
+                
+                # Kaygı dürzeyine göre öneri
+                if average_scores['test_anxiety'] >= 3.5:
+                    st.warning("⚠️ **Yüksek kaygı düzeyi:** Nefes egzersizleri, planlama ve simulation sınavları kaygınızı azaltabilir.")
+                elif average_scores['test_anxiety'] <= 2.5:
+                    st.success("✅ **Düşük kaygı düzeyi:** Harika! Bu avantajınızı koruyun ve performansınıza odaklanın.")
+                
+                # Dayanıklılık durumuna göre öneri
+                if average_scores['emotional_resilience'] >= 4.0:
+                    st.success("💪 **Yüksek dayanıklılık:** Zor konularda ısrarcı olun, bu gücünüz YKS'de büyük avantaj!")
+                else:
+                    st.info("🌱 **Dayanıklılık geliştirme:** Küçük başarıları kutlayın, kısa vadeli hedefler koyun.")
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            st.success("✅ Motivasyon & duygusal denge sonuçlarınız kaydedildi!")
+
+def run_time_management_test():
+    """Zaman Yönetimi & Çalışma Alışkanlığı Testi - 10 soru (Likert 1-5)"""
+    
+    # Ana menüye dön butonu
+    if st.button("🏠 Ana Menüye Dön", key="back_to_main_time"):
+        if 'page' in st.session_state:
+            del st.session_state.page
+        st.rerun()
+    
+    st.markdown("---")
+    
+    # CSS stilini ekle ve metin görünürlük sorunu için css ekle
+    st.markdown("""
+    <style>
+    body {
+        color: black !important;
+    }
+    .stMarkdown {
+        color: black !important;
+    }
+    .time-header {
+        background: linear-gradient(135deg, #4834d4 0%, #686de0 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 15px;
+        text-align: center;
+        margin-bottom: 2rem;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    }
+    .time-question {
+        background: #f8f9ff;
+        border-left: 4px solid #4834d4;
+        padding: 1rem;
+        margin: 0.5rem 0;
+        border-radius: 8px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.05);
+    }
+    .time-result {
+        background: linear-gradient(135deg, #a4b0ff 0%, #c7d2fe 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        margin: 2rem 0;
+        text-align: center;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Başlık
+    st.markdown("""
+    <div class="time-header">
+        <h1>⏰ Zaman Yönetimi & Çalışma Alışkanlığı Testi</h1>
+        <p>Planlama, disiplin, odak ve erteleme davranışınızı keşedin</p>
+        <p><strong>📋 10 soru | 🎯 1-5 arası puanlama</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Test açıklaması
+    st.markdown("""
+    ### 🔬 Test Hakkında
+    Bu test **4 ana boyutta** zaman yönetimi profilinizi analiz eder:
+    
+    📋 **Planlama & Disiplin** - Hedef belirleme ve planlı çalışma  
+    ⏰ **Erteleme & Son Dakikacılık** - Procastination eğilimi  
+    🎯 **Odak & Dikkat Yönetimi** - Konsantrasyon süresi ve mola dengesi  
+    🧠 **Öz Farkındalık** - Verimli zaman dilimlerini tanıma  
+    
+    **Puanlama:** 1 = Hiç katılmıyorum, 5 = Tamamen katılıyorum
+    """)
+    
+    # Test formunu başlat
+    with st.form("time_management_test_form"):
+        user_data = get_user_data()
+        existing_results_raw = user_data.get('time_test_results', {})
+        
+        # JSON string ise parse et, dict ise direkt kullan
+        if isinstance(existing_results_raw, str):
+            try:
+                existing_results = json.loads(existing_results_raw)
+            except (json.JSONDecodeError, TypeError):
+                existing_results = {}
+        else:
+            existing_results = existing_results_raw if isinstance(existing_results_raw, dict) else {}
+        
+        responses = {}
+        
+        # Soru sayısını takip et
+        for i, question in enumerate(TIME_MANAGEMENT_TEST):
+            question_key = f"time_{i+1}"
+            default_value = existing_results.get(question_key, 3)
+            
+            st.markdown(f'<div class="time-question">{i+1}. {question["question"]}</div>', unsafe_allow_html=True)
+            
+            # Likert scale slider
+            responses[question_key] = st.select_slider(
+                f"Soru {i+1} - Değerlendirmeniz:",
+                options=[1, 2, 3, 4, 5],
+                value=default_value,
+                key=question_key,
+                format_func=lambda x: {
+                    1: "1 - Hiç katılmıyorum",
+                    2: "2 - Katılmıyorum", 
+                    3: "3 - Kararsızım",
+                    4: "4 - Katılıyorum",
+                    5: "5 - Tamamen katılıyorum"
+                }[x]
+            )
+            st.markdown("---")
+        
+        # Test sonuçlarını hesapla ve kaydet
+        if st.form_submit_button("🎯 Testi Değerlendir", type="primary", use_container_width=True):
+            # Kategorilere göre puanları hesapla
+            category_scores = {
+                'planning': [],
+                'procrastination': [],
+                'focus_control': [],
+                'discipline': [],
+                'self_awareness': []
+            }
+            
+            for i, question in enumerate(TIME_MANAGEMENT_TEST):
+                question_key = f"time_{i+1}"
+                score = responses[question_key]
+                category = question['category']
+                category_scores[category].append(score)
+            
+            # Ortalama puanları hesapla
+            average_scores = {}
+            for category, scores in category_scores.items():
+                if scores:
+                    average_scores[category] = sum(scores) / len(scores)
+                else:
+                    average_scores[category] = 0
+            
+            # Veritabanına kaydet
+            update_user_in_firebase(st.session_state.current_user, {
+                'time_test_results': json.dumps(responses),
+                'time_test_scores': json.dumps(average_scores),
+                'time_test_completed': 'True'
+            })
+            
+            # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+            
+            # Sonuçları göster
+            st.markdown('<div class="time-result">', unsafe_allow_html=True)
+            st.markdown("## 🎉 Zaman Yönetimi Sonuçlarınız")
+            
+            # Sonuçları görselleştir
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("### 📋 Puanlarınız")
+                st.metric("📋 Planlama", f"{average_scores['planning']:.1f}/5")
+                st.metric("⏰ Erteleme Eğilimi", f"{average_scores['procrastination']:.1f}/5")
+                st.metric("🎯 Odak Kontrolü", f"{average_scores['focus_control']:.1f}/5")
+                st.metric("💪 Disiplin", f"{average_scores['discipline']:.1f}/5")
+                st.metric("🧠 Öz Farkındalık", f"{average_scores['self_awareness']:.1f}/5")
+            
+            with col2:
+                st.markdown("### 🎯 YKS İçin Öneriler")
+                
+                # Zaman yönetimi profilini belirle
+                planning_score = average_scores['planning']
+                procrastination_score = average_scores['procrastination']
+                focus_score = average_scores['focus_control']
+                
+                if planning_score >= 4.0:
+                    st.success("📋 **Mükemmel planlama:** Mevcut sisteminizi koruyun, sadece ince ayar yapın!")
+                elif planning_score >= 3.0:
+                    st.info("📊 **Orta düzey planlama:** Haftalık detaylı planlar yapın, günlük revizyon ekleyin.")
+                else:
+                    st.warning("⚠️ **Planlama geliştirme:** Küçük başlayın - önce günlük, sonra haftalık planlar.")
+                
+                if procrastination_score >= 3.5:
+                    st.warning("⏰ **Yüksek erteleme:** Pomodoro tekniği (25+5 dk) ve küçük hedefler size yardımcı olur.")
+                else:
+                    st.success("✅ **Düşük erteleme:** Harika! Bu disiplini koruyun.")
+                
+                if focus_score <= 2.5:
+                    st.info("🎯 **Odak geliştirme:** Telefonunu başka odaya koy, 20 dk odaklanma + 5 dk mola döngülünü dene.")
+                else:
+                    st.success("🎯 **İyi odak:** Mevcut odak sürenizi optimum şekilde kullanın.")
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            st.success("✅ Zaman yönetimi sonuçlarınız kaydedildi!")
+
+def render_learning_styles_test(user_data, progress_data, target_dept):
+    """🎨 Öğrenme Stilleri Testi"""
+    run_vak_learning_styles_test()
+
+def render_cognitive_profile_test(user_data, progress_data, target_dept):
+    """🧠 Bilişsel Profil Testi"""
+    run_cognitive_profile_test()
+
+def render_motivation_emotional_test(user_data, progress_data, target_dept):
+    """⚡ Motivasyon & Duygu Testi"""
+    run_motivation_emotional_test()
+
+def render_time_management_test(user_data, progress_data, target_dept):
+    """⏰ Zaman Yönetimi Testi"""
+    run_time_management_test()
@@ -0,0 +1,39 @@
+"""
+📊 İstatistikler sayfası
+Sayfa ilk seçildiğinde import edilir (yks_app.pages.render_page)
+"""
+
+from yks_app.core import *
+
+
+
+def render(user_data, progress_data, target_dept):
+    """📊 İstatistikler"""
+    st.markdown(f'<div class="main-header"><h1>📊 Detaylı İstatistikler</h1><p>İlerlemenizi analiz edin</p></div>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        total_completed = sum(data['completed'] for data in progress_data.values())
+        total_topics = count_total_topics()
+        st.metric("📊 Toplam Konu", f"{total_completed}/{total_topics}")
+    with col2:
+        completion_rate = (total_completed / total_topics * 100) if total_topics > 0 else 0
+        st.metric("🎯 Tamamlanma Oranı", f"%{completion_rate:.1f}")
+    with col3:
+        # Ana sayfadaki ilerleme ile aynı net dizisinden
+        avg_net = get_average_recorded_net(user_data)
+        st.metric("⭐ Ortalama Net", f"{avg_net:.1f}")
+
+    st.subheader("📈 Ders Bazında İlerleme")
+    if progress_data:
+        subjects = list(progress_data.keys())
+        percents = [data['percent'] for data in progress_data.values()]
+        cached_plotly_chart(
+            'stats_subject_progress', (subjects, percents),
+            lambda: px.bar(x=subjects, y=percents, title="Derslere Göre Tamamlanma Oranları", labels={'x': 'Dersler', 'y': 'Tamamlanma (%)'}, color=percents, color_continuous_scale="Viridis"),
+            use_container_width=True)
+        st.subheader("📋 Detaylı İlerleme Tablosu")
+        progress_df = pd.DataFrame([{'Ders': s, 'Tamamlanan': d['completed'], 'Toplam': d['total'], 'Oran (%)': d['percent']} for s, d in progress_data.items()])
+        st.dataframe(progress_df, use_container_width=True)
+    else:
+        st.info("📊 Henüz yeterli veri bulunmuyor. Konu takip sayfasından ilerlemenizi kaydedin.")
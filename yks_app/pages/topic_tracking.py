@@ -0,0 +1,585 @@
+"""
+📚 Konu Takip sayfası
+Sayfa ilk seçildiğinde import edilir (yks_app.pages.render_page)
+"""
+
+from yks_app.core import *
+from yks_app.planner import *
+
+def calculate_level(net_score):
+    """Net skora göre seviye göstergesi hesaplar"""
+    if net_score >= 18:
+        return "🎓 Uzman"
+    elif net_score >= 15:
+        return "🚀 İyi"
+    elif net_score >= 12:
+        return "💪 Orta"
+    elif net_score >= 8:
+        return "📘 Temel"
+    else:
+        return "⚠️ Zayıf"
+
+def show_topic_tracking_row(topic_id, topic_progress, user_data):
+    """Konu Takip sayfasında tek konu satırı: net, seviye, zorluk ve soru sıklığı"""
+    catalog = TOPIC_CATALOG
+    topic_key = catalog.keys[topic_id]
+    subject = catalog.subjects[topic_id]
+    category = catalog.categories[topic_id]
+    detail = catalog.topics[topic_id]
+    question_count = catalog.question_counts[topic_id]
+    
+    # DOM hata önleyici - widget key'leri önceki formatla aynı kalır
+    key_suffix = "_".join(part for part in (subject, category, catalog.subcategories[topic_id], detail) if part is not None)
+    
+    col1, col2, col3, col4, col5 = st.columns([3, 2, 1, 1, 1])
+    with col1:
+        # Soru sayısı bilgisini ekle
+        if question_count > 0:
+            st.write(f"• {detail} <span style='color: #ff6b6b; font-size: 0.8em;'>({question_count} soru)</span>", unsafe_allow_html=True)
+        else:
+            st.write(f"• {detail}")
+    with col2:
+        current_net = topic_progress.get(topic_key, '0')
+        current_net_int = parse_net_value(current_net)
+        stable_key = f"slider_{hash(topic_key)}_{key_suffix}"
+        new_net = st.slider(f"Net ({detail})", 0, 20, current_net_int, key=stable_key, label_visibility="collapsed")
+    with col3:
+        st.write(calculate_level(new_net))
+    with col4:
+        # Konu Zorluk Puanlama (1-5 arası)
+        difficulty_key = f"difficulty_{hash(topic_key)}_{key_suffix}"
+        current_difficulty = topic_progress.get(f"{topic_key}_difficulty", 3)  # Varsayılan: orta
+        try:
+            current_difficulty_int = int(current_difficulty)
+        except (ValueError, TypeError):
+            current_difficulty_int = 3
+        
+        difficulty_rating = st.selectbox(
+            "Zorluk",
+            options=[1, 2, 3, 4, 5],
+            index=current_difficulty_int - 1,
+            format_func=lambda x: f"{TOPIC_DIFFICULTY_SYSTEM[x]['icon']} {x}",
+            key=difficulty_key,
+            label_visibility="collapsed",
+            help=f"Zorluk: {TOPIC_DIFFICULTY_SYSTEM[current_difficulty_int]['name']} - {TOPIC_DIFFICULTY_SYSTEM[current_difficulty_int]['study_time']}"
+        )
+        
+        # Zorluk güncellemesi
+        if difficulty_rating != current_difficulty_int:
+            topic_progress[f"{topic_key}_difficulty"] = difficulty_rating
+            update_user_in_firebase(st.session_state.current_user, {'topic_progress': json.dumps(topic_progress)})
+    with col5:
+        # Soru sıklığı ikonu
+        if question_count >= 15:
+            st.write("🔥", help=f"Çok sık çıkan konu: {question_count} soru")
+        elif question_count >= 8:
+            st.write("⚡", help=f"Orta sıklıkta çıkan konu: {question_count} soru")
+        elif question_count > 0:
+            st.write("📚", help=f"Az sıklıkta çıkan konu: {question_count} soru")
+    
+    # Güncelleme
+    if str(new_net) != current_net:
+        topic_progress[topic_key] = str(new_net)
+        update_user_in_firebase(st.session_state.current_user, {'topic_progress': json.dumps(topic_progress)})
+        
+        # 🔥 Eğer net 15+ olduysa tekrar listesinden otomatik çıkar
+        if new_net >= 15 and category is not None:
+            remove_topic_from_review_list(user_data, f"{subject}_{detail}")
+        
+        # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+        # Haftalık plan cache'ini temizle
+        if 'weekly_plan_cache' in st.session_state:
+            del st.session_state.weekly_plan_cache
+        st.session_state.topic_updates.append((detail, new_net))
+        # 🔥 KRİTİK: Haftalık hedef konular listesini anında güncelle
+        st.rerun()
+
+
+
+def show_review_topics_section(review_topics, user_data):
+    """ESKİ FONKSİYON - Artık kullanılmıyor, show_review_topics_tab() kullanılıyor"""
+    
+    # 🔥 ÖNCELİK: Pending deletion'ları işle (sayfa her yüklendiğinde)
+    if 'pending_deletions' in st.session_state and st.session_state.pending_deletions:
+        logger.debug("🔄 %s pending deletion işlenecek...", len(st.session_state.pending_deletions))
+        
+        # Pending deletion'ları Firestore'a uygula
+        for deletion in st.session_state.pending_deletions[:]:  # Copy list to avoid modification during iteration
+            try:
+                # Firestore'dan gerçek silme işlemi
+                remove_topic_from_review_list(user_data, deletion['original_topic_key'])
+                
+                # Firestore'a kaydet
+                if 'username' in user_data:
+                    username = user_data['username']
+                    update_user_in_firebase(username, user_data)
+                    clear_user_cache(username)
+                    logger.info("✅ Pending deletion tamamlandı: %s - %s", deletion['subject'], deletion['topic'])
+                else:
+                    # Fallback için session state
+                    current_user = st.session_state.get('current_user')
+                    if current_user:
+                        st.session_state.users_db[current_user] = user_data
+                
+            except Exception as e:
+                logger.error("❌ Pending deletion hatası: %s", e)
+                # Hata durumunda, bu deletion'ı listeden çıkar (işlenmiş kabul et)
+        
+        # İşlenen pending deletion'ları temizle
+        st.session_state.pending_deletions = []
+        st.cache_data.clear()
+        logger.debug("🧹 Pending deletion listesi temizlendi")
+    
+    # Önce konu takip hatırlatmalarını göster
+    show_topic_reminder_alerts(user_data)
+    
+    # YENİ: Kalıcı öğrenme sistemi tekrarları
+    pending_mastery_topics = get_pending_review_topics(user_data)
+    
+    # Eğer her iki sistem de boşsa
+    if not review_topics and not pending_mastery_topics:
+        st.info("🎉 Bu hafta tekrar edilecek konu yok!")
+        return
+    
+    # Tüm tekrarları tek listede birleştir
+    all_review_topics = []
+    
+    # Kalıcı öğrenme tekrarlarını ekle (öncelik)
+    if pending_mastery_topics:
+        for topic in pending_mastery_topics:
+            topic_with_priority = topic.copy()
+            topic_with_priority['review_type'] = 'KALİCİ'
+            all_review_topics.append(topic_with_priority)
+    
+    # Genel tekrarları ekle
+    if review_topics:
+        for topic in review_topics:
+            topic_with_priority = topic.copy()
+            topic_with_priority['review_type'] = 'GENEL'
+            all_review_topics.append(topic_with_priority)
+    
+    # 🔥 %100 ÇÖZÜM: Streamlit Native Components ile Kartlar
+    if all_review_topics:
+        st.markdown("#### 🔄 TEKRAR EDİLECEK KONULAR")
+        
+        # Session state'i fresh data ile güncelle
+        st.session_state.all_review_topics = all_review_topics
+        
+        # Konu takip sisteminden güncel bilgileri al
+        topic_progress = user_data.get('topic_progress', {})
+        if isinstance(topic_progress, str):
+            try:
+                topic_progress = json.loads(topic_progress) if isinstance(topic_progress, str) else topic_progress
+            except:
+                topic_progress = {}
+        
+        # Zorlandığınız konuları al
+        struggling_subjects = user_data.get('struggling_subjects', {})
+        if isinstance(struggling_subjects, str):
+            try:
+                struggling_subjects = json.loads(struggling_subjects)
+            except:
+                struggling_subjects = {}
+        
+        st.markdown("<div style='margin-bottom: 20px;'></div>", unsafe_allow_html=True)
+        
+        # 🔥 ESKİ GÜZEL HTML KARTLAR + DOĞRU ÇALIŞAN BUTON!
+        for i, topic in enumerate(all_review_topics):
+            # Her topic'e unique key ekle
+            topic['unique_key'] = f"{topic['subject']}_{topic['topic']}_{i}"
+            topic_key = topic['unique_key']
+            button_key = f"repeat_{topic_key}"
+            
+            # Konu takip sisteminden güncel net bilgisini al
+            current_net = 0
+            topic_found_in_progress = False
+            
+            # Net bilgisini çek
+            for stored_key, stored_value in topic_progress.items():
+                if isinstance(stored_key, str):
+                    key_parts = stored_key.split(' | ')
+                    
+                    if len(key_parts) >= 3:
+                        stored_subject = key_parts[0].strip()
+                        stored_topic = key_parts[2].strip() if key_parts[2] != 'None' else key_parts[1].strip()
+                        
+                        if (topic['subject'] in stored_subject or stored_subject in topic['subject']) and \
+                           (topic['topic'] in stored_topic or stored_topic in topic['topic']):
+                            
+                            try:
+                                if isinstance(stored_value, str):
+                                    current_net = int(float(stored_value))
+                                    topic_found_in_progress = True
+                                    break
+                                elif isinstance(stored_value, dict):
+                                    net_from_dict = stored_value.get('net', '0')
+                                    current_net = int(float(net_from_dict))
+                                    topic_found_in_progress = True
+                                    break
+                            except:
+                                pass
+            
+            # Eğer bulunamadıysa, daha gevşek arama yap
+            if not topic_found_in_progress:
+                for stored_key, stored_value in topic_progress.items():
+                    if isinstance(stored_key, str) and isinstance(stored_value, str):
+                        if topic['topic'].lower() in stored_key.lower() or \
+                           any(word in stored_key.lower() for word in topic['topic'].lower().split()):
+                            try:
+                                current_net = int(float(stored_value))
+                                topic_found_in_progress = True
+                                break
+                            except:
+                                pass
+            
+            # Son çare: Eski veriyi kullan
+            if not topic_found_in_progress:
+                try:
+                    current_net = int(float(topic.get('net', 0)))
+                except:
+                    current_net = 0
+            
+            # Konu bilgilerini hazırla
+            review_type_icon = "🎯" if topic['review_type'] == 'KALİCİ' else "🔄"
+            
+            # Detaylı konu bilgisini çek - konu takip sisteminden
+            detail_info = topic.get('detail', '')
+            if not detail_info:
+                # Konu takip sisteminde detay bilgisini ara
+                for key, value in topic_progress.items():
+                    if topic['subject'] in key and topic['topic'] in key:
+                        if isinstance(value, dict):
+                            detail_info = value.get('detail', '')
+                            if detail_info:
+                                break
+            
+            # Eğer hala detay yoksa, genel açıklama ekle
+            if not detail_info:
+                # Türkçe sözcükte anlam gibi genel konular için özel açıklamalar
+                if "sözcükte anlam" in topic['topic'].lower():
+                    if "terim" in topic['topic'].lower():
+                        detail_info = "Terim Anlam - Sözlükte tanımlanmış özel anlamlar"
+                    elif "yan" in topic['topic'].lower():
+                        detail_info = "Yan Anlam - Kelimenin ikincil anlamları"
+                    elif "mecaz" in topic['topic'].lower():
+                        detail_info = "Mecaz Anlam - Gerçek dışı kullanımlar"
+                    else:
+                        detail_info = "Sözcükte Anlam - Temel kavramlar"
+                elif "paragraf" in topic['topic'].lower():
+                    if "anlam" in topic['topic'].lower():
+                        detail_info = "Paragraf Anlama - Metin yorumlama"
+                    elif "çıkarım" in topic['topic'].lower():
+                        detail_info = "Çıkarım - Gizli anlam bulma"
+                    else:
+                        detail_info = "Paragraf - Ana düşünce ve yapı"
+                elif "üslü" in topic['topic'].lower():
+                    detail_info = "Üslü İfadeler - Kuvvet ve kök işlemleri"
+                elif "denklem" in topic['topic'].lower():
+                    if "birinci" in topic['topic'].lower():
+                        detail_info = "Birinci Dereceden Denklemler"
+                    elif "ikinci" in topic['topic'].lower():
+                        detail_info = "İkinci Dereceden Denklemler"
+                    else:
+                        detail_info = "Denklem Çözme"
+                else:
+                    detail_info = "Ana Konu"
+            
+            # Seviye durumuna göre renk belirle
+            if current_net >= 15:
+                status_color = "#228B22"  # Yeşil - İyi seviye
+                status_text = f"✅ {current_net} net (İyi seviye)"
+            elif current_net >= 10:
+                status_color = "#FF8C00"  # Turuncu - Orta seviye
+                status_text = f"🟡 {current_net} net (Orta seviye)"
+            else:
+                status_color = "#DC143C"  # Kırmızı - Zayıf seviye
+                status_text = f"🔴 {current_net} net (Zayıf seviye)"
+            
+            # 🔥 ESKİ GÜZEL HTML KARTI - ÖNCE GÖSTER
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                # ESKİ GÜZEL KART TASARIMI
+                st.markdown(f"""
+                <div style='background: linear-gradient(135deg, {status_color} 0%, {status_color}88 50%, {status_color}66 100%); 
+                            border: 2px solid {status_color}; padding: 16px 20px; border-radius: 12px; 
+                            margin-bottom: 12px; box-shadow: 0 4px 8px rgba(0,0,0,0.2); color: white; position: relative;'>
+                    <div style='font-weight: bold; font-size: 16px; color: white; text-shadow: 1px 1px 2px rgba(0,0,0,0.3); margin-bottom: 8px;'>
+                        {i+1}. {topic['subject']} {review_type_icon}
+                    </div>
+                    <div style='font-size: 18px; color: white; margin: 6px 0 4px 0; font-weight: bold; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);'>
+                        📖 {topic['topic']}
+                    </div>
+                    <div style='font-size: 13px; color: rgba(255,255,255,0.9); margin: 4px 0 8px 0; font-style: italic; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);'>
+                        └ {detail_info}
+                    </div>
+                    <div style='display: flex; justify-content: space-between; align-items: center; margin-top: 12px;'>
+                        <div style='font-size: 14px; color: white; font-weight: bold; background: rgba(0,0,0,0.2); padding: 6px 10px; border-radius: 8px; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);'>
+                            {status_text}
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                # 🔥 SAĞ KOLONDA NATIVE STREAMLIT BUTON
+                st.markdown("<div style='height: 80px;'></div>", unsafe_allow_html=True)  # Kartın üstüne boşluk
+                if st.button("✅ Tekrar ettim", key=button_key):
+                    try:
+                        # 1. Session state'den hemen kaldır
+                        if 'all_review_topics' in st.session_state:
+                            original_length = len(st.session_state.all_review_topics)
+                            st.session_state.all_review_topics = [
+                                t for t in st.session_state.all_review_topics 
+                                if t.get('unique_key', '') != topic_key
+                            ]
+                            new_length = len(st.session_state.all_review_topics)
+                            removed_count = original_length - new_length
+                            logger.debug("🔍 Kart silindi: %s konu kaldırıldı", removed_count)
+                        
+                        # 2. Firestore işlemleri (pending)
+                        if 'username' in user_data:
+                            username = user_data['username']
+                            
+                            # Pending deletion'a ekle
+                            if 'pending_deletions' not in st.session_state:
+                                st.session_state.pending_deletions = []
+                            
+                            deletion_info = {
+                                'topic_key': topic_key,
+                                'subject': topic['subject'],
+                                'topic': topic['topic'],
+                                'original_topic_key': f"{topic['subject']}_{topic['topic']}",
+                                'timestamp': time.time()
+                            }
+                            st.session_state.pending_deletions.append(deletion_info)
+                            
+                            st.success(f"✅ {topic['subject']} - {topic['topic']} kaldırıldı!")
+                        
+                        # 3. Hemen UI'ı yenile
+                        st.rerun()
+                        
+                    except Exception as e:
+                        st.error(f"Hata: {e}")
+                
+                # Net bilgisi ve güncelleme durumu (sağ kolon alt kısım)
+                st.markdown("<div style='height: 40px;'></div>", unsafe_allow_html=True)  # Boşluk
+                if current_net >= 15:
+                    st.markdown(f"""
+                    <div style='text-align: center; padding: 20px 0;'>
+                        <div style='font-size: 18px; color: #228B22;'>✅</div>
+                        <div style='font-size: 11px; color: #228B22; font-weight: bold;'>İyi Seviye</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"""
+                    <div style='text-align: center; padding: 20px 0;'>
+                        <div style='font-size: 18px; color: #FF8C00;'>⚠️</div>
+                        <div style='font-size: 11px; color: #FF8C00; font-weight: bold;'>Güncelleme Gerekli</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+
+
+        st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
+        
+    else:
+        st.info("🔄 Bu hafta için tekrar edilecek konu bulunmuyor.")
+
+def remove_topic_from_review_list(user_data, topic_key):
+    """Konuyu tekrar edilecekler listesinden kaldır ve tekrar geçmişini güncelle"""
+    from datetime import datetime, timedelta
+    
+    try:
+        # Eğer topic_repetition_history yoksa oluştur
+        if 'topic_repetition_history' not in user_data:
+            user_data['topic_repetition_history'] = {}
+        
+        current_date = current_time()
+        current_date_str = current_date.strftime("%Y-%m-%d")
+        
+        # Tekrar geçmişine ekle
+        user_data['topic_repetition_history'][topic_key] = {
+            'level': 'Tekrar Ettim',
+            'date': current_date_str,
+            'action': 'completed',
+            'next_review_date': (current_date + timedelta(days=7)).strftime("%Y-%m-%d"),
+            'completed_at': current_date_str
+        }
+        
+        # 🔥 DÜZELTME: Weekly_plan'dan da kaldır
+        if 'weekly_plan' in user_data:
+            weekly_plan = user_data['weekly_plan']
+            if 'review_topics' in weekly_plan:
+                # Konuyu review_topics'ten kaldır (精确匹配)
+                new_review_topics = []
+                removed_count = 0
+                for review_topic in weekly_plan['review_topics']:
+                    review_topic_key = f"{review_topic.get('subject', '')}_{review_topic.get('topic', '')}"
+                    if review_topic_key != topic_key:
+                        new_review_topics.append(review_topic)
+                    else:
+                        removed_count += 1
+                
+                weekly_plan['review_topics'] = new_review_topics
+                user_data['weekly_plan'] = weekly_plan
+                
+                logger.info("✅ Weekly plan'dan %s konu kaldırıldı", removed_count)
+                logger.debug("🔍 Weekly plan review_topics uzunluğu: %s", len(weekly_plan.get('review_topics', [])))
+                logger.debug("🔍 new_review_topics uzunluğu: %s", len(new_review_topics))
+        
+        # Kalıcı öğrenme tekrarlarından da kaldır (varsa)
+        if 'pending_review_topics' in user_data:
+            pending_topics = user_data['pending_review_topics']
+            if isinstance(pending_topics, list):
+                new_pending_topics = []
+                removed_count = 0
+                for pending_topic in pending_topics:
+                    pending_topic_key = f"{pending_topic.get('subject', '')}_{pending_topic.get('topic', '')}"
+                    if pending_topic_key != topic_key:
+                        new_pending_topics.append(pending_topic)
+                    else:
+                        removed_count += 1
+                user_data['pending_review_topics'] = new_pending_topics
+                
+                logger.info("✅ Pending review'den %s konu kaldırıldı", removed_count)
+                logger.debug("🔍 Pending review yeni uzunluk: %s", len(new_pending_topics))
+        
+        # 🔥 DEBUG: Kaldırma işleminden sonra veri durumunu kontrol et
+        logger.debug("🔍 user_data['weekly_plan']['review_topics'] uzunluğu: %s", len(user_data.get('weekly_plan', {}).get('review_topics', [])))
+        logger.debug("🔍 user_data['pending_review_topics'] uzunluğu: %s", len(user_data.get('pending_review_topics', [])))
+        
+        # Firebase'e gönder
+        if 'username' in user_data:
+            try:
+                logger.debug("🔴 Firebase'e gönderiliyor... Username: %s", user_data['username'])
+                
+                # Ana kullanıcı verilerini güncelle
+                firebase_update_data = {
+                    'topic_repetition_history': user_data['topic_repetition_history'],
+                }
+                
+                # Weekly plan varsa onu da güncelle
+                if 'weekly_plan' in user_data:
+                    firebase_update_data['weekly_plan'] = user_data['weekly_plan']
+                    logger.debug("🔍 Firebase update data keys: %s", list(firebase_update_data.keys()))
+                    logger.debug("🔍 Review topics count: %s", firebase_update_data.get('weekly_plan', {}).get('review_topics', []))
+                
+                # Pending review topics varsa onu da güncelle  
+                if 'pending_review_topics' in user_data:
+                    firebase_update_data['pending_review_topics'] = user_data['pending_review_topics']
+                    
+                update_result = update_user_in_firebase(user_data['username'], firebase_update_data)
+                logger.info("✅ Firebase'e gönderildi: %s", topic_key)
+                
+            except Exception as firebase_error:
+                logger.error("Firebase güncelleme hatası: %s", firebase_error)
+                # Firebase hatası olsa bile devam et, yerel veri güncellenmiş olsun
+                
+    except Exception as e:
+        logger.error("Konu kaldırma hatası: %s", e)
+
+
+def get_topic_level_from_tracking(topic, user_data):
+    """Bir konunun mevcut seviyesini Konu Takip'ten alır"""
+    topic_progress_data = user_data.get('topic_progress', '{}')
+    topic_progress = json.loads(topic_progress_data) if isinstance(topic_progress_data, str) else topic_progress_data
+    current_net = topic_progress.get(topic['key'], '0')
+    
+    try:
+        net_value = int(float(current_net))
+        level_display = calculate_level(net_value)
+        return {
+            'net': net_value,
+            'level': net_value,
+            'display': level_display
+        }
+    except:
+        return {
+            'net': 0,
+            'level': 0,
+            'display': "🔴 Zayıf Seviye (0-5 net)"
+        }
+
+def render(user_data, progress_data, target_dept):
+    """📚 Konu Takip"""
+    st.markdown(f'<div class="main-header"><h1>📚 Konu Takip Sistemi</h1><p>Her konuda ustalaşın</p></div>', unsafe_allow_html=True)
+
+    # Soru istatistikleri açıklaması
+    st.info("""
+                **📊 YKS Son 6 Yıl Soru İstatistikleri (2019-2024)**  
+                Her konunun yanındaki sayı, o konudan son 6 yılda **kaç soru çıktığını** gösterir.  
+                🔥 **15+ soru**: Çok sık çıkan konular (Öncelikli)  
+                ⚡ **8-14 soru**: Orta sıklıkta çıkan konular  
+                📚 **1-7 soru**: Az sıklıkta çıkan konular  
+                """)
+
+    user_field = user_data.get('field', 'Belirlenmedi')
+
+    if user_field == "Sayısal":
+        available_subjects = ["TYT Türkçe", "TYT Matematik", "TYT Geometri", "TYT Fizik", "TYT Kimya", "TYT Biyoloji", "TYT Din Kültürü", "TYT Felsefe", "TYT Tarih (isteğe bağlı)", "TYT Coğrafya (isteğe bağlı)", "AYT Matematik", "AYT Fizik", "AYT Kimya", "AYT Biyoloji"]
+    elif user_field == "Eşit Ağırlık":
+        available_subjects = ["TYT Türkçe", "TYT Matematik", "TYT Geometri", "TYT Tarih", "TYT Coğrafya", "TYT Din Kültürü", "TYT Felsefe", "TYT Fizik (isteğe bağlı)", "TYT Kimya (isteğe bağlı)", "TYT Biyoloji (isteğe bağlı)", "AYT Matematik", "AYT Edebiyat", "AYT Tarih", "AYT Coğrafya"]
+    elif user_field == "Sözel":
+        available_subjects = ["TYT Türkçe", "TYT Tarih", "TYT Coğrafya", "TYT Felsefe", "TYT Din Kültürü", "AYT Edebiyat", "AYT Tarih", "AYT Coğrafya", "AYT Felsefe", "AYT Din Kültürü ve Ahlak Bilgisi"]
+
+    else:
+        available_subjects = list(YKS_TOPICS.keys())
+
+    # DOM hata önleyici - stabil key kullan
+    selected_subject = st.selectbox("📖 Ders Seçin", available_subjects, key="stable_subject_selector")
+
+    if selected_subject and selected_subject in TOPIC_CATALOG.subject_ranges:
+        st.subheader(f"{selected_subject} Konuları")
+
+        topic_progress_data = user_data.get('topic_progress', '{}')
+        topic_progress = json.loads(topic_progress_data) if isinstance(topic_progress_data, str) else topic_progress_data
+
+        # DOM hata önleyici - update tracker
+        if 'topic_updates' not in st.session_state:
+            st.session_state.topic_updates = []
+
+        # Toplu güncelleme için container
+        update_container = st.empty()
+
+        # Kategori ve alt kategori grupları derlenmiş katalogdan okunur
+        catalog = TOPIC_CATALOG
+        if catalog.category_names.get(selected_subject):
+            for main_topic in catalog.category_names[selected_subject]:
+                with st.expander(f"📂 {main_topic}", expanded=False):
+                    current_sub_topic = None
+                    for topic_id in catalog.category_ids(selected_subject, main_topic):
+                        sub_topic = catalog.subcategories[topic_id]
+                        if sub_topic is not None and sub_topic != current_sub_topic:
+                            st.write(f"**📋 {sub_topic}**")
+                            current_sub_topic = sub_topic
+                        show_topic_tracking_row(topic_id, topic_progress, user_data)
+        else:
+            # Ana içerik liste formatındaysa
+            with st.expander(f"📂 {selected_subject} Konuları", expanded=True):
+                for topic_id in catalog.subject_ids(selected_subject):
+                    show_topic_tracking_row(topic_id, topic_progress, user_data)
+
+        # Toplu güncelleme bildirimi - DOM güvenli
+        if len(st.session_state.topic_updates) > 0:
+            with update_container.container():
+                st.success(f"✅ {len(st.session_state.topic_updates)} konu güncellendi!")
+
+                # Güncellenen konuları göster
+                for detail, net in st.session_state.topic_updates[-5:]:  # Son 5 güncelleme
+                    st.caption(f"• {detail}: {net} net")
+
+        # Toplu kaydetme seçeneği
+        if st.button("💾 Tüm Değişiklikleri Kaydet", type="primary", key="save_all_button"):
+            try:
+                update_user_in_firebase(st.session_state.current_user, {'topic_progress': json.dumps(topic_progress)})
+                # 🚀 OPTİMİZE: update_user_in_firebase() zaten session state'i günceller
+                # Cache temizleme
+                if 'weekly_plan_cache' in st.session_state:
+                    del st.session_state.weekly_plan_cache
+                check_and_update_completion_dates()
+                st.success("✅ Tüm net değerleri başarıyla kaydedildi!")
+                # Güncelleme listesini temizle
+                st.session_state.topic_updates = []
+            except Exception as e:
+                st.error(f"Kaydetme hatası: {str(e)}")
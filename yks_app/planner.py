@@ -0,0 +1,3562 @@
+"""
+📅 Haftalık Plan Motoru
+YKS Canlı Takip ve Pomodoro sayfalarının ortak kullandığı plan/öncelik fonksiyonları
+"""
+
+import copy
+import pickle
+from collections import OrderedDict
+
+from yks_app.core import *
+
+def traced(name):
+    """Fonksiyonu isimli span içinde çalıştıran dekoratör"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if TRACE_SAMPLE_RATE <= 0.0:
+                return func(*args, **kwargs)
+            with trace_span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+class PlanEvents:
+    """Plan motorunun yan etkileri - motor Streamlit/Firebase'e dokunmaz, buraya yazar
+    
+    Canlı oturumda replay_plan_events ile ekrana ve Firebase'e aktarılır;
+    batch planlayıcıda güncellemeler doğrudan Firestore'a yazılır, mesajlar log'a düşer.
+    """
+    __slots__ = ('messages', 'user_updates')
+    
+    def __init__(self):
+        self.messages = []
+        self.user_updates = {}
+    
+    def notify(self, level, text):
+        """Kullanıcı mesajı (level: success/info/warning/error)"""
+        self.messages.append((level, text))
+    
+    def update_user(self, fields):
+        """Kullanıcı dokümanına yazılacak alanlar"""
+        self.user_updates.update(fields)
+
+def replay_plan_events(events, username):
+    """Plan motorunun biriktirdiği güncellemeleri Firebase'e, mesajları ekrana aktarır"""
+    if events.user_updates and username:
+        update_user_in_firebase(username, events.user_updates)
+    for level, text in events.messages:
+        getattr(st, level)(text)
+
+# 🎯 Hedef Bölüm Zorluk Sistemi (Net Aralığına Göre)
+TARGET_DEPARTMENT_DIFFICULTY = {
+    "Tıp": {
+        "difficulty_level": 5,  # En zor
+        "required_nets": {"TYT": 115, "AYT": 75},
+        "study_intensity": "maksimum",
+        "weekly_topic_multiplier": 1.5
+    },
+    "Diş Hekimliği": {
+        "difficulty_level": 5,
+        "required_nets": {"TYT": 110, "AYT": 70},
+        "study_intensity": "maksimum", 
+        "weekly_topic_multiplier": 1.4
+    },
+    "Mühendislik": {
+        "difficulty_level": 4,
+        "required_nets": {"TYT": 105, "AYT": 65},
+        "study_intensity": "yüksek",
+        "weekly_topic_multiplier": 1.3
+    },
+    "Hukuk": {
+        "difficulty_level": 4,
+        "required_nets": {"TYT": 100, "AYT": 60},
+        "study_intensity": "yüksek",
+        "weekly_topic_multiplier": 1.2
+    },
+    "Mimarlık": {
+        "difficulty_level": 3,
+        "required_nets": {"TYT": 95, "AYT": 55},
+        "study_intensity": "orta-yüksek",
+        "weekly_topic_multiplier": 1.1
+    },
+    "Psikoloji": {
+        "difficulty_level": 3,
+        "required_nets": {"TYT": 90, "AYT": 50},
+        "study_intensity": "orta-yüksek",
+        "weekly_topic_multiplier": 1.1
+    },
+    "İktisat": {
+        "difficulty_level": 2,
+        "required_nets": {"TYT": 85, "AYT": 45},
+        "study_intensity": "orta",
+        "weekly_topic_multiplier": 1.0
+    },
+    "Öğretmenlik": {
+        "difficulty_level": 2,
+        "required_nets": {"TYT": 80, "AYT": 40},
+        "study_intensity": "orta",
+        "weekly_topic_multiplier": 1.0
+    },
+    "Varsayılan": {
+        "difficulty_level": 1,
+        "required_nets": {"TYT": 75, "AYT": 35},
+        "study_intensity": "normal",
+        "weekly_topic_multiplier": 0.9
+    }
+}
+
+# 📚 Sınıf Bazlı Program Sistemi
+GRADE_BASED_PROGRAMS = {
+    "11. Sınıf": {
+        "focus": "temel_kavramlar_ve_konu_ogrenme",
+        "study_pace": "normal",
+        "weekly_topic_base": 12,  # 11. sınıf için daha fazla konu
+        "review_ratio": 0.2,  # %20 tekrar, %80 yeni konu
+        "exam_frequency": "ayda_1",
+        "special_notes": "Temel kavramları sağlam öğrenme dönemi"
+    },
+    "12. Sınıf": {
+        "focus": "konu_tamamlama_ve_deneme_odak",
+        "study_pace": "hızlandırılmış", 
+        "weekly_topic_base": 10,  # Standart
+        "review_ratio": 0.3,  # %30 tekrar, %70 yeni konu
+        "exam_frequency": "2_haftada_1",
+        "special_notes": "Konu tamamlama ve deneme stratejileri dönemi"
+    },
+    "Mezun": {
+        "focus": "eksik_kapama_ve_performans_artırma",
+        "study_pace": "maksimum",
+        "weekly_topic_base": 8,  # Daha az yeni konu, daha fazla tekrar
+        "review_ratio": 0.4,  # %40 tekrar, %60 yeni konu  
+        "exam_frequency": "haftada_1",
+        "special_notes": "Eksikleri kapatma ve performans maksimizasyonu dönemi"
+    }
+}
+
+# 📚 16 Haftalık Eşit Ağırlık Detay Planı
+EQUAL_WEIGHT_WEEKLY_PLAN = load_dataset('weekly_plan_equal_weight')
+
+# 📚 18 Haftalık Sayısal Detay Planı
+NUMERICAL_WEEKLY_PLAN = load_dataset('weekly_plan_numerical')
+
+# 🎨 TYT & MSÜ HAFTALIK PLAN - 9 HAFTALIK DETAY PLAN
+
+TYT_MSU_WEEKLY_PLAN = load_dataset('weekly_plan_tyt_msu')
+
+# 📚 SÖZEL HAFTALIK PLAN - 14 HAFTALIK DETAY PLAN
+
+VERBAL_WEEKLY_PLAN = load_dataset('weekly_plan_verbal')
+
+# ⭐ Puan Sistemi
+POINT_SYSTEM = {
+    "topic_completion": {
+        "easy": 10,      # Zorluk 1-2
+        "medium": 15,    # Zorluk 3
+        "hard": 20,      # Zorluk 4
+        "very_hard": 25  # Zorluk 5
+    },
+    "topic_review": 5,
+    "exam_analysis": 30,
+    "daily_goal_complete": 20,
+    "weekly_goal_complete": 100,
+    "streak_bonus": {
+        "daily": 5,
+        "weekly": 50
+    },
+    "milestone_bonus": {
+        "net_improvement": 10  # Net artışı başına bonus
+    }
+}
+
+# 🎯 Challenge Sistemi
+DAILY_CHALLENGES = [
+    {
+        "id": "daily_3_topics", 
+        "name": "Günlük Üçlü", 
+        "description": "Bugün 3 konu tamamla", 
+        "points": 30, 
+        "target": 3,
+        "type": "topic_count"
+    },
+    {
+        "id": "daily_math_focus", 
+        "name": "Matematik Odağı", 
+        "description": "Bugün sadece matematik çalış", 
+        "points": 25,
+        "type": "subject_focus",
+        "target_subject": "Matematik"
+    },
+    {
+        "id": "daily_review", 
+        "name": "Tekrar Günü", 
+        "description": "Bugün 5 konu tekrarı yap", 
+        "points": 20, 
+        "target": 5,
+        "type": "review_count"
+    },
+    {
+        "id": "daily_streak", 
+        "name": "Süreklilik", 
+        "description": "Günlük hedefini tamamla", 
+        "points": 15,
+        "type": "daily_goal"
+    }
+]
+
+WEEKLY_CHALLENGES = [
+    {
+        "id": "weekly_exam", 
+        "name": "Haftalık Deneme", 
+        "description": "Bu hafta 1 deneme çöz", 
+        "points": 100, 
+        "target": 1,
+        "type": "exam_count"
+    },
+    {
+        "id": "weekly_15_topics", 
+        "name": "Haftalık Maraton", 
+        "description": "Bu hafta 15 konu tamamla", 
+        "points": 150, 
+        "target": 15,
+        "type": "topic_count"
+    },
+    {
+        "id": "weekly_perfect", 
+        "name": "Mükemmel Hafta", 
+        "description": "Haftalık hedefini %100 tamamla", 
+        "points": 200,
+        "target": 100,
+        "type": "weekly_goal_percentage"
+    }
+]
+
+# 🏆 Seviye Sistemi
+LEVEL_SYSTEM = {
+    "level_thresholds": [0, 100, 300, 600, 1000, 1500, 2200, 3000, 4000, 5200, 6600, 8200, 10000, 12000, 14500, 17500, 21000, 25000, 30000, 36000],
+    "level_rewards": {
+        5: {"name": "YKS Yolcusu", "icon": "🎒", "reward": "Özel tema açıldı"},
+        10: {"name": "Kararlı Öğrenci", "icon": "💪", "reward": "İlerleme grafiği açıldı"},
+        15: {"name": "YKS Uzmanı", "icon": "🎓", "reward": "Detaylı analiz açıldı"},
+        20: {"name": "Çalışma Makinesi", "icon": "🤖", "reward": "Tüm özellikler açıldı"}
+    }
+}
+
+# 🎮 GAMİFİCATİON SİSTEMİ FONKSİYONLARI
+
+def init_gamification_system():
+    """Kullanıcı için gamification verilerini başlat"""
+    if 'gamification' not in st.session_state:
+        st.session_state.gamification = {
+            'total_points': 0,
+            'level': 1,
+            'badges': [],
+            'achievements': {},
+            'daily_streak': 0,
+            'weekly_streak': 0,
+            'last_activity_date': None,
+            'completed_challenges': {
+                'daily': {},
+                'weekly': {}
+            },
+            'current_challenges': {
+                'daily': generate_daily_challenges(),
+                'weekly': generate_weekly_challenges()
+            },
+            'stats': {
+                'topics_completed': 0,
+                'topics_reviewed': 0,
+                'exams_taken': 0,
+                'study_days': 0,
+                'total_study_time': 0,
+                'subject_progress': {}
+            },
+            'milestone_progress': {},
+            'last_level_up': None
+        }
+
+def calculate_user_level(total_points):
+    """Puana göre seviye hesapla"""
+    thresholds = LEVEL_SYSTEM["level_thresholds"]
+    for i, threshold in enumerate(thresholds):
+        if total_points < threshold:
+            return i
+    return len(thresholds)
+
+def award_points(activity_type, difficulty_level=None, subject=None):
+    """Aktivite tipine göre puan ver"""
+    if 'gamification' not in st.session_state:
+        init_gamification_system()
+    
+    points = 0
+    
+    if activity_type == "topic_completion":
+        if difficulty_level in [1, 2]:
+            points = POINT_SYSTEM["topic_completion"]["easy"]
+        elif difficulty_level == 3:
+            points = POINT_SYSTEM["topic_completion"]["medium"]
+        elif difficulty_level == 4:
+            points = POINT_SYSTEM["topic_completion"]["hard"]
+        elif difficulty_level == 5:
+            points = POINT_SYSTEM["topic_completion"]["very_hard"]
+    elif activity_type == "topic_review":
+        points = POINT_SYSTEM["topic_review"]
+    elif activity_type == "exam_analysis":
+        points = POINT_SYSTEM["exam_analysis"]
+    elif activity_type == "daily_goal_complete":
+        points = POINT_SYSTEM["daily_goal_complete"]
+    elif activity_type == "weekly_goal_complete":
+        points = POINT_SYSTEM["weekly_goal_complete"]
+    
+    # Streak bonusu ekle
+    if st.session_state.gamification['daily_streak'] >= 7:
+        points += POINT_SYSTEM["streak_bonus"]["weekly"]
+    elif st.session_state.gamification['daily_streak'] >= 1:
+        points += POINT_SYSTEM["streak_bonus"]["daily"]
+    
+    # Puanı ekle
+    old_level = st.session_state.gamification['level']
+    st.session_state.gamification['total_points'] += points
+    new_level = calculate_user_level(st.session_state.gamification['total_points'])
+    st.session_state.gamification['level'] = new_level
+    
+    # Seviye atlama kontrolü
+    if new_level > old_level:
+        st.session_state.gamification['last_level_up'] = new_level
+        show_level_up_notification(new_level)
+    
+    return points
+
+def generate_daily_challenges():
+    """Günlük challenge'lar üret"""
+    import random
+    return random.sample(DAILY_CHALLENGES, 2)  # Her gün 2 challenge
+
+def generate_weekly_challenges():
+    """Haftalık challenge'lar üret"""
+    import random
+    return random.sample(WEEKLY_CHALLENGES, 1)  # Her hafta 1 challenge
+
+# 🎯 Sınıf Bazlı Program Yönetimi
+def get_grade_based_strategy(grade, target_department):
+    """Sınıf ve hedef bölüme göre strateji döndürür"""
+    base_strategy = GRADE_BASED_PROGRAMS.get(grade, GRADE_BASED_PROGRAMS["12. Sınıf"])
+    
+    # Hedef bölüm zorluğunu al
+    dept_difficulty = TARGET_DEPARTMENT_DIFFICULTY.get(target_department, TARGET_DEPARTMENT_DIFFICULTY["Varsayılan"])
+    
+    # Stratejiyi zorluğa göre ayarla
+    adjusted_strategy = base_strategy.copy()
+    adjusted_strategy['weekly_topic_base'] = int(base_strategy['weekly_topic_base'] * dept_difficulty['weekly_topic_multiplier'])
+    adjusted_strategy['weekly_topic_multiplier'] = dept_difficulty['weekly_topic_multiplier']
+    adjusted_strategy['difficulty_level'] = dept_difficulty['difficulty_level']
+    adjusted_strategy['target_nets'] = dept_difficulty['required_nets']
+    
+    return adjusted_strategy
+
+def analyze_student_subject_performance(user_data):
+    """Öğrencinin ders bazlı performansını analiz eder"""
+    import json
+    topic_progress_str = user_data.get('topic_progress', '{}')
+    topic_progress = json.loads(topic_progress_str) if isinstance(topic_progress_str, str) else topic_progress_str if topic_progress_str else {}
+    
+    # Ders bazlı net ortalamaları
+    subject_stats = {}
+    
+    for key, value in topic_progress.items():
+        # "TYT Türkçe | ... | Konu" formatından ders adını çıkar
+        if ' | ' in key:
+            parts = key.split(' | ')
+            if len(parts) >= 2:
+                subject = parts[0].strip()  # "TYT Türkçe" gibi
+                
+                # Net değerini al
+                net_value = 0
+                if isinstance(value, dict):
+                    net_value = int(float(value.get('net', 0)))
+                else:
+                    try:
+                        net_value = int(float(str(value)))
+                    except:
+                        net_value = 0
+                
+                # İstatistikleri topla
+                if subject not in subject_stats:
+                    subject_stats[subject] = {'nets': [], 'total_net': 0, 'count': 0}
+                
+                subject_stats[subject]['nets'].append(net_value)
+                subject_stats[subject]['total_net'] += net_value
+                subject_stats[subject]['count'] += 1
+    
+    # Ortalamaları hesapla ve zorlanılan dersleri belirle
+    for subject, stats in subject_stats.items():
+        stats['avg_net'] = stats['total_net'] / stats['count'] if stats['count'] > 0 else 0
+        # Düşük net = zorluk
+        if stats['avg_net'] < 3:
+            stats['difficulty_level'] = 'high'  # Çok zorlanıyor
+            stats['priority'] = 1
+        elif stats['avg_net'] < 5:
+            stats['difficulty_level'] = 'medium'  # Orta zorluk
+            stats['priority'] = 2
+        else:
+            stats['difficulty_level'] = 'low'  # İyi gidiyor
+            stats['priority'] = 3
+    
+    return subject_stats
+
+def get_smart_balanced_topics(all_remaining_topics, user_data, weekly_limit=18):
+    """Akıllı ve dengeli konu seçimi - Her dersten orantılı dağılım + zorlanılan derslere öncelik"""
+    
+    # Öğrencinin ders performansını analiz et
+    subject_performance = analyze_student_subject_performance(user_data)
+    
+    # Konuları ders bazında grupla
+    topics_by_subject = {}
+    for topic in all_remaining_topics:
+        subject = topic.get('subject', 'Diğer')
+        if subject not in topics_by_subject:
+            topics_by_subject[subject] = []
+        topics_by_subject[subject].append(topic)
+    
+    # Her dersten kaç konu alınacağını hesapla
+    total_subjects = len(topics_by_subject)
+    if total_subjects == 0:
+        return []
+    
+    # Öncelikli derslere daha fazla konu
+    priority_subjects = []
+    normal_subjects = []
+    
+    for subject, topics in topics_by_subject.items():
+        subject_info = subject_performance.get(subject, {'priority': 2, 'difficulty_level': 'medium'})
+        
+        if subject_info['priority'] == 1:  # Zorlanılan ders
+            priority_subjects.append((subject, topics, subject_info))
+        else:
+            normal_subjects.append((subject, topics, subject_info))
+    
+    # Dengeli dağılım stratejisi
+    selected_topics = []
+    
+    # Önce zorlanılan derslerden daha fazla konu al
+    priority_quota = int(weekly_limit * 0.6) if priority_subjects else 0
+    normal_quota = weekly_limit - priority_quota
+    
+    # Zorlanılan derslerden konular ekle
+    if priority_subjects:
+        topics_per_priority_subject = max(1, priority_quota // len(priority_subjects))
+        for subject, topics, info in priority_subjects:
+            # Kolay konulardan başla (düşük difficulty)
+            sorted_topics = sorted(topics, key=lambda x: (
+                0 if x.get('difficulty', 'orta') == 'kolay' else 1 if x.get('difficulty') == 'orta' else 2,
+                -x.get('net', 0)  # Düşük net'li konulara öncelik
+            ))
+            
+            for topic in sorted_topics[:topics_per_priority_subject]:
+                topic['priority'] = 'high'
+                topic['color'] = '🔴'  # Zorlanılan ders
+                topic['reason'] = f"Öncelikli: {subject} dersinde ortalama netiniz düşük ({info.get('avg_net', 0):.1f})"
+                selected_topics.append(topic)
+    
+    # Normal derslerden dengeli şekilde ekle
+    if normal_subjects:
+        topics_per_normal_subject = max(1, normal_quota // len(normal_subjects))
+        for subject, topics, info in normal_subjects:
+            # Kolay → orta → zor sıralaması
+            sorted_topics = sorted(topics, key=lambda x: (
+                0 if x.get('difficulty', 'orta') == 'kolay' else 1 if x.get('difficulty') == 'orta' else 2,
+                -x.get('net', 0)
+            ))
+            
+            for topic in sorted_topics[:topics_per_normal_subject]:
+                topic['priority'] = 'normal'
+                topic['color'] = '🟢' if info.get('avg_net', 0) >= 5 else '🟡'
+                topic['reason'] = f"{subject} - Dengeli dağılım"
+                selected_topics.append(topic)
+    
+    # Öncelikli konuları başa al
+    selected_topics.sort(key=lambda x: (0 if x.get('priority') == 'high' else 1, x.get('subject', '')))
+    
+    return selected_topics[:weekly_limit]
+
+def get_equal_weight_weekly_topics(week_number, completed_topics, pending_topics, user_data=None):
+    """🎯 AKILLI Eşit Ağırlık Haftalık Konu Seçici - Dengeli Dağılım + Zorlanılan Derslere Öncelik"""
+    if week_number > 16:
+        week_number = 16  # Max 16 hafta
+    
+    # 🆕 DÜZELTİLDİ: Tamamlanmış konu isimlerini al (completed_topics artık tuple döndürüyor)
+    if isinstance(completed_topics, tuple):
+        completed_topics_list, completed_topic_names = completed_topics
+    else:
+        # Eski format ile uyumluluk
+        completed_topic_names = set()
+        if completed_topics:
+            for topic in completed_topics:
+                topic_name = topic.get('topic', '') if isinstance(topic, dict) else str(topic)
+                if topic_name:
+                    completed_topic_names.add(topic_name)
+    
+    # 🔥 KRİTİK: topic_progress'den gerçek net değerlerini al
+    topic_progress = {}
+    if user_data:
+        import json
+        topic_progress_str = user_data.get('topic_progress', '{}')
+        topic_progress = json.loads(topic_progress_str) if isinstance(topic_progress_str, str) else topic_progress_str if topic_progress_str else {}
+    
+    # 🎯 ADIM 1: O HAFTANIN STRATEJİSİNDEKİ DERSLERİ TESPIT ET
+    current_week_plan = EQUAL_WEIGHT_WEEKLY_PLAN.get(week_number, {})
+    current_week_subjects = set(current_week_plan.get('topics', {}).keys())
+    
+    # 🔥 ADIM 2: SADECE BU DERSLERİN KALAN KONULARINI TOPLA (TÜM HAFTALARDAN)
+    all_remaining_topics = []
+    
+    for wk in range(1, 17):  # Tüm 16 haftayı tara
+        week_plan = EQUAL_WEIGHT_WEEKLY_PLAN.get(wk, {})
+        planned_topics = week_plan.get('topics', {})
+        
+        for subject, topic_list in planned_topics.items():
+            # ✅ SADECE BU HAFTANIN STRATEJİSİNDEKİ DERSLERİ AL
+            # Örnek: Hafta 1 → Sadece TYT dersleri, AYT dersleri dahil değil
+            if subject not in current_week_subjects:
+                continue  # Bu ders bu haftanın stratejisinde yok, atla
+            
+            for topic in topic_list:
+                # Tamamlanmış konuları ATLA
+                if topic in completed_topic_names:
+                    continue
+                
+                # Gerçek net değerini bul
+                real_net = 0
+                for key, value in topic_progress.items():
+                    if topic in key or (" - " in topic and topic.split(" - ")[1] in key):
+                        if isinstance(value, dict):
+                            real_net = int(float(value.get('net', 0)))
+                        else:
+                            try:
+                                real_net = int(float(str(value)))
+                            except:
+                                real_net = 0
+                        break
+                
+                # 🎯 YENİ: Yüksek netlileri atla (büyük oranda tamamlanmış)
+                if real_net >= 15:
+                    continue
+                
+                all_remaining_topics.append({
+                    'subject': subject,
+                    'topic': topic,
+                    'week': wk,
+                    'priority': 'normal',
+                    'difficulty': get_topic_difficulty_by_name(topic),
+                    'status': 'planned',
+                    'net': real_net,
+                    'detail': ''
+                })
+    
+    # ÖNCEKİ HAFTALARDAKİ KALAN ÖNCELİKLİ KONULARI EKLE
+    if week_number > 1:
+        priority_topics = get_priority_topics_from_previous_weeks(pending_topics)
+        
+        for topic in priority_topics:
+            topic_name = topic.get('topic', '')
+            if topic_name not in completed_topic_names:
+                all_remaining_topics.insert(0, topic)
+    
+    # 🎯 AKILLI DENGELI SEÇİM: Zorlanılan derslere öncelik + Her dersten dengeli dağılım
+    if not user_data:
+        # user_data yoksa basit limit
+        return all_remaining_topics[:18]
+    
+    smart_topics = get_smart_balanced_topics(all_remaining_topics, user_data, weekly_limit=18)
+    return smart_topics
+
+def get_numerical_weekly_topics(week_number, completed_topics, pending_topics, user_data=None):
+    """🎯 AKILLI Sayısal Haftalık Konu Seçici - Dengeli Dağılım + Zorlanılan Derslere Öncelik"""
+    if week_number > 18:
+        week_number = 18  # Max 18 hafta
+    
+    # 🆕 DÜZELTİLDİ: Tamamlanmış konu isimlerini al
+    if isinstance(completed_topics, tuple):
+        completed_topics_list, completed_topic_names = completed_topics
+    else:
+        completed_topic_names = set()
+        if completed_topics:
+            for topic in completed_topics:
+                topic_name = topic.get('topic', '') if isinstance(topic, dict) else str(topic)
+                if topic_name:
+                    completed_topic_names.add(topic_name)
+    
+    # 🔥 KRİTİK: topic_progress'den gerçek net değerlerini al
+    topic_progress = {}
+    if user_data:
+        import json
+        topic_progress_str = user_data.get('topic_progress', '{}')
+        topic_progress = json.loads(topic_progress_str) if isinstance(topic_progress_str, str) else topic_progress_str if topic_progress_str else {}
+    
+    # 🎯 ADIM 1: O HAFTANIN STRATEJİSİNDEKİ DERSLERİ TESPIT ET
+    current_week_plan = NUMERICAL_WEEKLY_PLAN.get(week_number, {})
+    current_week_subjects = set(current_week_plan.get('topics', {}).keys())
+    
+    # 🔥 ADIM 2: SADECE BU DERSLERİN KALAN KONULARINI TOPLA (TÜM HAFTALARDAN)
+    all_remaining_topics = []
+    
+    for wk in range(1, 19):  # Tüm 18 haftayı tara
+        week_plan = NUMERICAL_WEEKLY_PLAN.get(wk, {})
+        planned_topics = week_plan.get('topics', {})
+        
+        for subject, topic_list in planned_topics.items():
+            # ✅ SADECE BU HAFTANIN STRATEJİSİNDEKİ DERSLERİ AL
+            if subject not in current_week_subjects:
+                continue  # Bu ders bu haftanın stratejisinde yok, atla
+            
+            for topic in topic_list:
+                if topic in completed_topic_names:
+                    continue
+                
+                real_net = 0
+                for key, value in topic_progress.items():
+                    if topic in key or (" - " in topic and topic.split(" - ")[1] in key):
+                        if isinstance(value, dict):
+                            real_net = int(float(value.get('net', 0)))
+                        else:
+                            try:
+                                real_net = int(float(str(value)))
+                            except:
+                                real_net = 0
+                        break
+                
+                # 🎯 YENİ: Yüksek netlileri atla (büyük oranda tamamlanmış)
+                if real_net >= 15:
+                    continue
+                
+                all_remaining_topics.append({
+                    'subject': subject,
+                    'topic': topic,
+                    'week': wk,
+                    'priority': 'normal',
+                    'difficulty': get_topic_difficulty_by_name(topic),
+                    'status': 'planned',
+                    'net': real_net,
+                    'detail': ''
+                })
+    
+    # ÖNCEKİ HAFTALARDAKİ KALAN ÖNCELİKLİ KONULARI EKLE
+    if week_number > 1:
+        priority_topics = get_priority_topics_from_previous_weeks(pending_topics)
+        
+        for topic in priority_topics:
+            topic_name = topic.get('topic', '')
+            if topic_name not in completed_topic_names:
+                all_remaining_topics.insert(0, topic)
+    
+    # 🎯 AKILLI DENGELI SEÇİM
+    if not user_data:
+        return all_remaining_topics[:20]  # Sayısal için 20 konu
+    
+    smart_topics = get_smart_balanced_topics(all_remaining_topics, user_data, weekly_limit=20)
+    return smart_topics
+
+def get_tyt_msu_weekly_topics(week_number, completed_topics, pending_topics, user_data=None):
+    """TYT & MSÜ için haftalık konuları getirir - SON DÜZELTİLDİ"""
+    if week_number > 9:
+        week_number = 9  # Max 9 hafta
+    
+    week_plan = TYT_MSU_WEEKLY_PLAN.get(week_number, {})
+    weekly_topics = []
+    
+    # 🆕 DÜZELTİLDİ: Tamamlanmış konu isimlerini al (completed_topics artık tuple döndürüyor)
+    if isinstance(completed_topics, tuple):
+        completed_topics_list, completed_topic_names = completed_topics
+    else:
+        # Eski format ile uyumluluk
+        completed_topic_names = set()
+        if completed_topics:
+            for topic in completed_topics:
+                topic_name = topic.get('topic', '') if isinstance(topic, dict) else str(topic)
+                if topic_name:
+                    completed_topic_names.add(topic_name)
+    
+    # Alt kategori bilgisini al
+    sub_category = user_data.get('tyt_msu_sub_category', '') if user_data else ''
+    
+    # 🔥 KRİTİK: topic_progress'den gerçek net değerlerini al
+    topic_progress = {}
+    if user_data:
+        import json
+        topic_progress_str = user_data.get('topic_progress', '{}')
+        topic_progress = json.loads(topic_progress_str) if isinstance(topic_progress_str, str) else topic_progress_str if topic_progress_str else {}
+    
+    # Bu haftanın planlanmış konularını al
+    planned_topics = week_plan.get('topics', {})
+    
+    # Alt kategoriye göre konu önceliklendirmesi
+    priority_subjects = []
+    if sub_category.startswith('MSÜ'):
+        # MSÜ öğrencileri için matematik ve fen bilimleri öncelikli
+        priority_subjects = ['TYT Matematik', 'TYT Fizik', 'TYT Kimya']
+    elif 'Bilgisayar' in sub_category or 'Teknoloji' in sub_category:
+        # Teknoloji alanı için matematik ve fizik öncelikli  
+        priority_subjects = ['TYT Matematik', 'TYT Fizik']
+    elif 'Tıbbi' in sub_category or 'Sağlık' in sub_category or 'Anestezi' in sub_category or 'ATT' in sub_category:
+        # Sağlık alanı için biyoloji ve kimya öncelikli
+        priority_subjects = ['TYT Biyoloji', 'TYT Kimya']
+    
+    # Önce öncelikli dersleri ekle
+    for subject in priority_subjects:
+        if subject in planned_topics:
+            topic_list = planned_topics[subject]
+            for topic in topic_list:
+                # 🆕 DÜZELTİLDİ: Tamamlanmış konuları ATLA
+                if topic in completed_topic_names:
+                    continue
+                
+                # 🔥 KRİTİK: Gerçek net değerini bul
+                real_net = 0
+                for key, value in topic_progress.items():
+                    if topic in key or (" - " in topic and topic.split(" - ")[1] in key):
+                        if isinstance(value, dict):
+                            real_net = int(float(value.get('net', 0)))
+                        else:
+                            try:
+                                real_net = int(float(str(value)))
+                            except:
+                                real_net = 0
+                        break
+                
+                # 🎯 YENİ: Yüksek netlileri atla (büyük oranda tamamlanmış)
+                if real_net >= 15:
+                    continue
+                
+                weekly_topics.append({
+                    'subject': subject,
+                    'topic': topic,
+                    'week': week_number,
+                    'priority': 'high',  # Yüksek öncelik
+                    'difficulty': get_topic_difficulty_by_name(topic),
+                    'status': 'planned',
+                    'net': real_net,  # 🔥 Gerçek net değeri!
+                    'detail': f'⭐ {sub_category} için öncelikli'
+                })
+    
+    # Sonra diğer dersleri ekle
+    for subject, topic_list in planned_topics.items():
+        if subject not in priority_subjects:  # Öncelikli olmayanlar
+            for topic in topic_list:
+                # 🆕 DÜZELTİLDİ: Tamamlanmış konuları ATLA
+                if topic in completed_topic_names:
+                    continue
+                
+                # 🔥 KRİTİK: Gerçek net değerini bul
+                real_net = 0
+                for key, value in topic_progress.items():
+                    if topic in key or (" - " in topic and topic.split(" - ")[1] in key):
+                        if isinstance(value, dict):
+                            real_net = int(float(value.get('net', 0)))
+                        else:
+                            try:
+                                real_net = int(float(str(value)))
+                            except:
+                                real_net = 0
+                        break
+                
+                # 🎯 YENİ: Yüksek netlileri atla (büyük oranda tamamlanmış)
+                if real_net >= 15:
+                    continue
+                
+                weekly_topics.append({
+                    'subject': subject,
+                    'topic': topic,
+                    'week': week_number,
+                    'priority': 'normal',
+                    'difficulty': get_topic_difficulty_by_name(topic),
+                    'status': 'planned',
+                    'net': real_net,  # 🔥 Gerçek net değeri!
+                    'detail': ''
+                })
+    
+    # Sadece 2. hafta ve sonrasında önceki haftalardan kalan konuları ekle
+    if week_number > 1:
+        priority_topics = get_priority_topics_from_previous_weeks(pending_topics)
+        
+        # 🆕 DÜZELTİLDİ: Öncelikli konuları da kontrol et
+        for topic in priority_topics:
+            topic_name = topic.get('topic', '')
+            if topic_name not in completed_topic_names:
+                topic['priority'] = 'high'
+                weekly_topics.insert(0, topic)
+    
+    return weekly_topics
+
+def get_verbal_weekly_topics(week_number, completed_topics, pending_topics, user_data=None):
+    """Sözel için haftalık konuları getirir - SON DÜZELTİLDİ"""
+    if week_number > 14:
+        week_number = 14  # Max 14 hafta
+    
+    week_plan = VERBAL_WEEKLY_PLAN.get(week_number, {})
+    weekly_topics = []
+    
+    # 🆕 DÜZELTİLDİ: Tamamlanmış konu isimlerini al (completed_topics artık tuple döndürüyor)
+    if isinstance(completed_topics, tuple):
+        completed_topics_list, completed_topic_names = completed_topics
+    else:
+        # Eski format ile uyumluluk
+        completed_topic_names = set()
+        if completed_topics:
+            for topic in completed_topics:
+                topic_name = topic.get('topic', '') if isinstance(topic, dict) else str(topic)
+                if topic_name:
+                    completed_topic_names.add(topic_name)
+    
+    # 🔥 KRİTİK: topic_progress'den gerçek net değerlerini al
+    topic_progress = {}
+    if user_data:
+        import json
+        topic_progress_str = user_data.get('topic_progress', '{}')
+        topic_progress = json.loads(topic_progress_str) if isinstance(topic_progress_str, str) else topic_progress_str if topic_progress_str else {}
+    
+    # Bu haftanın planlanmış konularını al
+    planned_topics = week_plan.get('topics', {})
+    
+    # Konuları birleştir
+    for subject, topic_list in planned_topics.items():
+        for topic in topic_list:
+            # 🆕 DÜZELTİLDİ: Tamamlanmış konuları ATLA
+            if topic in completed_topic_names:
+                continue
+            
+            # 🔥 KRİTİK: Gerçek net değerini bul
+            real_net = 0
+            for key, value in topic_progress.items():
+                if topic in key or (" - " in topic and topic.split(" - ")[1] in key):
+                    if isinstance(value, dict):
+                        real_net = int(float(value.get('net', 0)))
+                    else:
+                        try:
+                            real_net = int(float(str(value)))
+                        except:
+                            real_net = 0
+                    break
+            
+            weekly_topics.append({
+                'subject': subject,
+                'topic': topic,
+                'week': week_number,
+                'priority': 'normal',
+                'difficulty': get_topic_difficulty_by_name(topic),
+                'status': 'planned',
+                'net': real_net,  # 🔥 Gerçek net değeri!
+                'detail': ''
+            })
+    
+    # Sadece 2. hafta ve sonrasında önceki haftalardan kalan konuları ekle
+    if week_number > 1:
+        priority_topics = get_priority_topics_from_previous_weeks(pending_topics)
+        
+        # 🆕 DÜZELTİLDİ: Öncelikli konuları da kontrol et
+        for topic in priority_topics:
+            topic_name = topic.get('topic', '')
+            if topic_name not in completed_topic_names:
+                topic['priority'] = 'high'
+                weekly_topics.insert(0, topic)
+    
+    return weekly_topics
+
+def get_priority_topics_from_previous_weeks(pending_topics):
+    """Önceki haftalardan kalan öncelikli konuları döndürür"""
+    priority_topics = []
+    current_week = get_current_week_number()
+    
+    for topic in pending_topics:
+        topic_week = topic.get('week', 0)
+        topic_subject = topic.get('subject', '')
+        
+        # Sadece gerçekten önceki haftalardan kalan TYT konularını al
+        # AYT konuları zamanı gelmeden önceki hafta sayılmasın
+        if (topic.get('status') == 'incomplete' and 
+            topic_week > 0 and topic_week < current_week and
+            topic_subject.startswith('TYT')):
+            priority_topics.append(topic)
+    
+    return priority_topics
+
+def get_topic_difficulty_by_name(topic_name):
+    """Konu adına göre zorluk seviyesi döndürür"""
+    # Konu adına göre zorluk belirle (basit heuristic)
+    if any(keyword in topic_name.lower() for keyword in ['temel', 'giriş', 'tanım', 'kavram']):
+        return 2  # Kolay
+    elif any(keyword in topic_name.lower() for keyword in ['problem', 'analiz', 'uygulama', 'çözüm']):
+        return 4  # Zor
+    elif any(keyword in topic_name.lower() for keyword in ['ileri', 'karmaşık', 'detay', 'derinlemesine']):
+        return 5  # Çok Zor
+    else:
+        return 3  # Orta
+
+def calculate_weekly_progress_percentage(completed_topics, total_planned_topics):
+    """Haftalık ilerleme yüzdesini hesaplar"""
+    if total_planned_topics == 0:
+        return 0
+    
+    return min(100, (completed_topics / total_planned_topics) * 100)
+
+def get_flexible_topic_recommendations(user_data, current_week_progress, target_percentage=80):
+    """Esnek hedef sistemi - %80 hedef ve esnek konu önerileri"""
+    
+    # Mevcut hafta ilerleme durumu
+    if current_week_progress >= target_percentage:
+        # Hedef aşıldı, bir sonraki haftanın konularını öner
+        next_week_topics = get_next_week_topics(user_data)
+        return {
+            'status': 'ahead',
+            'message': f'🎉 Bu haftanın hedefini %{current_week_progress:.1f} ile aştınız!',
+            'recommendation': 'Bir sonraki haftanın konularına başlayabilirsiniz.',
+            'suggested_topics': next_week_topics[:3],  # İlk 3 konu
+            'action': 'advance'
+        }
+    elif current_week_progress >= 60:
+        # İyi durumda, biraz daha çalışarak hedefe ulaşabilir
+        return {
+            'status': 'on_track',
+            'message': f'👍 İyi gidiyorsunuz! Hedefin %{current_week_progress:.1f}ındasınız.',
+            'recommendation': f'%{target_percentage} hedefe ulaşmak için biraz daha çalışın.',
+            'action': 'continue'
+        }
+    else:
+        # Geride, öncelikli konulara odaklanmalı
+        return {
+            'status': 'behind',
+            'message': f'⚠️ Bu hafta %{current_week_progress:.1f} ilerleme sağladınız.',
+            'recommendation': 'Öncelikli konulara odaklanın, tüm konuları bitirmeye çalışmayın.',
+            'action': 'focus_priority'
+        }
+
+def get_current_week_number():
+    """Mevcut hafta numarasını döndürür"""
+    # Eğer session state'te kullanıcı verileri varsa ve eşit ağırlık öğrencisiyse
+    user_data = get_session_store().get('user_data')
+    if user_data:
+        if user_data.get('field') == 'Eşit Ağırlık':
+            return user_data.get('equal_weight_current_week', 1)
+    
+    # Diğer öğrenciler için normal takvim haftası
+    week_info = get_current_week_info()
+    return week_info.get('week_number', 1)
+
+def get_weekly_din_felsefe_topics(week_number):
+    """3. haftadan itibaren TYT Din ve Felsefe konularını haftalık 2-3 konu olarak döndürür"""
+    topics = []
+    
+    if week_number < 3:
+        return topics
+    
+    # Her hafta için Din ve Felsefe konularını belirle
+    week_offset = week_number - 3  # 3. haftadan başladığı için
+    
+    # TYT Felsefe konuları
+    felsefe_topics = [
+        "Felsefenin Konusu", "Bilgi Felsefesi (Epistemoloji)", "Varlık Felsefesi (Ontoloji)",
+        "Din, Kültür ve Medeniyet", "Ahlak Felsefesi", "Sanat Felsefesi",
+        "Din Felsefesi", "Siyaset Felsefesi", "Bilim Felsefesi", "İlk Çağ Felsefesi",
+        "Sokrates ve Felsefesi", "Platon ve Felsefesi", "Aristoteles ve Felsefesi",
+        "Orta Çağ Felsefesi", "İslam Felsefesi (Farabi, İbn Sina)"
+    ]
+    
+    # TYT Din Kültürü konuları 
+    din_topics = [
+        "İnsan ve Din (İnanç)", "Ahlak", "İbadet", "Peygamberlik",
+        "Kutsal Kitaplar", "Ahiret İnancı", "Dinler Tarihi", "İslam Tarihi",
+        "Hz. Muhammed'in Hayatı", "Temel Dini Kavramlar"
+    ]
+    
+    # Bu hafta için konuları seç (hafta başına 2-3 konu)
+    felsefe_start = (week_offset * 2) % len(felsefe_topics)
+    din_start = (week_offset * 2) % len(din_topics)
+    
+    # Felsefe'den 1-2 konu
+    for i in range(2):
+        idx = (felsefe_start + i) % len(felsefe_topics)
+        topics.append({
+            'subject': 'TYT Felsefe',
+            'topic': felsefe_topics[idx],
+            'week': week_number,
+            'priority': 'normal',
+            'difficulty': 3,
+            'status': 'planned'
+        })
+    
+    # Din'den 1 konu
+    din_idx = din_start % len(din_topics)
+    topics.append({
+        'subject': 'TYT Din Kültürü',
+        'topic': din_topics[din_idx],
+        'week': week_number,
+        'priority': 'normal', 
+        'difficulty': 2,
+        'status': 'planned'
+    })
+    
+    return topics
+
+def get_review_topics_for_equal_weight(user_data):
+    """Eşit Ağırlık öğrencileri için tekrar konularını döndürür"""
+    review_topics = []
+    
+    # Mastery sisteminden tekrar zamanı gelen konuları al
+    mastery_topics = get_pending_review_topics(user_data)
+    
+    # Eşit Ağırlık için maksimum 8 tekrar konu
+    review_topics = mastery_topics[:8]
+    
+    return review_topics
+    
+
+
+def update_weekly_plan_with_pending_topics(user_data, weekly_plan):
+    """Haftalık planı kalan konularla günceller"""
+    
+    # Kullanıcının tamamlanmamış konularını al
+    pending_topics = get_user_pending_topics(user_data)
+    
+    # Bu hafta için planlanan konuları al
+    current_week_topics = weekly_plan.get('new_topics', [])
+    
+    # Önceki haftalardan kalan konuları öncelikli olarak ekle
+    priority_topics = []
+    for topic in pending_topics:
+        if topic.get('week', 0) < get_current_week_number():
+            topic['priority'] = 'high'
+            topic['reason'] = 'Önceki haftadan kalan'
+            priority_topics.append(topic)
+    
+    # Öncelikli konuları başa ekle
+    updated_topics = priority_topics + current_week_topics
+    
+    # Güncellenen planı döndür
+    weekly_plan['new_topics'] = updated_topics
+    weekly_plan['priority_topics_count'] = len(priority_topics)
+    
+    return weekly_plan
+
+def get_user_pending_topics(user_data):
+    """Kullanıcının tamamlanmamış konularını döndürür"""
+    # Bu fonksiyon kullanıcının geçmiş haftalardaki tamamlanmamış konularını bulur
+    pending_topics = []
+    current_week = get_current_week_number()
+    
+    # Kullanıcı verilerinden tamamlanmamış konuları al
+    topic_progress_data = user_data.get('topic_progress', '{}')
+    topic_progress = json.loads(topic_progress_data) if isinstance(topic_progress_data, str) else topic_progress_data
+    
+    for topic_key, topic_data in topic_progress.items():
+        # topic_data'nın dictionary olduğundan emin ol
+        if not isinstance(topic_data, dict):
+            continue
+        
+        # Sadece gerçekten başlanmış konuları pending olarak say
+        topic_net = topic_data.get('net', 0)
+        topic_week = topic_data.get('planned_week', 999)  # Varsayılan olarak çok ileri hafta
+        topic_subject = topic_data.get('subject', '')
+        
+        # Koşullar:
+        # 1. Net sayısı 0'dan büyük olmalı (başlanmış olmalı)
+        # 2. Net sayısı 14'ten az olmalı (tamamlanmamış olmalı)  
+        # 3. Konu haftası mevcut haftadan küçük olmalı (geçmiş hafta olmalı)
+        # 4. TYT konusu olmalı (AYT konuları zamanı gelmeden pending sayılmasın)
+        if (topic_net > 0 and topic_net < 14 and 
+            topic_week < current_week and
+            topic_subject.startswith('TYT')):
+            pending_topics.append({
+                'subject': topic_subject,
+                'topic': topic_key,
+                'net': topic_net,
+                'week': topic_week,
+                'status': 'incomplete'
+            })
+    
+    return pending_topics
+
+def get_completed_topics_from_user_data(user_data):
+    """
+    🔥 TAMAMEN DÜZELTİLDİ: Kullanıcının "iyi" seviyeye getirdiği (net >= 14) konuları döndürür
+    Haftalık plan ile tam uyumlu - tüm olası format kombinasyonları eklenir
+    """
+    import json
+    import streamlit as st
+    
+    completed_topics = []
+    completed_topic_names = set()  # Hızlı arama için set
+    
+
+
+    
+    # 🔧 GÜVENLİ: user_data kontrolü
+    if not user_data:
+        return completed_topics, completed_topic_names
+    
+    try:
+        # topic_progress'i al
+        topic_progress_str = user_data.get('topic_progress', '{}')
+        if not topic_progress_str:
+            topic_progress_str = '{}'
+        
+        topic_progress = json.loads(topic_progress_str) if isinstance(topic_progress_str, str) else topic_progress_str
+    except Exception as e:
+        return completed_topics, completed_topic_names
+    
+    for topic_key, topic_data in topic_progress.items():
+        try:
+            # Veri formatını kontrol et
+            if isinstance(topic_data, dict):
+                topic_net = topic_data.get('net', 0)
+                # 🔧 GÜVENLİ: subject bilgisini al
+                subject = topic_data.get('subject', '') if topic_data else ''
+            elif isinstance(topic_data, (int, float, str)):
+                try:
+                    topic_net = int(float(str(topic_data)))
+                except:
+                    topic_net = 0
+                subject = ''  # Simple data type'larda subject bilgisi yok
+            else:
+                topic_net = 0
+                subject = ''
+            
+            # Net sayısı 14 veya daha fazla ise "iyi" seviye (tamamlanmış)
+            if topic_net >= 14:
+                # Konu formatını parse et
+                # Format: "TYT Türkçe | Anlam Bilgisi | Cümlede Anlam | Neden-Sonuç"
+                topic_parts = topic_key.split(' | ') if topic_key else [topic_key]
+                
+                completed_topics.append({
+                    'topic': topic_key,  # Tam format
+                    'topic_name_only': topic_parts[-1] if topic_parts else topic_key,
+                    'subject': subject,  # 🔧 GÜVENLİ: Yukarıda güvenli şekilde alındı
+                    'net': topic_net,
+                    'status': 'completed'
+                })
+                
+                # 🔥 KRİTİK: Haftalık plan ile eşleşme için TÜM olası formatları ekle
+                completed_topic_names.add(topic_key)  # Tam format
+                
+                if len(topic_parts) >= 1:
+                    completed_topic_names.add(topic_parts[-1])  # Sadece detail: "Neden-Sonuç"
+                
+                if len(topic_parts) >= 3 and topic_parts[-2] != "None":
+                    # Main topic - detail kombinasyonu
+                    main_topic_detail = f"{topic_parts[-2]} - {topic_parts[-1]}"
+                    completed_topic_names.add(main_topic_detail)
+                    
+
+                    if "Neden-Sonuç" in topic_parts[-1]:
+                        logger.debug("✅ Eklendi: %s (net=%s)", main_topic_detail, topic_net)
+                
+                if len(topic_parts) >= 2:
+                    # Category - detail kombinasyonu
+                    if topic_parts[-3] != "None" if len(topic_parts) > 2 else False:
+                        category_detail = f"{topic_parts[-3]} - {topic_parts[-1]}"
+                        completed_topic_names.add(category_detail)
+        except Exception as topic_error:
+            # Tek topic hatası tüm fonksiyonu bozmasın
+        
+            continue
+    
+
+    # Debug mod kaldırıldı
+
+    
+    return completed_topics, completed_topic_names
+
+# === YENİ SİSTEMATİK YKS TAKİP SİSTEMİ ===
+
+# Ders Önem Puanları (1-10 arası)
+SUBJECT_IMPORTANCE_SCORES = {
+    "TYT Matematik": 10,      # En kritik
+    "TYT Türkçe": 9,          # Yüksek soru sayısı
+    "TYT Fizik": 8,           # Önemli
+    "TYT Kimya": 8,           # Önemli
+    "TYT Biyoloji": 7,        # Orta-Yüksek
+    "TYT Geometri": 7,        # Orta-Yüksek
+    "TYT Tarih": 6,           # Orta
+    "TYT Coğrafya": 6,        # Orta
+    "TYT Felsefe": 4,         # 2-3. hafta başlangıç
+    "TYT Din Kültürü": 4,     # 2-3. hafta başlangıç
+    "AYT Matematik": 10,      # En kritik
+    "AYT Fizik": 9,           # Yüksek
+    "AYT Kimya": 9,           # Yüksek
+    "AYT Biyoloji": 8,        # Önemli
+    "AYT Edebiyat": 9,        # Sözel için kritik
+    "AYT Tarih": 7,           # Sözel için önemli
+    "AYT Coğrafya": 7,        # Sözel için önemli
+}
+
+# Bilimsel Tekrar Aralıkları (gün) - ESKİ SİSTEM
+SPACED_REPETITION_INTERVALS = [3, 7, 14, 30, 90]
+
+# === 🔎 NORMALİZE KONU-NET İNDEKSİ ===
+TOPIC_NET_SOURCE_FIELDS = (
+    'progress_tracking', 'topic_tracking', 'topic_progress', 'quiz_results',
+    'pomodoro_history', 'topic_evaluations', 'weekly_plan', 'topic_mastery_status',
+)
+# get_actual_net_value'nun kaynak önceliği
+ACTUAL_NET_SOURCE_ORDER = ('progress', 'tracking', 'topic_progress', 'quiz', 'pomodoro', 'evaluations', 'weekly_plan')
+EVALUATION_LEVEL_NETS = {'uzman': 15, 'iyi': 15, 'orta': 10, 'temel': 7, 'zayif': 3}
+
+def normalize_topic_text(text):
+    """Konu/ders adını karşılaştırma için normalize eder (boşluk + büyük/küçük harf)"""
+    return ' '.join(str(text).split()).casefold()
+
+class TopicNetIndex:
+    """Kullanıcının tüm kaynaklarındaki netleri normalize (ders, konu) anahtarıyla tutar
+    
+    Her kaynak ayrı tabloda durur; aynı anahtar için kaynaktaki ilk kayıt geçerlidir.
+    Dersi bilinmeyen kayıtlar ('', anahtar) altında tutulur. Değer None ise kayıt var ama net yok.
+    """
+    
+    SOURCES = ('progress', 'tracking', 'topic_progress', 'quiz', 'pomodoro',
+               'evaluations', 'weekly_plan', 'mastery', 'evaluation_levels')
+    
+    def __init__(self, user_data=None):
+        self.tables = {source: {} for source in self.SOURCES}
+        if user_data:
+            self._build(user_data)
+    
+    def _add(self, source, subject, topic, net_value):
+        net = None if net_value is None else parse_net_value(net_value)
+        self.tables[source].setdefault((normalize_topic_text(subject), normalize_topic_text(topic)), net)
+    
+    def _add_records(self, source, records, topic_field, net_fields=('net',)):
+        """subject/topic alanlı kayıt listesini ekler"""
+        if not isinstance(records, list):
+            return
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            net_value = next((record[field] for field in net_fields if field in record), 0)
+            self._add(source, record.get('subject', ''), record.get(topic_field, ''), net_value)
+    
+    def _build(self, user_data):
+        progress_tracking = user_data.get('progress_tracking', {})
+        if isinstance(progress_tracking, dict):
+            for subject, subject_data in progress_tracking.items():
+                if not isinstance(subject_data, dict):
+                    continue
+                for topic, topic_data in subject_data.items():
+                    if isinstance(topic_data, dict):
+                        self._add('progress', subject, topic, topic_data.get('net'))
+        
+        topic_tracking = user_data.get('topic_tracking', {})
+        if isinstance(topic_tracking, dict):
+            for key, data in topic_tracking.items():
+                if isinstance(data, dict):
+                    self._add('tracking', '', key, data.get('net'))
+        
+        # "Ders | Kategori | Alt Kategori | Konu" - konu, alt kategori ve kategori adıyla bulunabilir
+        for topic_key, net_value in load_topic_progress(user_data).items():
+            if topic_key.endswith('_difficulty') or net_value in ('1', '2', '3', '4', '5'):
+                continue
+            parts = topic_key.split(' | ')
+            if len(parts) < 2:
+                self._add('topic_progress', '', topic_key, net_value)
+                continue
+            for name in reversed(parts[1:]):
+                if name and name != 'None':
+                    self._add('topic_progress', parts[0], name, net_value)
+        
+        self._add_records('quiz', user_data.get('quiz_results', []), 'topic_name')
+        self._add_records('pomodoro', user_data.get('pomodoro_history', []), 'topic', ('net_earned', 'net'))
+        
+        topic_evaluations = user_data.get('topic_evaluations', [])
+        if isinstance(topic_evaluations, dict):
+            for key, evaluations in topic_evaluations.items():
+                if isinstance(evaluations, list) and evaluations and isinstance(evaluations[-1], dict):
+                    level_net = EVALUATION_LEVEL_NETS.get(evaluations[-1].get('evaluation', ''))
+                    if level_net is not None:
+                        self._add('evaluation_levels', '', key, level_net)
+        else:
+            self._add_records('evaluations', topic_evaluations, 'topic')
+        
+        weekly_plan = user_data.get('weekly_plan', {})
+        if isinstance(weekly_plan, dict):
+            self._add_records('weekly_plan', weekly_plan.get('review_topics', []), 'topic')
+        
+        mastery_status = user_data.get('topic_mastery_status', '{}')
+        if isinstance(mastery_status, str):
+            try:
+                mastery_status = json.loads(mastery_status) if mastery_status else {}
+            except (json.JSONDecodeError, TypeError):
+                mastery_status = {}
+        if isinstance(mastery_status, dict):
+            for key, mastery_data in mastery_status.items():
+                if isinstance(mastery_data, dict):
+                    self._add('mastery', '', key, mastery_data.get('current_net'))
+    
+    @staticmethod
+    def _probe_keys(subject, topic_name):
+        subject = normalize_topic_text(subject)
+        topic = normalize_topic_text(topic_name)
+        return (
+            (subject, topic),
+            ('', topic),
+            ('', f"{subject}_{topic}"),
+            ('', f"{subject}-{topic}"),
+            ('', f"{subject} {topic}"),
+        )
+    
+    def lookup(self, subject, topic_name, order=ACTUAL_NET_SOURCE_ORDER, require_net=False):
+        """Kaynak sırasına göre ilk eşleşen neti döndürür, bulunamazsa None"""
+        probe_keys = self._probe_keys(subject, topic_name)
+        for source in order:
+            table = self.tables[source]
+            for key in probe_keys:
+                if key not in table:
+                    continue
+                net = table[key]
+                if net is None:
+                    if require_net:
+                        continue
+                    return 0
+                return net
+        return None
+
+def get_topic_net_index(user_data):
+    """Kullanıcı dokümanının bu sürümü için net indeksini döndürür (sürüm değişmedikçe yeniden kurulmaz)"""
+    try:
+        version = hashlib.md5(json.dumps(
+            [user_data.get(field) for field in TOPIC_NET_SOURCE_FIELDS],
+            sort_keys=True, default=str,
+        ).encode('utf-8')).hexdigest()
+    except (TypeError, ValueError):
+        return TopicNetIndex(user_data)
+    
+    username = user_data.get('username', '')
+    cache = get_session_store().setdefault('topic_net_index_cache', {})
+    cached = cache.get(username)
+    if cached and cached[0] == version:
+        return cached[1]
+    
+    index = TopicNetIndex(user_data)
+    cache[username] = (version, index)
+    return index
+
+def get_actual_net_value(subject, topic_name, user_data, index=None):
+    """Konunun gerçek net değerini tüm kaynaklardan çeker - indeks üzerinden O(1)"""
+    if index is None:
+        index = get_topic_net_index(user_data)
+    net = index.lookup(subject, topic_name)
+    return net if net is not None else 0
+
+@rerun_cached()
+def get_time_based_strategy(days_to_yks, current_month):
+    """🎯 YKS'ye kalan süreye göre dinamik strateji belirleme sistemi"""
+    
+    # Aylık strateji haritalama
+    if days_to_yks > 210:  # Ekim-Kasım-Aralık (7+ ay kala)
+        return {
+            'period_name': 'TEMELCİ DÖNEM',
+            'focus': 'temel_kavramlar_ve_konu_ogenimi',
+            'priority': 'kavram_ogrenme',
+            'deneme_frequency': 'ayda_1',
+            'new_topics_per_week': 10,  # Yoğun konu öğrenimi
+            'review_ratio': 0.25,  # %25 tekrar, %75 yeni konu
+            'study_intensity': 'normal',
+            'special_notes': 'Temel kavramları sağlam öğrenme dönemi'
+        }
+    elif days_to_yks > 150:  # Ocak-Şubat (5-7 ay kala)
+        return {
+            'period_name': 'KONSOLDASYON DÖNEM',
+            'focus': 'konu_pekistirme_ve_baglanti',
+            'priority': 'konu_baglama',
+            'deneme_frequency': '3_haftada_2',
+            'new_topics_per_week': 8,
+            'review_ratio': 0.35,  # %35 tekrar, %65 yeni konu
+            'study_intensity': 'normal',
+            'special_notes': 'Konular arası bağlantı kurma dönemi'
+        }
+    elif days_to_yks > 120:  # Mart (3-5 ay kala)
+        return {
+            'period_name': 'EKSİK KAPATMA DÖNEM',
+            'focus': 'eksik_konular_ve_zayif_alanlar',
+            'priority': 'eksik_kapama',
+            'deneme_frequency': '2_haftada_1',
+            'new_topics_per_week': 6,
+            'review_ratio': 0.45,  # %45 tekrar, %55 yeni konu
+            'study_intensity': 'artiriyor',
+            'special_notes': 'Zayıf konuları tespit edip kapatma dönemi'
+        }
+    elif days_to_yks > 90:  # Nisan (3 ay kala) - YOĞUNDENEMECİ DÖNEM
+        return {
+            'period_name': 'YOĞUN DENEMECİ DÖNEM',
+            'focus': 'deneme_stratejisi_ve_hizli_cozum',
+            'priority': 'deneme_performansi',
+            'deneme_frequency': 'haftada_2',
+            'new_topics_per_week': 4,  # Denemeye odak, az yeni konu
+            'review_ratio': 0.65,  # %65 tekrar, %35 yeni konu
+            'study_intensity': 'yuksek',
+            'special_notes': 'Deneme stratejileri geliştirme dönemi - NISAN DOLUDUR!'
+        }
+    elif days_to_yks > 60:  # Mayıs (2 ay kala) - DENEMEVEANALİZ DÖNEM
+        return {
+            'period_name': 'DENEME VE ANALİZ DÖNEM',
+            'focus': 'deneme_analiz_odakli_calisma',
+            'priority': 'analiz_tabanlı_gelişim',
+            'deneme_frequency': 'haftada_3',
+            'new_topics_per_week': 2,  # Çok az yeni konu
+            'review_ratio': 0.75,  # %75 tekrar, %25 yeni konu
+            'study_intensity': 'maksimum',
+            'special_notes': 'Her deneme sonrası detaylı analiz dönemi - MAYIS YOĞUN!'
+        }
+    elif days_to_yks > 30:  # Haziran ilk yarı (1 ay kala) - SON SPRINT DÖNEM
+        return {
+            'period_name': 'SON SPRİNT DÖNEM',
+            'focus': 'guncele_odakli_ve_moral_koruma',
+            'priority': 'moral_ve_güven',
+            'deneme_frequency': 'günde_1',
+            'new_topics_per_week': 1,  # Sadece çok kritik eksikler
+            'review_ratio': 0.85,  # %85 tekrar, %15 yeni konu
+            'study_intensity': 'kontrollü_yoğun',
+            'special_notes': 'Güven artırma ve mükemmelleştirme dönemi'
+        }
+    else:  # Son 30 gün - MORAL KORUMA DÖNEM
+        return {
+            'period_name': 'MORAL KORUMA DÖNEM',
+            'focus': 'moral_koruma_ve_hazir_tutma',
+            'priority': 'mental_hazırlık',
+            'deneme_frequency': '2_günde_1',
+            'new_topics_per_week': 0,  # Hiç yeni konu öğrenme
+            'review_ratio': 1.0,  # %100 tekrar
+            'study_intensity': 'sakin',
+            'special_notes': 'Sadece bildiğini pekiştir, stres yapma!'
+        }
+
+def get_deneme_strategy_by_period(strategy):
+    """📊 Dönemlere göre deneme stratejisi"""
+    
+    deneme_strategies = {
+        'TEMELCİ DÖNEM': {
+            'type': 'kavram_deneme',
+            'frequency_description': 'Ayda 1 kere, kavram ölçme amaçlı',
+            'analysis_focus': 'Hangi konuları bilmiyorum?',
+            'recommendation': 'Deneme sonrası eksik konulara ağırlık ver'
+        },
+        'KONSOLDASYON DÖNEM': {
+            'type': 'baglanti_deneme',
+            'frequency_description': '3 haftada 2 kere, konular arası bağlantı ölçme',
+            'analysis_focus': 'Konuları birbirleriyle bağlayabiliyor muyum?',
+            'recommendation': 'Karma sorular çöz, farklı konu karışımları dene'
+        },
+        'EKSİK KAPATMA DÖNEM': {
+            'type': 'eksik_tespit_deneme',
+            'frequency_description': '2 haftada 1 kere, zayıf alanları tespit etme',
+            'analysis_focus': 'En çok puan kaybettiğim konular hangileri?',
+            'recommendation': 'Deneme sonrası 1 hafta o konulara odaklan'
+        },
+        'YOĞUN DENEMECİ DÖNEM': {
+            'type': 'strateji_deneme',
+            'frequency_description': 'Haftada 2 kere, çözüm stratejileri geliştirme',
+            'analysis_focus': 'Hangi soru tiplerinde yavaşım? Zaman yönetimi nasıl?',
+            'recommendation': 'Soru çözme hızını artır, zaman stratejisi geliştir'
+        },
+        'DENEME VE ANALİZ DÖNEM': {
+            'type': 'performans_deneme',
+            'frequency_description': 'Haftada 3 kere, performans maksimize etme',
+            'analysis_focus': 'Net sayımı nasıl artırabilirim?',
+            'recommendation': 'Her deneme sonrası 2 gün analiz, 2 gün eksik çalışma'
+        },
+        'SON SPRİNT DÖNEM': {
+            'type': 'guven_deneme',
+            'frequency_description': 'Günde 1 kere, güven artırma amaçlı',
+            'analysis_focus': 'Bildiklerimi doğru işaretleyebiliyor muyum?',
+            'recommendation': 'Hata minimizasyonu, işaretleme stratejisi'
+        },
+        'MORAL KORUMA DÖNEM': {
+            'type': 'rahatlatici_deneme',
+            'frequency_description': '2 günde 1 kere, stresi azaltma amaçlı',
+            'analysis_focus': 'Rahat ve kendimden eminim',
+            'recommendation': 'Çok analiz yapma, sadece formda kal'
+        }
+    }
+    
+    return deneme_strategies.get(strategy['period_name'], deneme_strategies['TEMELCİ DÖNEM'])
+
+def calculate_dynamic_topic_limits(strategy, subject_importance):
+    """🎯 Dönemlere göre dinamik konu limitleri"""
+    
+    base_limit = strategy['new_topics_per_week']
+    
+    # Ders önemine göre çarpan
+    importance_multiplier = {
+        10: 1.5,  # En önemli dersler (TYT Mat, AYT Mat)
+        9: 1.3,   # Çok önemli 
+        8: 1.1,   # Önemli
+        7: 1.0,   # Normal
+        6: 0.8,   # Az önemli
+        5: 0.6,   # En az önemli
+        4: 0.4,
+        3: 0.3,
+        2: 0.2,
+        1: 0.1
+    }
+    
+    multiplier = importance_multiplier.get(subject_importance, 1.0)
+    calculated_limit = int(base_limit * multiplier)
+    
+    # Minimum 1, maksimum limits
+    return max(1, min(calculated_limit, 15))
+
+def get_time_based_priority_boost(strategy, subject, user_performance):
+    """⚡ Zamansal stratejiye göre öncelik boost'u"""
+    return float(get_period_priority_boosts(strategy['period_name'], [subject], [user_performance])[0])
+
+def get_period_priority_boosts(period, subjects, performances):
+    """⚡ Dönem boost'ları - tüm dersler için tek seferde (performances: 0-100)"""
+    # Dönemlere göre ders öncelik boost'ları: (maske, boost)
+    if period == 'TEMELCİ DÖNEM':
+        # Temel matematik ve Türkçe'ye boost
+        mask, boost = [('TYT Matematik' in subject or 'TYT Türkçe' in subject) for subject in subjects], 2
+    elif period == 'EKSİK KAPATMA DÖNEM':
+        # Düşük performanslı derslere boost (%40'ın altı zayıf)
+        mask, boost = [performance < 40 for performance in performances], 3
+    elif period in ['YOĞUN DENEMECİ DÖNEM', 'DENEME VE ANALİZ DÖNEM']:
+        # Yüksek puanlı, sınav stratejik derslere boost
+        mask, boost = [any(x in subject for x in ['AYT Matematik', 'AYT Fizik', 'TYT Matematik'])
+                       for subject in subjects], 1.5
+    elif period == 'SON SPRİNT DÖNEM':
+        # Güçlü olunan derslere boost (güven artırma, %70'in üstü)
+        mask, boost = [performance > 70 for performance in performances], 2
+    else:
+        mask, boost = [False] * len(subjects), 0
+    
+    if NUMPY_AVAILABLE:
+        return np.asarray(mask, dtype=bool) * boost
+    return [boost if flag else 0 for flag in mask]
+
+def calculate_user_subject_performance(subject, user_data, deneme_list=None, topic_progress=None):
+    """📊 Kullanıcının bir dersteki performansını hesaplar (0-100 arası)
+    
+    deneme_list/topic_progress önceden ayrıştırıldıysa (PlanScorer) tekrar ayrıştırılmaz.
+    """
+    
+    # Deneme verilerinden performans hesapla
+    if deneme_list is None:
+        deneme_list = get_exam_store(user_data).records
+    
+    # Son 3 deneme ortalaması
+    if deneme_list:
+        recent_exams = deneme_list[-3:] if len(deneme_list) >= 3 else deneme_list
+        
+        total_score = 0
+        count = 0
+        
+        for exam in recent_exams:
+            if subject in ['TYT Matematik', 'TYT Türkçe', 'TYT Fen', 'TYT Sosyal']:
+                net_key = subject.lower().replace('tyt ', '') + '_net'
+                if net_key in exam:
+                    total_score += exam[net_key] * 2.5  # 40 soru üzerinden %100'e çevir
+                    count += 1
+            elif subject.startswith('AYT'):
+                ayt_subject = subject.replace('AYT ', '').lower()
+                net_key = ayt_subject + '_net'
+                if net_key in exam:
+                    # AYT dersleri genelde 40 soru üzerinden
+                    total_score += exam[net_key] * 2.5
+                    count += 1
+        
+        if count > 0:
+            return min(100, total_score / count)
+    
+    # Deneme verisi yoksa konu ilerlemesinden hesapla
+    if topic_progress is None:
+        topic_progress_data = user_data.get('topic_progress', '{}')
+        topic_progress = json.loads(topic_progress_data) if isinstance(topic_progress_data, str) else topic_progress_data
+    
+    # Bu derse ait konuları bul
+    subject_topics = []
+    for topic_key, progress in topic_progress.items():
+        if subject.lower().replace(' ', '_') in topic_key.lower():
+            subject_topics.append(progress)
+    
+    if subject_topics:
+        # Tamamlanan konu yüzdesi
+        completed = sum(1 for p in subject_topics if p.get('status') == 'completed')
+        return (completed / len(subject_topics)) * 100
+    
+    # Varsayılan: Orta seviye
+    return 50
+
+def should_include_subject_in_period(subject, importance, time_strategy, user_data, week_info, scorer=None):
+    """📅 Bu dersin bu dönemde çalışılıp çalışılmayacağını belirler"""
+    
+    period = time_strategy['period_name']
+    
+    # TEMELCİ DÖNEM: Sadece temel dersler
+    if period == 'TEMELCİ DÖNEM':
+        # Yüksek önem puanlı dersleri (≥7) ve temel TYT derslerini dahil et
+        if importance >= 7 or subject in ['TYT Matematik', 'TYT Türkçe']:
+            return True
+        return False
+    
+    # KONSOLDASYON DÖNEM: Çoğu dersi dahil et
+    elif period == 'KONSOLDASYON DÖNEM':
+        # Orta ve yüksek önemli dersleri dahil et (≥5)
+        return importance >= 5
+    
+    # EKSİK KAPATMA DÖNEM: Performansa dayalı filtreleme
+    elif period == 'EKSİK KAPATMA DÖNEM':
+        user_performance = scorer.user_performance(subject) if scorer else calculate_user_subject_performance(subject, user_data)
+        # Zayıf performanslı dersleri (<60) ve yüksek önemlileri dahil et
+        return user_performance < 60 or importance >= 8
+    
+    # YOĞUN DENEMECİ DÖNEM: Stratejik dersler
+    elif period == 'YOĞUN DENEMECİ DÖNEM':
+        # Sadece yüksek puanlı, sınav kritik dersleri
+        strategic_subjects = ['TYT Matematik', 'AYT Matematik', 'AYT Fizik', 'TYT Türkçe']
+        return any(s in subject for s in strategic_subjects) or importance >= 9
+    
+    # DENEME VE ANALİZ DÖNEM: Analiz bazlı seçim
+    elif period == 'DENEME VE ANALİZ DÖNEM':
+        # Son deneme sonuçlarına göre zayıf çıkan dersleri dahil et
+        return is_subject_weak_in_recent_exams(subject, user_data) or importance >= 9
+    
+    # SON SPRİNT DÖNEM: Güçlü olunan dersler
+    elif period == 'SON SPRİNT DÖNEM':
+        user_performance = scorer.user_performance(subject) if scorer else calculate_user_subject_performance(subject, user_data)
+        # Güçlü olunan dersleri dahil et (>70) - güven artırma
+        return user_performance > 70 or importance >= 10
+    
+    # MORAL KORUMA DÖNEM: Sadece en güçlü dersler
+    elif period == 'MORAL KORUMA DÖNEM':
+        user_performance = scorer.user_performance(subject) if scorer else calculate_user_subject_performance(subject, user_data)
+        # Sadece çok güçlü olunan dersleri (>80)
+        return user_performance > 80
+    
+    # Varsayılan: Dahil et
+    return True
+
+def is_subject_weak_in_recent_exams(subject, user_data):
+    """📉 Son denemelerde bu dersin zayıf olup olmadığını kontrol eder"""
+    
+    if subject in ['TYT Matematik', 'TYT Türkçe', 'TYT Fen', 'TYT Sosyal']:
+        net_key = subject.lower().replace('tyt ', '') + '_net'
+        threshold = 20  # TYT için 20 net altı zayıf kabul et
+    elif subject.startswith('AYT'):
+        net_key = subject.replace('AYT ', '').lower() + '_net'
+        threshold = 15  # AYT için 15 net altı zayıf kabul et
+    else:
+        return False
+    
+    # Son 2 denemede kaydı olanlar içinde eşik altı kalanlar
+    (total_count,), (weak_count,) = get_exam_store(user_data).below_counts([net_key], [threshold], last=2)
+    
+    # Denemelerin yarısından fazlasında zayıfsa True
+    return total_count > 0 and (weak_count / total_count) > 0.5
+
+def calculate_review_topics_limit_by_period(time_strategy):
+    """🔄 Dönemlere göre tekrar konusu limiti"""
+    
+    period = time_strategy['period_name']
+    review_ratio = time_strategy['review_ratio']
+    total_weekly_topics = time_strategy['new_topics_per_week']
+    
+    # Tekrar oranına göre limite hesapla
+    if period in ['TEMELCİ DÖNEM', 'KONSOLDASYON DÖNEM']:
+        return max(3, int(total_weekly_topics * review_ratio))
+    elif period == 'EKSİK KAPATMA DÖNEM':
+        return max(4, int(total_weekly_topics * review_ratio))
+    elif period == 'YOĞUN DENEMECİ DÖNEM':
+        return max(6, int(total_weekly_topics * review_ratio))
+    elif period == 'DENEME VE ANALİZ DÖNEM':
+        return max(8, int(total_weekly_topics * review_ratio))
+    elif period == 'SON SPRİNT DÖNEM':
+        return max(10, int(total_weekly_topics * review_ratio))
+    else:  # MORAL KORUMA
+        return 12  # Sadece tekrar
+    
+def filter_review_topics_by_strategy(review_topics, time_strategy, user_data, limit=None, scorer=None):
+    """📋 Zamansal stratejiye göre tekrar konularını filtrele ve öncelikle
+    
+    limit verilirse sadece ilk limit konu seçilir (tam sıralama yapılmaz).
+    """
+    
+    period = time_strategy['period_name']
+    
+    if not review_topics:
+        return []
+    
+    # Her dönem için farklı filtreleme stratejisi
+    if period == 'TEMELCİ DÖNEM':
+        # Temel konuları öncelikle - TYT matematik ve Türkçe
+        priority_subjects = ['TYT Matematik', 'TYT Türkçe']
+        return prioritize_topics_by_subjects(review_topics, priority_subjects, limit)
+    
+    elif period == 'KONSOLDASYON DÖNEM':
+        # Tüm konuları karışık şekilde
+        return review_topics[:limit]  # Karışık dönem
+    
+    elif period == 'EKSİK KAPATMA DÖNEM':
+        # Zayıf performanslı konuları öncelikle
+        return prioritize_topics_by_weakness(review_topics, user_data, limit, scorer)
+    
+    elif period in ['YOĞUN DENEMECİ DÖNEM', 'DENEME VE ANALİZ DÖNEM']:
+        # Yüksek puanlı, sınav kritik konuları öncelikle
+        strategic_subjects = ['TYT Matematik', 'AYT Matematik', 'AYT Fizik']
+        return prioritize_topics_by_subjects(review_topics, strategic_subjects, limit)
+    
+    elif period == 'SON SPRİNT DÖNEM':
+        # Güçlü olunan konuları öncelikle (güven artırma)
+        return prioritize_topics_by_strength(review_topics, user_data, limit, scorer)
+    
+    else:  # MORAL KORUMA DÖNEM
+        # En güçlü olunan konuları (stres azaltma)
+        return prioritize_topics_by_strength(review_topics, user_data, min(8, limit or 8), scorer)
+
+def _select_by_mask(topics, mask, limit=None):
+    """Maskedeki konular önce, sonra diğerleri - sıra korunur, ilk limit konu döner"""
+    return [topics[i] for i in select_top_indices(mask, limit)]
+
+def prioritize_topics_by_subjects(topics, priority_subjects, limit=None):
+    """📚 Belirli dersleri öncelikle sıralar"""
+    return _select_by_mask(topics, PlanScorer.subject_mask(topics, priority_subjects), limit)
+
+def prioritize_topics_by_weakness(topics, user_data, limit=None, scorer=None):
+    """📉 Zayıf performanslı konuları öncelikle sıralar"""
+    # Deneme verilerinden zayıf konuları belirle
+    scorer = scorer or PlanScorer(user_data)
+    return _select_by_mask(topics, scorer.subject_mask(topics, scorer.weak_subjects), limit)
+
+def prioritize_topics_by_strength(topics, user_data, limit=None, scorer=None):
+    """📈 Güçlü olunan konuları öncelikle sıralar"""
+    scorer = scorer or PlanScorer(user_data)
+    return _select_by_mask(topics, scorer.subject_mask(topics, scorer.strong_subjects), limit)
+
+# Deneme zayıflık eşikleri: ders → (eski deneme alanı, bu netin altı zayıf)
+EXAM_WEAKNESS_THRESHOLDS = {
+    'TYT Matematik': ('matematik_net', 20),
+    'TYT Türkçe': ('turkce_net', 20),
+    'TYT Fen': ('fen_net', 15),
+    'TYT Sosyal': ('sosyal_net', 15),
+    'AYT Matematik': ('matematik_net', 15),
+    'AYT Fizik': ('fizik_net', 10),
+    'AYT Kimya': ('kimya_net', 10),
+    'AYT Biyoloji': ('biyoloji_net', 10),
+}
+
+def get_weak_subjects_from_exams(user_data):
+    """📉 Deneme sonuçlarından zayıf dersleri belirler"""
+    
+    exam_store = get_exam_store(user_data)
+    if not exam_store.size:
+        return []
+    
+    # Son 2 denemede eşik altı kalan dersler (alanı olmayan deneme 0 net sayılır)
+    net_keys, thresholds = zip(*EXAM_WEAKNESS_THRESHOLDS.values())
+    _, below = exam_store.below_counts(net_keys, thresholds, last=2, missing=0)
+    return [subject for subject, count in zip(EXAM_WEAKNESS_THRESHOLDS, below) if count]
+
+def get_strong_subjects_from_performance(user_data):
+    """📈 Performans verilerinden güçlü dersleri belirler"""
+    
+    strong_subjects = []
+    
+    # TYT/AYT ortalama net değerlerinden hesapla
+    tyt_avg = user_data.get('tyt_avg_net', 0)
+    ayt_avg = user_data.get('ayt_avg_net', 0)
+    
+    # Deneme verilerinden de kontrol et
+    deneme_data = user_data.get('deneme_analizleri', '[]')
+    try:
+        deneme_list = json.loads(deneme_data) if deneme_data else []
+    except:
+        deneme_list = []
+    
+    if deneme_list:
+        recent_exams = deneme_list[-2:] if len(deneme_list) >= 2 else deneme_list
+        
+        for exam in recent_exams:
+            # TYT güçlü dersleri
+            if exam.get('matematik_net', 0) > 25:
+                strong_subjects.append('TYT Matematik')
+            if exam.get('turkce_net', 0) > 25:
+                strong_subjects.append('TYT Türkçe')
+            if exam.get('fen_net', 0) > 20:
+                strong_subjects.append('TYT Fen')
+            if exam.get('sosyal_net', 0) > 20:
+                strong_subjects.append('TYT Sosyal')
+            
+            # AYT güçlü dersleri
+            if exam.get('matematik_net', 0) > 20:
+                strong_subjects.append('AYT Matematik')
+            if exam.get('fizik_net', 0) > 15:
+                strong_subjects.append('AYT Fizik')
+            if exam.get('kimya_net', 0) > 15:
+                strong_subjects.append('AYT Kimya')
+            if exam.get('biyoloji_net', 0) > 15:
+                strong_subjects.append('AYT Biyoloji')
+    
+    return list(set(strong_subjects))
+
+def get_period_specific_recommendations(time_strategy, user_data):
+    """📋 Dönem bazlı özel öneriler"""
+    
+    period = time_strategy['period_name']
+    days_to_yks = time_strategy.get('days_to_yks', 300)
+    
+    recommendations = {
+        'TEMELCİ DÖNEM': [
+            "🧠 Temel kavramları derinlemesine öğrenmeye odaklan",
+            "📚 Her konu için alt yapı sağlamlaştır",
+            "🎯 Günde 4-5 saat düzenli çalışma temposu kur",
+            "📝 Ayda 1 deneme çöz, eksikleri tespit et",
+            "💡 Konuları sadece ezberlemek yerine anlayarak öğren"
+        ],
+        'KONSOLDASYON DÖNEM': [
+            "🔗 Konular arası bağlantıları güçlendir",
+            "🎓 Karma sorular çözmeye başla",
+            "📊 Deneme sıklığını artır (3 haftada 2)",
+            "💪 Çalışma saatini 5-6'ya çıkar",
+            "🔄 Öğrendiklerini günlük hayatla bağdaştır"
+        ],
+        'EKSİK KAPATMA DÖNEM': [
+            "🎯 Zayıf konuları tespit et ve onlara odaklan",
+            "📈 Deneme analizi yapmayı öğren",
+            "⚡ Çalışma temponu artır (günde 6-7 saat)",
+            "🔍 Detaylı konu tekrarları yap",
+            "💯 Net sayılarını sistematik takip et"
+        ],
+        'YOĞUN DENEMECİ DÖNEM': [
+            "🎲 Haftada 2-3 deneme çöz",
+            "⏱️ Zaman yönetimi stratejileri geliştir",
+            "🚀 Soru çözme hızını artır",
+            "📋 Her deneme sonrası detaylı analiz yap",
+            "🎯 Soru tipleri ve çözüm tekniklerini öğren",
+            "💪 Günde 7-8 saat yoğun tempo"
+        ],
+        'DENEME VE ANALİZ DÖNEM': [
+            "📊 Her deneme sonrası 2 gün analiz ayır",
+            "🔄 Hızlı eksik konu çalışması yap",
+            "🎯 Net sayısı optimizasyonuna odaklan",
+            "⚡ Maksimum performans için 8-9 saat çalış",
+            "🧠 Mental hazırlık ve motivasyonu korur",
+            "📈 Strateji denemelerine başla"
+        ],
+        'SON SPRİNT DÖNEM': [
+            "💎 Güçlü olduğun konuları pekiştir",
+            "🛡️ Hata yapma olasılığını minimize et",
+            "🎯 Günde 1 deneme + analiz",
+            "😊 Kendine güveni artır",
+            "⚖️ Stresi yönet, sakin kal",
+            "🔄 Sadece bildiklerini tekrar et"
+        ],
+        'MORAL KORUMA DÖNEM': [
+            "😌 Stres yapmaktan kaçın, sakin kal",
+            "💪 Özgüveni koruyun",
+            "🎯 Bildiğin konuları hızlı tekrar et",
+            "🚫 Yeni konu öğrenmeye çalışma",
+            "💤 Uyku düzenini koru",
+            "🧘 Rahatlama egzersizleri yap",
+            "🎉 Sınav gününe hazır olduğunu hatırla"
+        ]
+    }
+    
+    base_recommendations = recommendations.get(period, recommendations['TEMELCİ DÖNEM'])
+    
+    # Kalan gün sayısına göre özel mesajlar
+    if days_to_yks <= 7:
+        base_recommendations.append(f"⚡ Sadece {days_to_yks} gün kaldı! Son kontrollerini yap.")
+    elif days_to_yks <= 30:
+        base_recommendations.append(f"🔥 {days_to_yks} gün kaldı! Yoğun tempo devam!")
+    elif days_to_yks <= 90:
+        base_recommendations.append(f"💪 {days_to_yks} gün kaldı! Deneme döneminde son sürat!")
+    
+    return base_recommendations
+
+def get_focus_areas_by_period(time_strategy, user_data):
+    """🎯 Dönem bazlı odaklanma alanları"""
+    
+    period = time_strategy['period_name']
+    
+    focus_areas = {
+        'TEMELCİ DÖNEM': {
+            'primary': ['Temel Matematik', 'Türkçe Okuma Anlama', 'Fen Bilimleri Temeli'],
+            'secondary': ['Sosyal Bilimler', 'Geometri Temelleri'],
+            'avoid': ['İleri AYT Konuları', 'Çok Detaylı Konular']
+        },
+        'KONSOLDASYON DÖNEM': {
+            'primary': ['Tüm TYT Alanları', 'Temel AYT Geçişi', 'Konu Bağlantıları'],
+            'secondary': ['Deneme Teknikleri', 'Hız Geliştirme'],
+            'avoid': ['Çok Gelişmiş Konular', 'Yoğun Deneme']
+        },
+        'EKSİK KAPATMA DÖNEM': {
+            'primary': ['Zayıf Dersler', 'Düşük Net Alanları', 'Kritik Konular'],
+            'secondary': ['Orta Seviye Konular', 'Pekiştirme'],
+            'avoid': ['Güçlü Alanlar', 'Yeni Konular']
+        },
+        'YOĞUN DENEMECİ DÖNEM': {
+            'primary': ['Deneme Stratejileri', 'Zaman Yönetimi', 'Hızlı Çözüm'],
+            'secondary': ['Net Optimizasyonu', 'Soru Tipleri'],
+            'avoid': ['Yeni Konu Öğrenme', 'Temel Tekrarlar']
+        },
+        'DENEME VE ANALİZ DÖNEM': {
+            'primary': ['Deneme Analizi', 'Net Artırma', 'Hata Minimizasyonu'],
+            'secondary': ['Stratejik Konular', 'Hızlı Eksik Kapatma'],
+            'avoid': ['Kapsamlı Yeni Öğrenme', 'Temel Seviye']
+        },
+        'SON SPRİNT DÖNEM': {
+            'primary': ['Güçlü Konular', 'Özgüven Artırma', 'Hızlı Tekrar'],
+            'secondary': ['Sınav Stratejisi', 'Stres Yönetimi'],
+            'avoid': ['Zor Yeni Konular', 'Uzun Çalışma Seansları']
+        },
+        'MORAL KORUMA DÖNEM': {
+            'primary': ['Mental Hazırlık', 'Özgüven', 'Rahatlama'],
+            'secondary': ['Hızlı Tekrarlar', 'Pozitif Düşünce'],
+            'avoid': ['Stresli Çalışma', 'Yeni Konular', 'Çok Analiz']
+        }
+    }
+    
+    return focus_areas.get(period, focus_areas['TEMELCİ DÖNEM'])
+
+
+
+def get_subjects_by_field_yks(field):
+    """Alan bazında dersleri döndürür"""
+    if field == "Sayısal":
+        return ["TYT Matematik", "TYT Geometri", "TYT Fizik", "TYT Kimya", "TYT Biyoloji", "TYT Din Kültürü", "TYT Felsefe",
+                "TYT Tarih (isteğe bağlı)", "TYT Coğrafya (isteğe bağlı)",  # İsteğe bağlı
+                "AYT Matematik", "AYT Fizik", "AYT Kimya", "AYT Biyoloji"]
+    elif field == "Sözel":
+        return ["TYT Türkçe", "TYT Tarih", "TYT Coğrafya", "TYT Felsefe", "TYT Din Kültürü",
+                "AYT Edebiyat", "AYT Tarih", "AYT Coğrafya"]
+    elif field == "Eşit Ağırlık":
+        return ["TYT Matematik", "TYT Geometri", "TYT Türkçe", "TYT Tarih", "TYT Coğrafya", "TYT Din Kültürü", "TYT Felsefe",
+                "TYT Fizik (isteğe bağlı)", "TYT Kimya (isteğe bağlı)", "TYT Biyoloji (isteğe bağlı)",  # İsteğe bağlı
+                "AYT Matematik", "AYT Edebiyat", "AYT Tarih", "AYT Coğrafya"]
+
+    else:
+        return list(YKS_TOPICS.keys())
+
+# === 🧮 VEKTÖREL ÖNCELİK PUANLAMA ===
+# Deneme kayıtları ve topic_progress plan başına bir kez ayrıştırılır. Ders ve konu öncelikleri
+# aday başına özellik satırlarından (net, deneme zayıflığı, anket, dönem boost'u) dizi
+# aritmetiğiyle hesaplanır; seçim kısmi sıralama ile yapılır.
+PRIORITY_LEVELS = ("HIGH", "MEDIUM", "NORMAL", "LOW", "MINIMAL")
+PRIORITY_NET_THRESHOLDS = (5, 8, 14, 18)        # get_priority_by_net_level sınırları
+SUBJECT_PRIORITY_SCORES = (85, 70, 50, 30, 15)  # get_subject_priority_score_by_net puanları
+
+def _exam_net_ratio(deneme, subject):
+    """Denemedeki ders net oranı (net/total); kayıt yoksa None"""
+    ders_netleri = deneme.get('ders_netleri')
+    if not isinstance(ders_netleri, dict) or subject not in ders_netleri:
+        return None
+    net_info = ders_netleri[subject]
+    if not (isinstance(net_info, dict) and 'net' in net_info and 'total' in net_info):
+        return None
+    try:
+        return net_info['net'] / net_info['total'] if net_info['total'] > 0 else 0
+    except (TypeError, ZeroDivisionError):
+        return None
+
+def _net_levels(nets):
+    """Net değerlerini PRIORITY_LEVELS indekslerine çevirir (<=5 HIGH ... >18 MINIMAL)"""
+    if NUMPY_AVAILABLE:
+        return np.searchsorted(PRIORITY_NET_THRESHOLDS, np.asarray(nets, dtype=float), side='left')
+    return [bisect.bisect_left(PRIORITY_NET_THRESHOLDS, net) for net in nets]
+
+def select_top_indices(scores, k=None):
+    """Puana göre azalan, eşitlikte orijinal sırayı koruyan ilk k indeks
+    
+    Tam sıralama yerine k. büyük değere göre bölme (np.partition) yapılır; sonuç
+    sorted(..., reverse=True)[:k] ile aynıdır.
+    """
+    n = len(scores)
+    if not NUMPY_AVAILABLE:
+        order = sorted(range(n), key=lambda i: -scores[i])
+        return order if k is None else order[:k]
+    
+    scores = np.asarray(scores, dtype=float)
+    if k is None or k >= n:
+        return np.argsort(-scores, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=int)
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:k - len(above)]
+    chosen = np.concatenate([above, ties])
+    return chosen[np.argsort(-scores[chosen], kind='stable')]
+
+class PlanScorer:
+    """Plan üretimi boyunca paylaşılan öncelik puanlayıcı - kullanıcı verisi bir kez ayrıştırılır"""
+    
+    def __init__(self, user_data, survey_data=None, time_strategy=None):
+        self.user_data = user_data
+        self.survey_data = survey_data or {}
+        self.period = time_strategy['period_name'] if time_strategy else None
+        self.topic_progress = load_topic_progress(user_data)
+        self.exam_records = get_exam_store(user_data).records
+        self.recent_exams = self.exam_records[-3:]
+        self._topic_weak = {}
+        self._subject_weak = {}
+        self._performance = {}
+        self._weak_subjects = None
+        self._strong_subjects = None
+    
+    # --- Deneme özellikleri (ders başına bir kez) ---
+    def topic_weak(self, subject):
+        """Son 3 denemede ders %50'nin altında ya da tavsiyelerde zayıf olarak geçiyor mu"""
+        if subject not in self._topic_weak:
+            weak = False
+            for deneme in self.recent_exams:
+                if not isinstance(deneme, dict):
+                    continue
+                ratio = _exam_net_ratio(deneme, subject)
+                if ratio is not None and ratio < 0.5:
+                    weak = True
+                    break
+                if any(subject in tavsiye and any(word in tavsiye.lower() for word in ['zayıf', 'tekrar', 'çalış', 'boşluk'])
+                       for tavsiye in deneme.get('tavsiyeler', []) if isinstance(tavsiye, str)):
+                    weak = True
+                    break
+            self._topic_weak[subject] = weak
+        return self._topic_weak[subject]
+    
+    def subject_weak(self, subject):
+        """Son 3 denemenin en az 2'sinde ders %60'ın altında mı"""
+        if subject not in self._subject_weak:
+            ratios = [_exam_net_ratio(deneme, subject) for deneme in self.recent_exams if isinstance(deneme, dict)]
+            self._subject_weak[subject] = sum(1 for ratio in ratios if ratio is not None and ratio < 0.6) >= 2
+        return self._subject_weak[subject]
+    
+    def user_performance(self, subject):
+        """Dersteki performans (0-100) - bkz. calculate_user_subject_performance"""
+        if subject not in self._performance:
+            self._performance[subject] = calculate_user_subject_performance(
+                subject, self.user_data, self.exam_records, self.topic_progress)
+        return self._performance[subject]
+    
+    @property
+    def weak_subjects(self):
+        if self._weak_subjects is None:
+            self._weak_subjects = get_weak_subjects_from_exams(self.user_data)
+        return self._weak_subjects
+    
+    @property
+    def strong_subjects(self):
+        if self._strong_subjects is None:
+            self._strong_subjects = get_strong_subjects_from_performance(self.user_data)
+        return self._strong_subjects
+    
+    # --- Ders öncelikleri ---
+    def subject_base_scores(self, subjects):
+        """Özellik sütunları: ortalama net, deneme zayıflığı, anket (zor/sevilen/sevilmeyen)"""
+        avg_nets = [calculate_subject_average_net(subject, self.topic_progress) for subject in subjects]
+        weak = [self.subject_weak(subject) for subject in subjects]
+        difficult = [subject in self.survey_data.get('difficult_subjects', []) for subject in subjects]
+        favorite = [subject in self.survey_data.get('favorite_subjects', []) for subject in subjects]
+        disliked = [subject in self.survey_data.get('disliked_subjects', []) for subject in subjects]
+        
+        if NUMPY_AVAILABLE:
+            base = np.asarray(SUBJECT_PRIORITY_SCORES)[np.searchsorted(PRIORITY_NET_THRESHOLDS, avg_nets, side='left')]
+            scores = (base + 20 * np.asarray(weak) + 10 * np.asarray(difficult)
+                      + 15 * np.asarray(favorite) - 5 * np.asarray(disliked))
+            return np.minimum(100, scores)
+        return [min(100, SUBJECT_PRIORITY_SCORES[bisect.bisect_left(PRIORITY_NET_THRESHOLDS, avg)]
+                    + 20 * w + 10 * d + 15 * f - 5 * dl)
+                for avg, w, d, f, dl in zip(avg_nets, weak, difficult, favorite, disliked)]
+    
+    def subject_scores(self, subjects):
+        """Final ders öncelikleri = temel puan + dönem boost'u"""
+        base = self.subject_base_scores(subjects)
+        boosts = get_period_priority_boosts(self.period, subjects, [self.user_performance(subject) for subject in subjects])
+        if NUMPY_AVAILABLE:
+            return base + boosts
+        return [score + boost for score, boost in zip(base, boosts)]
+    
+    def rank_subjects(self, subjects):
+        """(ders, puan) listesi - puana göre azalan, eşitlikte orijinal sıra"""
+        scores = self.subject_scores(subjects)
+        return [(subjects[i], float(scores[i])) for i in select_top_indices(scores)]
+    
+    # --- Konu öncelikleri ---
+    def topic_net(self, topic):
+        """Konunun kayıtlı neti - alternatif anahtar formatlarından ilk bulunan"""
+        subject = topic['subject']
+        detail = topic.get('detail', '')
+        main_topic = topic.get('main_topic', '')
+        for key in (f"{subject} | {main_topic} | {topic['topic']} | {detail}",
+                    f"{subject} | {main_topic} | None | {detail}",
+                    f"{subject} | None | None | {detail}",
+                    f"{subject} | {topic['topic']} | None | {detail}"):
+            if key in self.topic_progress:
+                net_value = parse_net_value(self.topic_progress[key], default=None)
+                if net_value is not None:
+                    return net_value
+        return 0
+    
+    def topic_priorities(self, topics):
+        """Konu öncelik seviyeleri: net seviyesi, denemede zayıfsa bir seviye yukarı"""
+        nets = [self.topic_net(topic) for topic in topics]
+        weak = [self.topic_weak(topic['subject']) for topic in topics]
+        levels = _net_levels(nets)
+        if NUMPY_AVAILABLE:
+            levels = np.maximum(levels - np.asarray(weak, dtype=int), 0)
+        else:
+            levels = [max(level - int(w), 0) for level, w in zip(levels, weak)]
+        return [PRIORITY_LEVELS[level] for level in levels]
+    
+    @staticmethod
+    def subject_mask(topics, subjects):
+        """Konunun dersi verilen derslerden birini içeriyor mu (ders başına bir kez bakılır)"""
+        matches = {}
+        mask = []
+        for topic in topics:
+            topic_subject = topic.get('subject', '')
+            if topic_subject not in matches:
+                matches[topic_subject] = any(subject in topic_subject for subject in subjects)
+            mask.append(matches[topic_subject])
+        return mask
+
+def determine_topic_priority_by_performance(topic, user_data):
+    """Konunun öğrenci performansına göre öncelik seviyesini belirler"""
+    return PlanScorer(user_data).topic_priorities([topic])[0]
+
+def get_priority_by_net_level(net_value):
+    """Net değerine göre öncelik seviyesi döndürür"""
+    return PRIORITY_LEVELS[bisect.bisect_left(PRIORITY_NET_THRESHOLDS, net_value)]
+
+def check_topic_weakness_in_exams(topic, user_data):
+    """Deneme analizinde bu konunun zayıf olup olmadığını kontrol eder"""
+    return PlanScorer(user_data).topic_weak(topic['subject'])
+
+def calculate_subject_priority_new(subject, user_data, survey_data):
+    """YENİ SİSTEM: Ders önceliğini konu takip seviyelerine göre hesaplar"""
+    return int(PlanScorer(user_data, survey_data).subject_base_scores([subject])[0])
+
+def get_subject_priority_score_by_net(avg_net):
+    """Ders ortalama netine göre öncelik puanı"""
+    return SUBJECT_PRIORITY_SCORES[bisect.bisect_left(PRIORITY_NET_THRESHOLDS, avg_net)]
+
+def check_subject_weakness_in_exams(subject, user_data):
+    """Deneme analizinde bu dersin zayıf olup olmadığını kontrol eder"""
+    return PlanScorer(user_data).subject_weak(subject)
+
+def calculate_subject_average_net(subject, topic_progress):
+    """Bir dersin ortalama net performansını hesaplar"""
+    ids = TOPIC_CATALOG.subject_ids(subject)
+    if not ids:
+        return 0
+    
+    keys = TOPIC_CATALOG.keys
+    total_net = 0
+    topic_count = 0
+    
+    for topic_id in ids:
+        net_value = parse_net_value(topic_progress.get(keys[topic_id], '0'), default=None)
+        if net_value is not None:
+            total_net += net_value
+            topic_count += 1
+    
+    return total_net / topic_count if topic_count > 0 else 0
+
+def get_sequential_topics(subject, topic_progress, limit=5):
+    """Bir dersten sıralı olarak bir sonraki konuları getirir"""
+    catalog = TOPIC_CATALOG
+    topics = []
+    
+    for topic_id in catalog.subject_ids(subject):
+        topic_key = catalog.keys[topic_id]
+        main_topic = catalog.categories[topic_id] or "Genel"
+        # Üç seviyeli konularda alt kategori, iki seviyelilerde kategori başlığı
+        topic_title = catalog.subcategories[topic_id] or main_topic
+        
+        # Net bilgisi okunamazsa 0 kabul et
+        net_value = parse_net_value(topic_progress.get(topic_key, '0'))
+        if net_value < 14:  # İyi seviyenin altında
+            topics.append({
+                'subject': subject,
+                'main_topic': main_topic,
+                'topic': topic_title,
+                'detail': catalog.topics[topic_id],
+                'key': topic_key,
+                'net': net_value,
+                'order': len(topics)  # Sıralı index
+            })
+            if len(topics) >= limit:
+                return topics
+    
+    return topics
+
+def calculate_spaced_repetition_topics(user_data):
+    """Tekrar edilmesi gereken konuları bilimsel aralıklarla hesaplar"""
+    topic_progress_data = user_data.get('topic_progress', '{}')
+    topic_progress = json.loads(topic_progress_data) if isinstance(topic_progress_data, str) else topic_progress_data
+    completion_dates_data = user_data.get('topic_completion_dates', '{}')
+    completion_dates = json.loads(completion_dates_data) if isinstance(completion_dates_data, str) else completion_dates_data
+    
+    current_date = current_time()
+    review_topics = []
+    
+    for topic_key, net_str in topic_progress.items():
+        try:
+            net_value = int(float(net_str))
+            if net_value >= 14:  # İyi seviye ve üzeri
+                completion_date_str = completion_dates.get(topic_key)
+                if completion_date_str:
+                    completion_date = datetime.fromisoformat(completion_date_str)
+                    days_passed = (current_date - completion_date).days
+                    
+                    # Hangi tekrar aralığında olduğunu bul
+                    review_interval = None
+                    priority = "REPEAT_NORMAL"
+                    
+                    for i, interval in enumerate(SPACED_REPETITION_INTERVALS):
+                        if days_passed >= interval - 1 and days_passed <= interval + 1:
+                            review_interval = interval
+                            # Kritiklik seviyesi
+                            if i == 0:  # 3 gün
+                                priority = "REPEAT_HIGH"
+                            elif i <= 2:  # 7, 14 gün
+                                priority = "REPEAT_MEDIUM"
+                            else:  # 30, 90 gün
+                                priority = "REPEAT_NORMAL"
+                            break
+                    
+                    if review_interval:
+                        # Topic key'den subject ve diğer bilgileri çıkar
+                        parts = topic_key.split(' | ')
+                        if len(parts) >= 4:
+                            review_topics.append({
+                                'subject': parts[0],
+                                'main_topic': parts[1],
+                                'topic': parts[2] if parts[2] != 'None' else parts[1],
+                                'detail': parts[3],
+                                'key': topic_key,
+                                'net': net_value,
+                                'days_passed': days_passed,
+                                'interval': review_interval,
+                                'priority': priority,
+                                'completion_date': completion_date_str
+                            })
+        except:
+            continue
+    
+    # Öncelik sırasına göre sırala
+    priority_order = {"REPEAT_HIGH": 0, "REPEAT_MEDIUM": 1, "REPEAT_NORMAL": 2}
+    review_topics.sort(key=lambda x: (priority_order.get(x['priority'], 3), x['days_passed']))
+    
+    return review_topics
+
+def get_pending_review_topics(user_data):
+    """Tekrar değerlendirmesi bekleyen konuları döndürür - NET DEĞERLERİ DÜZELTİLDİ"""
+    import json
+    from datetime import datetime, timedelta
+    
+    all_topics = []
+    current_date = current_time()
+    net_index = get_topic_net_index(user_data)
+    
+    # 🔥 KAYNAK 1: Kalıcı Öğrenme Sistem (Çalışan)
+    # Sadece tekrar kuyruğunun vadesi gelmiş başı okunur; geçmiş sürüm başına bir kez ayrıştırılır
+    try:
+        repetition_history, _ = load_review_state(user_data)
+        
+        for _, topic_key in get_due_reviews(user_data, current_date):
+            try:
+                history = repetition_history.get(topic_key)
+                if not isinstance(history, dict):
+                    continue
+                    
+                current_stage = history.get('current_stage', 0)
+                
+                try:
+                    # Konu bilgilerini topic_key'den çıkar
+                    parts = topic_key.split(' | ')
+                    if len(parts) >= 4:
+                        subject = parts[0] if parts[0] else 'Bilinmiyor'
+                        topic_name = parts[2] if parts[2] != 'None' else parts[1] if parts[1] else 'Bilinmiyor'
+                        detail = parts[3] if parts[3] else f'{subject} - {topic_name} konusu'
+                        
+                        # 🔥 NET DEĞERİNİ GERÇEK VERİDEN ÇEK
+                        actual_net = get_actual_net_value(subject, topic_name, user_data, net_index)
+                        
+                        all_topics.append({
+                            'key': topic_key,
+                            'subject': subject,
+                            'main_topic': parts[1] if parts[1] else 'Bilinmiyor',
+                            'topic': topic_name,
+                            'detail': detail,
+                            'net': actual_net,  # 🔥 GERÇEK NET DEĞERİ
+                            'difficulty': history.get('difficulty', 'Orta'),
+                            'stage': current_stage,
+                            'stage_name': get_stage_name(current_stage),
+                            'days_since_last': (current_date - datetime.fromisoformat(history.get('initial_date', current_date.strftime('%Y-%m-%d')))).days,
+                            'review_count': len(history.get('reviews', [])),
+                            'source': 'KALİCİ ÖĞRENME'
+                        })
+                except Exception as inner_error:
+                    continue
+            except Exception as outer_error:
+                continue
+    except Exception as e:
+        logger.error("Kalıcı öğrenme verisi çekme hatası: %s", e)
+    
+    # 🔥 KAYNAK 2: Haftalık Plandan Tekrar Konuları
+    try:
+        weekly_plan = user_data.get('weekly_plan', {})
+        review_topics = weekly_plan.get('review_topics', [])
+        
+        for i, topic in enumerate(review_topics):
+            try:
+                subject = topic.get('subject', 'Bilinmiyor')
+                topic_name = topic.get('topic', 'Bilinmiyor')
+                
+                # 🔥 NET DEĞERİNİ GERÇEK VERİDEN ÇEK
+                actual_net = get_actual_net_value(subject, topic_name, user_data, net_index)
+                
+                all_topics.append({
+                    'subject': subject,
+                    'topic': topic_name,
+                    'detail': topic.get('detail', f'{subject} - {topic_name} konusu ile ilgili tekrar çalışması'),
+                    'net': actual_net,  # 🔥 GERÇEK NET DEĞERİ
+                    'difficulty': topic.get('difficulty', 'Orta'),
+                    'source': 'HAFTALIK PLAN',
+                    'stage': 0,  # Haftalık plan konuları için
+                    'stage_name': 'Haftalık Tekrar',
+                    'review_count': 0
+                })
+            except Exception as topic_error:
+                logger.error("Haftalık konu çekme hatası: %s", topic_error)
+                continue
+    except Exception as e:
+        logger.error("Haftalık plan verisi çekme hatası: %s", e)
+    
+    # 🔥 KAYNAK 3: İlerleme Takip Sisteminden Zayıf Konular
+    try:
+        progress_data = user_data.get('progress_tracking', {})
+        if progress_data:
+            for subject_key, subject_data in progress_data.items():
+                if isinstance(subject_data, dict):
+                    for topic_key, topic_data in subject_data.items():
+                        if isinstance(topic_data, dict):
+                            # 🔥 NET DEĞERİNİ GERÇEK VERİDEN ÇEK
+                            actual_net = get_actual_net_value(subject_key, topic_key, user_data, net_index)
+                            
+                            # Sadece zayıf konuları al (net < 10)
+                            if actual_net < 10:  # Zayıf konular
+                                all_topics.append({
+                                    'subject': subject_key,
+                                    'topic': topic_key,
+                                    'detail': f'{subject_key} - {topic_key} konusu (zayıf seviye: {actual_net} net)',
+                                    'net': actual_net,  # 🔥 GERÇEK NET DEĞERİ
+                                    'difficulty': topic_data.get('difficulty', 'Orta'),
+                                    'source': 'ZAYIF KONULAR',
+                                    'stage': 0,
+                                    'stage_name': 'Zayıf Konu Tekrarı',
+                                    'review_count': 0
+                                })
+    except Exception as e:
+        logger.error("İlerleme takip verisi çekme hatası: %s", e)
+    
+    return all_topics
+
+def get_stage_name(stage):
+    """Tekrar aşamasının adını döndürür"""
+    stage_names = {
+        0: "1. Tekrar (3 gün sonra)",
+        1: "2. Tekrar (7 gün sonra)", 
+        2: "3. Tekrar (7 gün sonra)",
+        3: "4. Tekrar (7 gün sonra)",
+        4: "Son Tekrar (7 gün sonra)"
+    }
+    return stage_names.get(stage, "Bilinmeyen Aşama")
+
+def get_weekly_topics_from_topic_tracking(user_data, student_field, survey_data):
+    """🎯 YENİ ZAMANSAL STRATEJİ HAFTALIK PLAN ÜRETİCİSİ - DÖNEM BAZLI DİNAMİK SİSTEM (canlı oturum)"""
+    events = PlanEvents()
+    weekly_plan = compute_weekly_topics(user_data, student_field, survey_data, events,
+                                        include_verbal_math=st.session_state.get('verbal_include_math', False))
+    replay_plan_events(events, user_data.get('username'))
+    return weekly_plan
+
+@traced('planner.weekly_topics')
+def compute_weekly_topics(user_data, student_field, survey_data, events, include_verbal_math=False):
+    """Saf plan motoru: Streamlit çağırmaz, mesajları ve alan güncellemelerini events'e yazar"""
+    
+    # Güncel zaman bilgisi al
+    week_info = get_current_week_info()
+    current_week = week_info['week_number']
+    current_month = week_info['today'].month
+    days_to_yks = week_info['days_to_yks']
+    
+    # 🚀 ZAMANSAL STRATEJİ ALMA - DÖNEMİ BELİRLE
+    time_strategy = dict(get_time_based_strategy(days_to_yks, current_month))
+    deneme_strategy = get_deneme_strategy_by_period(time_strategy)
+    
+    # 🎯 SINIF VE HEDEF BÖLÜM BAZLI STRATEJİ ENTEGRASYONU
+    student_grade = user_data.get('grade', '12. Sınıf')
+    target_department = user_data.get('target', 'Varsayılan')
+    grade_strategy = get_grade_based_strategy(student_grade, target_department)
+    
+    # Zamansal strateji ile sınıf bazlı stratejiyi birleştir
+    time_strategy['weekly_topic_base'] = grade_strategy['weekly_topic_base']
+    time_strategy['grade_multiplier'] = grade_strategy['weekly_topic_multiplier']
+    time_strategy['difficulty_level'] = grade_strategy['difficulty_level']
+    time_strategy['target_nets'] = grade_strategy['target_nets']
+    
+    # Strateji bilgilerini debug için kaydet
+    strategy_info = {
+        'period': time_strategy['period_name'],
+        'focus': time_strategy['focus'],
+        'deneme_freq': time_strategy['deneme_frequency'],
+        'new_topics_limit': time_strategy['new_topics_per_week'],
+        'review_ratio': time_strategy['review_ratio'],
+        'intensity': time_strategy['study_intensity'],
+        'days_to_yks': days_to_yks
+    }
+    
+    # TYT ve AYT ilerlemesini hesapla
+    tyt_progress = calculate_tyt_progress(user_data)
+    tyt_math_topics_completed = count_tyt_math_completed_topics(user_data)
+    
+    # Alan bazında dersleri al
+    available_subjects = get_subjects_by_field_yks(student_field)
+    
+    # AYT başlatma koşullarını kontrol et
+    include_ayt = should_include_ayt(tyt_progress, tyt_math_topics_completed)
+    
+    # 🎯 EŞİT AĞIRLIK ÖZEL PLANı KONTROLÜ
+    if student_field == "Eşit Ağırlık":
+        # Eşit Ağırlık için özel hafta sistemi (1-16 hafta)
+        equal_weight_week = user_data.get('equal_weight_current_week', 1)
+        
+        # Eğer hafta numarası user_data'da yoksa, 1. haftadan başlat
+        if equal_weight_week < 1 or equal_weight_week > 16:
+            equal_weight_week = 1
+        
+        # Eşit Ağırlık için 16 haftalık detay planı kullan
+        completed_topics_list, completed_topic_names = get_completed_topics_from_user_data(user_data)  # 🆕 DÜZELTİLDİ
+        pending_topics = get_user_pending_topics(user_data)  # Bekleyen konuları al
+        
+        equal_weight_topics = get_equal_weight_weekly_topics(equal_weight_week, (completed_topics_list, completed_topic_names), pending_topics, user_data)
+        
+        # 🆕 %80 İLERLEME KONTROLÜ: O haftanın konularında %80 ilerleme varsa otomatik geçiş
+        # O haftanın tamamlanmış konu sayısını hesapla
+        completed_in_week = len([t for t in completed_topics_list if t.get('week') == equal_weight_week and t.get('status') == 'completed'])
+        total_in_week = len([t for t in equal_weight_topics if t.get('week') == equal_weight_week])
+        
+        if total_in_week > 0:  # Bölme hatasını önle
+            week_completion = (completed_in_week / total_in_week) * 100
+            
+            if week_completion >= 80 and equal_weight_week < 16:
+                # %80 veya üstü tamamlanmış, otomatik bir sonraki haftaya geç
+                equal_weight_week += 1
+                user_data['equal_weight_current_week'] = equal_weight_week
+                # Firebase'e kaydet (plan bittikten sonra)
+                events.update_user({'equal_weight_current_week': equal_weight_week})
+                events.notify('success', f"🎉 Tebrikler! {equal_weight_week-1}. haftanın %{week_completion:.1f}'ini tamamladın! Otomatik olarak {equal_weight_week}. haftaya geçildi.")
+                # Yeni hafta konularını al
+                equal_weight_topics = get_equal_weight_weekly_topics(equal_weight_week, (completed_topics_list, completed_topic_names), pending_topics, user_data)
+        
+        # Esnek hedef sistemi uygula
+        current_week_progress = calculate_weekly_progress_percentage(
+            len([t for t in completed_topics_list if t.get('week') == equal_weight_week and t.get('status') == 'completed']),
+            len([t for t in equal_weight_topics if t.get('week') == equal_weight_week])
+        )
+        
+        flexible_recommendation = get_flexible_topic_recommendations(user_data, current_week_progress)
+        
+        # TYT Din ve Felsefe 3. haftadan sonra eklenir
+        if equal_weight_week >= 3:
+            # Din ve Felsefe konularını sistematik olarak ekle
+            din_felsefe_topics = get_weekly_din_felsefe_topics(equal_weight_week)
+            equal_weight_topics.extend(din_felsefe_topics)
+        
+        # Eşit Ağırlık için özel plan döndür
+        return {
+            'new_topics': equal_weight_topics,  # TÜM KONULAR - LİMİT KALDIRILDI
+            'review_topics': get_review_topics_for_equal_weight(user_data),
+            'all_topics': equal_weight_topics,  # TÜM KONULAR - Haftalık hedef konular listesi için
+            'week_target': len(equal_weight_topics),
+            'success_target': 0.8,  # %80 hedef
+            'flexible_recommendation': flexible_recommendation,
+            'time_strategy': time_strategy,
+            'grade_strategy': grade_strategy,
+            'equal_weight_special': True,
+            'current_week': equal_weight_week,  # Eşit ağırlık haftası
+            'total_weeks': 16
+        }
+    
+    # 🎯 SAYISAL ÖZEL PLANı KONTROLÜ  
+    if student_field == "Sayısal":
+        # Sayısal için özel hafta sistemi (1-18 hafta)
+        numerical_week = user_data.get('numerical_current_week', 1)
+        
+        # Eğer hafta numarası user_data'da yoksa, 1. haftadan başlat
+        if numerical_week < 1 or numerical_week > 18:
+            numerical_week = 1
+        
+        # Sayısal için 18 haftalık detay planı kullan
+        completed_topics_list, completed_topic_names = get_completed_topics_from_user_data(user_data)  # 🆕 DÜZELTİLDİ
+        pending_topics = get_user_pending_topics(user_data)  # Bekleyen konuları al
+        
+        numerical_topics = get_numerical_weekly_topics(numerical_week, (completed_topics_list, completed_topic_names), pending_topics, user_data)
+        
+        # 🆕 %80 İLERLEME KONTROLÜ: O haftanın konularında %80 ilerleme varsa otomatik geçiş
+        # O haftanın tamamlanmış konu sayısını hesapla
+        completed_in_week = len([t for t in completed_topics_list if t.get('week') == numerical_week and t.get('status') == 'completed'])
+        total_in_week = len([t for t in numerical_topics if t.get('week') == numerical_week])
+        
+        if total_in_week > 0:  # Bölme hatasını önle
+            week_completion = (completed_in_week / total_in_week) * 100
+            
+            if week_completion >= 80 and numerical_week < 18:
+                # %80 veya üstü tamamlanmış, otomatik bir sonraki haftaya geç
+                numerical_week += 1
+                user_data['numerical_current_week'] = numerical_week
+                # Firebase'e kaydet (plan bittikten sonra)
+                events.update_user({'numerical_current_week': numerical_week})
+                events.notify('success', f"🎉 Tebrikler! {numerical_week-1}. haftanın %{week_completion:.1f}'ini tamamladın! Otomatik olarak {numerical_week}. haftaya geçildi.")
+                # Yeni hafta konularını al
+                numerical_topics = get_numerical_weekly_topics(numerical_week, (completed_topics_list, completed_topic_names), pending_topics, user_data)
+        
+        # Esnek hedef sistemi uygula
+        current_week_progress = calculate_weekly_progress_percentage(
+            len([t for t in completed_topics_list if t.get('week') == numerical_week and t.get('status') == 'completed']),
+            len([t for t in numerical_topics if t.get('week') == numerical_week])
+        )
+        
+        flexible_recommendation = get_flexible_topic_recommendations(user_data, current_week_progress)
+        
+        # Sayısal için özel plan döndür
+        return {
+            'new_topics': numerical_topics,  # TÜM KONULAR - LİMİT KALDIRILDI
+            'review_topics': get_review_topics_for_equal_weight(user_data),  # Şimdilik aynı review sistemi
+            'all_topics': numerical_topics,  # TÜM KONULAR - Haftalık hedef konular listesi için
+            'week_target': len(numerical_topics),
+            'success_target': 0.8,  # %80 hedef
+            'flexible_recommendation': flexible_recommendation,
+            'time_strategy': time_strategy,
+            'grade_strategy': grade_strategy,
+            'numerical_special': True,
+            'current_week': numerical_week,  # Sayısal haftası
+            'total_weeks': 18
+        }
+    
+    # 🎯 TYT & MSÜ ÖZEL PLANI KONTROLÜ
+    if student_field == "TYT & MSÜ":
+        # TYT & MSÜ için özel hafta sistemi (1-9 hafta)
+        tyt_msu_week = user_data.get('tyt_msu_current_week', 1)
+        
+        # Eğer hafta numarası user_data'da yoksa, 1. haftadan başlat
+        if tyt_msu_week < 1 or tyt_msu_week > 9:
+            tyt_msu_week = 1
+        
+        # TYT & MSÜ için 9 haftalık detay planı kullan
+        completed_topics_list, completed_topic_names = get_completed_topics_from_user_data(user_data)  # 🆕 DÜZELTİLDİ
+        pending_topics = get_user_pending_topics(user_data)  # Bekleyen konuları al
+        
+        tyt_msu_topics = get_tyt_msu_weekly_topics(tyt_msu_week, (completed_topics_list, completed_topic_names), pending_topics, user_data)
+        
+        # 🆕 %80 İLERLEME KONTROLÜ: O haftanın konularında %80 ilerleme varsa otomatik geçiş
+        # O haftanın tamamlanmış konu sayısını hesapla
+        completed_in_week = len([t for t in completed_topics_list if t.get('week') == tyt_msu_week and t.get('status') == 'completed'])
+        total_in_week = len([t for t in tyt_msu_topics if t.get('week') == tyt_msu_week])
+        
+        if total_in_week > 0:  # Bölme hatasını önle
+            week_completion = (completed_in_week / total_in_week) * 100
+            
+            if week_completion >= 80 and tyt_msu_week < 9:
+                # %80 veya üstü tamamlanmış, otomatik bir sonraki haftaya geç
+                tyt_msu_week += 1
+                user_data['tyt_msu_current_week'] = tyt_msu_week
+                # Firebase'e kaydet (plan bittikten sonra)
+                events.update_user({'tyt_msu_current_week': tyt_msu_week})
+                events.notify('success', f"🎉 Tebrikler! {tyt_msu_week-1}. haftanın %{week_completion:.1f}'ini tamamladın! Otomatik olarak {tyt_msu_week}. haftaya geçildi.")
+                # Yeni hafta konularını al
+                tyt_msu_topics = get_tyt_msu_weekly_topics(tyt_msu_week, (completed_topics_list, completed_topic_names), pending_topics, user_data)
+        
+        # Esnek hedef sistemi uygula
+        current_week_progress = calculate_weekly_progress_percentage(
+            len([t for t in completed_topics_list if t.get('week') == tyt_msu_week and t.get('status') == 'completed']),
+            len([t for t in tyt_msu_topics if t.get('week') == tyt_msu_week])
+        )
+        
+        flexible_recommendation = get_flexible_topic_recommendations(user_data, current_week_progress)
+        
+        # TYT & MSÜ için özel plan döndür
+        return {
+            'new_topics': tyt_msu_topics,  # TÜM KONULAR - LİMİT KALDIRILDI
+            'review_topics': get_review_topics_for_equal_weight(user_data),  # Şimdilik aynı review sistemi
+            'all_topics': tyt_msu_topics,  # TÜM KONULAR - Haftalık hedef konular listesi için
+            'week_target': len(tyt_msu_topics),
+            'success_target': 0.8,  # %80 hedef
+            'flexible_recommendation': flexible_recommendation,
+            'time_strategy': time_strategy,
+            'grade_strategy': grade_strategy,
+            'tyt_msu_special': True,
+            'current_week': tyt_msu_week,  # TYT & MSÜ haftası
+            'total_weeks': 9
+        }
+    
+    # 🎯 SÖZEL ÖZEL PLANI KONTROLÜ
+    if student_field == "Sözel":
+        # Sözel için özel hafta sistemi (1-14 hafta)
+        verbal_week = user_data.get('verbal_current_week', 1)
+        
+        # Eğer hafta numarası user_data'da yoksa, 1. haftadan başlat
+        if verbal_week < 1 or verbal_week > 14:
+            verbal_week = 1
+        
+        # Sözel için 14 haftalık detay planı kullan
+        completed_topics_list, completed_topic_names = get_completed_topics_from_user_data(user_data)  # 🆕 DÜZELTİLDİ
+        pending_topics = get_user_pending_topics(user_data)  # Bekleyen konuları al
+        
+        verbal_topics = get_verbal_weekly_topics(verbal_week, (completed_topics_list, completed_topic_names), pending_topics, user_data)
+        
+        # 🆕 %80 İLERLEME KONTROLÜ: O haftanın konularında %80 ilerleme varsa otomatik geçiş
+        # O haftanın tamamlanmış konu sayısını hesapla
+        completed_in_week = len([t for t in completed_topics_list if t.get('week') == verbal_week and t.get('status') == 'completed'])
+        total_in_week = len([t for t in verbal_topics if t.get('week') == verbal_week])
+        
+        if total_in_week > 0:  # Bölme hatasını önle
+            week_completion = (completed_in_week / total_in_week) * 100
+            
+            if week_completion >= 80 and verbal_week < 14:
+                # %80 veya üstü tamamlanmış, otomatik bir sonraki haftaya geç
+                verbal_week += 1
+                user_data['verbal_current_week'] = verbal_week
+                # Firebase'e kaydet (plan bittikten sonra)
+                events.update_user({'verbal_current_week': verbal_week})
+                events.notify('success', f"🎉 Tebrikler! {verbal_week-1}. haftanın %{week_completion:.1f}'ini tamamladın! Otomatik olarak {verbal_week}. haftaya geçildi.")
+                # Yeni hafta konularını al
+                verbal_topics = get_verbal_weekly_topics(verbal_week, (completed_topics_list, completed_topic_names), pending_topics, user_data)
+        
+        # TYT Matematik seçeneğini kontrol et
+        if not include_verbal_math:
+            # Matematik konularını filtrele
+            verbal_topics = [topic for topic in verbal_topics 
+                           if not (topic.get('subject', '') == 'TYT Matematik')]
+        
+        # Esnek hedef sistemi uygula
+        current_week_progress = calculate_weekly_progress_percentage(
+            len([t for t in completed_topics_list if t.get('week') == verbal_week and t.get('status') == 'completed']),
+            len([t for t in verbal_topics if t.get('week') == verbal_week])
+        )
+        
+        flexible_recommendation = get_flexible_topic_recommendations(user_data, current_week_progress)
+        
+        # Sözel için özel plan döndür
+        return {
+            'new_topics': verbal_topics,  # TÜM KONULAR - LİMİT KALDIRILDI
+            'review_topics': get_review_topics_for_equal_weight(user_data),  # Şimdilik aynı review sistemi
+            'all_topics': verbal_topics,  # TÜM KONULAR - Haftalık hedef konular listesi için
+            'week_target': len(verbal_topics),
+            'success_target': 0.8,  # %80 hedef
+            'flexible_recommendation': flexible_recommendation,
+            'time_strategy': time_strategy,
+            'grade_strategy': grade_strategy,
+            'verbal_special': True,
+            'current_week': verbal_week,  # Sözel haftası
+            'total_weeks': 14
+        }
+    
+    # Konuların TYT/AYT durumuna göre filtrele (diğer alanlar için)
+    filtered_subjects = []
+    for subject in available_subjects:
+        if subject.startswith('AYT'):
+            # Genel AYT koşulunu kontrol et
+            if not include_ayt:
+                # Özel durumları kontrol et (prerequisite sistemi)
+                if should_include_specific_ayt_subject(subject, user_data):
+                    filtered_subjects.append(subject)
+                # Değilse atla
+                continue
+            else:
+                # Genel koşul sağlanmışsa ekle
+                filtered_subjects.append(subject)
+        else:
+            # TYT konusuysa direkt ekle
+            filtered_subjects.append(subject)
+    
+    # 🔧 DEBUG: Hangi dersler filtrelendi
+
+
+
+
+    
+    # 🎯 ZAMANSAL STRATEJİYE GÖRE DERS ÖNCELİKLERİNİ HESAPLA
+    # Temel puan (net seviyesi + deneme + anket) ve dönem boost'u tüm dersler için tek seferde;
+    # deneme kayıtları ve topic_progress plan başına bir kez ayrıştırılır
+    scorer = PlanScorer(user_data, survey_data, time_strategy)
+    
+    # Öncelik sırasına göre sırala
+    sorted_subjects = scorer.rank_subjects(filtered_subjects)
+    
+    # Haftalık plan oluştur
+    weekly_new_topics = []
+    weekly_review_topics = []
+    
+    # 1. 🎯 ZAMANSAL STRATEJİYE GÖRE KONU DAĞILIMI
+    for subject, priority_score in sorted_subjects:
+        
+        # Ders önem puanını al
+        importance = SUBJECT_IMPORTANCE_SCORES.get(subject, 5)
+
+        
+        # 🚀 ZAMANSAL STRATEJİYE GÖRE DİNAMİK HAFTALIK LİMİT HESAPLA
+        weekly_limit = calculate_dynamic_topic_limits(time_strategy, importance)
+        
+        # 📅 DÖNEM BAZLI DERS FİLTRELEME (Eski statik sistemin yerine)
+        should_include_subject = should_include_subject_in_period(
+            subject, importance, time_strategy, user_data, week_info, scorer
+        )
+
+        
+        
+        if not should_include_subject:
+            continue
+        
+        # Sıralı konuları al
+        sequential_topics = get_sequential_topics(subject, 
+            json.loads(user_data.get('topic_progress', '{}') or '{}'), 
+            limit=weekly_limit)
+        
+        # YENİ SİSTEM: Her konunun bireysel önceliğini performansa göre belirle
+        for topic, priority in zip(sequential_topics, scorer.topic_priorities(sequential_topics)):
+            topic['priority'] = priority
+        
+        weekly_new_topics.extend(sequential_topics)
+    
+    # 2. 🔄 ZAMANSAL STRATEJİYE GÖRE TEKRAR KONULARI
+    all_review_topics = calculate_spaced_repetition_topics(user_data)
+    
+    # 🎯 DÖNEM BAZLI TEKRAR KONUSU LİMİTİ
+    max_review_topics = calculate_review_topics_limit_by_period(time_strategy)
+    
+    # 📊 STRATEJİYE GÖRE TEKRAR KONULARİNİ FİLTRELE VE SIRALA
+    filtered_review_topics = filter_review_topics_by_strategy(
+        all_review_topics, time_strategy, user_data, limit=max_review_topics, scorer=scorer
+    )
+    
+    weekly_review_topics = filtered_review_topics[:max_review_topics]
+    
+    # 4. TÜM KONULARI HESAPLA (Pomodoro Timer için)
+    all_available_topics = []
+    
+    # Konu takipten tüm konuları al
+    topic_progress_data = user_data.get('topic_progress', '{}')
+    topic_progress = json.loads(topic_progress_data) if isinstance(topic_progress_data, str) else topic_progress_data
+    
+    for subject in filtered_subjects[:10]:  # Max 10 ders
+        try:
+            sequential_topics = get_sequential_topics(subject, 
+                                                    user_data.get('grade', '12'), 
+                                                    topic_progress,
+                                                    user_data.get('field', ''))
+            
+            # İlk 20 konuyu al
+            for topic in sequential_topics[:20]:
+                if topic not in [t.get('topic') for t in weekly_new_topics + weekly_review_topics]:
+                    all_available_topics.append({
+                        'topic': topic['topic'],
+                        'subject': subject,
+                        'detail': topic.get('detail', topic['topic']),
+                        'net': topic.get('net', 0),
+                        'priority': topic.get('priority', 'NORMAL'),
+                        'reason': 'Konu takip sistemi'
+                    })
+        except Exception as e:
+            continue
+    
+    # 5. 🎯 ZAMANSAL STRATEJİ İLE TOPLAM PLAN
+
+    
+    total_plan = {
+        'new_topics': weekly_new_topics[:time_strategy['new_topics_per_week']],  # Strateji bazlı limit
+        'review_topics': weekly_review_topics,
+        'all_topics': all_available_topics[:25],  # Max 25 tüm konu (Pomodoro için)
+        'week_target': len(weekly_new_topics[:time_strategy['new_topics_per_week']]) + len(weekly_review_topics),
+        'success_target': 0.8,  # %80 başarı hedefi
+        'projections': calculate_completion_projections(user_data, student_field, days_to_yks),
+        'tyt_progress': tyt_progress,
+        'ayt_enabled': include_ayt,
+        'tyt_math_completed': tyt_math_topics_completed,
+        
+        # 🚀 ZAMANSAL STRATEJİ BİLGİLERİ
+        'time_strategy': time_strategy,
+        'deneme_strategy': deneme_strategy,
+        'strategy_info': strategy_info,
+        'period_recommendations': get_period_specific_recommendations(time_strategy, user_data),
+        'focus_areas': get_focus_areas_by_period(time_strategy, user_data)
+    }
+    
+
+    if total_plan['new_topics']:
+        events.notify('info', "📋 Final new_topics listesi:")
+        for i, topic in enumerate(total_plan['new_topics'][:5]):
+            events.notify('info', f"  {i+1}. {topic.get('subject', 'N/A')} - {topic.get('topic', 'N/A')} - Net: {topic.get('net', 'N/A')}")
+    else:
+        events.notify('info', "❌ Hiç new_topics bulunamadı!")
+    
+    return total_plan
+
+def calculate_tyt_progress(user_data):
+    """TYT ilerlemesini yüzde olarak hesaplar"""
+    totals, completed = get_subject_completion(user_data, 14)  # İyi seviye
+    
+    tyt_total = 0
+    tyt_completed = 0
+    
+    # Sadece TYT dersleri
+    for code, subject in enumerate(TOPIC_CATALOG.subject_names):
+        if subject.startswith('TYT'):
+            tyt_total += int(totals[code])
+            tyt_completed += int(completed[code])
+    
+    if tyt_total > 0:
+        return (tyt_completed / tyt_total) * 100
+    return 0
+
+def count_tyt_math_completed_topics(user_data):
+    """TYT Matematik'te tamamlanan konu sayısını hesaplar"""
+    code = TOPIC_CATALOG.subject_code.get("TYT Matematik")
+    if code is None:
+        return 0
+    
+    # İyi seviye: 14+ net
+    _, completed = get_subject_completion(user_data, 14)
+    return int(completed[code])
+
+def should_include_ayt(tyt_progress, tyt_math_completed):
+    """AYT konularının dahil edilip edilmeyeceğini belirler"""
+    # Koşul 1: TYT'nin %60'ı tamamlanmış olmalı
+    condition1 = tyt_progress >= 60.0
+    
+    # Koşul 2: TYT Matematik'te en az 12 konu tamamlanmış olmalı  
+    condition2 = tyt_math_completed >= 12
+    
+    # Her iki koşul da sağlanmalı
+    return condition1 and condition2
+
+def should_include_specific_ayt_subject(ayt_subject, user_data):
+    """Belirli bir AYT dersinin dahil edilip edilmeyeceğini kontrol eder (prerequisite sistemi)"""
+    
+    # TYT-AYT devamı olan konular
+    PREREQUISITE_MAPPING = {
+        "AYT Matematik": {
+            "prerequisite_subject": "TYT Matematik", 
+            "required_topics": ["Temel Kavramlar", "Temel İşlemler"],  # İlk 2 kategorideki konular
+            "min_completed": 8  # En az 8 konu tamamlanmış olmalı
+        },
+        "AYT Fizik": {
+            "prerequisite_subject": "TYT Fizik",
+            "required_topics": ["Kuvvet ve Hareket"],  # Temel fizik
+            "min_completed": 4
+        },
+        "AYT Biyoloji": {
+            "prerequisite_subject": "TYT Biyoloji", 
+            "required_topics": ["Canlıların Temel Bileşenleri"],  # Temel biyoloji
+            "min_completed": 3
+        },
+        "AYT Kimya": {
+            "prerequisite_subject": "TYT Kimya",
+            "required_topics": ["Atom ve Periyodik Sistem"],  # Temel kimya
+            "min_completed": 3
+        }
+    }
+    
+    if ayt_subject not in PREREQUISITE_MAPPING:
+        return False  # Tanımlı değilse genel kuralı uygula
+    
+    prereq = PREREQUISITE_MAPPING[ayt_subject]
+    tyt_subject = prereq["prerequisite_subject"]
+    
+    # TYT konusunun tamamlanan konularını say
+    completed_count = count_completed_topics_in_categories(
+        user_data, tyt_subject, prereq["required_topics"]
+    )
+    
+    return completed_count >= prereq["min_completed"]
+
+def count_completed_topics_in_categories(user_data, subject, categories):
+    """Belirli kategorilerdeki tamamlanan konu sayısını hesaplar"""
+    topic_progress_data = user_data.get('topic_progress', '{}')
+    topic_progress = json.loads(topic_progress_data) if isinstance(topic_progress_data, str) else topic_progress_data
+    
+    completed_count = 0
+    # Sadece istenen kategorileri say - temel seviye (10+ net) yeterli
+    for category in dict.fromkeys(categories):
+        completed_count += count_topics_with_min_net(topic_progress, TOPIC_CATALOG.category_ids(subject, category), 10)
+    
+    return completed_count
+
+@rerun_cached(per_user=True)
+@traced('planner.completion_projections')
+def calculate_completion_projections(user_data, student_field, days_to_yks):
+    """Uzun vadeli tamamlanma tahminleri - DİNAMİK YKS TARİHİ İLE"""
+    available_subjects = get_subjects_by_field_yks(student_field)
+    
+    projections = {
+        'overall_progress': 0,
+        'tyt_progress': 0,
+        'ayt_progress': 0,
+        'estimated_completion': None,
+        'monthly_targets': [],
+        'weekly_average': 0
+    }
+    
+    total_topics = 0
+    completed_topics = 0
+    tyt_total = 0
+    tyt_completed = 0
+    ayt_total = 0
+    ayt_completed = 0
+    
+    # Her dersin ilerlemesini hesapla - ders bazında tek geçişte
+    subject_totals, subject_completed_counts = get_subject_completion(user_data, 14)
+    for subject in available_subjects:
+        code = TOPIC_CATALOG.subject_code.get(subject)
+        if code is None:
+            continue
+        
+        subject_total = int(subject_totals[code])
+        subject_completed = int(subject_completed_counts[code])
+        
+        total_topics += subject_total
+        completed_topics += subject_completed
+        
+        # TYT/AYT ayrımı
+        if subject.startswith('TYT'):
+            tyt_total += subject_total
+            tyt_completed += subject_completed
+        elif subject.startswith('AYT'):
+            ayt_total += subject_total
+            ayt_completed += subject_completed
+    
+    # İlerleme yüzdelerini hesapla
+    if total_topics > 0:
+        projections['overall_progress'] = (completed_topics / total_topics) * 100
+    if tyt_total > 0:
+        projections['tyt_progress'] = (tyt_completed / tyt_total) * 100
+    if ayt_total > 0:
+        projections['ayt_progress'] = (ayt_completed / ayt_total) * 100
+    
+    # Haftalık ortalama hesapla (son 4 hafta simülasyonu)
+    weekly_avg = 12  # Varsayılan haftalık tamamlama
+    projections['weekly_average'] = weekly_avg
+    
+    # Tahmini bitiş tarihi
+    remaining_topics = total_topics - completed_topics
+    if remaining_topics > 0 and weekly_avg > 0:
+        weeks_needed = remaining_topics / (weekly_avg * 0.8)  # %80 başarı faktörü
+        completion_date = current_time() + timedelta(weeks=weeks_needed)
+        projections['estimated_completion'] = completion_date.strftime("%d %B %Y")
+    
+    return projections
+
+# ===== YENİ: DİNAMİK HAFTALIK PLAN SİSTEMİ =====
+
+@rerun_cached(per_user=True)
+def get_user_dynamic_week_info(user_data):
+    """🔁 Kullanıcı kayıt tarihinden itibaren dinamik hafta ve gün bilgisini hesaplar"""
+    from datetime import datetime, timedelta
+    import json
+    
+    try:
+        # Kullanıcının kayıt tarihini al
+        registration_date = None
+        
+        # Önce created_at alanını kontrol et (ISO format)
+        if 'created_at' in user_data and user_data['created_at']:
+            try:
+                # ISO format: 2025-10-18T05:55:30 veya 2025-10-18T05:55:30.123456
+                date_str = user_data['created_at'].split('T')[0]  # Sadece tarih kısmını al
+                registration_date = datetime.strptime(date_str, '%Y-%m-%d')
+            except:
+                pass
+        
+        # Eğer created_at yoksa created_date kontrol et (eski format)
+        if not registration_date and 'created_date' in user_data and user_data['created_date']:
+            try:
+                if len(user_data['created_date']) > 10:  # Saat bilgisi de varsa
+                    date_str = user_data['created_date'][:10]  # Sadece tarih kısmını al
+                else:
+                    date_str = user_data['created_date']
+                registration_date = datetime.strptime(date_str, '%Y-%m-%d')
+            except:
+                pass
+        
+        # Eğer hiçbir tarih bulunamazsa bugünü kayıt tarihi olarak kabul et
+        if not registration_date:
+            registration_date = current_time().replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        # Bugünün tarihini al
+        today = current_time().replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        # Kayıt tarihinden bu yana geçen gün sayısı
+        days_since_registration = (today - registration_date).days
+        
+        # 7 günlük döngülerde hangi hafta ve gün
+        current_week = (days_since_registration // 7) + 1  # 1. hafta, 2. hafta...
+        current_day_in_week = (days_since_registration % 7) + 1  # Haftanın 1-7. günü
+        
+        # 🔥 TAMAMEN YENİ FİX: Hafta başlangıcını BUGÜNDEN geriye hesapla (gerçek takvim!)
+        week_start_date = today - timedelta(days=current_day_in_week - 1)
+        week_end_date = week_start_date + timedelta(days=6)
+        
+        # Bu haftada kalan gün sayısı
+        days_left_in_week = 7 - current_day_in_week + 1
+        
+        # Türkçe gün çevirisi
+        day_translation = {
+            'Monday': 'Pazartesi', 'Tuesday': 'Salı', 'Wednesday': 'Çarşamba',
+            'Thursday': 'Perşembe', 'Friday': 'Cuma', 'Saturday': 'Cumartesi', 'Sunday': 'Pazar'
+        }
+        
+        # 🔥 FİX: Her gün için GERÇEK takvim gününü hesapla (kayıt tarihinden itibaren)
+        turkish_weekdays = []
+        for day_offset in range(7):
+            # Bu hafta döngüsündeki günün gerçek tarihini hesapla
+            actual_date = week_start_date + timedelta(days=day_offset)
+            day_name_english = actual_date.strftime('%A')
+            day_name_turkish = day_translation.get(day_name_english, day_name_english)
+            turkish_weekdays.append(day_name_turkish)
+        
+        # Bugünün gerçek gün ismini al
+        current_day_name = today.strftime('%A')
+        current_day_name = day_translation.get(current_day_name, current_day_name)
+        
+        return {
+            'registration_date': registration_date,
+            'current_week': current_week,
+            'current_day_in_week': current_day_in_week,
+            'current_day_name': current_day_name,
+            'days_left_in_week': days_left_in_week,
+            'week_start_date': week_start_date,
+            'week_end_date': week_end_date,
+            'days_since_registration': days_since_registration,
+            'weekday_cycle': turkish_weekdays,
+            'total_weeks_completed': current_week - 1 if current_day_in_week == 1 and days_since_registration > 0 else current_week - 1
+        }
+        
+    except Exception as e:
+        # Hata durumunda varsayılan değerler
+        today = current_time()
+        return {
+            'registration_date': today,
+            'current_week': 1,
+            'current_day_in_week': 1,
+            'current_day_name': 'Pazartesi',
+            'days_left_in_week': 7,
+            'week_start_date': today,
+            'week_end_date': today + timedelta(days=6),
+            'days_since_registration': 0,
+            'weekday_cycle': ['Pazartesi', 'Salı', 'Çarşamba', 'Perşembe', 'Cuma', 'Cumartesi', 'Pazar'],
+            'total_weeks_completed': 0
+        }
+
+# === 🗓️ HAFTALIK PLAN CACHE ===
+# Plan (kullanıcı, ISO hafta, plan girdilerinin özeti) ile anahtarlanır. Plan motorunun okuduğu tüm
+# alanlar (TopicNetIndex kaynakları dahil) ve Sözel matematik tercihi özete girer; social_media_daily
+# gibi ilgisiz alanların yazılması planı geçersiz kılmaz. Kalan gün, hafta içi gün ve tekrar vadeleri
+# güne bağlı olduğundan bugünün tarihi de özettedir.
+WEEKLY_PLAN_INPUT_FIELDS = (
+    'field', 'grade', 'target', 'name', 'tyt_avg_net', 'ayt_avg_net',
+    'topic_progress', 'topic_completion_dates', 'topic_repetition_history', 'topic_mastery_status',
+    'progress_tracking', 'topic_tracking', 'topic_evaluations', 'quiz_results', 'pomodoro_history',
+    'deneme_analizleri', 'weekly_plan', 'created_at', 'created_date', 'weekly_plan_start_date',
+    'weekly_program_started',
+    'equal_weight_current_week', 'numerical_current_week', 'verbal_current_week',
+    'tyt_msu_current_week', 'tyt_msu_sub_category',
+)
+WEEKLY_PLAN_CACHE_LIMIT = 256  # Süreç genelinde tutulan plan sayısı
+# Opsiyonel disk kalıcılığı: tanımlıysa planlar bu dizine yazılır, yeni süreçler de okur
+WEEKLY_PLAN_CACHE_DIR = os.environ.get('YKS_WEEKLY_PLAN_CACHE_DIR')
+
+@st.cache_resource
+def get_weekly_plan_store():
+    """Süreç genelinde paylaşılan plan cache'i (LRU) - yeni oturumlar da yararlanır"""
+    return {'lock': threading.Lock(), 'plans': OrderedDict()}
+
+def get_weekly_plan_cache_key(user_data, student_field, survey_data, approved_coached_topics,
+                              include_verbal_math=False):
+    """(kullanıcı, ISO hafta, plan girdileri özeti) anahtarı"""
+    payload = [current_time().date().isoformat(), student_field, survey_data, approved_coached_topics,
+               bool(include_verbal_math)]
+    payload.extend(user_data.get(field) for field in WEEKLY_PLAN_INPUT_FIELDS)
+    digest = hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+    return (user_data.get('username', ''), get_iso_week_id(current_time()), digest)
+
+def _weekly_plan_path(cache_key, cache_dir):
+    username, week_id, digest = cache_key
+    user_hash = hashlib.sha1(username.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{user_hash}-{week_id}-{digest}.pickle"), user_hash
+
+def _read_persisted_plan(cache_key):
+    path, _ = _weekly_plan_path(cache_key, WEEKLY_PLAN_CACHE_DIR)
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+def persist_weekly_plan(cache_key, weekly_plan, cache_dir=None):
+    """Planı diske yazar (atomik) ve kullanıcının eski planlarını temizler"""
+    cache_dir = cache_dir or WEEKLY_PLAN_CACHE_DIR
+    path, user_hash = _weekly_plan_path(cache_key, cache_dir)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(weekly_plan, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        for file_name in os.listdir(cache_dir):
+            if file_name.startswith(f"{user_hash}-") and file_name.endswith('.pickle') \
+                    and os.path.join(cache_dir, file_name) != path:
+                os.remove(os.path.join(cache_dir, file_name))
+    except (OSError, pickle.PicklingError, TypeError) as e:
+        logger.warning("Haftalık plan diske yazılamadı: %s", e)
+
+def get_cached_weekly_plan(cache_key):
+    """Oturum → süreç → disk sırasıyla plan arar; bulunamazsa None"""
+    username = cache_key[0]
+    session_cache = st.session_state.get('weekly_plan_cache', {})
+    entry = session_cache.get(username)
+    if entry is not None and entry[0] == cache_key:
+        return entry[1]
+    
+    store = get_weekly_plan_store()
+    with store['lock']:
+        weekly_plan = store['plans'].get(cache_key)
+        if weekly_plan is not None:
+            store['plans'].move_to_end(cache_key)
+    if weekly_plan is None and WEEKLY_PLAN_CACHE_DIR:
+        weekly_plan = _read_persisted_plan(cache_key)
+        if weekly_plan is not None:
+            with store['lock']:
+                store['plans'][cache_key] = weekly_plan
+    if weekly_plan is None:
+        return None
+    
+    # Paylaşılan kopya değiştirilmesin diye oturuma kendi kopyası verilir
+    weekly_plan = copy.deepcopy(weekly_plan)
+    st.session_state.setdefault('weekly_plan_cache', {})[username] = (cache_key, weekly_plan)
+    return weekly_plan
+
+def store_weekly_plan(cache_key, weekly_plan):
+    """Hesaplanan planı oturuma, süreç cache'ine ve (açıksa) diske yazar"""
+    if not weekly_plan:
+        return
+    st.session_state.setdefault('weekly_plan_cache', {})[cache_key[0]] = (cache_key, weekly_plan)
+    
+    shared_plan = copy.deepcopy(weekly_plan)
+    store = get_weekly_plan_store()
+    with store['lock']:
+        store['plans'][cache_key] = shared_plan
+        store['plans'].move_to_end(cache_key)
+        while len(store['plans']) > WEEKLY_PLAN_CACHE_LIMIT:
+            store['plans'].popitem(last=False)
+    if WEEKLY_PLAN_CACHE_DIR:
+        persist_weekly_plan(cache_key, shared_plan)
+
+def create_dynamic_weekly_plan(user_data, student_field, survey_data):
+    """🔄 Kullanıcının dinamik haftalık planını oluşturur - KOÇ ONAYLARIYLA BİRLİKTE (cache'li)"""
+    try:
+        # Güvenli: user_data kontrolü
+        if not user_data:
+            st.error("❌ Kullanıcı verisi bulunamadı! Lütfen sayfayı yenileyin.")
+            return {}
+        
+        # Haftalık program başlama kaydı - İLK KEZ ÇAĞIRILDIĞINDA KAYDET
+        if not user_data.get('weekly_program_started', False):
+            user_data['weekly_program_started'] = True
+            user_data['weekly_plan_start_date'] = current_time().strftime("%Y-%m-%d")
+            # Firebase'e güncelleyi gönder
+            if 'username' in user_data:
+                update_user_in_firebase(user_data['username'], {
+                    'weekly_program_started': True,
+                    'weekly_plan_start_date': user_data['weekly_plan_start_date']
+                })
+            st.success("🎆 Haftalık program başlatıldı! Gidişat analizi İLK HAFTAN bitince açılacak.")
+        
+        # Koç onayları plan girdisidir; cache anahtarına da girer
+        approved_coached_topics = get_approved_coached_topics(user_data)
+        
+        include_verbal_math = st.session_state.get('verbal_include_math', False)
+        cache_key = get_weekly_plan_cache_key(user_data, student_field, survey_data, approved_coached_topics,
+                                              include_verbal_math)
+        weekly_plan = get_cached_weekly_plan(cache_key)
+        if weekly_plan is None:
+            events = PlanEvents()
+            weekly_plan = build_dynamic_weekly_plan(
+                user_data, student_field, survey_data, approved_coached_topics, events,
+                include_verbal_math=include_verbal_math)
+            store_weekly_plan(cache_key, weekly_plan)
+            if events.user_updates:
+                # Motor hafta ilerlettiyse sonraki rerun'lar güncel alanlarla aynı planı bulsun
+                store_weekly_plan(get_weekly_plan_cache_key(user_data, student_field, survey_data, approved_coached_topics,
+                                                            include_verbal_math), weekly_plan)
+            replay_plan_events(events, user_data.get('username'))
+            if approved_coached_topics:
+                clear_coach_plan_caches(user_data)
+        return weekly_plan
+        
+    except Exception as e:
+        st.error(f"❌ Haftalık plan oluşturma hatası: {e}")
+
+        return {}
+
+@traced('planner.build_dynamic_weekly_plan')
+def build_dynamic_weekly_plan(user_data, student_field, survey_data, approved_coached_topics, events,
+                              include_verbal_math=False):
+    """Dinamik haftalık planı sıfırdan hesaplar - saf motor, cache ve Streamlit kullanmaz"""
+    # Dinamik hafta bilgisini al
+    week_info = get_user_dynamic_week_info(user_data)
+    
+    # 🆕 FİX: TYT/AYT ilerleme hesaplaması için projections hesapla
+    days_to_yks = get_current_week_info()['days_to_yks']
+    projections = calculate_completion_projections(user_data, student_field, days_to_yks)
+    
+    # Mevcut haftalık plan sistemindeki temel bilgileri al
+    base_weekly_plan = compute_weekly_topics(user_data, student_field, survey_data, events, include_verbal_math)
+    
+    # 🔥 KOÇ ONAYLARINI HAFTALIK HEDEF KONULAR'A ENTEGRE ET (DEĞİŞİKLİKLERLE)
+    # Koç onaylı konuları entegre et
+    original_topics = base_weekly_plan.get('new_topics', [])
+    
+    if approved_coached_topics:
+        # Mevcut konuları güncelle/sil/ekle
+        updated_new_topics = apply_coach_changes(original_topics, approved_coached_topics, user_data, events)
+        
+        # 🔥 BONUS: KONU TAKİP SİSTEMİNDEN NET DEĞİŞİKLİKLERİ ENTEGRE ET
+        try:
+            completed_topics, completed_topic_names = get_completed_topics_from_user_data(user_data)
+            if completed_topics:
+                # Koç onaylı konularda tamamlanmış olanları net değerleriyle güncelle
+                for updated_topic in updated_new_topics:
+                    for completed_topic in completed_topics:
+                        if (updated_topic.get('subject') == completed_topic.get('subject') and
+                            updated_topic.get('topic') == completed_topic.get('topic')):
+                            
+                            updated_topic['net'] = completed_topic.get('net', 0)
+
+                            break
+        except Exception as topic_tracking_error:
+            pass
+        
+        base_weekly_plan['new_topics'] = updated_new_topics
+    
+    # Dinamik bilgileri ekle
+    base_weekly_plan['dynamic_week_info'] = week_info
+    base_weekly_plan['is_dynamic'] = True
+    base_weekly_plan['projections'] = projections  # 🆕 FİX: Projections ekle
+    
+    # Özel dinamik başlık ve açıklama
+    base_weekly_plan['dynamic_title'] = f"🔁 {week_info['current_week']}. Haftanız - Gün {week_info['current_day_in_week']}/7"
+    base_weekly_plan['dynamic_description'] = f"""
+        📅 **Kayıt Tarihinizden Bu Yana:** {week_info['days_since_registration']} gün  
+        🔄 **Mevcut Hafta Döngünüz:** {week_info['current_week']}. hafta  
+        📆 **Bugün:** {week_info['current_day_name']} ({week_info['current_day_in_week']}/7)  
+        ⏳ **Bu Haftada Kalan:** {week_info['days_left_in_week']} gün  
+        🏁 **Hafta Aralığı:** {week_info['week_start_date'].strftime('%d.%m')} - {week_info['week_end_date'].strftime('%d.%m')}
+        """
+    
+    # Haftalık döngü takvimini ekle
+    base_weekly_plan['weekly_calendar'] = create_weekly_calendar(week_info)
+    
+    return base_weekly_plan
+
+def apply_coach_changes(original_topics, coach_approved_topics, user_data, events=None):
+    """💯 GÜÇLENDIRILMIŞ KOÇ DEĞİŞİKLİKLERİ UYGULAMA - KESIN ÇÖZÜM"""
+    try:
+        if not coach_approved_topics:
+
+            return original_topics
+        
+
+        
+        # 💯 ANINDA GÜNCELLEME: Haftalık hedef konuları koç onayladıklarıyla DEĞİŞTİR
+        updated_topics = []
+        
+        for coach_topic in coach_approved_topics:
+            # Koçun onayladığı her konuyu direkt kullan
+            new_topic = {
+                'subject': coach_topic.get('subject', 'Bilinmeyen'),
+                'topic': coach_topic.get('topic', 'Bilinmeyen'),
+                'detail': coach_topic.get('detail', ''),
+                'priority': coach_topic.get('priority', 'NORMAL'),
+                'net': coach_topic.get('net', 0),
+                'approval_date': coach_topic.get('approval_date', ''),
+                'coach_notes': coach_topic.get('coach_notes', '')
+            }
+            
+            updated_topics.append(new_topic)
+        
+        return updated_topics
+        
+    except Exception as e:
+        if events is not None:
+            events.notify('error', f"Koç değişiklikleri uygulama hatası: {e}")
+        else:
+            logger.error("Koç değişiklikleri uygulama hatası: %s", e)
+
+        return original_topics
+
+def clear_coach_plan_caches(user_data):
+    """Koç değişiklikleri uygulandıktan sonra öğrencinin oturum cache'lerini temizler (canlı oturum)"""
+    # 🔥 GÜÇLÜ CACHE TEMİZLEME - Öğrencinin tüm cache'ini temizle
+    try:
+        # Tüm olası cache key'lerini temizle
+        username = user_data.get('username', 'unknown')
+        cache_keys_to_delete = [
+            f"weekly_plan_{username}",
+            f"topics_from_user_data_{username}",
+            f"get_weekly_topics_{username}",
+            f"create_dynamic_weekly_plan_{username}"
+        ]
+        
+        for key in cache_keys_to_delete:
+            if key in st.session_state:
+                del st.session_state[key]
+
+        
+        # Genel cache de temizle
+        if hasattr(st.session_state, 'firebase_cache'):
+            try:
+                st.session_state.firebase_cache.clear()
+
+            except:
+                pass
+    except Exception as cache_error:
+        pass
+
+def get_approved_coached_topics(user_data):
+    """Koç tarafından onaylanan öğrenci konularını Firebase'den getir"""
+    try:
+        if is_firebase_connected() and 'username' in user_data:
+            # Coach approvals'dan bu kullanıcı için olanları çek
+            approvals_data = cached_firestore_get("coach_approvals")
+            return select_approved_coached_topics(approvals_data, user_data)
+        else:
+            # Session state'den (fallback)
+            return []
+    except Exception as e:
+        st.error(f"Onaylanan konuları getirme hatası: {e}")
+        return []
+
+def select_approved_coached_topics(approvals_data, user_data):
+    """coach_approvals dokümanından öğrencinin onaylanmış konularını seçer (Firebase/Streamlit'siz)"""
+    approved_topics = []
+    if approvals_data:
+        username = user_data['username']
+            
+        for approval_key, approval_data in approvals_data.items():
+            # Student bilgileri çıkar
+            student_username = approval_data.get('student_username', '')
+            student_name = approval_data.get('student_name', '')
+            
+            # Eğer student_username yoksa approval_key'den çıkar
+            if not student_username:
+                try:
+                    student_username = approval_key.split('_')[0]
+                except:
+                    student_username = ''
+            
+            # Username eşleşmesi veya name eşleşmesi veya key eşleşmesi
+            user_matches = (student_username == username or 
+                student_name == user_data.get('name', username) or
+                approval_key.startswith(username))
+
+            
+            if user_matches:
+                # Onaylanmış durumda ise ve onaylanan konular varsa
+                if (approval_data.get('status') == 'approved' and 
+                    'approved_topics' in approval_data and 
+                    approval_data['approved_topics']):
+                    
+
+                    
+                    # Onaylanan konuları ekle
+                    for topic in approval_data['approved_topics']:
+                        # Tarih bilgisi ekle
+                        topic_with_date = topic.copy()
+                        topic_with_date['approval_date'] = approval_data.get('approved_date', '')
+                        topic_with_date['coach_notes'] = approval_data.get('coach_notes', '')
+                        approved_topics.append(topic_with_date)
+                else:
+                    pass
+    return approved_topics
+
+def create_weekly_calendar(week_info):
+    """📅 7 günlük döngü takvimi oluşturur - GERÇEK TAKVİM TARİHLERİYLE"""
+    from datetime import datetime, timedelta
+    
+    calendar = []
+    
+    # Türkçe gün çevirisi
+    day_translation = {
+        'Monday': 'Pazartesi', 'Tuesday': 'Salı', 'Wednesday': 'Çarşamba',
+        'Thursday': 'Perşembe', 'Friday': 'Cuma', 'Saturday': 'Cumartesi', 'Sunday': 'Pazar'
+    }
+    
+    # Bugünün tarihini al
+    today = current_time().replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    # Kullanıcının haftasının başlangıç tarihi
+    week_start_date = week_info['week_start_date']
+    
+    for day_num in range(1, 8):
+        # 🔥 FİX: Her gün için GERÇEK takvim tarihini hesapla
+        actual_date = week_start_date + timedelta(days=day_num - 1)
+        day_name_english = actual_date.strftime('%A')
+        day_name = day_translation.get(day_name_english, day_name_english)
+        
+        # Bugün mü?
+        is_today = (day_num == week_info['current_day_in_week'])
+        
+        # Geçmiş mi?
+        is_past = (day_num < week_info['current_day_in_week'])
+        
+        # Gelecek mi?
+        is_future = (day_num > week_info['current_day_in_week'])
+        
+        calendar.append({
+            'day_number': day_num,
+            'day_name': day_name,  # Artık gerçek tarihten geliyor!
+            'actual_date': actual_date.strftime('%d.%m'),  # Ek bilgi
+            'is_today': is_today,
+            'is_past': is_past,
+            'is_future': is_future,
+            'status_emoji': '🔴' if is_today else ('✅' if is_past else '⏳')
+        })
+    
+    return calendar
+
+def get_next_week_topics(user_data, student_field, survey_data):
+    """Gelecek haftanın konularını getirir"""
+    try:
+        # Gelecek hafta için sabit bonus konular listesi
+        next_week_topics = []
+        
+        # Alan bazında bonus konular
+        bonus_topics_by_field = {
+            "TM": [  # Türkçe-Matematik
+                {"subject": "TYT Matematik", "topic": "Fonksiyonlar", "detail": "Ters Fonksiyon", "net": 0},
+                {"subject": "TYT Türkçe", "topic": "Edebiyat", "detail": "Divan Edebiyatı", "net": 0},
+                {"subject": "AYT Matematik", "topic": "Türev", "detail": "Türev Kuralları", "net": 0},
+                {"subject": "TYT Geometri", "topic": "Çember", "detail": "Çember Teoremi", "net": 0},
+                {"subject": "TYT Tarih", "topic": "İlk Çağ", "detail": "Anadolu Medeniyetleri", "net": 0},
+                {"subject": "AYT Matematik", "topic": "İntegral", "detail": "Belirsiz İntegral", "net": 0}
+            ],
+            "TM2": [  # Türkçe-Matematik (aynı)
+                {"subject": "TYT Matematik", "topic": "Fonksiyonlar", "detail": "Ters Fonksiyon", "net": 0},
+                {"subject": "TYT Türkçe", "topic": "Edebiyat", "detail": "Divan Edebiyatı", "net": 0},
+                {"subject": "AYT Matematik", "topic": "Türev", "detail": "Türev Kuralları", "net": 0},
+                {"subject": "TYT Geometri", "topic": "Çember", "detail": "Çember Teoremi", "net": 0},
+                {"subject": "TYT Tarih", "topic": "İlk Çağ", "detail": "Anadolu Medeniyetleri", "net": 0},
+                {"subject": "AYT Matematik", "topic": "İntegral", "detail": "Belirsiz İntegral", "net": 0}
+            ],
+            "MF": [  # Matematik-Fen
+                {"subject": "AYT Matematik", "topic": "Türev", "detail": "Türev Kuralları", "net": 0},
+                {"subject": "AYT Fizik", "topic": "Kuvvet ve Hareket", "detail": "Atış Hareketleri", "net": 0},
+                {"subject": "AYT Kimya", "topic": "Kimyasal Bağlar", "detail": "İyonik Bağ", "net": 0},
+                {"subject": "AYT Biyoloji", "topic": "Hücre", "detail": "Hücre Zarı", "net": 0},
+                {"subject": "TYT Matematik", "topic": "Logaritma", "detail": "Logaritma Özellikleri", "net": 0},
+                {"subject": "AYT Matematik", "topic": "İntegral", "detail": "Belirsiz İntegral", "net": 0}
+            ],
+            "Varsayılan": [
+                {"subject": "TYT Matematik", "topic": "Temel Konular", "detail": "Sayı Sistemleri", "net": 0},
+                {"subject": "TYT Türkçe", "topic": "Paragraf", "detail": "Ana Fikir", "net": 0},
+                {"subject": "TYT Geometri", "topic": "Temel Şekiller", "detail": "Üçgen", "net": 0},
+                {"subject": "TYT Tarih", "topic": "Temel Konular", "detail": "Osmanlı Tarihi", "net": 0},
+                {"subject": "TYT Coğrafya", "topic": "Fiziki Coğrafya", "detail": "İklim", "net": 0},
+                {"subject": "TYT English", "topic": "Grammar", "detail": "Present Tense", "net": 0}
+            ]
+        }
+        
+        # Öğrencinin alanına göre bonus konuları seç
+        field_code = student_field if student_field in bonus_topics_by_field else "Varsayılan"
+        next_week_topics = bonus_topics_by_field[field_code].copy()
+        
+        # Her konuya bonus özelliği ekle
+        for topic in next_week_topics:
+            topic['priority'] = 'NEXT_WEEK_BONUS'
+            topic['is_bonus'] = True
+        
+        return next_week_topics[:6]  # Maksimum 6 bonus konu
+        
+    except Exception as e:
+        # Hata durumunda varsayılan konular
+        return [
+            {"subject": "TYT Matematik", "topic": "Temel Konular", "detail": "Bonus Çalışma", "net": 0, "priority": 'NEXT_WEEK_BONUS', "is_bonus": True},
+            {"subject": "TYT Türkçe", "topic": "Temel Konular", "detail": "Bonus Çalışma", "net": 0, "priority": 'NEXT_WEEK_BONUS', "is_bonus": True},
+            {"subject": "TYT Geometri", "topic": "Temel Konular", "detail": "Bonus Çalışma", "net": 0, "priority": 'NEXT_WEEK_BONUS', "is_bonus": True}
+        ]
+
+# 🎮 GAMİFİCATİON UI BİLEŞENLERİ
+
+def show_gamification_dashboard():
+    """Gamification dashboard'unu göster"""
+    if 'gamification' not in st.session_state:
+        init_gamification_system()
+    
+    st.markdown("### 🎮 Başarı ve İlerleme Paneli")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        level = st.session_state.gamification['level']
+        level_info = LEVEL_SYSTEM["level_rewards"].get(level, {"name": f"Seviye {level}", "icon": "🎯"})
+        st.metric("👤 Seviye", f"{level} - {level_info['name']}")
+    
+    with col2:
+        total_points = st.session_state.gamification['total_points']
+        next_level_threshold = LEVEL_SYSTEM["level_thresholds"][min(level, len(LEVEL_SYSTEM["level_thresholds"])-1)]
+        remaining = max(0, next_level_threshold - total_points)
+        st.metric("⭐ Toplam Puan", f"{total_points:,}", delta=f"Sonraki seviyeye: {remaining}")
+    
+    with col3:
+        daily_streak = st.session_state.gamification['daily_streak']
+        st.metric("🔥 Günlük Seri", f"{daily_streak} gün")
+    
+    with col4:
+        badge_count = len(st.session_state.gamification['badges'])
+        st.metric("🏆 Rozetler", badge_count)
+    
+    # İlerleme çubuğu
+    if level < len(LEVEL_SYSTEM["level_thresholds"])-1:
+        current_threshold = LEVEL_SYSTEM["level_thresholds"][level-1] if level > 0 else 0
+        next_threshold = LEVEL_SYSTEM["level_thresholds"][level]
+        progress = (total_points - current_threshold) / (next_threshold - current_threshold)
+        st.progress(min(1.0, progress))
+        st.caption(f"Seviye {level+1} için {next_threshold - total_points} puan kaldı")
+
+def show_daily_challenges():
+    """Günlük challenge'ları göster"""
+    if 'gamification' not in st.session_state:
+        init_gamification_system()
+    
+    st.subheader("🎯 Günlük Görevler")
+    
+    today = current_time().strftime("%Y-%m-%d")
+    
+    for challenge in st.session_state.gamification['current_challenges']['daily']:
+        progress = get_challenge_progress(challenge, today)
+        completion_percentage = min(100, (progress / challenge.get('target', 1)) * 100)
+        
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.markdown(f"**{challenge['name']}** - {challenge['description']}")
+            if 'target' in challenge:
+                st.progress(completion_percentage / 100)
+                st.caption(f"İlerleme: {progress}/{challenge['target']}")
+        with col2:
+            if completion_percentage >= 100:
+                st.success(f"✅ +{challenge['points']} puan")
+            else:
+                st.info(f"🎯 {challenge['points']} puan")
+
+def show_level_up_notification(new_level):
+    """Seviye atlama bildirimi göster"""
+    st.balloons()
+    st.success(f"🎊 Tebrikler! Seviye {new_level}'e yükseldin!")
+    
+    # Seviye ödülü varsa göster
+    if new_level in LEVEL_SYSTEM["level_rewards"]:
+        reward = LEVEL_SYSTEM["level_rewards"][new_level]
+        st.info(f"🎁 Seviye ödülü: {reward['reward']}")